@@ -12,7 +12,9 @@ from album.core.api.model.collection_solution import ICollectionSolution
 from album.core.api.model.configuration import IConfiguration
 from album.core.api.model.event import IEvent
 from album.core.controller.album_controller import AlbumController
+from album.core.model.default_values import DefaultValues
 from album.core.utils.core_logging import configure_root_logger
+from album.core.utils.operations.blob_operations import prune_blobs
 from album.runner.album_logging import LogLevel, pop_active_logger
 from album.runner.core.api.model.solution import ISolution
 
@@ -30,6 +32,7 @@ class Album:
         _log_format: str | None = None
         _log_format_time: str | None = None
         _log_level: LogLevel | None = None
+        _clean_trash: bool = True
 
         def base_cache_path(self, base_cache_path: str | Path) -> Album.Builder:
             """Set the base cache path."""
@@ -51,9 +54,14 @@ class Album:
             self._log_level = log_level
             return self
 
+        def clean_trash(self, clean_trash: bool) -> Album.Builder:
+            """Set whether to resume deleting the trash in the background on startup."""
+            self._clean_trash = clean_trash
+            return self
+
         def build(self) -> Album:
             """Build the album instance."""
-            _controller = AlbumController(self._base_cache_path)
+            _controller = AlbumController(self._base_cache_path, self._clean_trash)
             configure_root_logger(
                 log_format=self._log_format,
                 log_format_time=self._log_format_time,
@@ -70,9 +78,21 @@ class Album:
         """Close the album instance."""
         self.close()
 
-    def resolve(self, resolve_solution: str) -> ICollectionSolution:
-        """Resolve a solution."""
-        return self._controller.collection_manager().resolve_and_load(resolve_solution)
+    def resolve(
+        self, resolve_solution: str, metadata_only: bool = False
+    ) -> ICollectionSolution:
+        """Resolve a solution.
+
+        Args:
+            resolve_solution:
+                What to resolve. Either path, doi, group:name:version, catalog:group:name:version, url
+            metadata_only:
+                Load the solution from cached metadata if possible. Its functions (e.g. run) are not available then.
+
+        """
+        return self._controller.collection_manager().resolve_and_load(
+            resolve_solution, metadata_only
+        )
 
     def resolve_installed(self, resolve_solution: str) -> ICollectionSolution:
         """Resolve an installed solution."""
@@ -138,6 +158,40 @@ class Album:
             run_async,
         )
 
+    def install_many(
+        self,
+        solutions_to_resolve: list[str],
+        allow_recursive: bool = False,
+        argv=None,
+        max_workers: int | None = None,
+        run_async=False,
+    ):
+        """Install several solutions to the disk.
+
+        Shared parents are installed once, environments of independent solutions are created concurrently.
+
+        Args:
+            solutions_to_resolve:
+                The solutions to install.
+            allow_recursive:
+                Allow album to be installed in the solution environments.
+            argv:
+                Arguments which should be appended to the script calls.
+            max_workers:
+                The number of solutions installed concurrently.
+            run_async:
+                Run the installation as task.
+
+        Returns:
+            The error of each solution or None if it is installed.
+
+        """
+        return self._run_async(
+            self._controller.install_manager().install_many,
+            (solutions_to_resolve, allow_recursive, argv, max_workers),
+            run_async,
+        )
+
     def uninstall(
         self, solution_to_resolve: str, rm_dep=False, argv=None, run_async=False
     ):
@@ -213,6 +267,54 @@ class Album:
             no_conda_lock=no_conda_lock,
         )
 
+    def deploy_many(
+        self,
+        deploy_paths: list[str],
+        catalog_name: str,
+        dry_run: bool,
+        push_options: list[str] | None = None,
+        git_email: str = "",
+        git_name: str = "",
+        force_deploy: bool = False,
+        changelog: str = "",
+        no_conda_lock: bool = False,
+    ):
+        """Deploy several solutions with a single commit to a catalog of type direct.
+
+        Args:
+            deploy_paths:
+                Paths to directories or files. A directory must contain a "solution.py" file.
+            catalog_name:
+                The catalog to deploy to.
+            dry_run:
+                When set, prepares deployment in local src of the catalog (creating zip, docker, yml),
+                but not adding to the catalog src.
+            push_options:
+                Push options for the catalog repository.
+            git_email:
+                The git email to use. (Default: systems git configuration)
+            git_name:
+                The git user to use. (Default: systems git configuration)
+            force_deploy:
+                Force overwrites existing solutions during deployment.
+            changelog:
+                The change associated with this version of the solutions compared to their last versions.
+            no_conda_lock:
+                Do not lock the conda environments when deploying.
+
+        """
+        return self._controller.deploy_manager().deploy_many(
+            deploy_paths=deploy_paths,
+            catalog_name=catalog_name,
+            dry_run=dry_run,
+            push_options=push_options,
+            git_email=git_email,
+            git_name=git_name,
+            force_deploy=force_deploy,
+            changelog=changelog,
+            no_conda_lock=no_conda_lock,
+        )
+
     def undeploy(
         self,
         solution_to_resolve: str,
@@ -267,6 +369,127 @@ class Album:
         """
         return self._controller.clone_manager().clone(path, target_dir, name)
 
+    def collect_garbage(self, max_workers: int | None = None) -> dict[str, Any]:
+        """Remove orphans and delete environments and installations which were removed from the collection.
+
+        Orphans are links and folders in the album cache not used by a catalog or an installed solution, e.g. left
+        behind by failed installations or removed catalogs. Removing orphans, environments or installations only
+        moves their folders into the trash folder of album. The trash is emptied in the background on startup and
+        by calling this method. Afterwards the blobs no longer linked from a solution package are removed.
+
+        Args:
+            max_workers:
+                The number of threads deleting concurrently.
+
+        Returns:
+            The removed orphans ("orphans"), the deleted entries of the trash ("deleted") and the removed blobs
+            ("blobs").
+
+        """
+        if max_workers is None:
+            max_workers = DefaultValues.gc_max_workers.value
+        orphans = self._controller.disk_usage_manager().reclaim_orphans()
+        deleted = self._controller.configuration().empty_trash(max_workers)
+        # package folders deleted from the trash release their blobs
+        blobs = prune_blobs(self._controller.configuration().blob_path())
+        return {"orphans": orphans, "deleted": deleted, "blobs": blobs}
+
+    def get_disk_usage(self, max_workers: int | None = None) -> dict[str, Any]:
+        """Get the disk space used by environments, packages, installations, downloads and shared resources.
+
+        Args:
+            max_workers:
+                The number of threads scanning concurrently.
+
+        Returns:
+            The size in bytes of each category ("categories"), the orphans removed by collect_garbage including their
+            size ("orphans") and the size of all categories ("total").
+
+        """
+        return self._controller.disk_usage_manager().get_disk_usage(max_workers)
+
+    def pack_environment(
+        self, solution_to_resolve: str, archive: str | Path | None = None
+    ) -> Path:
+        """Write a relocatable archive of the environment of an installed solution.
+
+        The archive can be unpacked on other hosts with the same platform instead of creating the environment there.
+
+        Args:
+            solution_to_resolve:
+                What to resolve. Either path, doi, group:name:version, catalog:group:name:version, url
+            archive:
+                The archive to write (.tar.gz, .tgz, .tar.xz or .tar), <environment name>.tar.gz in the working
+                directory by default.
+
+        Returns:
+            The archive.
+
+        """
+        collection_solution = (
+            self._controller.collection_manager().resolve_installed_and_load(
+                solution_to_resolve
+            )
+        )
+        return self._controller.environment_manager().pack_environment(
+            collection_solution, archive
+        )
+
+    def unpack_environment(self, archive: str | Path) -> None:
+        """Extract an environment archive written by pack_environment and register the environment in the collection.
+
+        Installing the solution of the environment afterwards reuses the unpacked environment instead of creating it.
+
+        Args:
+            archive:
+                The archive of the environment.
+
+        """
+        self._controller.environment_manager().unpack_environment(archive)
+
+    def create_bundle(
+        self,
+        archive: str | Path,
+        catalog_names: list[str] | None = None,
+        environments: bool = False,
+        resources: bool = False,
+    ) -> dict[str, Any]:
+        """Write catalogs, their downloaded solution packages and optionally environments and resources into a bundle.
+
+        The bundle can be imported with import_bundle on hosts without network access.
+
+        Args:
+            archive:
+                The archive to write (.tar.gz, .tgz, .tar.xz or .tar).
+            catalog_names:
+                The catalogs to export. Defaults to all catalogs except the cache catalog.
+            environments:
+                Whether to add the packed environments of the installed solutions of the catalogs.
+            resources:
+                Whether to add the shared resources of the catalogs.
+
+        Returns:
+            The manifest of the bundle.
+
+        """
+        return self._controller.bundle_manager().create_bundle(
+            archive, catalog_names, environments, resources
+        )
+
+    def import_bundle(self, archive: str | Path) -> dict[str, Any]:
+        """Import a bundle written by create_bundle without accessing the network.
+
+        Args:
+            archive:
+                The archive of the bundle.
+
+        Returns:
+            The imported catalogs ("catalogs"), the number of solution packages ("solutions"), the names of the
+            unpacked environments ("environments") and the number of shared resource files ("resources").
+
+        """
+        return self._controller.bundle_manager().import_bundle(archive)
+
     def close(self):
         """Close the album instance."""
         if self.logger_pushed:
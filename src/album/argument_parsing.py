@@ -1,16 +1,23 @@
 """Argument parsing for the album command line interface."""
 
+from __future__ import annotations
+
 import argparse
 import sys
+import time
 import traceback
-from importlib.metadata import entry_points
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 from album import core
-from album.api import Album
 from album.commandline import (
     add_catalog,
+    bundle,
     clone,
     deploy,
+    du,
+    env,
+    gc,
     index,
     info,
     install,
@@ -24,6 +31,9 @@ from album.commandline import (
     update,
     upgrade,
 )
+from album.core.model.default_values import DefaultValues
+from album.core.utils.operations.entry_point_operations import get_entry_points
+from album.core.utils.profiling import span, start_profiling, stop_profiling
 from album.environments.utils.subcommand import SubProcessError
 from album.runner.album_logging import (
     LogLevel,
@@ -32,21 +42,54 @@ from album.runner.album_logging import (
     to_loglevel,
 )
 
+if TYPE_CHECKING:
+    from album.api import Album
+
 
 def main():
     """Entry points of `album`."""
+    started = time.perf_counter()
     parser = create_parser()
 
     get_active_logger().debug("Parsing base album call arguments...")
     namespace, args = parser.parse_known_args()
-    __handle_args(namespace, args, parser)
+    __handle_args(namespace, args, parser, started)
 
 
-def __handle_args(namespace, args, parser):
+def __handle_args(namespace, args, parser, started=None):
     """Handle all arguments provided after the album command."""
     level = namespace.log
     print_json = getattr(namespace, "json", False)
-    __run_subcommand(namespace, args, parser, level, print_json)
+    profile_output = getattr(namespace, "profile_output", None)
+    if not getattr(namespace, "profile", False) and not profile_output:
+        __run_subcommand(namespace, args, parser, level, print_json)
+        return
+
+    profiler = start_profiling(use_cprofile=bool(profile_output), start=started)
+    if started is not None:
+        profiler.add_span("parse arguments", started, time.perf_counter())
+    try:
+        with span("command"):
+            __run_subcommand(namespace, args, parser, level, print_json)
+    finally:
+        _report_profile(profile_output)
+
+
+def _report_profile(profile_output: Optional[str]):
+    """Print the recorded phases of the album call and write the profile files if requested."""
+    profiler = stop_profiling()
+    if profiler is None:
+        return
+    # stderr, as stdout might hold the JSON result of the command
+    print(profiler.get_summary_as_string(), file=sys.stderr)
+    if profile_output:
+        profiler.write_stats(profile_output + ".pstats")
+        profiler.write_trace(profile_output + ".trace.json")
+        print(
+            "Profile written to %s.pstats and %s.trace.json."
+            % (profile_output, profile_output),
+            file=sys.stderr,
+        )
 
 
 def _capture_output():
@@ -79,7 +122,7 @@ def __run_subcommand(namespace, args, parser, level: LogLevel, print_json):
     sys.argv = [sys.argv[0]] + args
 
     # Makes sure album is initialized.
-    album_instance = create_album_instance(level)
+    album_instance = create_album_instance(level, album_command)
     if print_json:
         _capture_output()
     get_active_logger().info("album version %s" % core.__version__)
@@ -100,16 +143,28 @@ def __run_subcommand(namespace, args, parser, level: LogLevel, print_json):
         _handle_exception(e)
 
 
-def create_album_instance(level: LogLevel) -> Album:
+def create_album_instance(level: LogLevel, album_command: str = "") -> Album:
     """Create an album instance with a specific log level."""
-    return Album.Builder().log_level(level).build()
+    with span("setup"):
+        # the core is only imported when a command gets executed
+        from album.api import Album
+
+        # album gc empties the trash itself, using several threads
+        return (
+            Album.Builder().log_level(level).clean_trash(album_command != "gc").build()
+        )
 
 
 def create_parser():
     """Create a parser for all known album arguments."""
     parser = AlbumParser()
     parser_creators = []
-    for entry_point in entry_points(group="console_parsers_album"):
+    for entry_point in get_entry_points(
+        "console_parsers_album",
+        Path(DefaultValues.app_data_dir.value).joinpath(
+            DefaultValues.entry_point_cache_file_name.value
+        ),
+    ):
         try:
             parser_creators.append(entry_point.load())
         except Exception as e:
@@ -210,6 +265,113 @@ def create_add_catalog_parser(parser):
     p.add_argument("src", type=str, help="src of the catalog")
 
 
+def create_gc_parser(parser):
+    """Create a parser for the gc command."""
+    p = parser.create_command_parser(
+        "gc",
+        gc,
+        "remove orphans, delete the folders of removed environments and installations and unused blobs.",
+    )
+    p.add_argument(
+        "--max-workers",
+        required=False,
+        type=int,
+        help="Number of threads deleting concurrently. Defaults to ALBUM_GC_MAX_WORKERS or %s."
+        % DefaultValues.gc_max_workers.value,
+        default=None,
+    )
+
+
+def create_du_parser(parser):
+    """Create a parser for the du command."""
+    p = parser.create_command_parser(
+        "du",
+        du,
+        "print the disk space used by environments, packages, installations, downloads and shared resources, "
+        "including orphans removed by album gc.",
+    )
+    p.add_argument(
+        "--max-workers",
+        required=False,
+        type=int,
+        help="Number of threads scanning concurrently. Defaults to ALBUM_GC_MAX_WORKERS or %s."
+        % DefaultValues.gc_max_workers.value,
+        default=None,
+    )
+
+
+def create_env_parser(parser):
+    """Create a parser for the env command."""
+    p = parser.create_command_parser(
+        "env",
+        env,
+        "pack the environment of an installed solution into a relocatable archive "
+        "or unpack such an archive to install the environment without creating it.",
+    )
+    p.add_argument(
+        "action",
+        type=str,
+        choices=["pack", "unpack"],
+        help="pack: write the archive of the environment of a solution. unpack: install the environment of an "
+        "archive.",
+    )
+    p.add_argument(
+        "path",
+        type=str,
+        help="pack: the solution, either group:name:version, catalog:group:name:version or a path. "
+        "unpack: the archive.",
+    )
+    p.add_argument(
+        "--output",
+        required=False,
+        type=str,
+        help="pack: the archive to write (.tar.gz, .tgz, .tar.xz or .tar). "
+        "Defaults to <environment name>.tar.gz in the working directory.",
+        default=None,
+    )
+
+
+def create_bundle_parser(parser):
+    """Create a parser for the bundle command."""
+    p = parser.create_command_parser(
+        "bundle",
+        bundle,
+        "create a bundle of catalogs, solutions, environments and resources "
+        "or import such a bundle on a host without network access.",
+    )
+    p.add_argument(
+        "action",
+        type=str,
+        choices=["create", "import"],
+        help="create: write a bundle. import: import a bundle into the collection.",
+    )
+    p.add_argument(
+        "path",
+        type=str,
+        help="The archive of the bundle (.tar.gz, .tgz, .tar.xz or .tar).",
+    )
+    p.add_argument(
+        "--catalog",
+        required=False,
+        action="append",
+        help="create: a catalog to add to the bundle, can be given several times. "
+        "Defaults to all catalogs except the cache catalog.",
+        default=None,
+    )
+    p.add_argument(
+        "--environments",
+        required=False,
+        action="store_true",
+        help="create: add the environments of the installed solutions of the catalogs.",
+    )
+    p.add_argument(
+        "--resources",
+        required=False,
+        action="store_true",
+        help="create: add the shared resources of the catalogs.",
+    )
+
+
 def create_info_parser(parser):
     """Create a parser for the info command."""
     parser.create_file_command_parser(
@@ -234,20 +396,37 @@ def create_uninstall_parser(parser):
 
 def create_install_parser(parser):
     """Create a parser for the install command."""
-    p = parser.create_file_command_parser(
-        "install", install, "install an album solution."
+    p = parser.create_command_parser(
+        "install",
+        install,
+        "install one or several album solutions. Several solutions are installed concurrently.",
     )
+    p.add_argument("path", type=str, nargs="+", help="path(s) for the solution file(s)")
     p.add_argument(
         "--allow-recursive",
         required=False,
         help="Parameter to indicate to allow album in album installation.",
         action="store_true",
     )
+    p.add_argument(
+        "--max-workers",
+        required=False,
+        type=int,
+        help="Number of solutions installed concurrently when installing several solutions. "
+        "Defaults to ALBUM_INSTALL_MAX_WORKERS or %s."
+        % DefaultValues.install_max_workers.value,
+        default=None,
+    )
 
 
 def create_deploy_parser(parser):
     """Create a parser for the deploy command."""
-    p = parser.create_file_command_parser("deploy", deploy, "deploy an album solution.")
+    p = parser.create_command_parser(
+        "deploy",
+        deploy,
+        "deploy one or several album solutions. Several solutions are deployed with a single commit.",
+    )
+    p.add_argument("path", type=str, nargs="+", help="path(s) for the solution file(s)")
     p.add_argument(
         "catalog",
         type=str,
@@ -398,6 +577,24 @@ class AlbumParser(ArgumentParser):
             " Instead, the result of the command - if present - is printed as JSON.",
             action="store_true",
         )
+        parent_parser.add_argument(
+            "--profile",
+            required=False,
+            help="Print the time spent in the phases of the album command (setup, collection, resolve, "
+            "environment, solution) when it finished.",
+            action="store_true",
+            # the options are shared by the main and the subcommand parsers, don't let a subcommand parser
+            # overwrite a value given before the subcommand
+            default=argparse.SUPPRESS,
+        )
+        parent_parser.add_argument(
+            "--profile-output",
+            required=False,
+            help="Write a cProfile statistics file <prefix>.pstats and a Chrome trace event file "
+            "<prefix>.trace.json of the album command. Implies --profile.",
+            default=argparse.SUPPRESS,
+            metavar="PREFIX",
+        )
         parent_parser.add_argument(
             "--version", "-V", action="version", version="%s " % core.__version__
         )
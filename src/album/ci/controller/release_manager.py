@@ -14,6 +14,7 @@ from album.api import Album
 from album.ci.controller.zenodo_manager import ZenodoManager
 from album.ci.utils.continuous_integration import create_report, get_ssh_url
 from album.ci.utils.zenodo_api import InvalidResponseStatusError, ZenodoMetadata
+from album.core.api.model.catalog_updates import ChangeType
 from album.core.api.model.configuration import IConfiguration
 from album.core.model.catalog import Catalog, retrieve_index_files_from_src
 from album.core.model.default_values import DefaultValues
@@ -551,6 +552,8 @@ class ReleaseManager:
                     )
                     if index_db.exists():
                         copy(index_db, self.catalog.index_file_path())
+                        # the revision of the meta file must match the index
+                        copy(index_meta, self.catalog.get_meta_file_path())
                         module_logger().info(
                             "Remote index DB copied to %s"
                             % self.catalog.index_file_path()
@@ -601,6 +604,11 @@ class ReleaseManager:
         module_logger().info(
             "Solution list exported to %s" % self.catalog.solution_list_path()
         )
+        if self.catalog.export_index_transport(
+            self.catalog.path(),
+            [{"change_type": ChangeType.CHANGED.name, "solution": yml_dict}],
+        ):
+            module_logger().info("Index transport files exported.")
 
     def commit_changes(
         self, branch_name: str, ci_user_name: str, ci_user_email: str
@@ -685,13 +693,15 @@ class ReleaseManager:
                 self.catalog.solution_list_path(),
                 self.catalog.index_file_path(),
             ]
-            module_logger().info(
-                "Merge commit files: %s" % ", ".join(Path(f).name for f in commit_files)
-            )
             if not all(Path(f).is_file() for f in commit_files):
                 raise FileNotFoundError(
                     "Invalid deploy request or broken catalog repository!"
                 )
+            if self.catalog.index_url():
+                commit_files += self._get_index_transport_paths(self.catalog.path())
+            module_logger().info(
+                "Merge commit files: %s" % ", ".join(Path(f).name for f in commit_files)
+            )
 
             commit_msg = "Updated index."
 
@@ -713,6 +723,15 @@ class ReleaseManager:
             else:
                 module_logger().info("Merge commit pushed to origin/%s." % branch_name)
 
+    @staticmethod
+    def _get_index_transport_paths(base_dir: Path) -> List[Path]:
+        paths = [
+            base_dir.joinpath(DefaultValues.catalog_index_metafile_json.value),
+            base_dir.joinpath(DefaultValues.catalog_index_compressed_file_name.value),
+            base_dir.joinpath(DefaultValues.catalog_index_delta_prefix.value),
+        ]
+        return [p for p in paths if p.exists()]
+
     def _get_zenodo_manager(
         self, zenodo_access_token: str, zenodo_base_url: str
     ) -> ZenodoManager:
@@ -1,16 +1,20 @@
 """Module containing the commandline functions for the `album` commandline tool."""
+
+from __future__ import annotations
+
 import os
 import pkgutil
 import sys
 import tempfile
 from argparse import Namespace
+from typing import TYPE_CHECKING
 
-from album.api import Album
 from album.core.utils.operations.solution_operations import (
     get_deploy_dict,
     serialize_json,
 )
 from album.core.utils.operations.view_operations import (
+    get_disk_usage_as_string,
     get_index_as_string,
     get_search_result_as_string,
     get_solution_as_string,
@@ -19,6 +23,9 @@ from album.core.utils.operations.view_operations import (
 from album.runner.album_logging import get_active_logger
 from album.runner.core.model.solution import Solution
 
+if TYPE_CHECKING:
+    from album.api import Album
+
 module_logger = get_active_logger
 
 
@@ -57,8 +64,21 @@ def upgrade(album_instance: Album, args: Namespace):
 
 def deploy(album_instance: Album, args: Namespace):
     """Call function corresponding to the `deploy` subcommand of `album`."""
+    if len(args.path) > 1:
+        album_instance.deploy_many(
+            args.path,
+            args.catalog,
+            args.dry_run,
+            args.push_option,
+            args.git_email,
+            args.git_name,
+            args.force_deploy,
+            args.changelog,
+            args.no_conda_lock,
+        )
+        return
     album_instance.deploy(
-        args.path,
+        args.path[0],
         args.catalog,
         args.dry_run,
         args.push_option,
@@ -84,7 +104,18 @@ def undeploy(album_instance: Album, args: Namespace):
 
 def install(album_instance: Album, args: Namespace):
     """Call function corresponding to the `install` subcommand of `album`."""
-    album_instance.install(str(args.path), args.allow_recursive, sys.argv)
+    if len(args.path) > 1:
+        results = album_instance.install_many(
+            args.path, args.allow_recursive, sys.argv, args.max_workers
+        )
+        failed = [path for path, error in results.items() if error is not None]
+        if failed:
+            raise RuntimeError(
+                "Failed to install %s of %s solutions: %s"
+                % (len(failed), len(results), ", ".join(failed))
+            )
+        return
+    album_instance.install(args.path[0], args.allow_recursive, sys.argv)
 
 
 def uninstall(album_instance: Album, args: Namespace):
@@ -95,7 +126,7 @@ def uninstall(album_instance: Album, args: Namespace):
 def info(album_instance: Album, args: Namespace):
     """Call function corresponding to the `info` subcommand of `album`."""
     solution_path = args.path
-    resolve_result = album_instance.resolve(str(args.path))
+    resolve_result = album_instance.resolve(str(args.path), metadata_only=True)
     print_json = _get_print_json(args)
     solution = resolve_result.loaded_solution()
     if print_json:
@@ -143,6 +174,69 @@ def index(album_instance: Album, args: Namespace):
         module_logger().info(res)
 
 
+def gc(album_instance: Album, args: Namespace):
+    """Call function corresponding to the `gc` subcommand of `album`."""
+    res = album_instance.collect_garbage(args.max_workers)
+    module_logger().info(
+        "Removed %s orphans, deleted %s removed folders from the trash and %s unused blobs."
+        % (len(res["orphans"]), len(res["deleted"]), len(res["blobs"]))
+    )
+
+
+def du(album_instance: Album, args: Namespace):
+    """Call function corresponding to the `du` subcommand of `album`."""
+    disk_usage = album_instance.get_disk_usage(args.max_workers)
+    print_json = _get_print_json(args)
+    if print_json:
+        print(_as_json(disk_usage))
+    else:
+        module_logger().info(get_disk_usage_as_string(disk_usage))
+
+
+def env(album_instance: Album, args: Namespace):
+    """Call function corresponding to the `env` subcommand of `album`."""
+    if args.action == "pack":
+        archive = album_instance.pack_environment(args.path, args.output)
+        module_logger().info(
+            "Packed the environment of %s into %s." % (args.path, archive)
+        )
+    else:
+        album_instance.unpack_environment(args.path)
+        module_logger().info("Unpacked the environment of %s." % args.path)
+
+
+def bundle(album_instance: Album, args: Namespace):
+    """Call function corresponding to the `bundle` subcommand of `album`."""
+    if args.action == "create":
+        manifest = album_instance.create_bundle(
+            args.path, args.catalog, args.environments, args.resources
+        )
+        module_logger().info(
+            "Bundled %s catalogs, %s environments and %s files into %s."
+            % (
+                len(manifest["catalogs"]),
+                len(manifest["environments"]),
+                len(manifest["files"]),
+                args.path,
+            )
+        )
+    else:
+        res = album_instance.import_bundle(args.path)
+        print_json = _get_print_json(args)
+        if print_json:
+            print(_as_json(res))
+        else:
+            module_logger().info(
+                "Imported %s catalogs, %s solutions, %s environments and %s resource files."
+                % (
+                    len(res["catalogs"]),
+                    res["solutions"],
+                    len(res["environments"]),
+                    res["resources"],
+                )
+            )
+
+
 def _merge_scripts(script1, script2_content, tmp_dir):
     """Merge two scripts into one."""
     with open(script1) as fp:
@@ -0,0 +1,62 @@
+"""Interface exporting catalogs, solutions, environments and resources into offline bundles and importing them."""
+
+from abc import ABCMeta, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+
+class IBundleManager:
+    """Interface exporting parts of the collection into a single archive and importing it on hosts without network.
+
+    A bundle holds the index and meta file of catalogs, the packages of their solutions including lock files and
+    optionally the packed environments of installed solutions and the shared resources of the catalogs. Every file
+    is listed with its sha256 in the manifest of the bundle.
+    """
+
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def create_bundle(
+        self,
+        archive: Union[str, Path],
+        catalog_names: Optional[List[str]] = None,
+        environments: bool = False,
+        resources: bool = False,
+    ) -> Dict[str, Any]:
+        """Write a bundle.
+
+        Args:
+            archive:
+                The archive to write (.tar.gz, .tgz, .tar.xz or .tar).
+            catalog_names:
+                The catalogs to export. Defaults to all catalogs except the cache catalog.
+            environments:
+                Whether to add the packed environments of the installed solutions of the catalogs.
+            resources:
+                Whether to add the shared resources of the catalogs.
+
+        Returns:
+            The manifest of the bundle.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def import_bundle(self, archive: Union[str, Path]) -> Dict[str, Any]:
+        """Import a bundle without accessing the network.
+
+        The files of the bundle are verified before anything gets imported. Catalogs are added to the collection
+        from their bundled index, solution packages are materialized as hardlinks to the blob store and environments
+        are unpacked, installing a bundled solution afterwards neither downloads the solution nor creates its
+        environment.
+
+        Args:
+            archive:
+                The archive written by create_bundle.
+
+        Returns:
+            The imported catalogs ("catalogs"), the number of solution packages ("solutions"), the names of the
+            unpacked environments ("environments") and the number of shared resource files ("resources").
+
+        """
+        raise NotImplementedError
@@ -1,5 +1,7 @@
 """This module contains the interface for the catalog handler."""
+
 from abc import ABCMeta, abstractmethod
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from album.core.api.model.catalog import ICatalog
@@ -35,6 +37,35 @@ class ICatalogHandler:
         """Add a catalog by their src (Git, network-drive, folder outside cache, etc.)."""
         raise NotImplementedError
 
+    @abstractmethod
+    def add_by_index(
+        self,
+        source: str,
+        index_file: Path,
+        meta_file: Path,
+        branch_name: str = "main",
+    ) -> ICatalog:
+        """Add a catalog from a copy of its index and meta file instead of retrieving them from its src.
+
+        The catalog and its solutions are added to the collection in a single transaction. A catalog with the same
+        name and src already in the collection gets its index replaced and its solutions updated.
+
+        Args:
+            source:
+                The src of the catalog.
+            index_file:
+                The copy of the index database of the catalog.
+            meta_file:
+                The copy of the meta file of the catalog.
+            branch_name:
+                The branch of the catalog.
+
+        Returns:
+            The catalog.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _add_to_index(self, catalog: ICatalog) -> int:
         """Add a catalog to the collection index.
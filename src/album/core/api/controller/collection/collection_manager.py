@@ -1,6 +1,8 @@
 """The Album Catalog Collection interface class."""
+
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, ContextManager, Dict
 
 from album.runner.core.api.model.coordinates import ICoordinates
 
@@ -86,7 +88,9 @@ class ICollectionManager:
         raise NotImplementedError
 
     @abstractmethod
-    def resolve_and_load(self, resolve_solution: str) -> ICollectionSolution:
+    def resolve_and_load(
+        self, resolve_solution: str, metadata_only: bool = False
+    ) -> ICollectionSolution:
         """Resolve a string input and load its content.
 
         Downloads a catalog if not already cached.
@@ -94,6 +98,8 @@ class ICollectionManager:
         Args:
             resolve_solution:
                 What to resolve. Either path, doi, group:name:version, catalog:group:name:version, url
+            metadata_only:
+                Load the solution from its cached metadata if possible, without executing the solution file.
 
         Returns:
             The resolve result, including the loaded solution.
@@ -117,14 +123,66 @@ class ICollectionManager:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def invalidate_resolve_cache(self) -> None:
+        """Forget all memoized resolve results.
+
+        Resolve results and their loaded solutions are shared between calls resolving the same input until the
+        collection changes, e.g. when a solution gets installed, uninstalled or a catalog gets updated.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_collection_index(self) -> ICollectionIndex:
         """Get the collection index."""
         raise NotImplementedError
 
+    @abstractmethod
+    def write_lock(self) -> ContextManager[Any]:
+        """Return the lock serializing writes to the collection index of threads working concurrently.
+
+        Each thread uses its own connection to the collection index. Registering links holds the lock, threads
+        writing to the collection next to other threads, e.g. concurrent installations, need to hold it as well.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_link_target(
+        self, point_from: Path, point_to: Path, create: bool = True
+    ) -> Path:
+        """Return the folder in the lnk folder a path links to.
+
+        Links and their targets are registered in the collection index. A registered link is only validated,
+        resolving it and creating its target happens when it is not registered yet or no longer valid.
+
+        Args:
+            point_from:
+                The path of the link.
+            point_to:
+                The folder name in the lnk folder holding the link targets.
+            create:
+                Whether to create the link if it does not exist.
+
+        Returns:
+            The target of the link. An empty path if the link does not exist and create is False.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def register_link(self, point_from: Path, target: Path) -> None:
+        """Register a link created outside of get_link_target."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def unregister_link(self, point_from: Path) -> None:
+        """Remove a link from the registered links."""
+        raise NotImplementedError
+
     @abstractmethod
     def retrieve_and_load_resolve_result(
-        self, resolve_result: ICollectionSolution
+        self, resolve_result: ICollectionSolution, metadata_only: bool = False
     ) -> None:
         """Retrieve and load a resolve result."""
         raise NotImplementedError
@@ -1,11 +1,13 @@
 """Interface for the Album Controller."""
 from abc import ABCMeta, abstractmethod
 
+from album.core.api.controller.bundle_manager import IBundleManager
 from album.core.api.controller.clone_manager import ICloneManager
 from album.core.api.controller.collection.catalog_handler import ICatalogHandler
 from album.core.api.controller.collection.collection_manager import ICollectionManager
 from album.core.api.controller.collection.solution_handler import ISolutionHandler
 from album.core.api.controller.deploy_manager import IDeployManager
+from album.core.api.controller.disk_usage_manager import IDiskUsageManager
 from album.core.api.controller.environment_manager import IEnvironmentManager
 from album.core.api.controller.event_manager import IEventManager
 from album.core.api.controller.install_manager import IInstallManager
@@ -119,3 +121,13 @@ class IAlbumController:
     def download_manager(self) -> IDownloadManager:
         """Return the download manager."""
         raise NotImplementedError
+
+    @abstractmethod
+    def disk_usage_manager(self) -> IDiskUsageManager:
+        """Return the disk usage manager."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def bundle_manager(self) -> IBundleManager:
+        """Return the bundle manager."""
+        raise NotImplementedError
@@ -63,6 +63,52 @@ class IDeployManager:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def deploy_many(
+        self,
+        deploy_paths: List[str],
+        catalog_name: str,
+        dry_run: bool,
+        push_options: Optional[List[str]] = None,
+        git_email: str = "",
+        git_name: str = "",
+        force_deploy: bool = False,
+        changelog: str = "",
+        no_conda_lock: bool = False,
+    ) -> None:
+        """Deploy several solutions to a catalog of type direct with a single commit and push.
+
+        The catalog is retrieved and its index loaded once. All solutions are loaded and validated before the
+        catalog is changed, errors are reported for all of them at once. The index is updated in one transaction
+        and the commit is pushed together with the tags of all solutions. Versions of the same solution share their
+        folder in the catalog and have to be deployed one after another.
+
+        Args:
+            deploy_paths:
+                Paths to directories or files. A directory must contain a "solution.py" file.
+            catalog_name:
+                The catalog to deploy to.
+            dry_run:
+                When set, prepares deployment in local src of the catalog, but not adding to the catalog src.
+            push_options:
+                Push options for the catalog repository.
+            git_email:
+                The git email to use. (Default: systems git configuration)
+            git_name:
+                The git user to use. (Default: systems git configuration)
+            force_deploy:
+                Force overwrites existing solutions during deployment.
+            changelog:
+                The change associated with this version of the solutions compared to their last versions.
+            no_conda_lock:
+                Do not create conda lock files for the deployment.
+
+        Raises:
+            RuntimeError listing every solution which cannot be deployed.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def undeploy(
         self,
@@ -0,0 +1,57 @@
+"""Interface accounting the disk space used by album and reclaiming the space of orphans."""
+
+from abc import ABCMeta, abstractmethod
+from typing import Any, Dict, List, Optional
+
+
+class IDiskUsageManager:
+    """Interface accounting the disk space used by album and reclaiming the space of orphans.
+
+    Orphans are links and folders in the album cache not used by a catalog or an installed solution, e.g. left
+    behind by failed installations, manually deleted collections or removed catalogs.
+    """
+
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def get_disk_usage(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """Return the disk space used by environments, packages, installations, downloads and shared resources.
+
+        The "blobs" category only holds the blobs no longer linked from a solution package, removed by album gc. The
+        other blobs share their content with the package files and are counted as packages.
+
+        Args:
+            max_workers:
+                The number of threads scanning concurrently. Defaults to ALBUM_GC_MAX_WORKERS or 8.
+
+        Returns:
+            The name, path and size in bytes of each category ("categories"), the orphans including their size
+            ("orphans") and the size of all categories ("total").
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_orphans(self) -> List[Dict[str, Any]]:
+        """Return the orphans in the album cache, each described by its type and path.
+
+        Links and folders modified more recently than ALBUM_GC_ORPHAN_MIN_AGE seconds are not orphans, these
+        might belong to an installation running concurrently.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def reclaim_orphans(
+        self, orphans: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Remove orphans. Links and registered links are removed, folders are moved into the trash.
+
+        Args:
+            orphans:
+                The orphans to remove. Defaults to all orphans in the album cache.
+
+        Returns:
+            The removed orphans.
+
+        """
+        raise NotImplementedError
@@ -1,6 +1,7 @@
 """Interface for managing environments."""
 
 from abc import ABCMeta, abstractmethod
+from pathlib import Path
 from typing import Any, Dict, List, Mapping, Optional, Union
 
 from album.core.api.model.catalog import ICatalog
@@ -40,6 +41,34 @@ class IEnvironmentManager:
         """Remove an environment."""
         raise NotImplementedError
 
+    @abstractmethod
+    def pack_environment(
+        self,
+        collection_solution: ICollectionSolution,
+        archive: Optional[Union[str, Path]] = None,
+    ) -> Path:
+        """Write a relocatable archive of the environment of an installed solution.
+
+        Args:
+            collection_solution:
+                The installed solution.
+            archive:
+                The archive to write, <environment name>.tar.gz in the working directory by default.
+
+        Returns:
+            The archive.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def unpack_environment(self, archive: Union[str, Path]) -> IEnvironment:
+        """Extract an environment archive written by pack_environment and register the environment.
+
+        Installing the solution of the environment afterwards reuses the environment instead of creating it.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def run_script(
         self,
@@ -1,6 +1,6 @@
 """Interface handling the installation and uninstallation process of a solution."""
 from abc import ABCMeta, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from album.runner.core.api.model.solution import ISolution
 
@@ -25,6 +25,36 @@ class IInstallManager:
         """Install an album solution."""
         raise NotImplementedError
 
+    @abstractmethod
+    def install_many(
+        self,
+        solutions_to_resolve: List[str],
+        allow_recursive: bool = False,
+        argv: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Optional[BaseException]]:
+        """Install several album solutions.
+
+        All solutions and their parents are resolved up front. Parents shared by several solutions are installed
+        once. Solutions are installed after their parents, the environments of solutions not depending on each
+        other are created concurrently. A failing solution does not stop the installation of the others.
+
+        Args:
+            solutions_to_resolve:
+                The path, DOI or group-name-version information of the solutions to install.
+            allow_recursive:
+                Allow album to be installed in the solution environments.
+            argv:
+                Arguments which should be appended to the script calls.
+            max_workers:
+                The number of solutions installed concurrently. Defaults to ALBUM_INSTALL_MAX_WORKERS or 4.
+
+        Returns:
+            The error of each solution or None if it was installed successfully or is already installed.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def uninstall(
         self,
@@ -59,8 +59,21 @@ class IMigrationManager:
         raise NotImplementedError
 
     @abstractmethod
-    def migrate_solution_attrs(self, attrs) -> Dict[str, Any]:
-        """Migrate the solution attributes to the current framework version."""
+    def migrate_solution_attrs(
+        self, attrs, skip_validated: bool = True
+    ) -> Dict[str, Any]:
+        """Migrate the solution attributes to the current framework version.
+
+        Args:
+            attrs:
+                The attributes of the setup call of a solution.
+            skip_validated:
+                Skip the schema validation of attributes already validated successfully in this process.
+
+        Raises:
+            ValidationError when the attributes do not match the solution schema.
+
+        """
         raise NotImplementedError
 
     @abstractmethod
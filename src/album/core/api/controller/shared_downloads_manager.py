@@ -1,6 +1,6 @@
 from abc import ABCMeta, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from album.core.api.model.collection_solution import ICollectionSolution
 
@@ -47,6 +47,23 @@ class IDownloadManager:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def download_resources(self, solution: ICollectionSolution) -> List[Path]:
+        """Download the resources of a solution like download_resources_from_yaml.
+
+        When a download fails, the resources downloaded by this call are removed again and the error is raised.
+
+        Returns:
+            The files downloaded by this call. Resources already present before are not included.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    @abstractmethod
+    def remove_downloads(downloads: List[Path]) -> None:
+        """Remove downloaded resources, e.g. the ones of a failed installation."""
+        raise NotImplementedError
+
     @abstractmethod
     def get_download_paths(
         self, collection_solution: ICollectionSolution
@@ -10,6 +10,21 @@ class IStateManager:
     __metaclass__ = ABCMeta
 
     @abstractmethod
-    def load(self, path) -> ISolution:
-        """Load the state from the given path."""
+    def load(self, path, metadata_only: bool = False) -> ISolution:
+        """Load the state from the given path.
+
+        Args:
+            path:
+                The path of the solution file.
+            metadata_only:
+                When set and the unchanged solution file was loaded before, the solution is created from the cached
+                setup attributes without executing the file. Functions of the solution (e.g. run, install) are not
+                available in this case.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear_metadata_cache(self) -> None:
+        """Remove all cached setup attributes and compiled code of solution files."""
         raise NotImplementedError
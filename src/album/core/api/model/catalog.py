@@ -1,15 +1,19 @@
 """This module contains the interface for the Catalog class."""
+
 from abc import ABCMeta, abstractmethod
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Generator, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Union
 
 from album.runner.core.api.model.coordinates import ICoordinates
 from album.runner.core.api.model.solution import ISolution
-from git import Repo
 
 from album.core.api.model.catalog_index import ICatalogIndex
 
+if TYPE_CHECKING:
+    # importing git is slow, it is only needed when a catalog repository gets retrieved
+    from git import Repo
+
 
 class ICatalog:
     """Interface representing a Catalog.
@@ -40,6 +44,11 @@ class ICatalog:
         """Get the source of the catalog. Gitlab/github link or path."""
         raise NotImplementedError
 
+    @abstractmethod
+    def index_url(self) -> Optional[str]:
+        """Get the raw file url serving the index files of the catalog, if the catalog provides one."""
+        raise NotImplementedError
+
     @abstractmethod
     def version(self) -> str:
         """Get the version of the catalog."""
@@ -120,18 +129,54 @@ class ICatalog:
         """Add a solution to the catalog."""
         raise NotImplementedError
 
+    @abstractmethod
+    def add_all(
+        self, active_solutions: List[ISolution], force_overwrite: bool = False
+    ) -> None:
+        """Add several solutions to the catalog in one index transaction.
+
+        All solutions are validated first. Nothing is added if any of them cannot be added.
+
+        Raises:
+            RuntimeError listing every solution which cannot be added.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def remove(self, coordinates: ICoordinates) -> None:
         """Remove a solution from the catalog."""
         raise NotImplementedError
 
+    @abstractmethod
+    def export_index_transport(
+        self, path: Path, changes: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Path]:
+        """Write the files serving the index via http to a checkout of the catalog.
+
+        Only done for catalogs announcing an index url in their meta file. Increases the revision in the meta file,
+        writes the delta file of the revision and the compressed copy of the index.
+
+        Args:
+            path:
+                The working tree of the catalog repository.
+            changes:
+                The solution changes of the revision. Defaults to all changes made via add and remove since the
+                last export.
+
+        Returns:
+            The files and folders to commit, empty if the catalog does not serve its index via http.
+
+        """
+        raise NotImplementedError
+
     @contextmanager
     def retrieve_catalog(
         self,
         path: Union[Path, None] = None,
         force_retrieve: bool = False,
         update: bool = True,
-    ) -> Generator[Repo, None, None]:
+    ) -> Generator["Repo", None, None]:
         """Retrieve the catalog."""
         yield
         raise NotImplementedError
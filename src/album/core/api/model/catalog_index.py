@@ -1,4 +1,5 @@
 """This module contains the interface for the Catalog Index class."""
+
 from abc import ABCMeta, abstractmethod
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
@@ -129,6 +130,20 @@ class ICatalogIndex(IDatabase):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def apply_changes(self, changes: List[Dict[str, Any]], close: bool = True) -> None:
+        """Apply solution changes published by a catalog to the index.
+
+        Args:
+            close:
+                if specified closes the connection after execution
+            changes:
+                The changes in the order they were made. Each change holds its "change_type". Removals hold
+                the group, name and version of the solution, all other changes the full "solution" attributes.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def save(self):
         """Save the index database to disk."""
@@ -251,3 +251,23 @@ class ICollectionIndex(IDatabase):
     def remove_parent(self, collection_id, close=True):
         """Remove a parent collection."""
         raise NotImplementedError
+
+    @abstractmethod
+    def get_link_target(self, link: str, close: bool = True) -> Optional[str]:
+        """Return the registered target of a link in the lnk folder or None if the link is not registered."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_all_links(self, close: bool = True) -> Dict[str, str]:
+        """Return the registered targets of all links in the lnk folder by link."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_link_target(self, link: str, target: str, close: bool = True) -> None:
+        """Register the target of a link in the lnk folder."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove_link(self, link: str, close: bool = True) -> None:
+        """Remove a link from the registered links."""
+        raise NotImplementedError
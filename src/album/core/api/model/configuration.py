@@ -1,7 +1,8 @@
 """Configuration of the album framework installation instance."""
+
 from abc import ABCMeta, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from album.runner.core.api.model.coordinates import ICoordinates
 
@@ -26,7 +27,39 @@ class IConfiguration:
 
     @abstractmethod
     def tmp_path(self) -> Path:
-        """Get the path for solution unspecific temporary files of album."""
+        """Get the path for solution unspecific temporary files of album, owned by the running process."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clean_tmp(self, max_age: Optional[int] = None) -> List[Path]:
+        """Remove temporary files of album processes no longer running.
+
+        Args:
+            max_age:
+                The time in seconds since the last modification before temporary files are removed.
+                (Default: DefaultValues.tmp_max_age)
+
+        Returns:
+            The removed entries.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def empty_trash(self, max_workers: int = 1) -> List[Path]:
+        """Delete environments and installations moved to the trash folder when they were removed.
+
+        Waits for the deletion of the trash started in the background by setup, the entries it deleted are part of
+        the result.
+
+        Args:
+            max_workers:
+                The number of threads deleting concurrently.
+
+        Returns:
+            The deleted entries.
+
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -49,14 +82,49 @@ class IConfiguration:
         """Path for shared resources."""
         raise NotImplementedError
 
+    @abstractmethod
+    def blob_path(self) -> Path:
+        """Path of the content addressed store of files materialized in solution packages via hardlinks."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def solution_metadata_cache_path(self) -> Path:
+        """Path of the cached setup attributes and compiled code of loaded solution files."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def doi_cache_path(self) -> Path:
+        """Path of the persistent cache of solutions downloaded via DOI."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def environment_fingerprints_path(self) -> Path:
+        """Path of the registry of environments shared by solutions with identical dependencies."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def trash_path(self) -> Path:
+        """Get the path removed environments and installations are moved to until they get deleted."""
+        raise NotImplementedError
+
     @abstractmethod
     def is_setup(self) -> bool:
         """Check if configuration was already performed."""
         raise NotImplementedError
 
     @abstractmethod
-    def setup(self, base_cache_path: Union[None, str, Path] = None) -> None:
-        """Set up the configuration."""
+    def setup(
+        self, base_cache_path: Union[None, str, Path] = None, clean_trash: bool = True
+    ) -> None:
+        """Set up the configuration.
+
+        Args:
+            base_cache_path:
+                The folder album stores everything in. (Default: DefaultValues.app_data_dir)
+            clean_trash:
+                Resume deleting the trash folder in the background.
+
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -1,12 +1,14 @@
 from pathlib import Path
 from typing import Optional, Union
 
+from album.core.api.controller.bundle_manager import IBundleManager
 from album.core.api.controller.clone_manager import ICloneManager
 from album.core.api.controller.collection.catalog_handler import ICatalogHandler
 from album.core.api.controller.collection.collection_manager import ICollectionManager
 from album.core.api.controller.collection.solution_handler import ISolutionHandler
 from album.core.api.controller.controller import IAlbumController
 from album.core.api.controller.deploy_manager import IDeployManager
+from album.core.api.controller.disk_usage_manager import IDiskUsageManager
 from album.core.api.controller.environment_manager import IEnvironmentManager
 from album.core.api.controller.event_manager import IEventManager
 from album.core.api.controller.install_manager import IInstallManager
@@ -20,27 +22,17 @@ from album.core.api.controller.state_manager import IStateManager
 from album.core.api.controller.task_manager import ITaskManager
 from album.core.api.controller.test_manager import ITestManager
 from album.core.api.model.configuration import IConfiguration
-from album.core.controller.clone_manager import CloneManager
-from album.core.controller.collection.collection_manager import CollectionManager
-from album.core.controller.deploy_manager import DeployManager
-from album.core.controller.environment_manager import EnvironmentManager
-from album.core.controller.event_manager import EventManager
-from album.core.controller.install_manager import InstallManager
-from album.core.controller.migration_manager import MigrationManager
-from album.core.controller.resource_manager import ResourceManager
-from album.core.controller.run_manager import RunManager
-from album.core.controller.script_manager import ScriptManager
-from album.core.controller.search_manager import SearchManager
-from album.core.controller.shared_downloads_manager import DownloadManager
-from album.core.controller.state_manager import StateManager
-from album.core.controller.task_manager import TaskManager
-from album.core.controller.test_manager import TestManager
-from album.core.model.configuration import Configuration
+from album.core.utils.profiling import span
 
 
 class AlbumController(IAlbumController):
-    def __init__(self, base_cache_path: Optional[Union[Path, str]] = None) -> None:
+    def __init__(
+        self,
+        base_cache_path: Optional[Union[Path, str]] = None,
+        clean_trash: bool = True,
+    ) -> None:
         self.base_cache_path = base_cache_path
+        self.clean_trash = clean_trash
         self._deploy_manager: Optional[IDeployManager] = None
         self._run_manager: Optional[IRunManager] = None
         self._install_manager: Optional[IInstallManager] = None
@@ -57,6 +49,8 @@ class AlbumController(IAlbumController):
         self._configuration: Optional[IConfiguration] = None
         self._resource_manager: Optional[IResourceManager] = None
         self._download_manager: Optional[IDownloadManager] = None
+        self._disk_usage_manager: Optional[IDiskUsageManager] = None
+        self._bundle_manager: Optional[IBundleManager] = None
 
     def catalogs(self) -> ICatalogHandler:
         return self.collection_manager().catalogs()
@@ -66,77 +60,112 @@ class AlbumController(IAlbumController):
 
     def configuration(self) -> IConfiguration:
         if not self._configuration:
-            self._configuration = Configuration()
-            self._configuration.setup(base_cache_path=self.base_cache_path)
+            from album.core.model.configuration import Configuration
+
+            with span("configuration setup"):
+                self._configuration = Configuration()
+                self._configuration.setup(
+                    base_cache_path=self.base_cache_path, clean_trash=self.clean_trash
+                )
         return self._configuration
 
     def environment_manager(self) -> IEnvironmentManager:
         if not self._environment_manager:
+            from album.core.controller.environment_manager import EnvironmentManager
+
             self._environment_manager = EnvironmentManager(self)
         return self._environment_manager
 
     def migration_manager(self) -> IMigrationManager:
         if not self._migration_manager:
+            from album.core.controller.migration_manager import MigrationManager
+
             self._migration_manager = MigrationManager(self)
         return self._migration_manager
 
     def script_manager(self) -> IScriptManager:
         if not self._script_manager:
+            from album.core.controller.script_manager import ScriptManager
+
             self._script_manager = ScriptManager(self)
         return self._script_manager
 
     def deploy_manager(self) -> IDeployManager:
         if not self._deploy_manager:
+            from album.core.controller.deploy_manager import DeployManager
+
             self._deploy_manager = DeployManager(self)
         return self._deploy_manager
 
     def install_manager(self) -> IInstallManager:
         if not self._install_manager:
+            from album.core.controller.install_manager import InstallManager
+
             self._install_manager = InstallManager(self)
         return self._install_manager
 
     def run_manager(self) -> IRunManager:
         if not self._run_manager:
+            from album.core.controller.run_manager import RunManager
+
             self._run_manager = RunManager(self)
         return self._run_manager
 
     def test_manager(self) -> ITestManager:
         if not self._test_manager:
+            from album.core.controller.test_manager import TestManager
+
             self._test_manager = TestManager(self)
         return self._test_manager
 
     def search_manager(self) -> ISearchManager:
         if not self._search_manager:
+            from album.core.controller.search_manager import SearchManager
+
             self._search_manager = SearchManager(self)
         return self._search_manager
 
     def clone_manager(self) -> ICloneManager:
         if not self._clone_manager:
+            from album.core.controller.clone_manager import CloneManager
+
             self._clone_manager = CloneManager(self)
         return self._clone_manager
 
     def state_manager(self) -> IStateManager:
         if not self._state_manager:
+            from album.core.controller.state_manager import StateManager
+
             self._state_manager = StateManager(self)
         return self._state_manager
 
     def collection_manager(self) -> ICollectionManager:
         if not self._collection_manager:
+            from album.core.controller.collection.collection_manager import (
+                CollectionManager,
+            )
+
             self._collection_manager = CollectionManager(self)
         return self._collection_manager
 
     def event_manager(self) -> IEventManager:
         if not self._event_manager:
+            from album.core.controller.event_manager import EventManager
+
             self._event_manager = EventManager()
         return self._event_manager
 
     def task_manager(self) -> ITaskManager:
         if not self._task_manager:
+            from album.core.controller.task_manager import TaskManager
+
             self._task_manager = TaskManager()
         return self._task_manager
 
     def resource_manager(self) -> IResourceManager:
         if not self._resource_manager:
+            from album.core.controller.resource_manager import ResourceManager
+
             self._resource_manager = ResourceManager(self)
         return self._resource_manager
 
@@ -146,5 +175,21 @@ class AlbumController(IAlbumController):
 
     def download_manager(self) -> IDownloadManager:
         if not self._download_manager:
+            from album.core.controller.shared_downloads_manager import DownloadManager
+
             self._download_manager = DownloadManager(self)
         return self._download_manager
+
+    def disk_usage_manager(self) -> IDiskUsageManager:
+        if not self._disk_usage_manager:
+            from album.core.controller.disk_usage_manager import DiskUsageManager
+
+            self._disk_usage_manager = DiskUsageManager(self)
+        return self._disk_usage_manager
+
+    def bundle_manager(self) -> IBundleManager:
+        if not self._bundle_manager:
+            from album.core.controller.bundle_manager import BundleManager
+
+            self._bundle_manager = BundleManager(self)
+        return self._bundle_manager
@@ -0,0 +1,238 @@
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path, PurePosixPath
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, List, Optional, Union
+
+from album.core import __version__ as album_version
+from album.core.api.controller.bundle_manager import IBundleManager
+from album.core.api.controller.controller import IAlbumController
+from album.core.api.model.catalog import ICatalog
+from album.core.model.default_values import DefaultValues
+from album.core.utils.operations.blob_operations import link_folder_from_blobs
+from album.core.utils.operations.bundle_operations import (
+    BUNDLE_CATALOGS_FOLDER,
+    BUNDLE_ENVIRONMENTS_FOLDER,
+    BUNDLE_RESOURCES_FOLDER,
+    read_bundle,
+    write_bundle,
+)
+from album.core.utils.operations.file_operations import (
+    create_path_recursively,
+    force_remove,
+    get_link_target,
+)
+from album.core.utils.operations.resolve_operations import dict_to_coordinates
+from album.runner import album_logging
+
+module_logger = album_logging.get_active_logger
+
+
+class BundleManager(IBundleManager):
+    def __init__(self, album: IAlbumController):
+        self.album = album
+
+    def create_bundle(
+        self,
+        archive: Union[str, Path],
+        catalog_names: Optional[List[str]] = None,
+        environments: bool = False,
+        resources: bool = False,
+    ) -> Dict[str, Any]:
+        if catalog_names:
+            catalogs = [self.album.catalogs().get_by_name(n) for n in catalog_names]
+        else:
+            catalogs = [c for c in self.album.catalogs().get_all() if not c.is_cache()]
+        for catalog in catalogs:
+            if catalog.is_cache():
+                raise ValueError("Cannot bundle the cache catalog %s!" % catalog.name())
+
+        files: Dict[str, Union[str, Path]] = {}
+        manifest_catalogs = []
+        manifest_environments: List[Dict[str, str]] = []
+        with TemporaryDirectory(dir=self.album.configuration().tmp_path()) as tmp_dir:
+            for catalog in catalogs:
+                module_logger().info("Bundling catalog %s..." % catalog.name())
+                manifest_catalogs.append(self._add_catalog(catalog, files, resources))
+                if environments:
+                    manifest_environments += self._add_environments(
+                        catalog, files, Path(tmp_dir)
+                    )
+
+            module_logger().info("Writing %s files to %s..." % (len(files), archive))
+            return write_bundle(
+                archive,
+                files,
+                {
+                    "created": datetime.now().isoformat(),
+                    "album_version": album_version,
+                    "catalogs": manifest_catalogs,
+                    "environments": manifest_environments,
+                },
+            )
+
+    def _add_catalog(
+        self, catalog: ICatalog, files: Dict[str, Union[str, Path]], resources: bool
+    ) -> Dict[str, Any]:
+        if not catalog.index_file_path().is_file():
+            raise RuntimeError(
+                "Index of catalog %s not available, update the catalog first!"
+                % catalog.name()
+            )
+        folder = PurePosixPath(BUNDLE_CATALOGS_FOLDER, catalog.name())
+        files[str(folder / catalog.index_file_path().name)] = catalog.index_file_path()
+        files[str(folder / catalog.get_meta_file_path().name)] = (
+            catalog.get_meta_file_path()
+        )
+
+        # packages not downloaded yet are not part of the bundle
+        solutions = []
+        collection_index = self.album.collection_manager().get_collection_index()
+        for solution in collection_index.get_solutions_by_catalog(catalog.catalog_id()):
+            coordinates = dict_to_coordinates(solution.setup())
+            suffix = self.album.configuration().get_solution_path_suffix(coordinates)
+            package = get_link_target(catalog.path().joinpath(suffix))
+            solution_file = DefaultValues.solution_default_name.value
+            if package is None or not package.joinpath(solution_file).is_file():
+                continue
+            _add_folder(files, package, folder / suffix.as_posix())
+            solutions.append(
+                {
+                    "group": coordinates.group(),
+                    "name": coordinates.name(),
+                    "version": coordinates.version(),
+                }
+            )
+
+        if resources:
+            _add_folder(
+                files,
+                self.album.configuration()
+                .shared_resources_path()
+                .joinpath(catalog.name()),
+                PurePosixPath(BUNDLE_RESOURCES_FOLDER, catalog.name()),
+            )
+
+        return {
+            "name": catalog.name(),
+            "src": str(catalog.src()),
+            "branch_name": catalog.branch_name(),
+            "type": catalog.type(),
+            "solutions": solutions,
+        }
+
+    def _add_environments(
+        self, catalog: ICatalog, files: Dict[str, Union[str, Path]], tmp_dir: Path
+    ) -> List[Dict[str, str]]:
+        environment_manager = self.album.environment_manager()
+        collection_manager = self.album.collection_manager()
+        collection_index = collection_manager.get_collection_index()
+        environments = []
+        for solution in collection_index.get_all_installed_solutions_by_catalog(
+            catalog.catalog_id()
+        ):
+            if solution.internal()["parent"]:
+                # runs in the environment of its parent
+                continue
+            coordinates = dict_to_coordinates(solution.setup())
+            env_name = environment_manager.get_environment_name(coordinates, catalog)
+            name = "%s/%s.tar" % (BUNDLE_ENVIRONMENTS_FOLDER, env_name)
+            try:
+                collection_solution = collection_manager.resolve_installed_and_load(
+                    "%s:%s" % (catalog.name(), coordinates)
+                )
+                files[name] = environment_manager.pack_environment(
+                    collection_solution, tmp_dir.joinpath(env_name + ".tar")
+                )
+            except LookupError as e:
+                module_logger().warning(
+                    "Cannot bundle environment %s, skipping it: %s" % (env_name, e)
+                )
+                continue
+            environments.append({"name": env_name, "file": name})
+        return environments
+
+    def import_bundle(self, archive: Union[str, Path]) -> Dict[str, Any]:
+        configuration = self.album.configuration()
+        res: Dict[str, Any] = {
+            "catalogs": [],
+            "solutions": 0,
+            "environments": [],
+            "resources": 0,
+        }
+        with TemporaryDirectory(dir=configuration.tmp_path()) as tmp_dir:
+            bundle = Path(tmp_dir)
+            module_logger().info("Reading bundle %s..." % archive)
+            manifest = read_bundle(archive, bundle)
+
+            for catalog_entry in manifest["catalogs"]:
+                folder = bundle.joinpath(BUNDLE_CATALOGS_FOLDER, catalog_entry["name"])
+                catalog = self.album.catalogs().add_by_index(
+                    catalog_entry["src"],
+                    folder.joinpath(DefaultValues.catalog_index_file_name.value),
+                    folder.joinpath(DefaultValues.catalog_index_metafile_json.value),
+                    catalog_entry["branch_name"],
+                )
+                res["catalogs"].append(catalog.name())
+
+                for solution in catalog_entry["solutions"]:
+                    coordinates = dict_to_coordinates(solution)
+                    package = self.album.solutions().get_solution_package_path(
+                        catalog, coordinates
+                    )
+                    for f in os.listdir(str(package)):
+                        force_remove(package.joinpath(f))
+                    link_folder_from_blobs(
+                        configuration.blob_path(),
+                        folder.joinpath(
+                            configuration.get_solution_path_suffix(coordinates)
+                        ),
+                        package,
+                    )
+                    res["solutions"] += 1
+
+                res["resources"] += _move_folder(
+                    bundle.joinpath(BUNDLE_RESOURCES_FOLDER, catalog.name()),
+                    configuration.shared_resources_path().joinpath(catalog.name()),
+                )
+
+            for environment in manifest["environments"]:
+                try:
+                    self.album.environment_manager().unpack_environment(
+                        bundle.joinpath(environment["file"])
+                    )
+                except RuntimeError as e:
+                    module_logger().warning(
+                        "Cannot import environment %s, skipping it: %s"
+                        % (environment["name"], e)
+                    )
+                    continue
+                res["environments"].append(environment["name"])
+
+        return res
+
+
+def _add_folder(
+    files: Dict[str, Union[str, Path]], folder: Path, name: PurePosixPath
+) -> None:
+    """Add the files of a folder to the files of a bundle. Links are not followed."""
+    for root, _, file_names in os.walk(folder):
+        for file_name in file_names:
+            file = Path(root, file_name)
+            if file.is_symlink():
+                continue
+            files[str(name / file.relative_to(folder).as_posix())] = file
+
+
+def _move_folder(folder: Path, target: Path) -> int:
+    """Move the files of a folder into the target folder, replacing existing files. Returns the number of files."""
+    moved = 0
+    for root, _, file_names in os.walk(folder):
+        for file_name in file_names:
+            file = Path(root, file_name)
+            target_file = target.joinpath(file.relative_to(folder))
+            create_path_recursively(target_file.parent)
+            shutil.move(str(file), str(target_file))
+            moved += 1
+    return moved
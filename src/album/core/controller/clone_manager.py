@@ -12,12 +12,12 @@ from album.core.api.controller.clone_manager import ICloneManager
 from album.core.api.controller.controller import IAlbumController
 from album.core.model.default_values import DefaultValues
 from album.core.utils.operations import url_operations
+from album.core.utils.operations.extraction_operations import extract_archive_cached
 from album.core.utils.operations.file_operations import (
     create_path_recursively,
     force_remove,
     get_dict_from_json,
     list_files_recursively,
-    unzip_archive,
 )
 from album.core.utils.operations.git_operations import (
     add_files_commit_and_push,
@@ -92,8 +92,10 @@ class CloneManager(ICloneManager):
                 .cache_path_download()
                 .joinpath(template_name + ".zip")
             )
-            download_unzip_target = (
-                self.album.configuration().cache_path_download().joinpath(template_name)
+            extraction_cache = (
+                self.album.configuration()
+                .cache_path_download()
+                .joinpath(DefaultValues.cache_path_extraction_prefix.value)
             )
 
             download_resource(template_url, download_zip_target)
@@ -102,7 +104,9 @@ class CloneManager(ICloneManager):
                 % (template_url, download_zip_target)
             )
 
-            unzip_archive(download_zip_target, download_unzip_target)
+            download_unzip_target = extract_archive_cached(
+                download_zip_target, extraction_cache
+            )
             download_unzip_target_subdir = download_unzip_target.joinpath(
                 f"{template_name}-main"
             )
@@ -1,9 +1,9 @@
 """Implementation of the ICatalogHandler interface."""
+
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Any, Dict, List, Optional
 
-import validators
 from album.environments.utils.file_operations import copy
 from album.runner import album_logging
 
@@ -20,6 +20,7 @@ from album.core.model.catalog import Catalog, retrieve_index_files_from_src
 from album.core.model.catalog_updates import CatalogUpdates, SolutionChange
 from album.core.model.default_values import DefaultValues
 from album.core.model.mmversion import MMVersion
+from album.core.utils.operations.blob_operations import prune_blobs
 from album.core.utils.operations.dict_operations import str_to_dict
 from album.core.utils.operations.file_operations import force_remove, get_dict_from_json
 from album.core.utils.operations.resolve_operations import dict_to_coordinates
@@ -58,6 +59,8 @@ class CatalogHandler(ICatalogHandler):
             ).dispose()
 
     def add_by_src(self, source: str, branch_name: str = "main") -> ICatalog:
+        import validators
+
         # source can be path or url
         source = str(source)
         if not validators.url(source):
@@ -104,6 +107,92 @@ class CatalogHandler(ICatalogHandler):
 
         return catalog
 
+    def add_by_index(
+        self,
+        source: str,
+        index_file: Path,
+        meta_file: Path,
+        branch_name: str = "main",
+    ) -> ICatalog:
+        catalog_meta_information = get_dict_from_json(meta_file)
+        catalog_dict = self._get_collection_index().get_catalog_by_name(
+            catalog_meta_information["name"]
+        )
+        if catalog_dict:
+            if catalog_dict["src"] != source:
+                raise RuntimeError(
+                    'Catalog "%s" already exists with source %s!'
+                    % (catalog_meta_information["name"], catalog_dict["src"])
+                )
+            catalog = self._as_catalog(catalog_dict)
+        else:
+            catalog = self._create_catalog_from_src(
+                source, catalog_meta_information, branch_name
+            )
+
+        self._create_catalog_cache_if_missing(catalog)
+        catalog.dispose()
+        copy(meta_file, catalog.get_meta_file_path())
+        copy(index_file, catalog.index_file_path())
+        self.album.migration_manager().migrate_catalog_index_db(
+            catalog.index_file_path(),
+            MMVersion.from_string(catalog_meta_information["version"]),
+            MMVersion.from_string(DefaultValues.catalog_index_db_version.value),
+        )
+        catalog.load_index()
+        self.set_version(catalog)
+
+        if catalog_dict:
+            # keep the installation state of the solutions already in the collection
+            self._update_collection_from_index(catalog)
+        else:
+            self._add_to_index_with_solutions(catalog)
+        module_logger().info("Added catalog %s from its index!" % catalog.name())
+        return catalog
+
+    def _add_to_index_with_solutions(self, catalog: ICatalog) -> None:
+        index = catalog.index()
+        if index is None:
+            raise RuntimeError("Catalog %s not loaded!" % catalog.name())
+        collection_index = self._get_collection_index()
+        try:
+            catalog_id = collection_index.insert_catalog(
+                catalog.name(),
+                str(catalog.src()),
+                str(catalog.path()),
+                catalog.is_deletable(),
+                catalog.branch_name(),
+                catalog.type(),
+                close=False,
+            )
+            for solution_attrs in index.get_all_solutions():
+                collection_index.insert_solution(
+                    catalog_id, solution_attrs, close=False
+                )
+        except Exception:
+            collection_index.close_current_connection(commit=False)
+            raise
+        collection_index.close_current_connection()
+        catalog.set_catalog_id(catalog_id)
+        self.album.collection_manager().invalidate_resolve_cache()
+
+    def _update_collection_from_index(self, catalog: ICatalog) -> ICatalogUpdates:
+        index = catalog.index()
+        if index is None:
+            raise RuntimeError("Catalog %s not loaded!" % catalog.name())
+        divergence = CatalogUpdates(
+            catalog,
+            solution_changes=self._compare_solutions(
+                self._get_collection_index().get_solutions_by_catalog(
+                    catalog.catalog_id()
+                ),
+                index.get_all_solutions(),
+            ),
+        )
+        for change in divergence.solution_changes():
+            self.album.solutions().apply_change(catalog, change, False)
+        return divergence
+
     def _add_to_index(self, catalog: ICatalog) -> int:
         catalog_id = self._get_collection_index().insert_catalog(
             catalog.name(),
@@ -114,6 +203,7 @@ class CatalogHandler(ICatalogHandler):
             catalog.type(),
         )
         catalog.set_catalog_id(catalog_id)
+        self.album.collection_manager().invalidate_resolve_cache()
         return catalog.catalog_id()
 
     def get_by_id(self, catalog_id: int) -> ICatalog:
@@ -267,6 +357,7 @@ class CatalogHandler(ICatalogHandler):
             )
 
         self._get_collection_index().remove_catalog(catalog_to_remove.catalog_id())
+        self.album.collection_manager().invalidate_resolve_cache()
 
         # get cache path
         cache_path = (
@@ -276,6 +367,8 @@ class CatalogHandler(ICatalogHandler):
         )
         force_remove(cache_path)
         force_remove(catalog_to_remove.path())
+        # release the content of the removed solution packages
+        prune_blobs(self.album.configuration().blob_path())
 
         catalog_to_remove.dispose()
 
@@ -312,6 +405,8 @@ class CatalogHandler(ICatalogHandler):
         return catalog_to_remove
 
     def remove_from_collection_by_src(self, src: str) -> Optional[ICatalog]:
+        import validators
+
         if not validators.url(str(src)):
             if Path(src).exists():
                 src = str(Path(src).resolve())
@@ -1,6 +1,8 @@
+import os
 import shutil
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, ContextManager, Dict, List, Optional, Tuple
 
 from album.core.api.controller.collection.catalog_handler import ICatalogHandler
 from album.core.api.controller.collection.collection_manager import ICollectionManager
@@ -15,7 +17,11 @@ from album.core.model.collection_index import CollectionIndex
 from album.core.model.default_values import DefaultValues
 from album.core.model.mmversion import MMVersion
 from album.core.model.resolve_result import ResolveResult
-from album.core.utils.operations.file_operations import write_dict_to_json
+from album.core.utils.operations.file_operations import (
+    construct_cache_link_target,
+    get_link_target,
+    write_dict_to_json,
+)
 from album.core.utils.operations.resolve_operations import (
     check_doi,
     check_file_or_url,
@@ -23,6 +29,7 @@ from album.core.utils.operations.resolve_operations import (
     get_attributes_from_string,
     get_doi_from_input,
 )
+from album.core.utils.profiling import profiled
 from album.runner import album_logging
 from album.runner.core.api.model.coordinates import ICoordinates
 
@@ -36,6 +43,12 @@ class CollectionManager(ICollectionManager):
         self.catalog_handler = CatalogHandler(self.album)
         self.catalog_collection: Optional[ICollectionIndex] = None
         self.collection_loaded = False
+        # memoized resolve results of the current collection generation and whether they got loaded completely
+        self._resolve_generation = 0
+        self._resolve_memo: Dict[Tuple[Any, ...], ICollectionSolution] = {}
+        self._resolve_memo_loaded: Dict[Tuple[Any, ...], bool] = {}
+        # reentrant, registering links happens within the writes of concurrent installations
+        self._write_lock = threading.RLock()
 
     def __del__(self):
         self.close()
@@ -51,12 +64,71 @@ class CollectionManager(ICollectionManager):
             self.catalog_collection.close()
             self.catalog_collection = None
         self.collection_loaded = False
+        self.invalidate_resolve_cache()
+
+    def invalidate_resolve_cache(self) -> None:
+        self._resolve_generation += 1
+        self._resolve_memo = {}
+        self._resolve_memo_loaded = {}
 
     def get_collection_index(self) -> ICollectionIndex:
         if self.catalog_collection is None:
             raise LookupError("No collection loaded! Aborting...")
         return self.catalog_collection
 
+    def write_lock(self) -> ContextManager[Any]:
+        return self._write_lock
+
+    def get_link_target(
+        self, point_from: Path, point_to: Path, create: bool = True
+    ) -> Path:
+        link = os.path.normpath(point_from)
+        target = None
+        if self.catalog_collection is not None:
+            target = self.catalog_collection.get_link_target(link)
+            if target is not None and self._is_link_valid(link, target):
+                return Path(target)
+
+        target_path = construct_cache_link_target(
+            self.album.configuration().lnk_path(),
+            point_from=Path(point_from),
+            point_to=point_to,
+            create=create,
+        )
+        if target_path is None or target_path == Path(""):
+            if target is not None:
+                self.unregister_link(point_from)
+            return Path("")
+        if str(target_path) != target:
+            self.register_link(point_from, target_path)
+        return target_path
+
+    def register_link(self, point_from: Path, target: Path) -> None:
+        if self.catalog_collection is not None:
+            with self._write_lock:
+                self.catalog_collection.set_link_target(
+                    os.path.normpath(point_from), str(target)
+                )
+
+    def unregister_link(self, point_from: Path) -> None:
+        if self.catalog_collection is not None:
+            with self._write_lock:
+                self.catalog_collection.remove_link(os.path.normpath(point_from))
+
+    @staticmethod
+    def _is_link_valid(link: str, target: str) -> bool:
+        """Check whether a registered link still exists and points to the registered, existing folder.
+
+        Link destinations are reused, a link pointing elsewhere must not hand out the folder of another link.
+        """
+        target_path = get_link_target(link)
+        return (
+            target_path is not None
+            and target_path.is_dir()
+            and target_path == Path(target).resolve()
+        )
+
+    @profiled("collection load")
     def load_or_create(self) -> None:
         if self.collection_loaded:
             module_logger().warning(
@@ -171,19 +243,34 @@ class CollectionManager(ICollectionManager):
     def resolve_installed_and_load(self, resolve_solution: str) -> ICollectionSolution:
         resolve_result = self.resolve_installed(resolve_solution)
 
+        key = self._get_resolve_memo_key(resolve_solution)
+        if self._resolve_memo_loaded.get(key, None) is True:
+            return resolve_result
+
         loaded_solution = self.album.state_manager().load(resolve_result.path())
         self.solution_handler.set_cache_paths(loaded_solution, resolve_result.catalog())
 
         resolve_result.set_loaded_solution(loaded_solution)
+        self._resolve_memo_loaded[key] = True
 
         return resolve_result
 
-    def resolve_and_load(self, resolve_solution: str) -> ICollectionSolution:
+    def resolve_and_load(
+        self, resolve_solution: str, metadata_only: bool = False
+    ) -> ICollectionSolution:
         resolve_result = self._resolve(resolve_solution)
-        self.retrieve_and_load_resolve_result(resolve_result)
+
+        # a completely loaded solution also serves requests for its metadata
+        key = self._get_resolve_memo_key(resolve_solution)
+        loaded = self._resolve_memo_loaded.get(key, None)
+        if loaded is True or (loaded is False and metadata_only):
+            return resolve_result
+
+        self.retrieve_and_load_resolve_result(resolve_result, metadata_only)
         self.solution_handler.set_cache_paths(
             resolve_result.loaded_solution(), resolve_result.catalog()
         )
+        self._resolve_memo_loaded[key] = not metadata_only
 
         return resolve_result
 
@@ -254,6 +341,27 @@ class CollectionManager(ICollectionManager):
     def _resolve(self, str_input: str) -> ICollectionSolution:
         str_input = str(str_input)
 
+        key = self._get_resolve_memo_key(str_input)
+        resolve_result = self._resolve_memo.get(key, None)
+        if resolve_result is None:
+            resolve_result = self._resolve_uncached(str_input)
+            self._resolve_memo[key] = resolve_result
+        return resolve_result
+
+    def _get_resolve_memo_key(self, str_input: str) -> Tuple[Any, ...]:
+        """Return the memo key of an input. Local solution files are only reused as long as they do not change."""
+        str_input = str(str_input)
+        path = Path(str_input)
+        try:
+            if path.is_dir():
+                path = path.joinpath(DefaultValues.solution_default_name.value)
+            stat = path.stat()
+        except (OSError, ValueError):
+            return str_input, self._resolve_generation
+        return str_input, self._resolve_generation, stat.st_size, stat.st_mtime_ns
+
+    @profiled("resolve")
+    def _resolve_uncached(self, str_input: str) -> ICollectionSolution:
         # A single-file solution is when the user points directly at a .py
         # file (not a zip, directory, URL, or DOI).  Only single files may
         # have an arbitrary name; inside a folder / zip the file is always
@@ -293,7 +401,11 @@ class CollectionManager(ICollectionManager):
                 else:
                     # download DOI — check_doi / prepare_path returns the
                     # path to solution.py inside the unzipped Zenodo archive
-                    path = check_doi(doi["doi"], self.album.configuration().tmp_path())
+                    path = check_doi(
+                        doi["doi"],
+                        self.album.configuration().tmp_path(),
+                        self.album.configuration().doi_cache_path(),
+                    )
                     catalog = self.album.catalogs().get_cache_catalog()
             else:  # case no doi
                 solution_entry = self._search(str_input)
@@ -340,7 +452,7 @@ class CollectionManager(ICollectionManager):
     def _search_for_local_file(
         self, path: Path
     ) -> Optional[ICollectionIndex.ICollectionSolution]:
-        active_solution = self.album.state_manager().load(path)
+        active_solution = self.album.state_manager().load(path, metadata_only=True)
 
         if self.catalog_collection is None:
             raise LookupError("No collection loaded! Aborting...")
@@ -451,7 +563,7 @@ class CollectionManager(ICollectionManager):
         return solution_entries
 
     def retrieve_and_load_resolve_result(
-        self, resolve_result: ICollectionSolution
+        self, resolve_result: ICollectionSolution, metadata_only: bool = False
     ) -> None:
         db_entry = resolve_result.database_entry()
 
@@ -464,7 +576,7 @@ class CollectionManager(ICollectionManager):
                 dict_to_coordinates(db_entry.setup()),
             )
         resolve_result.set_loaded_solution(
-            self.album.state_manager().load(resolve_result.path())
+            self.album.state_manager().load(resolve_result.path(), metadata_only)
         )
         resolve_result.set_coordinates(resolve_result.loaded_solution().coordinates())
 
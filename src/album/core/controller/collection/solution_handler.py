@@ -4,7 +4,6 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Dict, Optional
 
-from album.environments.utils.file_operations import copy, copy_folder
 from album.runner import album_logging
 from album.runner.core.api.model.coordinates import ICoordinates
 from album.runner.core.api.model.solution import ISolution
@@ -18,14 +17,11 @@ from album.core.api.model.collection_solution import ICollectionSolution
 from album.core.model.collection_index import CollectionIndex
 from album.core.model.default_values import DefaultValues
 from album.core.model.link import Link
-from album.core.utils.operations.file_operations import (
-    construct_cache_link_target,
-    force_remove,
-)
-from album.core.utils.operations.git_operations import (
-    checkout_files,
-    clone_repository_sparse,
+from album.core.utils.operations.blob_operations import (
+    link_file_from_blob,
+    link_folder_from_blobs,
 )
+from album.core.utils.operations.file_operations import force_remove
 from album.core.utils.operations.resolve_operations import (
     as_tag,
     dict_to_coordinates,
@@ -54,6 +50,7 @@ class SolutionHandler(ISolutionHandler):
         index.add_or_replace_solution(
             catalog.catalog_id(), solution.coordinates(), deploy_dict
         )
+        self._invalidate_resolve_cache()
         # get the installation location
         install_location = self.get_solution_package_path(
             catalog, dict_to_coordinates(deploy_dict)
@@ -63,7 +60,8 @@ class SolutionHandler(ISolutionHandler):
             if solution.path() is None:
                 raise RuntimeError("Single file solution without path!")
 
-            copy(
+            link_file_from_blob(
+                self.album.configuration().blob_path(),
                 solution.path(),
                 install_location.joinpath(DefaultValues.solution_default_name.value),
             )
@@ -73,7 +71,11 @@ class SolutionHandler(ISolutionHandler):
             if _path is None:
                 raise RuntimeError("Solution without path!")
 
-            copy_folder(Path(_path).parent, install_location, copy_root_folder=False)
+            link_folder_from_blobs(
+                self.album.configuration().blob_path(),
+                Path(_path).parent,
+                install_location,
+            )
 
     def add_to_cache_catalog(self, solution: ICollectionSolution) -> None:
         self.add_or_replace(self.album.catalogs().get_cache_catalog(), solution)
@@ -93,6 +95,7 @@ class SolutionHandler(ISolutionHandler):
             parent_entry.internal()["catalog_id"],
             child_entry.internal()["catalog_id"],
         )
+        self._invalidate_resolve_cache()
 
     def remove_parent(self, catalog: ICatalog, coordinates: ICoordinates) -> None:
         index = self._get_collection_index()
@@ -109,6 +112,7 @@ class SolutionHandler(ISolutionHandler):
             )
 
         index.remove_parent(entry.internal()["collection_id"])
+        self._invalidate_resolve_cache()
 
     def remove_solution(self, catalog: ICatalog, coordinates: ICoordinates) -> None:
         index = self._get_collection_index()
@@ -116,6 +120,7 @@ class SolutionHandler(ISolutionHandler):
             raise RuntimeError("Collection index not found!")
 
         index.remove_solution(catalog.catalog_id(), coordinates)
+        self._invalidate_resolve_cache()
 
     def update_solution(
         self, catalog: ICatalog, coordinates: ICoordinates, attrs: dict
@@ -130,6 +135,7 @@ class SolutionHandler(ISolutionHandler):
             attrs,
             CollectionIndex.get_collection_column_keys(),
         )
+        self._invalidate_resolve_cache()
 
     def apply_change(
         self, catalog: ICatalog, change: ISolutionChange, override: bool
@@ -153,6 +159,7 @@ class SolutionHandler(ISolutionHandler):
                 change.coordinates(),
                 cat_index.get_solution_by_coordinates(change.coordinates()),
             )
+            self._invalidate_resolve_cache()
 
         elif change.change_type() is ChangeType.REMOVED:
             self.remove_solution(catalog, change.coordinates())
@@ -173,6 +180,7 @@ class SolutionHandler(ISolutionHandler):
                 change.coordinates(),
                 cat_index.get_solution_by_coordinates(change.coordinates()),
             )
+            self._invalidate_resolve_cache()
             if installed:
                 # set old (install) status and parents again
                 self._set_old_db_stat(catalog, change)
@@ -247,10 +255,8 @@ class SolutionHandler(ISolutionHandler):
         base_link = catalog.path().joinpath(
             self.album.configuration().get_solution_path_suffix(coordinates)
         )
-        link_target = construct_cache_link_target(
-            self.album.configuration().lnk_path(),
-            base_link,
-            Path(DefaultValues.lnk_package_prefix.value),
+        link_target = self.album.collection_manager().get_link_target(
+            base_link, Path(DefaultValues.lnk_package_prefix.value)
         )
         return Link(link_target).set_link(link=base_link)
 
@@ -264,10 +270,8 @@ class SolutionHandler(ISolutionHandler):
             coordinates.name(),
             coordinates.version(),
         )
-        link_target = construct_cache_link_target(
-            self.album.configuration().lnk_path(),
-            base_link,
-            Path(DefaultValues.lnk_solution_prefix.value),
+        link_target = self.album.collection_manager().get_link_target(
+            base_link, Path(DefaultValues.lnk_solution_prefix.value)
         )
         return Link(link_target).set_link(link=base_link)
 
@@ -300,6 +304,12 @@ class SolutionHandler(ISolutionHandler):
         return solution_path
 
     def _download_solution(self, src, coordinates: ICoordinates, target: Path) -> None:
+        # git is slow to import, it is only imported when a solution gets downloaded
+        from album.core.utils.operations.git_operations import (
+            checkout_files,
+            clone_repository_sparse,
+        )
+
         solution_pck = str(
             self.album.configuration().get_solution_path_suffix_unversioned(coordinates)
         )
@@ -313,7 +323,9 @@ class SolutionHandler(ISolutionHandler):
                 if target.exists():
                     for f in os.listdir(str(target)):
                         force_remove(os.path.join(str(target), f))
-                copy_folder(tmp_solution, target, copy_root_folder=False)
+                link_folder_from_blobs(
+                    self.album.configuration().blob_path(), tmp_solution, target
+                )
             finally:
                 force_remove(repo_dir)
 
@@ -325,6 +337,10 @@ class SolutionHandler(ISolutionHandler):
         solution.installation().set_package_path(package_path)
         solution.installation().set_installation_path(solution_path)
 
+    def _invalidate_resolve_cache(self) -> None:
+        # resolve results loaded before the change might be outdated
+        self.album.collection_manager().invalidate_resolve_cache()
+
     def _get_collection_index(self) -> Optional[ICollectionIndex]:
         return self.album.collection_manager().get_collection_index()
 
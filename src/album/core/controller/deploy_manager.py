@@ -1,6 +1,6 @@
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from git import Repo
 
@@ -13,6 +13,7 @@ from album.core.utils.operations.file_operations import folder_empty
 from album.core.utils.operations.git_operations import (
     add_files_commit_and_push,
     add_tag,
+    add_tags,
     checkout_main,
     clean_repository,
     create_new_head,
@@ -93,6 +94,86 @@ class DeployManager(IDeployManager):
                 f"Successfully deployed {_deploy_path} to {catalog_name}."
             )
 
+    def deploy_many(
+        self,
+        deploy_paths: List[str],
+        catalog_name: str,
+        dry_run: bool,
+        push_options: Optional[List[str]] = None,
+        git_email: str = "",
+        git_name: str = "",
+        force_deploy: bool = False,
+        changelog: str = "",
+        no_conda_lock: bool = False,
+    ) -> None:
+        _push_options = push_options if push_options is not None else []
+        exit_msg = (
+            "Pretending to deploy %s solution(s) to %s..."
+            if dry_run
+            else "Deploying %s solution(s) to %s..."
+        )
+        module_logger().info(exit_msg % (len(deploy_paths), catalog_name))
+
+        if catalog_name:
+            catalog = self.album.catalogs().get_by_name(catalog_name)
+        else:
+            raise RuntimeError("No catalog specified for deployment!")
+        if catalog.type() != "direct":
+            raise NotImplementedError(
+                "Deploying several solutions at once is only supported for catalogs of type direct!"
+            )
+
+        # load all solutions before touching the catalog
+        deployments: List[Tuple[ISolution, Path]] = []
+        errors = []
+        for deploy_path in deploy_paths:
+            _deploy_path = Path(deploy_path)
+            try:
+                path_to_solution = self._get_path_to_solution(_deploy_path)
+                active_solution = self.album.state_manager().load(path_to_solution)
+            except Exception as e:
+                errors.append("%s: %s" % (deploy_path, e))
+                continue
+            active_solution.setup().changelog = changelog
+            deployments.append((active_solution, _deploy_path))
+
+        # versions of a solution share their folder in the catalog, each needs its own commit
+        versions: Dict[str, Set[str]] = {}
+        for active_solution, _ in deployments:
+            coordinates = active_solution.coordinates()
+            versions.setdefault(
+                "%s:%s" % (coordinates.group(), coordinates.name()), set()
+            ).add(coordinates.version())
+        for solution, solution_versions in versions.items():
+            if len(solution_versions) > 1:
+                errors.append(
+                    "%s: Cannot deploy several versions (%s) at once, deploy them one after another!"
+                    % (solution, ", ".join(sorted(solution_versions)))
+                )
+        if errors:
+            raise RuntimeError(
+                "Cannot deploy %s of %s solution(s):\n%s"
+                % (len(errors), len(deploy_paths), "\n".join(errors))
+            )
+
+        self._deploy_many(
+            catalog,
+            deployments,
+            dry_run,
+            force_deploy,
+            _push_options,
+            git_email,
+            git_name,
+            no_conda_lock,
+        )
+
+        exit_msg = (
+            "Successfully pretended to deploy %s solution(s) to %s."
+            if dry_run
+            else "Successfully deployed %s solution(s) to %s."
+        )
+        module_logger().info(exit_msg % (len(deploy_paths), catalog_name))
+
     def undeploy(
         self,
         solution_to_resolve: str,
@@ -150,10 +231,23 @@ class DeployManager(IDeployManager):
 
             self._remove_from_downloaded_catalog(catalog, coordinates, dry_run)
 
+            index_files = [DefaultValues.catalog_index_file_name.value]
+            if not dry_run:
+                index_files += [
+                    str(x)
+                    for x in catalog.export_index_transport(Path(repo.working_tree_dir))
+                ]
+
             if not previous_version_tag:
                 # remove files from catalog, update db, remove tag
                 self._remove_db_entry_and_files(
-                    repo, coordinates, dry_run, _push_options, git_email, git_name
+                    repo,
+                    coordinates,
+                    index_files,
+                    dry_run,
+                    _push_options,
+                    git_email,
+                    git_name,
                 )
             else:
                 if current_version_tag == version_to_be_removed:
@@ -161,6 +255,7 @@ class DeployManager(IDeployManager):
                     self._remove_db_entry_and_revert_files(
                         repo,
                         coordinates,
+                        index_files,
                         previous_version_tag,
                         dry_run,
                         _push_options,
@@ -170,7 +265,13 @@ class DeployManager(IDeployManager):
                 else:
                     # remove tag, update db
                     self._remove_db_entry_and_tag(
-                        repo, coordinates, dry_run, _push_options, git_email, git_name
+                        repo,
+                        coordinates,
+                        index_files,
+                        dry_run,
+                        _push_options,
+                        git_email,
+                        git_name,
                     )
 
         # refresh the local index of the catalog
@@ -203,7 +304,8 @@ class DeployManager(IDeployManager):
 
         dl_path = self.get_download_path(catalog)
 
-        # a catalog is always a repository
+        # a catalog is always a repository. The working copy in the download path is reused (fetched, reset and
+        # cleaned) as long as it is safe to do so, otherwise it is cloned again.
         with catalog.retrieve_catalog(dl_path, force_retrieve=True) as repo:
             # load index
             catalog.set_index_path(
@@ -272,6 +374,8 @@ class DeployManager(IDeployManager):
             catalog, repo, active_solution, deploy_path, no_conda_lock
         )
         commit_files = solution_files + [catalog.index_file_path()]
+        if not dry_run:
+            commit_files += catalog.export_index_transport(Path(repo.working_tree_dir))
         solution_root = str(
             self.album.configuration().get_solution_path_suffix_unversioned(
                 active_solution.coordinates()
@@ -311,6 +415,104 @@ class DeployManager(IDeployManager):
             )
             module_logger().info("Would refresh the index from src")
 
+    def _deploy_many(
+        self,
+        catalog: ICatalog,
+        deployments: List[Tuple[ISolution, Path]],
+        dry_run: bool,
+        force_deploy: bool,
+        push_options: List[str],
+        git_email: str = "",
+        git_name: str = "",
+        no_conda_lock: bool = False,
+    ) -> None:
+        # check for cache catalog only
+        if catalog.is_cache():
+            raise RuntimeError(
+                "Cannot deploy to catalog only used for caching! Aborting..."
+            )
+
+        active_solutions = [active_solution for active_solution, _ in deployments]
+        dl_path = self.get_download_path(catalog)
+
+        with catalog.retrieve_catalog(dl_path, force_retrieve=True) as repo:
+            # load index once for all solutions
+            catalog.set_index_path(
+                Path(repo.working_tree_dir).joinpath(
+                    DefaultValues.catalog_index_file_name.value
+                )
+            )
+            self.album.migration_manager().load_index(catalog)
+
+            timestamp = datetime.strftime(datetime.now(), "%Y-%m-%dT%H:%M:%S.%f")
+            for active_solution, deploy_path in deployments:
+                process_changelog_file(catalog, active_solution, deploy_path)
+                self._carry_forward_doi(catalog, active_solution)
+                active_solution.setup()["timestamp"] = timestamp
+
+            # validates all solutions before adding any of them in a single transaction
+            if not dry_run:
+                catalog.add_all(active_solutions, force_overwrite=force_deploy)
+            else:
+                module_logger().info(
+                    "Would add the solutions %s to index..."
+                    % ", ".join(s.coordinates().name() for s in active_solutions)
+                )
+
+            solution_files: List[Path] = []
+            solution_roots = []
+            for active_solution, deploy_path in deployments:
+                solution_files += self._deploy_routine_in_local_src(
+                    catalog, repo, active_solution, deploy_path, no_conda_lock
+                )
+                solution_roots.append(
+                    str(
+                        self.album.configuration().get_solution_path_suffix_unversioned(
+                            active_solution.coordinates()
+                        )
+                    )
+                )
+            commit_files = solution_files + [catalog.index_file_path()]
+
+            if dry_run:
+                module_logger().info(
+                    "Would commit the changes of %s solution(s) and push to %s..."
+                    % (len(deployments), catalog.src())
+                )
+                module_logger().info("Would refresh the index from src")
+                return
+
+            commit_files += catalog.export_index_transport(Path(repo.working_tree_dir))
+            commit_msg = "Adding new/updated %s" % ", ".join(
+                DeployManager.retrieve_head_name(s.coordinates())
+                for s in active_solutions
+            )
+            try:
+                self._commit_to_main(
+                    commit_msg,
+                    repo,
+                    solution_roots,
+                    [str(x) for x in commit_files],
+                    dry_run,
+                    push_options,
+                    git_email,
+                    git_name,
+                )
+                add_tags(repo, [as_tag(s.coordinates()) for s in active_solutions])
+            except Exception as e:
+                module_logger().error(
+                    "Pushing to catalog failed! Rolling back deployment..."
+                )
+                try:
+                    clean_repository(repo)
+                    for export in solution_files:
+                        export.unlink()
+                finally:
+                    raise e
+
+        # refresh the local index of the catalog
+        self.album.migration_manager().refresh_index(catalog)
+
     def _deploy_to_request_catalog(
         self,
         repo: Repo,
@@ -556,6 +758,31 @@ class DeployManager(IDeployManager):
         push_option: Optional[List[str]] = None,
         email: str = "",
         username: str = "",
+    ) -> None:
+        commit_msg = "Adding new/updated %s" % DeployManager.retrieve_head_name(
+            coordinates
+        )
+        DeployManager._commit_to_main(
+            commit_msg,
+            repo,
+            files_to_remove,
+            files_to_add,
+            dry_run,
+            push_option,
+            email,
+            username,
+        )
+
+    @staticmethod
+    def _commit_to_main(
+        commit_msg: str,
+        repo: Repo,
+        files_to_remove: List[str],
+        files_to_add: List[str],
+        dry_run: Optional[bool] = False,
+        push_option: Optional[List[str]] = None,
+        email: str = "",
+        username: str = "",
     ) -> None:
         if push_option is None:
             push_option = []
@@ -563,9 +790,6 @@ class DeployManager(IDeployManager):
         # don't create a new branch. use reference branch from origin
         head = checkout_main(repo)
 
-        commit_msg = "Adding new/updated %s" % DeployManager.retrieve_head_name(
-            coordinates
-        )
         remove_files(head, files_to_remove)
 
         add_files_commit_and_push(
@@ -583,6 +807,7 @@ class DeployManager(IDeployManager):
         self,
         repo: Repo,
         coordinates: ICoordinates,
+        index_files: List[str],
         dry_run: bool,
         push_options: List[str],
         git_email: str,
@@ -592,7 +817,7 @@ class DeployManager(IDeployManager):
         solution_root = str(
             self.album.configuration().get_solution_path_suffix_unversioned(coordinates)
         )
-        db_index = DefaultValues.catalog_index_file_name.value
+        db_index = ", ".join(index_files)
 
         init_msg = (
             "Would remove files %s, would update %s.."
@@ -606,7 +831,7 @@ class DeployManager(IDeployManager):
                 coordinates,
                 repo,
                 [solution_root],
-                [db_index],
+                index_files,
                 push_options,
                 git_email,
                 git_name,
@@ -616,6 +841,7 @@ class DeployManager(IDeployManager):
         self,
         repo: Repo,
         coordinates: ICoordinates,
+        index_files: List[str],
         previous_version_tag: str,
         dry_run: bool,
         push_options: List[str],
@@ -626,7 +852,7 @@ class DeployManager(IDeployManager):
         solution_root = str(
             self.album.configuration().get_solution_path_suffix_unversioned(coordinates)
         )
-        db_index = DefaultValues.catalog_index_file_name.value
+        db_index = ", ".join(index_files)
 
         init_msg = (
             "Would revert %s to %s, would update %s.."
@@ -638,26 +864,27 @@ class DeployManager(IDeployManager):
         if not dry_run:
             revert(repo, previous_version_tag, [solution_root])
             self._try_push_remove_tag(
-                coordinates, repo, [], [db_index], push_options, git_email, git_name
+                coordinates, repo, [], index_files, push_options, git_email, git_name
             )
 
     def _remove_db_entry_and_tag(
         self,
         repo: Repo,
         coordinates: ICoordinates,
+        index_files: List[str],
         dry_run: bool,
         push_options: List[str],
         git_email: str,
         git_name: str,
     ):
-        db_index = DefaultValues.catalog_index_file_name.value
+        db_index = ", ".join(index_files)
 
         init_msg = "Would update %s.." if dry_run else "Updating %s.."
         module_logger().info(init_msg % (db_index))
 
         if not dry_run:
             self._try_push_remove_tag(
-                coordinates, repo, [], [db_index], push_options, git_email, git_name
+                coordinates, repo, [], index_files, push_options, git_email, git_name
             )
 
     def _try_push_remove_tag(
@@ -0,0 +1,273 @@
+import os
+import platform
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from album.core.api.controller.controller import IAlbumController
+from album.core.api.controller.disk_usage_manager import IDiskUsageManager
+from album.core.controller.environment_manager import EnvironmentManager
+from album.core.model.default_values import DefaultValues
+from album.core.model.link import Link
+from album.core.utils.operations.blob_operations import get_unreferenced_blobs
+from album.core.utils.operations.disk_usage_operations import get_sizes
+from album.core.utils.operations.environment_fingerprint_operations import (
+    release_environment,
+)
+from album.core.utils.operations.file_operations import (
+    get_link_target,
+    release_link_slot,
+)
+from album.core.utils.operations.resolve_operations import dict_to_coordinates
+from album.core.utils.operations.trash_operations import move_to_trash
+from album.runner import album_logging
+
+module_logger = album_logging.get_active_logger
+
+# a row of the link table whose link or target does not exist anymore
+ORPHAN_REGISTERED_LINK = "registered link"
+# an environment or installation link not used by an installed solution or a link to a missing folder
+ORPHAN_LINK = "link"
+# a folder in the lnk folder no link points to
+ORPHAN_LINK_DESTINATION = "link destination"
+# the shared resources of a catalog no longer in the collection
+ORPHAN_SHARED_RESOURCES = "shared resources"
+
+# links are removed before the folders they point to
+_ORPHAN_TYPES = [
+    ORPHAN_REGISTERED_LINK,
+    ORPHAN_LINK,
+    ORPHAN_LINK_DESTINATION,
+    ORPHAN_SHARED_RESOURCES,
+]
+
+
+class DiskUsageManager(IDiskUsageManager):
+    def __init__(self, album: IAlbumController):
+        self.album = album
+
+    def get_disk_usage(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        if max_workers is None:
+            max_workers = DefaultValues.gc_max_workers.value
+        configuration = self.album.configuration()
+        lnk_path = Path(configuration.lnk_path())
+        categories = {
+            "environments": lnk_path.joinpath(DefaultValues.lnk_env_prefix.value),
+            "packages": lnk_path.joinpath(DefaultValues.lnk_package_prefix.value),
+            "installations": lnk_path.joinpath(DefaultValues.lnk_solution_prefix.value),
+            "downloads": Path(configuration.cache_path_download()),
+            "shared resources": Path(configuration.shared_resources_path()),
+            "trash": Path(configuration.trash_path()),
+            "blobs": Path(configuration.blob_path()),
+        }
+        orphans = self.get_orphans()
+
+        # scan the entries of each category concurrently, most orphans are one of them
+        entries = {name: _list_dir(path) for name, path in categories.items()}
+        # blobs still linked from a solution package are counted as packages
+        entries["blobs"] = get_unreferenced_blobs(categories["blobs"])
+        paths = list(
+            dict.fromkeys(
+                [entry for e in entries.values() for entry in e]
+                + [Path(orphan["path"]) for orphan in orphans]
+            )
+        )
+        sizes = dict(zip(paths, get_sizes(paths, max_workers)))
+
+        res_categories = [
+            {
+                "name": name,
+                "path": str(path),
+                "size": sum(sizes[entry] for entry in entries[name]),
+            }
+            for name, path in categories.items()
+        ]
+        return {
+            "categories": res_categories,
+            "orphans": [
+                dict(orphan, size=sizes[Path(orphan["path"])]) for orphan in orphans
+            ],
+            "total": sum(c["size"] for c in res_categories),
+        }
+
+    def get_orphans(self) -> List[Dict[str, Any]]:
+        configuration = self.album.configuration()
+        collection_index = self.album.collection_manager().get_collection_index()
+        catalogs = self.album.catalogs().get_all()
+        environments_path = Path(configuration.environments_path())
+        installation_path = Path(configuration.installation_path())
+
+        # links of the installed solutions
+        used_links = {
+            environments_path.joinpath(DefaultValues.default_environment.value)
+        }
+        for catalog in catalogs:
+            for solution in collection_index.get_all_installed_solutions_by_catalog(
+                catalog.catalog_id()
+            ):
+                coordinates = dict_to_coordinates(solution.setup())
+                used_links.add(
+                    installation_path.joinpath(
+                        catalog.name(),
+                        coordinates.group(),
+                        coordinates.name(),
+                        coordinates.version(),
+                    )
+                )
+                used_links.add(
+                    environments_path.joinpath(
+                        EnvironmentManager.get_environment_name(coordinates, catalog)
+                    )
+                )
+
+        # packages are kept as long as their catalog is part of the collection
+        package_links = [
+            link
+            for catalog in catalogs
+            for link in _find_links(
+                Path(catalog.path()).joinpath(
+                    DefaultValues.catalog_solutions_prefix.value
+                ),
+                3,
+            )
+        ]
+        links = _find_links(environments_path, 1) + _find_links(installation_path, 4)
+
+        orphans = []
+        orphan_links: Set[Path] = set()
+        targets: Set[Path] = set()
+        for link in package_links + links:
+            target = get_link_target(link)
+            if target is None or not target.is_dir():
+                orphan_links.add(link)
+            elif (
+                link in used_links
+                or link in package_links
+                or not _is_old(_get_link_file(link))
+            ):
+                targets.add(target.resolve())
+            else:
+                orphan_links.add(link)
+        orphans += [_orphan(ORPHAN_LINK, link) for link in sorted(orphan_links)]
+
+        for link, target in collection_index.get_all_links().items():
+            if Path(link) in orphan_links:
+                continue
+            target_path = get_link_target(link)
+            if (
+                target_path is None
+                or not target_path.is_dir()
+                or target_path.resolve() != Path(target).resolve()
+            ):
+                orphans.append(_orphan(ORPHAN_REGISTERED_LINK, Path(link)))
+            else:
+                targets.add(target_path.resolve())
+
+        lnk_path = Path(configuration.lnk_path())
+        for prefix in [
+            DefaultValues.lnk_env_prefix.value,
+            DefaultValues.lnk_package_prefix.value,
+            DefaultValues.lnk_solution_prefix.value,
+        ]:
+            for destination in _list_dir(lnk_path.joinpath(prefix)):
+                if (
+                    destination.name.isdigit()
+                    and destination.is_dir()
+                    and not destination.is_symlink()
+                    and destination.resolve() not in targets
+                    and _is_old(destination)
+                ):
+                    orphans.append(_orphan(ORPHAN_LINK_DESTINATION, destination))
+
+        catalog_names = {catalog.name() for catalog in catalogs}
+        for resources in _list_dir(Path(configuration.shared_resources_path())):
+            if (
+                resources.is_dir()
+                and not resources.is_symlink()
+                and resources.name not in catalog_names
+                and _is_old(resources)
+            ):
+                orphans.append(_orphan(ORPHAN_SHARED_RESOURCES, resources))
+
+        return orphans
+
+    def reclaim_orphans(
+        self, orphans: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        if orphans is None:
+            orphans = self.get_orphans()
+        configuration = self.album.configuration()
+        collection_manager = self.album.collection_manager()
+        environments_path = Path(configuration.environments_path())
+
+        reclaimed = []
+        for orphan in sorted(orphans, key=lambda o: _ORPHAN_TYPES.index(o["type"])):
+            path = Path(orphan["path"])
+            try:
+                if orphan["type"] == ORPHAN_REGISTERED_LINK:
+                    collection_manager.unregister_link(path)
+                elif orphan["type"] == ORPHAN_LINK:
+                    Link(path).set_link(path).dispose()
+                    collection_manager.unregister_link(path)
+                    if path.parent == environments_path:
+                        release_environment(
+                            configuration.environment_fingerprints_path(), path.name
+                        )
+                else:
+                    move_to_trash(path, configuration.trash_path())
+                    if orphan["type"] == ORPHAN_LINK_DESTINATION:
+                        release_link_slot(path)
+            except OSError as e:
+                module_logger().warning("Cannot remove orphan %s: %s" % (path, e))
+                continue
+            module_logger().debug("Removed orphan %s %s." % (orphan["type"], path))
+            reclaimed.append(orphan)
+        return reclaimed
+
+
+def _orphan(orphan_type: str, path: Path) -> Dict[str, Any]:
+    return {"type": orphan_type, "path": str(path)}
+
+
+def _is_old(path: Path) -> bool:
+    """Check whether a path was not modified for ALBUM_GC_ORPHAN_MIN_AGE seconds, links are not followed."""
+    try:
+        mtime = os.lstat(path).st_mtime
+    except OSError:
+        return False
+    return time.time() - mtime >= DefaultValues.gc_orphan_min_age.value
+
+
+def _get_link_file(link: Path) -> Path:
+    if "windows" in platform.system().lower():
+        return Path(str(link) + ".lnk")
+    return link
+
+
+def _list_dir(path: Path) -> List[Path]:
+    try:
+        return sorted(path.iterdir())
+    except OSError:
+        return []
+
+
+def _find_links(root: Path, depth: int) -> List[Path]:
+    """Return the links exactly depth levels below root. Links are not followed."""
+    windows = "windows" in platform.system().lower()
+    folders = [root]
+    for _ in range(depth - 1):
+        folders = [
+            entry
+            for folder in folders
+            for entry in _list_dir(folder)
+            if entry.is_dir() and not entry.is_symlink()
+        ]
+    links = []
+    for folder in folders:
+        for entry in _list_dir(folder):
+            if windows and entry.suffix == ".lnk":
+                # shortcuts are named after the link with the .lnk suffix
+                links.append(entry.with_suffix(""))
+            elif not windows and entry.is_symlink():
+                links.append(entry)
+    return links
@@ -1,7 +1,8 @@
 import os
+import threading
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, Union
 
 from album.core import __version__ as album_version
 from album.core.api.controller.controller import IAlbumController
@@ -13,13 +14,30 @@ from album.core.model.default_values import (
     DefaultValues,
 )
 from album.core.model.link import Link
+from album.core.utils.operations.environment_fingerprint_operations import (
+    get_environment_fingerprint,
+    get_fingerprint_target,
+    get_fingerprint_users,
+    get_registered_fingerprint,
+    register_environment,
+    release_environment,
+)
+from album.core.utils.operations.environment_pack_operations import (
+    extract_environment_pack,
+    get_environment_pack_platform,
+    read_environment_pack_manifest,
+    write_environment_pack,
+)
 from album.core.utils.operations.file_operations import (
-    construct_cache_link_target,
+    create_link,
     create_path_recursively,
+    get_link_target,
     remove_link,
 )
 from album.core.utils.operations.resolve_operations import dict_to_coordinates
 from album.core.utils.operations.solution_operations import set_environment_paths
+from album.core.utils.operations.trash_operations import move_to_trash
+from album.core.utils.profiling import profiled
 from album.environments.api.environment_api import IEnvironmentAPI
 from album.environments.api.model.environment import IEnvironment
 from album.environments.initialization import init_environment_handler
@@ -42,6 +60,9 @@ class EnvironmentManager(IEnvironmentManager):
         self._environment_handler = init_environment_handler(
             self.env_base_path, album.configuration().base_cache_path()
         )
+        # environments listed by the package manager, valid as long as the base folder is not modified
+        self._environment_list: Optional[Tuple[Optional[int], Set[Path]]] = None
+        self._environment_list_lock = threading.Lock()
 
     def _get_base_envs_path(self, album: IAlbumController) -> Path:
         return Path(album.configuration().lnk_path()).joinpath(
@@ -96,15 +117,154 @@ class EnvironmentManager(IEnvironmentManager):
         env_file = self._prepare_env_file(
             dependencies, cache, env_name, album_api_version, allow_recursive
         )
+        solution_lock_file = solution_package_path.joinpath("solution.conda-lock.yml")
+        fingerprint = get_environment_fingerprint(env_file, solution_lock_file)
+
+        environment = self._link_shared_environment(env_file, env_name, fingerprint)
+        if environment:
+            return environment
+
         env_path = self.get_environment_path(env_name, create=True)
         environment = Environment(env_file, env_name, env_path)
-        solution_lock_file = solution_package_path.joinpath("solution.conda-lock.yml")
-        self._environment_handler.create_environment_prefer_lock_file(
-            environment, str(solution_lock_file.absolute())
+        try:
+            self._environment_handler.create_environment_prefer_lock_file(
+                environment, str(solution_lock_file.absolute())
+            )
+        finally:
+            self._invalidate_environment_list()
+        register_environment(
+            self._album.configuration().environment_fingerprints_path(),
+            fingerprint,
+            env_name,
+            env_path,
         )
 
         return environment
 
+    def _link_shared_environment(
+        self, env_file: Path, env_name: str, fingerprint: str
+    ) -> Optional[IEnvironment]:
+        """Link an environment to the existing environment with the same dependency fingerprint.
+
+        Returns the environment as it is when it is already registered for the fingerprint, e.g. unpacked from an
+        environment pack. Returns None when there is no such environment or the environment already has a folder
+        of its own.
+        """
+        registry = self._album.configuration().environment_fingerprints_path()
+        link = self._album.configuration().environments_path().joinpath(env_name)
+
+        if env_name in get_fingerprint_users(
+            registry, fingerprint
+        ) and self._environment_exists(link):
+            module_logger().info("Reusing environment %s..." % env_name)
+            env_path = Link(get_link_target(link)).set_link(link)
+            return Environment(env_file, env_name, env_path)
+
+        # the environment was shared before, the dependencies might have changed since
+        if release_environment(registry, env_name):
+            self._unlink_environment(env_name)
+        if get_link_target(link) is not None:
+            return None
+
+        target = get_fingerprint_target(registry, fingerprint)
+        if target is None or not self._environment_exists(target):
+            return None
+
+        module_logger().info(
+            "Reusing environment %s with identical dependencies for %s..."
+            % (target, env_name)
+        )
+        env_path = Link(create_link(link, target)).set_link(link)
+        self._album.collection_manager().register_link(link, env_path)
+        register_environment(registry, fingerprint, env_name, target)
+        return Environment(env_file, env_name, env_path)
+
+    def pack_environment(
+        self,
+        collection_solution: ICollectionSolution,
+        archive: Optional[Union[str, Path]] = None,
+    ) -> Path:
+        environment = self.set_environment(collection_solution)
+        env_path = self.get_installed_environment_path(environment.name())
+        fingerprint = get_registered_fingerprint(
+            self._album.configuration().environment_fingerprints_path(),
+            environment.name(),
+        )
+        if fingerprint is None:
+            raise LookupError(
+                "Environment %s is not registered, reinstall the solution before packing its environment!"
+                % environment.name()
+            )
+        if archive is None:
+            archive = Path.cwd().joinpath(environment.name() + ".tar.gz")
+
+        module_logger().info(
+            "Packing environment %s into %s..." % (environment.name(), archive)
+        )
+        return write_environment_pack(
+            env_path,
+            archive,
+            {
+                "name": environment.name(),
+                "fingerprint": fingerprint,
+                "solution": str(collection_solution.coordinates()),
+                "catalog": collection_solution.catalog().name(),
+            },
+        )
+
+    def unpack_environment(self, archive: Union[str, Path]) -> IEnvironment:
+        manifest = read_environment_pack_manifest(archive)
+        if manifest["platform"] != get_environment_pack_platform():
+            raise RuntimeError(
+                "Environment pack %s was created for %s and cannot be used on %s!"
+                % (archive, manifest["platform"], get_environment_pack_platform())
+            )
+        env_name = manifest["name"]
+        fingerprint = manifest["fingerprint"]
+        registry = self._album.configuration().environment_fingerprints_path()
+        link = self._album.configuration().environments_path().joinpath(env_name)
+
+        if get_link_target(link) is not None:
+            if env_name in get_fingerprint_users(
+                registry, fingerprint
+            ) and self._environment_exists(link):
+                module_logger().info("Environment %s already exists." % env_name)
+                return Environment(
+                    None, env_name, Link(get_link_target(link)).set_link(link)
+                )
+            raise RuntimeError(
+                "Environment %s already exists with different dependencies, remove the solution first!"
+                % env_name
+            )
+
+        target = get_fingerprint_target(registry, fingerprint)
+        if target is not None and self._environment_exists(target):
+            module_logger().info(
+                "Reusing environment %s with identical dependencies for %s..."
+                % (target, env_name)
+            )
+            env_path = Link(create_link(link, target)).set_link(link)
+            self._album.collection_manager().register_link(link, env_path)
+        else:
+            module_logger().info("Unpacking environment %s..." % env_name)
+            env_path = self.get_environment_path(env_name, create=True)
+            try:
+                extract_environment_pack(archive, env_path)
+            except Exception:
+                remove_link(env_path)
+                self._album.collection_manager().unregister_link(link)
+                raise
+            finally:
+                self._invalidate_environment_list()
+        register_environment(registry, fingerprint, env_name, env_path)
+        return Environment(None, env_name, env_path)
+
+    def _unlink_environment(self, env_name: str) -> None:
+        env_path = self._environment_name_to_path(env_name, create=False)
+        if env_path is not None:
+            env_path.dispose()
+            self._album.collection_manager().unregister_link(env_path.get_link())
+
     @staticmethod
     def _get_pypi_package_name_version(str_: str) -> Tuple[str, str]:
         if "==" in str_:
@@ -175,6 +335,7 @@ class EnvironmentManager(IEnvironmentManager):
                     "Potentially incompatible installation of album in album detected!"
                 )
 
+    @profiled("environment lookup")
     def set_environment(self, collection_solution: ICollectionSolution) -> IEnvironment:
         db_entry = collection_solution.database_entry()
 
@@ -210,11 +371,8 @@ class EnvironmentManager(IEnvironmentManager):
                 .joinpath(environment_name)
             )
         )
-        target = construct_cache_link_target(
-            self._album.configuration().lnk_path(),
-            point_from=path,
-            point_to=Path(DefaultValues.lnk_env_prefix.value),
-            create=create,
+        target = self._album.collection_manager().get_link_target(
+            path, Path(DefaultValues.lnk_env_prefix.value), create=create
         )
         if target:
             return Link(target).set_link(path)
@@ -233,23 +391,81 @@ class EnvironmentManager(IEnvironmentManager):
         if path_expected is None:
             raise LookupError("Could not find environment %s." % environment_name)
 
-        environment_list = (
-            self._environment_handler.get_package_manager().get_environment_list()
-        )
-
-        if path_expected.resolve() in [env.resolve() for env in environment_list]:
+        if path_expected.resolve() in self._get_environment_list():
             return path_expected
 
         raise LookupError("Could not find environment %s." % environment_name)
 
+    def _get_environment_list(self) -> Set[Path]:
+        """Return the resolved folders of the environments of the package manager.
+
+        Listing the environments is delegated to the package manager once. The result is reused until an environment
+        gets created or removed by album or the modification time of the environment base folder changes.
+        """
+        try:
+            mtime: Optional[int] = os.stat(self.env_base_path).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        with self._environment_list_lock:
+            if (
+                self._environment_list is not None
+                and self._environment_list[0] == mtime
+            ):
+                return self._environment_list[1]
+
+        environment_list = {
+            Path(env).resolve()
+            for env in self._environment_handler.get_package_manager().get_environment_list()
+        }
+        with self._environment_list_lock:
+            self._environment_list = (mtime, environment_list)
+        return environment_list
+
+    def _invalidate_environment_list(self) -> None:
+        with self._environment_list_lock:
+            self._environment_list = None
+
+    def _environment_exists(self, environment_path: Union[Path, str]) -> bool:
+        environment_path = Path(environment_path).resolve()
+        if environment_path not in self._get_environment_list():
+            return False
+        try:
+            with os.scandir(environment_path) as it:
+                return any(True for _ in it)
+        except OSError:
+            return False
+
     def set_environment_path(self, environment: IEnvironment) -> None:
         path = self.get_environment_path(environment.name())
         module_logger().debug("Set environment path to %s..." % path)
         environment.set_path(path)
 
     def remove_environment(self, environment: IEnvironment) -> bool:
-        self._environment_handler.remove_environment(environment)
-        self.remove_disc_content_from_environment(environment)
+        registry = self._album.configuration().environment_fingerprints_path()
+        if release_environment(registry, environment.name()):
+            # other solutions with identical dependencies still use the environment, only remove the link
+            module_logger().debug(
+                "Environment %s is shared, removing the link only..."
+                % environment.name()
+            )
+            self._unlink_environment(environment.name())
+            environment.set_path(None)  # type: ignore[arg-type]
+            return True
+
+        try:
+            # deleting the environment folder is deferred, see IConfiguration.empty_trash.
+            # The package manager is not called: it lists the environments by the folders in the environment base
+            # folder, renaming the folder deregisters it. Removing it through the package manager would delete the
+            # folder file by file. Stale prefixes in environments.txt of conda or micromamba are skipped by them as
+            # long as the prefix does not exist.
+            if environment.path() is not None:
+                move_to_trash(
+                    environment.path(), self._album.configuration().trash_path()
+                )
+            self.remove_disc_content_from_environment(environment)
+        finally:
+            self._invalidate_environment_list()
         return True
 
     def run_script(
@@ -1,4 +1,7 @@
-from typing import Any, Dict, List, Optional
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from album.environments.utils.subcommand import SubProcessError
 
@@ -7,6 +10,7 @@ from album.core.api.controller.install_manager import IInstallManager
 from album.core.api.model.collection_index import ICollectionIndex
 from album.core.api.model.collection_solution import ICollectionSolution
 from album.core.controller.environment_manager import EnvironmentManager
+from album.core.model.default_values import DefaultValues
 from album.core.model.resolve_result import ResolveResult
 from album.core.utils.operations.file_operations import remove_link
 from album.core.utils.operations.resolve_operations import (
@@ -18,6 +22,7 @@ from album.core.utils.operations.solution_operations import (
     get_deploy_dict,
     get_parent_dict,
 )
+from album.core.utils.operations.trash_operations import move_to_trash
 from album.runner import album_logging
 from album.runner.core.api.model.coordinates import ICoordinates
 from album.runner.core.api.model.solution import ISolution
@@ -26,6 +31,19 @@ module_logger = album_logging.get_active_logger
 
 
 class InstallManager(IInstallManager):
+    class PlanEntry:
+        """A solution of an installation plan, installed after the parent it depends on."""
+
+        def __init__(
+            self,
+            resolve_result: ICollectionSolution,
+            parent: Optional["InstallManager.PlanEntry"] = None,
+        ):
+            self.resolve_result = resolve_result
+            self.parent = parent
+            self.installed = False
+            self.error: Optional[BaseException] = None
+
     def __init__(self, album: IAlbumController):
         self.album = album
 
@@ -45,10 +63,223 @@ class InstallManager(IInstallManager):
             resolve_result, parent=False, allow_recursive=allow_recursive
         )
 
-        # TODO: run install and download in parallel, enable resource feature
-        # self.album.download_manager().download_resources_from_yaml(resolve_result)
         return resolve_result.loaded_solution()
 
+    def install_many(
+        self,
+        solutions_to_resolve: List[str],
+        allow_recursive: bool = False,
+        argv: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Optional[BaseException]]:
+        # this needs to happen before any (potentially not completely installed) solution is resolved
+        self.clean_unfinished_installations()
+
+        errors: Dict[str, BaseException] = {}
+        plan: Dict[Tuple[str, str], InstallManager.PlanEntry] = {}
+        targets: Dict[str, InstallManager.PlanEntry] = {}
+        for solution_to_resolve in solutions_to_resolve:
+            try:
+                targets[solution_to_resolve] = self._plan_installation(
+                    solution_to_resolve, plan
+                )
+            except Exception as e:
+                module_logger().error(
+                    'Cannot install "%s": %s' % (solution_to_resolve, e)
+                )
+                errors[solution_to_resolve] = e
+
+        self._install_plan(
+            list(plan.values()),
+            allow_recursive,
+            max_workers if max_workers else DefaultValues.install_max_workers.value,
+        )
+
+        if any(entry.resolve_result.catalog().is_cache() for entry in plan.values()):
+            # always clean after registration to a catalog! Not before all solutions are registered.
+            clean_resolve_tmp(self.album.configuration().tmp_path())
+
+        results = {
+            s: errors[s] if s in errors else targets[s].error
+            for s in solutions_to_resolve
+        }
+        self._log_install_summary(solutions_to_resolve, results)
+        return results
+
+    def _plan_installation(
+        self,
+        solution_to_resolve: str,
+        plan: Dict[Tuple[str, str], "InstallManager.PlanEntry"],
+    ) -> "InstallManager.PlanEntry":
+        """Resolve a solution and its parents and add them to the plan, parents shared by solutions are added once.
+
+        Nothing is added to the plan when the solution or one of its parents cannot be resolved.
+        """
+        resolve_result = self.album.collection_manager().resolve_and_load(
+            solution_to_resolve
+        )
+        if not resolve_result.catalog():
+            raise RuntimeError(
+                "Solution cannot be installed without being associated with a catalog!"
+            )
+        key = self._get_plan_key(resolve_result)
+        if key in plan:
+            return plan[key]
+
+        entry = InstallManager.PlanEntry(resolve_result)
+        planned = {key: entry}
+        if self._resolve_result_is_installed(resolve_result):
+            module_logger().warning(
+                'Solution "%s" already installed. Skipping...'
+                % resolve_result.loaded_solution().coordinates().name()
+            )
+            entry.installed = True
+            plan.update(planned)
+            return entry
+
+        # parents are installed first, a child runs in the environment of its parent
+        child = entry
+        parent_dict = get_parent_dict(resolve_result.loaded_solution())
+        while parent_dict:
+            parent_resolve_result = self._resolve_parent(
+                parent_dict,
+                child.resolve_result.loaded_solution().setup().album_api_version,
+                child.resolve_result.coordinates(),
+            )
+            parent_key = self._get_plan_key(parent_resolve_result)
+            if parent_key in plan or parent_key in planned:
+                child.parent = plan.get(parent_key, planned.get(parent_key, None))
+                break
+            child.parent = InstallManager.PlanEntry(parent_resolve_result)
+            planned[parent_key] = child.parent
+            if self._resolve_result_is_installed(parent_resolve_result):
+                child.parent.installed = True
+                break
+            child = child.parent
+            parent_dict = get_parent_dict(parent_resolve_result.loaded_solution())
+
+        plan.update(planned)
+        return entry
+
+    @staticmethod
+    def _get_plan_key(resolve_result: ICollectionSolution) -> Tuple[str, str]:
+        return (
+            str(resolve_result.catalog().catalog_id()),
+            str(resolve_result.coordinates()),
+        )
+
+    def _install_plan(
+        self,
+        plan: List["InstallManager.PlanEntry"],
+        allow_recursive: bool,
+        max_workers: int,
+    ) -> None:
+        """Install the planned solutions, solutions not depending on each other are installed concurrently."""
+        waiting = [entry for entry in plan if not entry.installed]
+        running: Dict[Future, InstallManager.PlanEntry] = {}
+        parent_thread = threading.current_thread().ident
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="album-install"
+        ) as executor:
+            while waiting or running:
+                changed = True
+                while changed:
+                    changed = False
+                    for entry in list(waiting):
+                        if entry.parent and entry.parent.error:
+                            entry.error = RuntimeError(
+                                'Parent solution "%s" could not be installed!'
+                                % entry.parent.resolve_result.coordinates()
+                            )
+                        elif not entry.parent or entry.parent.installed:
+                            running[
+                                executor.submit(
+                                    self._install_plan_entry,
+                                    entry,
+                                    allow_recursive,
+                                    parent_thread,
+                                )
+                            ] = entry
+                        else:
+                            continue
+                        waiting.remove(entry)
+                        changed = True
+                if not running:
+                    # nothing left to wait for, the remaining solutions are parents of each other
+                    for entry in waiting:
+                        entry.error = RuntimeError(
+                            'Solution "%s" has cyclic parent dependencies!'
+                            % entry.resolve_result.coordinates()
+                        )
+                    break
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    entry = running.pop(future)
+                    entry.error = future.exception()
+                    entry.installed = entry.error is None
+
+    def _install_plan_entry(
+        self,
+        entry: "InstallManager.PlanEntry",
+        allow_recursive: bool,
+        parent_thread: Optional[int],
+    ) -> None:
+        album_logging.configure_logging("install", parent_thread_id=parent_thread)
+        resolve_result = entry.resolve_result
+        try:
+            module_logger().info(
+                'Installing "%s"...'
+                % resolve_result.loaded_solution().coordinates().name()
+            )
+            # link registrations of the installation hold the same lock
+            collection_manager = self.album.collection_manager()
+            with collection_manager.write_lock():
+                self._register(resolve_result)
+                self.album.solutions().set_installation_unfinished(
+                    resolve_result.catalog(), resolve_result.coordinates()
+                )
+                if entry.parent:
+                    self._set_parent(resolve_result, entry.parent.resolve_result)
+
+            self._install_with_resources(
+                resolve_result, not entry.parent, allow_recursive
+            )
+
+            with collection_manager.write_lock():
+                self.album.solutions().set_installed(
+                    resolve_result.catalog(), resolve_result.coordinates()
+                )
+            module_logger().info("Installed %s!" % resolve_result.coordinates().name())
+        except Exception as e:
+            module_logger().error(
+                "Failed to install %s: %s" % (resolve_result.coordinates(), e)
+            )
+            raise e
+        finally:
+            # each pool thread uses its own connection to the collection index
+            self.album.collection_manager().get_collection_index().close_current_connection()
+            album_logging.pop_active_logger()
+
+    @staticmethod
+    def _log_install_summary(
+        solutions_to_resolve: List[str], results: Dict[str, Optional[BaseException]]
+    ) -> None:
+        failed = [s for s in solutions_to_resolve if results.get(s, None) is not None]
+        lines = [
+            "Installed %s of %s solutions:"
+            % (len(solutions_to_resolve) - len(failed), len(solutions_to_resolve))
+        ]
+        for solution_to_resolve in solutions_to_resolve:
+            error = results.get(solution_to_resolve, None)
+            lines.append(
+                "  %s: %s"
+                % (solution_to_resolve, "failed (%s)" % error if error else "installed")
+            )
+        if failed:
+            module_logger().error("\n".join(lines))
+        else:
+            module_logger().info("\n".join(lines))
+
     def _resolve_result_is_installed(self, resolve_result: ICollectionSolution) -> bool:
         if resolve_result.database_entry():  # we know the solution is in the collection
             return (
@@ -190,44 +421,124 @@ class InstallManager(IInstallManager):
                 raise e
 
             if parent_resolve_result:
-                db_entry_parent = parent_resolve_result.database_entry()
-                if db_entry_parent is None:
-                    raise RuntimeError(
-                        "Parent solution not found in collection index. Cannot install parent solution!"
-                    )
-
-                db_entry_solution = collection_solution.database_entry()
-                if db_entry_solution is None:
-                    raise RuntimeError(
-                        "Solution not found in collection index. Cannot install solution!"
-                    )
-
-                self.album.solutions().set_parent(
-                    db_entry_parent,
-                    db_entry_solution,
-                )
+                self._set_parent(collection_solution, parent_resolve_result)
             else:
                 self._remove_parent(collection_solution)
+                self._update_database_entry(collection_solution)
 
-            db_entry = (
-                self.album.collection_manager()
-                .get_collection_index()
-                .get_solution_by_catalog_grp_name_version(
-                    collection_solution.catalog().catalog_id(),
-                    collection_solution.coordinates(),
-                )
+        self._install_with_resources(collection_solution, not parent, allow_recursive)
+        return parent_resolve_result
+
+    def _install_with_resources(
+        self,
+        collection_solution: ICollectionSolution,
+        install_environment: bool,
+        allow_recursive: bool = False,
+    ) -> None:
+        """Install the environment and run the install routine while the resources of the solution are downloaded.
+
+        Both are finished when this returns. When one of them fails, the resources downloaded are removed again.
+        """
+        if not self._has_resource_file(collection_solution.loaded_solution()):
+            self._install_solution(
+                collection_solution, install_environment, allow_recursive
             )
-            if db_entry is None:
-                raise RuntimeError(
-                    "Solution not found in collection index. Cannot install parent solution!"
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="album-download"
+        ) as executor:
+            download = executor.submit(
+                self._download_resources,
+                collection_solution,
+                threading.current_thread().ident,
+            )
+            try:
+                self._install_solution(
+                    collection_solution, install_environment, allow_recursive
                 )
+            except Exception as e:
+                # wait for the downloads, these are not needed anymore
+                if download.exception() is None:
+                    self.album.download_manager().remove_downloads(download.result())
+                raise e
+            # raises download errors, partial downloads are removed already
+            downloads = download.result()
+        module_logger().debug(
+            "Downloaded %s resources of %s."
+            % (len(downloads), collection_solution.coordinates())
+        )
 
-            collection_solution.set_database_entry(db_entry)
-        else:
+    def _install_solution(
+        self,
+        collection_solution: ICollectionSolution,
+        install_environment: bool,
+        allow_recursive: bool = False,
+    ) -> None:
+        if install_environment:
             self.album.environment_manager().install_environment(
                 collection_solution, allow_recursive
             )
 
+        self._create_installation_paths(collection_solution)
+
+        self._run_solution_install_routine(collection_solution)
+
+    def _download_resources(
+        self, collection_solution: ICollectionSolution, parent_thread: Optional[int]
+    ) -> List[Path]:
+        album_logging.configure_logging("download", parent_thread_id=parent_thread)
+        try:
+            return self.album.download_manager().download_resources(collection_solution)
+        finally:
+            album_logging.pop_active_logger()
+
+    @staticmethod
+    def _has_resource_file(solution: ISolution) -> bool:
+        dependencies = solution.setup().dependencies
+        return bool(dependencies) and "resource_file" in dependencies
+
+    def _set_parent(
+        self,
+        collection_solution: ICollectionSolution,
+        parent_resolve_result: ICollectionSolution,
+    ) -> None:
+        db_entry_parent = parent_resolve_result.database_entry()
+        if db_entry_parent is None:
+            raise RuntimeError(
+                "Parent solution not found in collection index. Cannot install parent solution!"
+            )
+
+        db_entry_solution = collection_solution.database_entry()
+        if db_entry_solution is None:
+            raise RuntimeError(
+                "Solution not found in collection index. Cannot install solution!"
+            )
+
+        self.album.solutions().set_parent(
+            db_entry_parent,
+            db_entry_solution,
+        )
+        self._update_database_entry(collection_solution)
+
+    def _update_database_entry(self, collection_solution: ICollectionSolution) -> None:
+        db_entry = (
+            self.album.collection_manager()
+            .get_collection_index()
+            .get_solution_by_catalog_grp_name_version(
+                collection_solution.catalog().catalog_id(),
+                collection_solution.coordinates(),
+            )
+        )
+        if db_entry is None:
+            raise RuntimeError(
+                "Solution not found in collection index. Cannot install parent solution!"
+            )
+
+        collection_solution.set_database_entry(db_entry)
+
+    @staticmethod
+    def _create_installation_paths(collection_solution: ICollectionSolution) -> None:
         # ensure cache paths exist
         collection_solution.loaded_solution().installation().internal_cache_path().mkdir(
             exist_ok=True, parents=True
@@ -242,14 +553,25 @@ class InstallManager(IInstallManager):
             exist_ok=True, parents=True
         )
 
-        self._run_solution_install_routine(collection_solution)
-        return parent_resolve_result
-
     def _install_parent(
         self,
         parent_dict: Dict[str, Any],
         api_version: str,
         child_coordinates: ICoordinates,
+    ) -> ICollectionSolution:
+        resolve_result_parent = self._resolve_parent(
+            parent_dict, api_version, child_coordinates
+        )
+
+        # recursive installation call. Not failing for already installed solutions. parent set to "True"
+        self._install_loaded_resolve_result(resolve_result_parent, parent=True)
+        return resolve_result_parent
+
+    def _resolve_parent(
+        self,
+        parent_dict: Dict[str, Any],
+        api_version: str,
+        child_coordinates: ICoordinates,
     ) -> ICollectionSolution:
         resolve_solution = build_resolve_string(parent_dict)
         resolve_result_parent = self.album.collection_manager().resolve_and_load(
@@ -276,9 +598,6 @@ class InstallManager(IInstallManager):
                     api_version,
                 )
             )
-
-        # recursive installation call. Not failing for already installed solutions. parent set to "True"
-        self._install_loaded_resolve_result(resolve_result_parent, parent=True)
         return resolve_result_parent
 
     def uninstall(
@@ -478,17 +797,15 @@ class InstallManager(IInstallManager):
     def _remove_disc_content_from_solution(
         self, resolve_result: ICollectionSolution
     ) -> None:
-        remove_link(
-            self.album.collection_manager()
-            .solutions()
-            .get_solution_installation_path(
+        solutions = self.album.collection_manager().solutions()
+        for link in [
+            solutions.get_solution_installation_path(
                 resolve_result.catalog(), resolve_result.coordinates()
-            )
-        )
-        remove_link(
-            self.album.collection_manager()
-            .solutions()
-            .get_solution_package_path(
+            ),
+            solutions.get_solution_package_path(
                 resolve_result.catalog(), resolve_result.coordinates()
-            )
-        )
+            ),
+        ]:
+            # deleting the folder is deferred, see IConfiguration.empty_trash
+            move_to_trash(link, self.album.configuration().trash_path())
+            remove_link(link)
@@ -1,15 +1,16 @@
+import hashlib
 import json
 import pkgutil
 import shutil
 import sqlite3
 from copy import deepcopy
+from functools import lru_cache
 from importlib.metadata import version as importlib_version
 from importlib.resources import files
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Any, Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Set, Tuple
 
-from jsonschema import ValidationError, validate
 from packaging import version
 
 from album.core.api.controller.controller import IAlbumController
@@ -23,21 +24,62 @@ from album.core.utils.operations.file_operations import (
     get_dict_from_json,
     write_dict_to_json,
 )
+from album.core.utils.profiling import profiled
 from album.runner import album_logging
 
+if TYPE_CHECKING:
+    from jsonschema.protocols import Validator
+
 module_logger = album_logging.get_active_logger
 
+# hashes of solution attributes successfully validated in this process, per schema
+_validated_solution_attrs: Set[Tuple[str, str]] = set()
+
+
+@lru_cache(maxsize=None)
+def _get_schema_validator(package: str, resource: str) -> "Validator":
+    """Return a validator for a json schema. The schema gets checked once per process."""
+    # jsonschema is slow to import, it is only imported once solutions get validated
+    from jsonschema.validators import validator_for
+
+    data = pkgutil.get_data(package, resource)
+    if data is None:
+        raise FileNotFoundError("Cannot find schema %s in %s!" % (resource, package))
+    schema = json.loads(data)
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+def _get_attrs_hash(attrs: Any) -> str:
+    """Return a hash of solution attributes reflecting everything a json schema validation depends on."""
+
+    def _canonical(value: Any) -> Any:
+        if isinstance(value, dict):
+            return "dict", sorted((str(k), _canonical(v)) for k, v in value.items())
+        if isinstance(value, (list, tuple)):
+            return type(value).__name__, [_canonical(v) for v in value]
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return type(value).__name__, value
+        # validation of other objects (e.g. functions) only depends on their type
+        return type(value).__name__
+
+    return hashlib.sha256(repr(_canonical(attrs)).encode("utf-8")).hexdigest()
+
 
 class MigrationManager(IMigrationManager):
     def __init__(self, album: IAlbumController):
         self.schema_solution = None
         self.schema_solution_runner_0_4_2 = None
+        self._solution_validator = None
+        self._solution_validator_runner_0_4_2 = None
         self.album = album
         self.collection_db_versions = (
             self._read_collection_database_versions_from_scripts()
         )
         self.catalog_db_versions = self._read_catalog_database_versions_from_scripts()
 
+    @profiled("collection migration")
     def migrate_collection_index(
         self, collection_index: ICollectionIndex, initial_version: IMMVersion
     ) -> None:
@@ -187,7 +229,11 @@ class MigrationManager(IMigrationManager):
                 return True
         return False
 
-    def migrate_solution_attrs(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
+    def migrate_solution_attrs(
+        self, attrs: Dict[str, Any], skip_validated: bool = True
+    ) -> Dict[str, Any]:
+        from jsonschema import ValidationError
+
         self._load_solution_schema()
         if "album_api_version" not in attrs:
             raise ValidationError(
@@ -199,21 +245,52 @@ class MigrationManager(IMigrationManager):
         # TODO: replace hardcoded migration with a more general approach. see database migration for example
         api_version = version.parse(attrs["album_api_version"])
         if api_version >= version.parse("0.5.1"):
-            validate(attrs, self.schema_solution)
+            self._validate_solution_attrs(
+                attrs, self._solution_validator, "solution", skip_validated
+            )
             return attrs
         else:
-            validate(attrs, self.schema_solution_runner_0_4_2)
+            self._validate_solution_attrs(
+                attrs,
+                self._solution_validator_runner_0_4_2,
+                "solution_0.4.2",
+                skip_validated,
+            )
             return self._convert_schema0_schema1(attrs)
 
     def _load_solution_schema(self):
         if not self.schema_solution:
             # the namespace "runner" is still used here, even though the solution schema comes
             # from album-solution-api package
-            data = pkgutil.get_data("album.runner.core.schema", "solution_schema.json")
-            self.schema_solution = json.loads(data)
+            self._solution_validator = _get_schema_validator(
+                "album.runner.core.schema", "solution_schema.json"
+            )
+            self.schema_solution = self._solution_validator.schema
         if not self.schema_solution_runner_0_4_2:
-            data = pkgutil.get_data("album.core.schema", "solution_schema_0.4.2.json")
-            self.schema_solution_runner_0_4_2 = json.loads(data)
+            self._solution_validator_runner_0_4_2 = _get_schema_validator(
+                "album.core.schema", "solution_schema_0.4.2.json"
+            )
+            self.schema_solution_runner_0_4_2 = (
+                self._solution_validator_runner_0_4_2.schema
+            )
+
+    @staticmethod
+    def _validate_solution_attrs(
+        attrs: Dict[str, Any],
+        validator: "Validator",
+        schema_name: str,
+        skip_validated: bool,
+    ) -> None:
+        attrs_key = (schema_name, _get_attrs_hash(attrs))
+        if skip_validated and attrs_key in _validated_solution_attrs:
+            return
+
+        from jsonschema.exceptions import best_match
+
+        error = best_match(validator.iter_errors(attrs))
+        if error is not None:
+            raise error
+        _validated_solution_attrs.add(attrs_key)
 
     @staticmethod
     def _load_catalog_collection_migration_schema(
@@ -9,6 +9,7 @@ from album.core.api.controller.script_manager import IScriptManager
 from album.core.api.model.collection_solution import ICollectionSolution
 from album.core.model.default_values import DefaultValues
 from album.core.model.script_queue_entry import ScriptQueueEntry
+from album.core.utils.profiling import profiled
 from album.runner import album_logging
 from album.runner.album_logging import get_active_logger
 from album.runner.core.api.model.solution import ISolution
@@ -48,6 +49,7 @@ class ScriptManager(IScriptManager):
         except Empty:
             module_logger().debug("Currently nothing more to run!")
 
+    @profiled("script queue")
     def build_queue(
         self,
         collection_solution: ICollectionSolution,
@@ -139,6 +141,7 @@ class ScriptManager(IScriptManager):
 
         return script_path
 
+    @profiled("solution subprocess")
     def _run_in_environment(
         self, script_queue_entry: ScriptQueueEntry, pipe_output: bool = True
     ) -> None:
@@ -1,7 +1,7 @@
 import json
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import pooch
 import validators
@@ -9,7 +9,7 @@ import validators
 from album.core.api.controller.controller import IAlbumController
 from album.core.api.controller.shared_downloads_manager import IDownloadManager
 from album.core.api.model.collection_solution import ICollectionSolution
-from album.environments.utils.file_operations import get_dict_from_yml
+from album.environments.utils.file_operations import force_remove, get_dict_from_yml
 from album.environments.utils.url_operations import download_resource
 from album.runner.album_logging import get_active_logger
 
@@ -21,13 +21,26 @@ class DownloadManager(IDownloadManager):
     def download_resources_from_yaml(
         self, collection_solution: ICollectionSolution
     ) -> bool:
-        result = self._resources_yaml_to_dict(collection_solution)
-        if result:
-            resources_dict, resources_json_path = result
-            self._retrieve_resources_from_dict(resources_dict)
-            self._set_file_paths_in_json(resources_dict, resources_json_path)
+        self.download_resources(collection_solution)
         return True
 
+    def download_resources(
+        self, collection_solution: ICollectionSolution
+    ) -> List[Path]:
+        result = self._resources_yaml_to_dict(collection_solution)
+        if not result:
+            return []
+        resources_dict, resources_json_path = result
+        downloaded = self._retrieve_resources_from_dict(resources_dict)
+        self._set_file_paths_in_json(resources_dict, resources_json_path)
+        return downloaded
+
+    @staticmethod
+    def remove_downloads(downloads: List[Path]) -> None:
+        for download in downloads:
+            get_active_logger().debug("Removing download %s..." % download)
+            force_remove(download)
+
     def get_download_paths(
         self, collection_solution: ICollectionSolution
     ) -> Tuple[Dict[str, Any], Path]:
@@ -165,20 +178,26 @@ class DownloadManager(IDownloadManager):
         return None
 
     @staticmethod
-    def _retrieve_resources_from_dict(resources_dict: Dict[str, Any]) -> None:
+    def _retrieve_resources_from_dict(resources_dict: Dict[str, Any]) -> List[Path]:
         """Download the files specified in the dictionary.
 
+        When a download fails, the files downloaded before are removed again. Files already present before are
+        kept, these might be shared with other solutions.
+
         Args:
             resources_dict:
                 Resources dictionary with resolved paths in regard to scope.
 
         Returns:
-            None, if it worked.
+            The files downloaded, not including files already present.
         """
+        downloaded: List[Path] = []
         for _, resource_value in resources_dict["resources"].items():
             if "os" in resource_value and not resource_value["os"] == sys.platform:
                 continue
 
+            target = Path(resource_value["path"]).joinpath(resource_value["name"])
+            existed = target.exists()
             try:
                 fpath = pooch.retrieve(
                     url=resource_value["url"],
@@ -189,7 +208,10 @@ class DownloadManager(IDownloadManager):
                 )
             except Exception as e:
                 get_active_logger().error(f"Failed to download resource: {e}")
-                fpath = None
+                DownloadManager.remove_downloads(downloaded)
+                raise e
+            if not existed:
+                downloaded.append(Path(fpath))
 
             get_active_logger().info(f"Downloaded a resource to {fpath}")
             if resource_value["hash"] is None:
@@ -201,7 +223,7 @@ class DownloadManager(IDownloadManager):
                     "file to enforce reproducibility before deployment: \n"
                     f"{pooch.file_hash(fpath, alg='md5')}"
                 )
-        return None
+        return downloaded
 
     @staticmethod
     def _set_paths_in_dict(
@@ -7,20 +7,54 @@ from album.runner.core.model.solution import Solution
 
 from album.core.api.controller.controller import IAlbumController
 from album.core.api.controller.state_manager import IStateManager
+from album.core.model.solution_metadata_cache import SolutionMetadataCache
+from album.core.utils.operations.solution_operations import (
+    get_setup_attrs_from_source,
+)
+from album.core.utils.profiling import profiled, span
 
 
 class StateManager(IStateManager):
     def __init__(self, album: IAlbumController):
         self._active_solution: List[ISolution] = []
         self.album = album
+        self._metadata_cache: Optional[SolutionMetadataCache] = None
         # overwrite album setup with this setup
         api.setup = self._setup_solution
 
-    def load(self, path: str) -> ISolution:
+    @profiled("solution load")
+    def load(self, path: str, metadata_only: bool = False) -> ISolution:
         get_active_logger().debug(f"Loading solution from {path}...")
-        with open(path) as f:
-            solution = f.read()
-        exec(solution)
+        with open(path, "rb") as f:
+            source = f.read()
+
+        metadata_cache = self._get_metadata_cache()
+        cache_entry = metadata_cache.get(path, source)
+        if metadata_only and cache_entry and cache_entry.attrs is not None:
+            get_active_logger().debug("Using cached metadata of solution %s." % path)
+            active_solution = Solution(cache_entry.attrs)
+            active_solution.set_script(path)
+            return active_solution
+
+        if cache_entry and cache_entry.code is not None:
+            code = cache_entry.code
+        else:
+            code = compile(source, str(path), "exec")
+
+        if metadata_only:
+            attrs = get_setup_attrs_from_source(source)
+            if attrs is not None:
+                get_active_logger().debug(
+                    "Extracted metadata of solution %s without executing it." % path
+                )
+                attrs = self.album.migration_manager().migrate_solution_attrs(attrs)
+                metadata_cache.put(path, source, attrs, code)
+                active_solution = Solution(attrs)
+                active_solution.set_script(path)
+                return active_solution
+
+        with span("solution exec"):
+            exec(code)
         active_solution = self._get_active_solution()
         if active_solution is None:
             get_active_logger().error("Cannot load solution %s!" % path)
@@ -28,8 +62,21 @@ class StateManager(IStateManager):
 
         active_solution.set_script(path)
         self._pop_active_solution()
+        # a complete entry of an unchanged file is not written again
+        if cache_entry is None or cache_entry.code is None or cache_entry.attrs is None:
+            metadata_cache.put(path, source, active_solution.setup(), code)
         return active_solution
 
+    def clear_metadata_cache(self) -> None:
+        self._get_metadata_cache().clear()
+
+    def _get_metadata_cache(self) -> SolutionMetadataCache:
+        if self._metadata_cache is None:
+            self._metadata_cache = SolutionMetadataCache(
+                self.album.configuration().solution_metadata_cache_path()
+            )
+        return self._metadata_cache
+
     def _setup_solution(self, **attrs) -> None:
         attrs = self.album.migration_manager().migrate_solution_attrs(attrs)
         next_solution = Solution(attrs)
@@ -1,30 +1,36 @@
 """Catalog class to represent a catalog in the Album system."""
 
+import json
 import os
+import tempfile
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Generator, List, Optional, Tuple, Union
-
-import validators
-from git import GitCommandError, Repo
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Tuple, Union
 
 from album.core.api.model.catalog import ICatalog
 from album.core.api.model.catalog_index import ICatalogIndex
+from album.core.api.model.catalog_updates import ChangeType
 from album.core.model.catalog_index import CatalogIndex
 from album.core.model.default_values import DefaultValues
-from album.core.utils.operations.file_operations import force_remove
-from album.core.utils.operations.git_operations import (
-    checkout_files,
-    clone_repository_sparse,
-    download_repository,
+from album.core.utils.operations.file_operations import (
+    compress_file,
+    decompress_file,
+    force_remove,
+    get_dict_entry,
+    get_dict_from_json,
+    write_dict_to_json,
 )
 from album.core.utils.operations.solution_operations import get_deploy_dict
+from album.core.utils.operations.url_operations import conditional_download
 from album.environments.utils.file_operations import copy
 from album.runner import album_logging
 from album.runner.core.api.model.coordinates import ICoordinates
 from album.runner.core.api.model.solution import ISolution
 from album.runner.core.model.solution import Solution
 
+if TYPE_CHECKING:
+    from git import Repo
+
 module_logger = album_logging.get_active_logger
 
 
@@ -36,6 +42,14 @@ def retrieve_index_files_from_src(
     Expects a git repository behind the src!
 
     """
+    # git is slow to import, it is only imported when a catalog gets retrieved
+    from git import GitCommandError
+
+    from album.core.utils.operations.git_operations import (
+        checkout_files,
+        clone_repository_sparse,
+    )
+
     tmp_dir = Path(tmp_dir)
     with clone_repository_sparse(src, branch_name, tmp_dir) as repo:
         # meta file - must be available
@@ -56,6 +70,137 @@ def retrieve_index_files_from_src(
     return index_src, index_meta_src
 
 
+def retrieve_index_files_from_url(
+    index_url: str, target_dir: Path
+) -> Tuple[Path, Path]:
+    """Take a raw file url and downloads the index files served below it.
+
+    Files already present in the target directory are only downloaded again when they changed remotely.
+    When the catalog publishes revisions, a present index is brought up to date by applying the delta files
+    of the missing revisions. Otherwise, the (compressed) index is downloaded as a whole.
+
+    """
+    target_dir = Path(target_dir)
+    index_url = index_url.rstrip("/")
+    index_src = target_dir.joinpath(DefaultValues.catalog_index_file_name.value)
+    index_meta_src = target_dir.joinpath(
+        DefaultValues.catalog_index_metafile_json.value
+    )
+
+    local_revision = None
+    if index_src.exists() and index_meta_src.exists():
+        local_revision = get_dict_entry(
+            get_dict_from_json(index_meta_src),
+            DefaultValues.catalog_index_revision_key.value,
+        )
+
+    # meta file - must be available
+    conditional_download(
+        "/".join([index_url, DefaultValues.catalog_index_metafile_json.value]),
+        index_meta_src,
+    )
+    meta = get_dict_from_json(index_meta_src)
+    remote_revision = get_dict_entry(
+        meta, DefaultValues.catalog_index_revision_key.value
+    )
+
+    try:
+        if remote_revision is None:
+            _download_index_file(index_url, index_src, None)
+        elif local_revision is None or local_revision > remote_revision:
+            _download_index_file(
+                index_url,
+                index_src,
+                get_dict_entry(meta, DefaultValues.catalog_index_compressed_key.value),
+            )
+        elif local_revision < remote_revision:
+            try:
+                _apply_index_deltas(
+                    index_url, index_src, meta, local_revision, remote_revision
+                )
+            except FileNotFoundError:
+                module_logger().debug(
+                    "Index deltas not available. Downloading the whole index..."
+                )
+                _download_index_file(
+                    index_url,
+                    index_src,
+                    get_dict_entry(
+                        meta, DefaultValues.catalog_index_compressed_key.value
+                    ),
+                )
+    except Exception:
+        # never keep an index not matching the meta file
+        force_remove(index_src, warning=False)
+        force_remove(index_meta_src, warning=False)
+        raise
+
+    return index_src, index_meta_src
+
+
+def _download_index_file(
+    index_url: str, index_src: Path, compressed_file_name: Optional[str]
+) -> None:
+    """Download the index file, prefers the compressed copy when the catalog publishes one."""
+    if compressed_file_name:
+        # the present index might differ from the compressed copy after applying deltas
+        compressed_src = index_src.parent.joinpath(compressed_file_name)
+        conditional_download(
+            "/".join([index_url, compressed_file_name]), compressed_src
+        )
+        decompress_file(compressed_src, index_src)
+        return
+
+    try:
+        # db file - optional
+        conditional_download(
+            "/".join([index_url, DefaultValues.catalog_index_file_name.value]),
+            index_src,
+        )
+    except FileNotFoundError:
+        # catalog index file does not have to be present for empty catalogs
+        force_remove(index_src, warning=False)
+
+
+def _apply_index_deltas(
+    index_url: str,
+    index_src: Path,
+    meta: Dict[str, Any],
+    local_revision: int,
+    remote_revision: int,
+) -> None:
+    """Download the delta files of the given revision range and apply them to a copy of the index.
+
+    Raises:
+        FileNotFoundError when a delta file of the range is not (or no longer) published.
+
+    """
+    with tempfile.TemporaryDirectory(dir=index_src.parent) as tmp_dir:
+        changes: List[Dict[str, Any]] = []
+        for revision in range(local_revision + 1, remote_revision + 1):
+            delta_file = Path(tmp_dir).joinpath("%s.json" % revision)
+            conditional_download(
+                "/".join(
+                    [
+                        index_url,
+                        DefaultValues.catalog_index_delta_prefix.value,
+                        delta_file.name,
+                    ]
+                ),
+                delta_file,
+            )
+            changes.extend(get_dict_from_json(delta_file)["changes"])
+
+        tmp_index = Path(tmp_dir).joinpath(index_src.name)
+        copy(index_src, tmp_index)
+        catalog_index = CatalogIndex(meta["name"], tmp_index)
+        try:
+            catalog_index.apply_changes(changes, close=False)
+        finally:
+            catalog_index.close()
+        os.replace(tmp_index, index_src)
+
+
 class Catalog(ICatalog):
     """Catalog class to represent a catalog in the Album system."""
 
@@ -108,7 +253,11 @@ class Catalog(ICatalog):
         self._index_file_path = self._path.joinpath(
             DefaultValues.catalog_index_file_name.value
         )
+        self._index_http_cache_path = self._path.joinpath(
+            DefaultValues.catalog_index_http_cache_prefix.value
+        )
         self._type = catalog_type
+        self._index_changes: List[Dict[str, Any]] = []
 
         if self.is_local() and self._src:
             self._src = str(Path(self._src).absolute())
@@ -132,11 +281,15 @@ class Catalog(ICatalog):
         )
 
     def is_local(self) -> bool:
+        import validators
+
         return not self._src or (
             not validators.url(str(self._src)) and Path(self._src).exists()
         )
 
     def update_index_cache_if_possible(self, tmp_dir: str) -> bool:
+        from git import GitCommandError
+
         try:
             self.update_index_cache(tmp_dir)
         except GitCommandError as e:
@@ -169,6 +322,50 @@ class Catalog(ICatalog):
         if self._catalog_index is None:
             raise RuntimeError("Catalog index not loaded!")
 
+        solution_attrs, exists = self._get_index_attrs(active_solution, force_overwrite)
+
+        self._catalog_index.update(active_solution.coordinates(), solution_attrs)
+        self._catalog_index.save()
+        self._catalog_index.export(self._solution_list_path)
+
+        self._append_index_change(solution_attrs, exists)
+
+    def add_all(
+        self, active_solutions: List[ISolution], force_overwrite: bool = False
+    ) -> None:
+        if self._catalog_index is None:
+            raise RuntimeError("Catalog index not loaded!")
+
+        # validate all solutions before changing the index
+        errors = []
+        to_add = []
+        coordinates_to_add: List[ICoordinates] = []
+        for active_solution in active_solutions:
+            coordinates = active_solution.coordinates()
+            try:
+                if coordinates in coordinates_to_add:
+                    raise RuntimeError("Solution added more than once! Aborting...")
+                coordinates_to_add.append(coordinates)
+                to_add.append(self._get_index_attrs(active_solution, force_overwrite))
+            except RuntimeError as e:
+                errors.append("%s: %s" % (coordinates, e))
+        if errors:
+            raise RuntimeError(
+                "Cannot add %s of %s solution(s) to catalog %s:\n%s"
+                % (len(errors), len(active_solutions), self._name, "\n".join(errors))
+            )
+
+        for coordinates, (solution_attrs, exists) in zip(coordinates_to_add, to_add):
+            self._catalog_index.update(coordinates, solution_attrs, close=False)
+            self._append_index_change(solution_attrs, exists)
+        self._catalog_index.save()
+        self._catalog_index.export(self._solution_list_path)
+
+    def _get_index_attrs(
+        self, active_solution: ISolution, force_overwrite: bool
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Return the index attributes of a solution and whether it already exists in the index."""
+        assert self._catalog_index is not None
         solution_attrs = get_deploy_dict(active_solution)
 
         if active_solution.setup().doi:
@@ -194,9 +391,17 @@ class Catalog(ICatalog):
             else:
                 raise RuntimeError("Solution already exists in catalog! Aborting...")
 
-        self._catalog_index.update(active_solution.coordinates(), solution_attrs)
-        self._catalog_index.save()
-        self._catalog_index.export(self._solution_list_path)
+        return solution_attrs, lookup_solution is not None
+
+    def _append_index_change(self, solution_attrs: Dict[str, Any], exists: bool):
+        self._index_changes.append(
+            {
+                "change_type": (
+                    ChangeType.CHANGED.name if exists else ChangeType.ADDED.name
+                ),
+                "solution": solution_attrs,
+            }
+        )
 
     def remove(self, coordinates: ICoordinates) -> None:
         if self._catalog_index is None:
@@ -207,10 +412,32 @@ class Catalog(ICatalog):
         )
         if solution_entry:
             self._catalog_index.export(self._solution_list_path)
+            self._index_changes.append(
+                {
+                    "change_type": ChangeType.REMOVED.name,
+                    "group": coordinates.group(),
+                    "name": coordinates.name(),
+                    "version": coordinates.version(),
+                }
+            )
         else:
             module_logger().warning("Solution not found! Doing nothing...")
 
     def _update_index_cache(self, tmp_dir: str) -> bool:
+        index_url = self.index_url()
+        if index_url:
+            try:
+                src, meta_src = retrieve_index_files_from_url(
+                    index_url, self._index_http_cache_path
+                )
+                return self._copy_index_to_cache(src, meta_src)
+            except (ConnectionError, FileNotFoundError) as e:
+                module_logger().warning(
+                    "Could not retrieve index from %s. Falling back to git..."
+                    % index_url
+                )
+                module_logger().debug(e)
+
         repo_dir = Path(tmp_dir).joinpath("repo")
         try:
             src, meta_src = retrieve_index_files_from_src(
@@ -245,13 +472,60 @@ class Catalog(ICatalog):
                 return False
         return True
 
+    def export_index_transport(
+        self, path: Path, changes: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Path]:
+        path = Path(path)
+        meta_file = path.joinpath(DefaultValues.catalog_index_metafile_json.value)
+        meta = get_dict_from_json(meta_file) if meta_file.exists() else {}
+
+        # only catalogs serving their index files via http make use of the transport files
+        if not get_dict_entry(meta, DefaultValues.catalog_index_url_key.value):
+            return []
+
+        if changes is None:
+            changes = self._index_changes
+            self._index_changes = []
+
+        revision = (
+            get_dict_entry(meta, DefaultValues.catalog_index_revision_key.value) or 0
+        ) + 1
+        delta_dir = path.joinpath(DefaultValues.catalog_index_delta_prefix.value)
+        module_logger().debug(
+            "Writing index delta of revision %s to %s..." % (revision, delta_dir)
+        )
+        write_dict_to_json(
+            delta_dir.joinpath("%s.json" % revision),
+            {"revision": revision, "changes": changes},
+        )
+        retention = DefaultValues.catalog_index_delta_retention.value
+        for delta_file in delta_dir.glob("*.json"):
+            if (
+                delta_file.stem.isdigit()
+                and int(delta_file.stem) <= revision - retention
+            ):
+                force_remove(delta_file)
+
+        compressed_file = path.joinpath(
+            DefaultValues.catalog_index_compressed_file_name.value
+        )
+        compress_file(self._index_file_path, compressed_file)
+
+        meta[DefaultValues.catalog_index_revision_key.value] = revision
+        meta[DefaultValues.catalog_index_compressed_key.value] = compressed_file.name
+        write_dict_to_json(meta_file, meta)
+
+        return [meta_file, compressed_file, delta_dir]
+
     @contextmanager
     def retrieve_catalog(
         self,
         path: Union[Path, None] = None,
         force_retrieve: bool = False,
         update: bool = True,
-    ) -> Generator[Repo, None, None]:
+    ) -> Generator["Repo", None, None]:
+        from album.core.utils.operations.git_operations import download_repository
+
         if self.is_cache():
             raise RuntimeError("Cannot retrieve a cache catalog as no source exists!")
 
@@ -296,6 +570,16 @@ class Catalog(ICatalog):
     def src(self) -> str:
         return self._src
 
+    def index_url(self) -> Optional[str]:
+        if not self._meta_file_path.exists():
+            return None
+        try:
+            meta_dict = get_dict_from_json(self._meta_file_path)
+        except json.JSONDecodeError:
+            # a broken cache gets replaced with the meta file from the catalog src
+            return None
+        return get_dict_entry(meta_dict, DefaultValues.catalog_index_url_key.value)
+
     def version(self) -> str:
         return self._version
 
@@ -5,8 +5,10 @@ from typing import Any, Dict, List, Optional, Union
 
 from album.runner import album_logging
 from album.runner.core.api.model.coordinates import ICoordinates
+from album.runner.core.model.coordinates import Coordinates
 
 from album.core.api.model.catalog_index import ICatalogIndex
+from album.core.api.model.catalog_updates import ChangeType
 from album.core.model.database import Database
 from album.core.model.default_values import DefaultValues
 from album.core.utils.operations.file_operations import (
@@ -706,6 +708,29 @@ class CatalogIndex(ICatalogIndex, Database):
             module_logger().debug("Insert solution...")
             self._insert_solution(solution_attrs, close=close)
 
+    def apply_changes(self, changes: List[Dict[str, Any]], close: bool = True) -> None:
+        module_logger().debug("Apply %s change(s) to index..." % len(changes))
+
+        for change in changes:
+            if change["change_type"] == ChangeType.REMOVED.name:
+                coordinates = Coordinates(
+                    change["group"], change["name"], change["version"]
+                )
+                self.remove_solution_by_group_name_version(coordinates, close=False)
+            else:
+                solution_attrs = change["solution"]
+                coordinates = Coordinates(
+                    solution_attrs["group"],
+                    solution_attrs["name"],
+                    solution_attrs["version"],
+                )
+                self.update(coordinates, solution_attrs, close=False)
+
+        self.save()
+
+        if close:
+            self.close_current_connection()
+
     def save(self) -> None:
         module_logger().debug("Saving index...")
         self.get_connection().commit()
@@ -377,7 +377,7 @@ class CollectionIndex(ICollectionIndex, Database):
 
         if "args" in solution_attrs:
             for argument in solution_attrs["args"]:
-                argument_id = self._exists_argument(argument, catalog_id)
+                argument_id = self._exists_argument(argument, catalog_id, close=False)
                 if not argument_id:
                     argument_id = self._insert_argument(
                         argument, catalog_id, close=False
@@ -388,7 +388,9 @@ class CollectionIndex(ICollectionIndex, Database):
 
         if "covers" in solution_attrs:
             for cover in solution_attrs["covers"]:
-                if not self._exists_cover(cover, catalog_id, collection_id):
+                if not self._exists_cover(
+                    cover, catalog_id, collection_id, close=False
+                ):
                     self._insert_cover(cover, catalog_id, collection_id, close=False)
 
         if "documentation" in solution_attrs:
@@ -403,7 +405,9 @@ class CollectionIndex(ICollectionIndex, Database):
         if "custom" in solution_attrs:
             for custom in solution_attrs["custom"]:
                 custom_value = solution_attrs["custom"][custom]
-                custom_id = self._exists_custom(custom, custom_value, catalog_id)
+                custom_id = self._exists_custom(
+                    custom, custom_value, catalog_id, close=False
+                )
                 if not custom_id:
                     custom_id = self._insert_custom(
                         custom, custom_value, catalog_id, close=False
@@ -1496,6 +1500,47 @@ class CollectionIndex(ICollectionIndex, Database):
         if close:
             self.close_current_connection()
 
+    # ### link ###
+
+    def get_link_target(self, link: str, close: bool = True) -> Optional[str]:
+        cursor = self.get_cursor()
+
+        r = cursor.execute(
+            "SELECT target FROM link WHERE link=:link", {"link": link}
+        ).fetchone()
+
+        if close:
+            self.close_current_connection()
+
+        return r["target"] if r else None
+
+    def get_all_links(self, close: bool = True) -> Dict[str, str]:
+        cursor = self.get_cursor()
+
+        r = cursor.execute("SELECT link, target FROM link").fetchall()
+
+        if close:
+            self.close_current_connection()
+
+        return {row["link"]: row["target"] for row in r}
+
+    def set_link_target(self, link: str, target: str, close: bool = True) -> None:
+        cursor = self.get_cursor()
+        cursor.execute(
+            "INSERT OR REPLACE INTO link (link, target) VALUES (:link, :target)",
+            {"link": link, "target": target},
+        )
+
+        if close:
+            self.close_current_connection()
+
+    def remove_link(self, link: str, close: bool = True) -> None:
+        cursor = self.get_cursor()
+        cursor.execute("DELETE FROM link WHERE link=:link", {"link": link})
+
+        if close:
+            self.close_current_connection()
+
     def is_installed(
         self, catalog_id: int, coordinates: ICoordinates, close: bool = True
     ) -> bool:
@@ -1,7 +1,8 @@
 """Implements the IConfiguration interface."""
 
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from album.core.api.model.configuration import IConfiguration
 from album.core.model.default_values import DefaultValues
@@ -9,7 +10,12 @@ from album.core.utils.operations.file_operations import (
     create_paths_recursively,
     get_dict_from_json,
 )
-from album.environments.utils.file_operations import force_remove
+from album.core.utils.operations.tmp_operations import (
+    clean_tmp,
+    create_process_tmp_dir,
+)
+from album.core.utils.operations.trash_operations import empty_trash
+from album.core.utils.profiling import profiled
 from album.runner import album_logging
 from album.runner.core.api.model.coordinates import ICoordinates
 
@@ -22,12 +28,21 @@ class Configuration(IConfiguration):
         self._base_cache_path = None
         self._conda_executable = None
         self._tmp_path = None
+        self._tmp_base_path = None
         self._cache_path_envs = None
         self._catalog_collection_path = None
         self._installation_path = None
         self._cache_path_download = None
         self._lnk_path = None
         self._shared_globally_path = None
+        self._blob_path = None
+        self._solution_metadata_cache_path = None
+        self._doi_cache_path = None
+        self._environment_fingerprints_path = None
+        self._trash_path = None
+        # serializes deleting the trash in the background with explicit calls of empty_trash
+        self._trash_lock = threading.Lock()
+        self._trash_deleted_in_background: List[Path] = []
 
     def base_cache_path(self) -> Path:
         return self._base_cache_path
@@ -50,10 +65,27 @@ class Configuration(IConfiguration):
     def shared_resources_path(self) -> Path:
         return self._shared_globally_path
 
+    def blob_path(self) -> Path:
+        return self._blob_path
+
+    def solution_metadata_cache_path(self) -> Path:
+        return self._solution_metadata_cache_path
+
+    def doi_cache_path(self) -> Path:
+        return self._doi_cache_path
+
+    def environment_fingerprints_path(self) -> Path:
+        return self._environment_fingerprints_path
+
+    def trash_path(self) -> Path:
+        return self._trash_path
+
     def is_setup(self) -> bool:
         return self._is_setup
 
-    def setup(self, base_cache_path: Union[None, str, Path] = None) -> None:
+    def setup(
+        self, base_cache_path: Union[None, str, Path] = None, clean_trash: bool = True
+    ) -> None:
         if self._is_setup:
             raise RuntimeError(
                 "Configuration::setup was already called and should not be called twice."
@@ -77,7 +109,7 @@ class Configuration(IConfiguration):
         self._installation_path = self._base_cache_path.joinpath(
             DefaultValues.installation_folder_prefix.value
         )
-        self._tmp_path = self._base_cache_path.joinpath(
+        self._tmp_base_path = self._base_cache_path.joinpath(
             DefaultValues.cache_path_tmp_prefix.value
         )
         self._lnk_path = self._base_cache_path.joinpath(
@@ -86,20 +118,72 @@ class Configuration(IConfiguration):
         self._shared_globally_path = self._base_cache_path.joinpath(
             DefaultValues.shared_globally_suffix.value
         )
+        self._blob_path = self._base_cache_path.joinpath(
+            DefaultValues.cache_path_blob_prefix.value
+        )
+        self._solution_metadata_cache_path = self._base_cache_path.joinpath(
+            DefaultValues.cache_path_solution_meta_prefix.value
+        )
+        self._doi_cache_path = self._base_cache_path.joinpath(
+            DefaultValues.cache_path_doi_prefix.value
+        )
+        self._environment_fingerprints_path = self._base_cache_path.joinpath(
+            DefaultValues.cache_path_env_fingerprint_prefix.value
+        )
+        self._trash_path = self._base_cache_path.joinpath(
+            DefaultValues.cache_path_trash_prefix.value
+        )
 
-        self._empty_tmp()
         create_paths_recursively(
             [
-                self._tmp_path,
+                self._tmp_base_path,
                 self._cache_path_download,
                 self._cache_path_envs,
                 self._catalog_collection_path,
                 self._installation_path,
                 self._lnk_path,
                 self._shared_globally_path,
+                self._blob_path,
+                self._solution_metadata_cache_path,
+                self._doi_cache_path,
+                self._environment_fingerprints_path,
+                self._trash_path,
             ]
         )
 
+        # each process uses its own temporary folder, leftovers of other processes are removed in the background
+        self._tmp_path = create_process_tmp_dir(self._tmp_base_path)
+        threading.Thread(
+            target=self.clean_tmp, name="album-tmp-cleanup", daemon=True
+        ).start()
+        # resume deleting the trash, e.g. after an interrupted album gc
+        if clean_trash:
+            threading.Thread(
+                target=self._empty_trash_in_background,
+                name="album-trash-cleanup",
+                daemon=True,
+            ).start()
+
+    @profiled("tmp cleanup")
+    def clean_tmp(self, max_age: Optional[int] = None) -> List[Path]:
+        if max_age is None:
+            max_age = DefaultValues.tmp_max_age.value
+        return clean_tmp(self._tmp_base_path, max_age, keep=self._tmp_path)
+
+    @profiled("trash cleanup")
+    def empty_trash(self, max_workers: int = 1) -> List[Path]:
+        # waits for the deletion started in the background, its entries are part of the result
+        with self._trash_lock:
+            deleted = self._trash_deleted_in_background + empty_trash(
+                self._trash_path, max_workers
+            )
+            self._trash_deleted_in_background = []
+        return deleted
+
+    def _empty_trash_in_background(self) -> None:
+        with self._trash_lock:
+            self._trash_deleted_in_background += empty_trash(self._trash_path)
+
     def get_solution_path_suffix(self, coordinates: ICoordinates) -> Path:
         return Path("").joinpath(
             DefaultValues.catalog_solutions_prefix.value,
@@ -147,10 +231,3 @@ class Configuration(IConfiguration):
         return {
             DefaultValues.default_catalog_name.value: DefaultValues.default_catalog_src_branch.value
         }
-
-    def _empty_tmp(self) -> None:
-        # Following two commented functions should not be done since there could be links in
-        # tmp_user or tmp_internal which have to be resolved when deleting them!
-        # force_remove(self._cache_path_tmp_user)
-        # force_remove(self._cache_path_tmp_internal)
-        force_remove(self._tmp_path)
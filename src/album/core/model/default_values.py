@@ -66,7 +66,7 @@ class DefaultValues(Enum):
         "catalog_collection.json"  # the default name of the Collection JSON
     )
     catalog_collection_db_version = (
-        "0.1.0"  # the version of the collection database created by this album version
+        "0.2.0"  # the version of the collection database created by this album version
     )
     catalog_index_file_name = (
         "album_catalog_index.db"  # the default index file name of the catalog_index
@@ -77,6 +77,27 @@ class DefaultValues(Enum):
     catalog_index_db_version = (
         "0.1.0"  # the version of the catalog database created by this album version
     )
+    catalog_index_url_key = (
+        "index_url"  # meta file key of an optional raw file url serving the index files
+    )
+    catalog_index_http_cache_prefix = (
+        "index_http"  # catalog cache folder of the index files fetched via http
+    )
+    catalog_index_revision_key = (
+        "revision"  # meta file key counting the published changes of the index
+    )
+    catalog_index_compressed_key = (
+        "index_compressed"  # meta file key naming the compressed copy of the index
+    )
+    catalog_index_compressed_file_name = (
+        "album_catalog_index.db.gz"  # compressed copy of the index (.gz or .xz)
+    )
+    catalog_index_delta_prefix = (
+        "index_deltas"  # folder holding one file of solution changes per revision
+    )
+    catalog_index_delta_retention = (
+        100  # number of revisions a catalog keeps delta files for
+    )
     catalog_solution_list_file_name = "album_solution_list.json"  # the default file name for exporting the list of solutions of a catalog  # noqa: E501
     catalog_folder_prefix = (
         "catalogs"  # base folder prefix where all not local catalogs live
@@ -85,14 +106,63 @@ class DefaultValues(Enum):
         "installations"  # base folder prefix where installations live
     )
     cache_path_tmp_prefix = "tmp"  # base folder prefix where solution unspecific internal temporary files live
+    tmp_max_age = int(
+        os.getenv("ALBUM_TMP_MAX_AGE", 60 * 60)
+    )  # seconds before temporary files of processes no longer running are removed
+    lease_max_age = int(
+        os.getenv("ALBUM_LEASE_MAX_AGE", 10 * 60)
+    )  # seconds a lease of a process on another host stays valid without being refreshed
+    install_max_workers = int(
+        os.getenv("ALBUM_INSTALL_MAX_WORKERS", 4)
+    )  # number of solutions installed concurrently by album install with several solutions
+    gc_max_workers = int(
+        os.getenv("ALBUM_GC_MAX_WORKERS", 8)
+    )  # number of threads deleting or scanning concurrently when running album gc or album du
+    gc_orphan_min_age = int(
+        os.getenv("ALBUM_GC_ORPHAN_MIN_AGE", 60 * 60)
+    )  # seconds before links and folders not used by an installed solution are considered orphaned
     link_folder_prefix = (
         "lnk"  # base folder prefix where all internal link destinations live
     )
     catalog_solutions_prefix = "solutions"  # base folder prefix where solutions live
     cache_path_download_prefix = "downloads"  # base folder prefix where downloads live
     cache_path_envs_prefix = "envs"  # base folder prefix where environments live in
+    cache_path_blob_prefix = (
+        "blobs"  # base folder prefix of the content addressed store of package files
+    )
+    cache_path_solution_meta_prefix = (
+        "solution_meta"  # base folder prefix of cached solution metadata and code
+    )
+    cache_path_env_fingerprint_prefix = (
+        "env_fingerprints"  # base folder prefix of the registry of shared environments
+    )
+    cache_path_trash_prefix = (
+        "trash"  # base folder prefix of removed folders waiting for deletion
+    )
+    cache_path_doi_prefix = (
+        "doi"  # base folder prefix of the cache of solutions downloaded via DOI
+    )
+    doi_cache_meta_file_name = (
+        "doi.json"  # file describing a complete entry of the DOI cache
+    )
+    doi_cache_max_size = (
+        1024 * 1024 * 1024  # size in bytes the DOI cache gets evicted to
+    )
+    cache_path_url_prefix = (
+        "urls"  # download cache folder of solutions resolved via url
+    )
+    url_cache_file_name = "download"  # name of a cached url download
+    cache_path_extraction_prefix = (
+        "extracted"  # download cache folder of archives extracted by content hash
+    )
+    extraction_cache_max_size = (
+        1024 * 1024 * 1024  # size in bytes the extraction cache gets evicted to
+    )
 
     shared_globally_suffix = "shared_downloads"  # suffix for shared globally downloads
+    entry_point_cache_file_name = (
+        "entry_points.json"  # cache of discovered entry points in the base data path
+    )
 
     # solutions
     solution_default_name = (
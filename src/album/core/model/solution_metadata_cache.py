@@ -0,0 +1,182 @@
+"""Solution metadata cache module."""
+
+import copy
+import hashlib
+import json
+import marshal
+import os
+import sys
+import tempfile
+from pathlib import Path
+from types import CodeType
+from typing import Any, Dict, Optional, Union
+
+from album.runner import album_logging
+
+from album.core.utils.operations.file_operations import create_path_recursively
+
+module_logger = album_logging.get_active_logger
+
+
+class SolutionMetadataCache:
+    """Caches the migrated setup attributes and the compiled code of solution files.
+
+    Entries are kept in memory and persisted in the cache folder. An entry is only valid for a solution file with
+    the same path, size, modification time and content hash it was created from. Attributes holding functions of
+    the solution are not cached, these are only available after executing the solution.
+
+    """
+
+    class Entry:
+        def __init__(
+            self,
+            attrs: Optional[Dict[str, Any]] = None,
+            code: Optional[CodeType] = None,
+        ):
+            self.attrs = attrs
+            self.code = code
+
+    def __init__(self, path: Union[str, Path]):
+        self._path = Path(path)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    def get(self, solution_file: Union[str, Path], source: bytes) -> Optional[Entry]:
+        """Return the cached entry of a solution file or None if the file changed since it was cached.
+
+        Args:
+            solution_file:
+                Path to the solution file.
+            source:
+                The content of the solution file.
+
+        """
+        key = self._get_key(solution_file)
+        stat_key = self._get_stat_key(solution_file, source)
+
+        meta = self._entries.get(key, None)
+        if meta is None:
+            meta = self._read_meta(key)
+        if meta is None or meta["stat"] != stat_key:
+            return None
+        self._entries[key] = meta
+
+        if meta.get("code", None) is None:
+            meta["code"] = self._read_code(key, stat_key)
+
+        attrs = meta.get("attrs", None)
+        return SolutionMetadataCache.Entry(
+            copy.deepcopy(attrs) if attrs is not None else None, meta["code"]
+        )
+
+    def put(
+        self,
+        solution_file: Union[str, Path],
+        source: bytes,
+        attrs: Dict[str, Any],
+        code: CodeType,
+    ) -> None:
+        """Cache the migrated setup attributes and the compiled code of a solution file."""
+        key = self._get_key(solution_file)
+        try:
+            metadata = self._get_metadata(attrs)
+        except (TypeError, ValueError, copy.Error):
+            # attributes cannot be copied - only cache the code
+            metadata = None
+        meta = {
+            "path": str(Path(solution_file).absolute()),
+            "stat": self._get_stat_key(solution_file, source),
+            "attrs": metadata,
+        }
+
+        try:
+            self._write(
+                self._path.joinpath(key + ".json"),
+                json.dumps(meta).encode("utf-8"),
+            )
+            # the meta file and the code file are replaced separately, the code is stored with the stat key
+            # it was compiled from to never combine it with the meta of another version of the solution
+            self._write(self._get_code_path(key), marshal.dumps((meta["stat"], code)))
+        except (TypeError, ValueError, OSError) as e:
+            # attributes not serializable or cache not writable - keep the entry in memory
+            module_logger().debug(
+                "Cannot persist metadata of solution %s: %s" % (solution_file, e)
+            )
+
+        meta["code"] = code
+        self._entries[key] = meta
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries = {}
+        if self._path.exists():
+            for f in self._path.iterdir():
+                f.unlink()
+
+    def _read_meta(self, key: str) -> Optional[Dict[str, Any]]:
+        meta_file = self._path.joinpath(key + ".json")
+        if not meta_file.exists():
+            return None
+        try:
+            with open(meta_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _read_code(self, key: str, stat_key: list) -> Optional[CodeType]:
+        code_file = self._get_code_path(key)
+        if not code_file.exists():
+            return None
+        try:
+            with open(code_file, "rb") as f:
+                code_stat_key, code = marshal.load(f)
+        except (OSError, ValueError, EOFError, TypeError):
+            return None
+        if code_stat_key != stat_key or not isinstance(code, CodeType):
+            return None
+        return code
+
+    def _get_code_path(self, key: str) -> Path:
+        # marshalled code is only valid for the python version writing it
+        return self._path.joinpath("%s.%s.code" % (key, sys.implementation.cache_tag))
+
+    def _write(self, target: Path, content: bytes) -> None:
+        create_path_recursively(self._path)
+        fd, tmp_file_name = tempfile.mkstemp(dir=self._path)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_file_name, target)
+        finally:
+            if os.path.exists(tmp_file_name):
+                os.remove(tmp_file_name)
+
+    @staticmethod
+    def _get_key(solution_file: Union[str, Path]) -> str:
+        return hashlib.sha256(
+            str(Path(solution_file).absolute()).encode("utf-8")
+        ).hexdigest()
+
+    @staticmethod
+    def _get_stat_key(solution_file: Union[str, Path], source: bytes) -> list:
+        stat = os.stat(solution_file)
+        return [
+            str(Path(solution_file).absolute()),
+            stat.st_size,
+            stat.st_mtime_ns,
+            hashlib.sha256(source).hexdigest(),
+        ]
+
+    @staticmethod
+    def _get_metadata(value: Any) -> Any:
+        """Return a copy of the attributes without functions of the solution."""
+        if isinstance(value, dict):
+            return {
+                k: SolutionMetadataCache._get_metadata(v)
+                for k, v in value.items()
+                if not callable(v)
+            }
+        if isinstance(value, (list, tuple)):
+            return [
+                SolutionMetadataCache._get_metadata(v) for v in value if not callable(v)
+            ]
+        return copy.deepcopy(value)
@@ -179,3 +179,10 @@ CREATE TABLE IF NOT EXISTS collection_custom
     FOREIGN KEY (catalog_id) REFERENCES catalog (catalog_id)
 );
 
+CREATE TABLE IF NOT EXISTS link
+(
+    link_id INTEGER PRIMARY KEY,
+    link    TEXT not null UNIQUE,
+    target  TEXT not null
+);
+
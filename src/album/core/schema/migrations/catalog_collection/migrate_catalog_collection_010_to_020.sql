@@ -0,0 +1,9 @@
+CREATE TABLE IF NOT EXISTS link
+(
+    link_id INTEGER PRIMARY KEY,
+    link    TEXT not null UNIQUE,
+    target  TEXT not null
+);
+
+UPDATE catalog_collection
+SET version = '0.2.0';
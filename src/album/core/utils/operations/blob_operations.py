@@ -0,0 +1,150 @@
+"""Content addressed store of files, shared between solution packages via hardlinks."""
+
+import hashlib
+import os
+import shutil
+import stat
+import tempfile
+from pathlib import Path
+from typing import List, Union
+
+from album.core.utils.operations.file_operations import create_path_recursively
+from album.environments.utils.file_operations import force_remove
+from album.runner import album_logging
+
+module_logger = album_logging.get_active_logger
+
+BLOB_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def get_file_hash(file: Union[str, Path]) -> str:
+    """Return the sha256 hex digest of the content of a file."""
+    h = hashlib.sha256()
+    with open(file, "rb") as f:
+        for chunk in iter(lambda: f.read(BLOB_HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def get_blob_path(blob_root: Union[str, Path], file: Union[str, Path]) -> Path:
+    """Return the path of the blob storing the content of the given file.
+
+    Executable files are stored apart from other files, as the file mode is shared between all links of a blob.
+
+    """
+    file_hash = get_file_hash(file)
+    blob_name = file_hash + (".x" if os.access(file, os.X_OK) else "")
+    return Path(blob_root).joinpath(file_hash[:2], blob_name)
+
+
+def store_blob(blob_root: Union[str, Path], file: Union[str, Path]) -> Path:
+    """Add the content of a file to the blob store. Returns the path of the blob.
+
+    Blobs are shared between all files linked to them. Album never writes into a materialized file in place, the
+    link is always replaced instead.
+
+    """
+    file = Path(file)
+    blob = get_blob_path(blob_root, file)
+
+    if blob.exists():
+        if blob.stat().st_size == file.stat().st_size:
+            return blob
+        module_logger().warning("Replacing corrupted blob %s..." % blob)
+        force_remove(blob)
+
+    create_path_recursively(blob.parent)
+    fd, tmp_file_name = tempfile.mkstemp(dir=blob.parent)
+    os.close(fd)
+    try:
+        shutil.copyfile(file, tmp_file_name)
+        os.chmod(tmp_file_name, stat.S_IMODE(file.stat().st_mode))
+        os.replace(tmp_file_name, blob)
+    finally:
+        if os.path.exists(tmp_file_name):
+            force_remove(tmp_file_name)
+
+    return blob
+
+
+def link_file_from_blob(
+    blob_root: Union[str, Path], file: Union[str, Path], target: Union[str, Path]
+) -> Path:
+    """Materialize a file at the target path as hardlink to the blob of its content.
+
+    Falls back to copying the file in case the file system does not support hardlinks between the blob store and
+    the target.
+
+    """
+    target = Path(target)
+    blob = store_blob(blob_root, file)
+
+    create_path_recursively(target.parent)
+    # never write into an existing target, it might be a link to another blob
+    force_remove(target)
+    try:
+        os.link(blob, target)
+    except OSError as e:
+        module_logger().debug(
+            "Cannot link %s to %s, copying instead: %s" % (blob, target, e)
+        )
+        shutil.copy(file, target)
+
+    return target
+
+
+def link_folder_from_blobs(
+    blob_root: Union[str, Path], folder: Union[str, Path], target: Union[str, Path]
+) -> List[Path]:
+    """Materialize the content of a folder in the target folder as hardlinks to the blob store.
+
+    Behaves like copying the content of the folder into the target folder. Files already present in the target
+    folder but not in the source folder are kept.
+
+    Returns:
+        The materialized files.
+
+    """
+    folder = Path(folder)
+    target = Path(target)
+    create_path_recursively(target)
+
+    files = []
+    for root, dirs, file_names in os.walk(folder):
+        for d in dirs:
+            create_path_recursively(target.joinpath(Path(root, d).relative_to(folder)))
+        for file_name in file_names:
+            file = Path(root, file_name)
+            files.append(
+                link_file_from_blob(
+                    blob_root, file, target.joinpath(file.relative_to(folder))
+                )
+            )
+
+    return files
+
+
+def get_unreferenced_blobs(blob_root: Union[str, Path]) -> List[Path]:
+    """Return all blobs no longer linked from any solution package."""
+    blob_root = Path(blob_root)
+    blobs: List[Path] = []
+    if not blob_root.exists():
+        return blobs
+
+    for blob_folder in blob_root.iterdir():
+        if not blob_folder.is_dir():
+            continue
+        for blob in blob_folder.iterdir():
+            if blob.is_file() and blob.stat().st_nlink <= 1:
+                blobs.append(blob)
+    return blobs
+
+
+def prune_blobs(blob_root: Union[str, Path]) -> List[Path]:
+    """Remove all blobs no longer linked from any solution package. Returns the removed blobs."""
+    removed = get_unreferenced_blobs(blob_root)
+    for blob in removed:
+        force_remove(blob)
+
+    module_logger().debug("Pruned %s blob(s) from %s." % (len(removed), blob_root))
+    return removed
@@ -0,0 +1,174 @@
+"""Offline bundles, single archives transporting catalogs, solution packages, environments and resources."""
+
+import hashlib
+import io
+import json
+import os
+import stat
+import tarfile
+import time
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Union
+
+from album.core.utils.operations.blob_operations import (
+    BLOB_HASH_CHUNK_SIZE,
+    get_file_hash,
+)
+from album.core.utils.operations.file_operations import create_path_recursively
+
+BUNDLE_MANIFEST_NAME = "album_bundle.json"
+BUNDLE_VERSION = "1"
+BUNDLE_CATALOGS_FOLDER = "catalogs"
+BUNDLE_ENVIRONMENTS_FOLDER = "environments"
+BUNDLE_RESOURCES_FOLDER = "resources"
+
+
+def write_bundle(
+    archive: Union[str, Path],
+    files: Dict[str, Union[str, Path]],
+    manifest: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Write a bundle archive.
+
+    The archive is written as a stream, starting with the manifest listing the sha256 and size of every file. It can
+    be read again from a pipe or any other source which cannot seek.
+
+    Args:
+        archive:
+            The archive to write. Compressed with gzip (.tar.gz, .tgz), xz (.tar.xz) or not compressed (.tar).
+        files:
+            The files to add, by their name in the archive.
+        manifest:
+            Further information to store in the manifest, e.g. the catalogs of the bundle.
+
+    Returns:
+        The manifest of the archive.
+
+    """
+    for name in files:
+        _check_name(name)
+    manifest = dict(
+        manifest,
+        version=BUNDLE_VERSION,
+        files={
+            name: {"sha256": get_file_hash(path), "size": os.path.getsize(path)}
+            for name, path in sorted(files.items())
+        },
+    )
+
+    archive = Path(archive)
+    create_path_recursively(archive.parent)
+    with tarfile.open(str(archive), "w|" + _get_compression(archive)) as tar:
+        data = json.dumps(manifest, indent=4).encode("utf-8")
+        info = tarfile.TarInfo(BUNDLE_MANIFEST_NAME)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        tar.addfile(info, io.BytesIO(data))
+        for name in manifest["files"]:
+            # hard linked files, e.g. solution package files shared via the blob store, are stored as files
+            st = os.stat(files[name])
+            info = tarfile.TarInfo(name)
+            info.size = st.st_size
+            info.mtime = int(st.st_mtime)
+            info.mode = stat.S_IMODE(st.st_mode)
+            with open(files[name], "rb") as f:
+                tar.addfile(info, f)
+    return manifest
+
+
+def read_bundle(archive: Union[str, Path], target: Union[str, Path]) -> Dict[str, Any]:
+    """Extract a bundle archive, verifying the content of every file against the manifest.
+
+    The archive is read as a stream, in a single pass.
+
+    Args:
+        archive:
+            The archive written by write_bundle.
+        target:
+            The folder to extract the files to.
+
+    Returns:
+        The manifest of the archive.
+
+    """
+    target = Path(target)
+    with tarfile.open(str(archive), "r|*") as tar:
+        members = iter(tar)
+        member = next(members, None)
+        if member is None or member.name != BUNDLE_MANIFEST_NAME:
+            raise ValueError("%s is not an album bundle!" % archive)
+        manifest = json.load(tar.extractfile(member))  # type: ignore[arg-type]
+        if manifest.get("version") != BUNDLE_VERSION:
+            raise ValueError(
+                "Bundle %s has version %s, only version %s is supported!"
+                % (archive, manifest.get("version"), BUNDLE_VERSION)
+            )
+        files = manifest["files"]
+        for name in files:
+            _check_name(name)
+
+        extracted = set()
+        for member in members:
+            if member.name not in files or member.name in extracted:
+                raise ValueError(
+                    "Unexpected member %s in bundle %s!" % (member.name, archive)
+                )
+            if not member.isfile():
+                raise ValueError(
+                    "Member %s of bundle %s is not a file!" % (member.name, archive)
+                )
+            _extract_file(
+                tar, member, target.joinpath(member.name), files[member.name]["sha256"]
+            )
+            extracted.add(member.name)
+
+    missing = set(files) - extracted
+    if missing:
+        raise ValueError(
+            "Bundle %s is incomplete, missing %s!"
+            % (archive, ", ".join(sorted(missing)))
+        )
+    return manifest
+
+
+def _extract_file(
+    tar: tarfile.TarFile, member: tarfile.TarInfo, path: Path, sha256: str
+) -> None:
+    h = hashlib.sha256()
+    create_path_recursively(path.parent)
+    src = tar.extractfile(member)
+    if src is None:
+        raise ValueError("Cannot read member %s!" % member.name)
+    with open(path, "wb") as f:
+        for chunk in iter(lambda: src.read(BLOB_HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+            f.write(chunk)
+    os.chmod(path, member.mode & 0o755 | 0o600)
+    if h.hexdigest() != sha256:
+        raise ValueError(
+            "Content of %s does not match the manifest of the bundle!" % member.name
+        )
+
+
+def _check_name(name: str) -> None:
+    path = PurePosixPath(name)
+    if (
+        name == BUNDLE_MANIFEST_NAME
+        or path.is_absolute()
+        or ".." in path.parts
+        or "\\" in name
+    ):
+        raise ValueError("Invalid file name %s in bundle!" % name)
+
+
+def _get_compression(archive: Path) -> str:
+    name = archive.name
+    if name.endswith(".tar.gz") or name.endswith(".tgz"):
+        return "gz"
+    if name.endswith(".tar.xz"):
+        return "xz"
+    if name.endswith(".tar"):
+        return ""
+    raise ValueError(
+        'Unsupported archive format "%s", use .tar.gz, .tgz, .tar.xz or .tar!' % name
+    )
@@ -0,0 +1,73 @@
+"""Size accounting of files and folders in the album cache."""
+
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Set, Tuple, Union
+
+
+def get_size(path: Union[str, Path]) -> int:
+    """Return the size of a file or folder in bytes.
+
+    Links are not followed. Files with several hard links, e.g. solution package files materialized from the blob
+    store, are counted once per call. Entries which cannot be accessed are skipped.
+
+    Args:
+        path:
+            The file or folder.
+
+    Returns:
+        The size in bytes, 0 if the path does not exist.
+
+    """
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return 0
+    if not stat.S_ISDIR(st.st_mode):
+        return st.st_size
+
+    seen: Set[Tuple[int, int]] = set()
+    total = 0
+    folders = [str(path)]
+    while folders:
+        try:
+            with os.scandir(folders.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            folders.append(entry.path)
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if st.st_nlink > 1:
+                        if (st.st_dev, st.st_ino) in seen:
+                            continue
+                        seen.add((st.st_dev, st.st_ino))
+                    total += st.st_size
+        except OSError:
+            continue
+    return total
+
+
+def get_sizes(paths: List[Union[str, Path]], max_workers: int = 1) -> List[int]:
+    """Return the sizes of several files or folders in bytes, scanning them concurrently.
+
+    Args:
+        paths:
+            The files or folders.
+        max_workers:
+            The number of threads scanning concurrently.
+
+    Returns:
+        The size of each path in the order of the paths.
+
+    """
+    if max_workers > 1 and len(paths) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(paths)), thread_name_prefix="album-du"
+        ) as executor:
+            return list(executor.map(get_size, paths))
+    return [get_size(path) for path in paths]
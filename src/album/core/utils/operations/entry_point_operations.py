@@ -0,0 +1,93 @@
+"""Discovery of the entry points of installed packages, cached between album calls."""
+
+import json
+import os
+import sys
+import tempfile
+from importlib.metadata import EntryPoint, entry_points
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from album.runner import album_logging
+
+module_logger = album_logging.get_active_logger
+
+# entry points already discovered by this process
+_entry_points: Dict[str, List[EntryPoint]] = {}
+
+
+def get_entry_points(
+    group: str, cache_file: Optional[Union[str, Path]] = None
+) -> List[EntryPoint]:
+    """Return the entry points of a group.
+
+    Discovering entry points scans the metadata of all installed packages. The result is kept for the running
+    process and, if a cache file is given, persisted together with the modification times of all folders on the
+    python path. Installing or removing a package changes these and invalidates the persisted entry points.
+    The cache file is only written if its folder exists.
+
+    Args:
+        group:
+            The entry point group.
+        cache_file:
+            The file persisting discovered entry points.
+
+    Returns:
+        The entry points of the group.
+
+    """
+    if group in _entry_points:
+        return _entry_points[group]
+
+    fingerprint = _get_path_fingerprint()
+    cache = _read_cache(cache_file) if cache_file else None
+    if cache is None or cache.get("fingerprint", None) != fingerprint:
+        cache = {"fingerprint": fingerprint, "groups": {}}
+
+    if group in cache["groups"]:
+        eps = [EntryPoint(name, value, group) for name, value in cache["groups"][group]]
+    else:
+        eps = list(entry_points(group=group))
+        cache["groups"][group] = [[ep.name, ep.value] for ep in eps]
+        if cache_file:
+            _write_cache(Path(cache_file), cache)
+
+    _entry_points[group] = eps
+    return eps
+
+
+def _get_path_fingerprint() -> List[Any]:
+    fingerprint: List[Any] = []
+    for path in sys.path:
+        try:
+            fingerprint.append([path, os.stat(path or ".").st_mtime_ns])
+        except OSError:
+            fingerprint.append([path, None])
+    return fingerprint
+
+
+def _read_cache(cache_file: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or not isinstance(cache.get("groups", None), dict):
+        return None
+    return cache
+
+
+def _write_cache(cache_file: Path, cache: Dict[str, Any]) -> None:
+    if not cache_file.parent.exists():
+        return
+    try:
+        fd, tmp_file_name = tempfile.mkstemp(dir=cache_file.parent)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_file_name, cache_file)
+        finally:
+            if os.path.exists(tmp_file_name):
+                os.remove(tmp_file_name)
+    except OSError as e:
+        module_logger().debug("Cannot cache entry points in %s: %s" % (cache_file, e))
@@ -0,0 +1,154 @@
+"""Registry of environments shared by solutions with identical dependencies, keyed by a dependency fingerprint."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import List, Optional, Union
+
+from album.core.utils.operations.file_operations import (
+    create_path_recursively,
+    force_remove,
+)
+from album.environments.utils.file_operations import get_dict_from_yml
+from album.runner import album_logging
+
+module_logger = album_logging.get_active_logger
+
+FINGERPRINT_TARGET_FILE_NAME = "target"
+FINGERPRINT_USERS_NAME = "users"
+
+
+def get_environment_fingerprint(
+    env_file: Union[str, Path], lock_file: Optional[Union[str, Path]] = None
+) -> str:
+    """Return the fingerprint of the dependencies of an environment.
+
+    The name of the environment is not part of the fingerprint. Two environments with the same fingerprint are
+    created from the same dependency specification and lock file.
+
+    Args:
+        env_file:
+            The prepared environment file.
+        lock_file:
+            The lock file the environment is created from, if present.
+
+    Returns:
+        The sha256 hex digest of the dependencies.
+
+    """
+    env_dict = get_dict_from_yml(env_file)
+    env_dict.pop("name", None)
+
+    sha = hashlib.sha256()
+    sha.update(json.dumps(env_dict, sort_keys=True, default=str).encode("utf-8"))
+    if lock_file and Path(lock_file).is_file():
+        sha.update(b"\0")
+        with open(lock_file, "rb") as f:
+            sha.update(f.read())
+    return sha.hexdigest()
+
+
+def get_fingerprint_target(
+    registry: Union[str, Path], fingerprint: str
+) -> Optional[Path]:
+    """Return the folder of the environment registered for a fingerprint or None if there is none."""
+    target_file = Path(registry).joinpath(fingerprint, FINGERPRINT_TARGET_FILE_NAME)
+    try:
+        target = Path(target_file.read_text())
+    except OSError:
+        return None
+    return target if target.is_dir() else None
+
+
+def get_fingerprint_users(registry: Union[str, Path], fingerprint: str) -> List[str]:
+    """Return the names of the environments using the environment registered for a fingerprint."""
+    users = Path(registry).joinpath(fingerprint, FINGERPRINT_USERS_NAME)
+    if not users.is_dir():
+        return []
+    return sorted(os.listdir(users))
+
+
+def get_registered_fingerprint(
+    registry: Union[str, Path], env_name: str
+) -> Optional[str]:
+    """Return the fingerprint an environment is registered for or None if it is not registered."""
+    registry = Path(registry)
+    if not registry.is_dir():
+        return None
+    for entry in registry.iterdir():
+        if entry.joinpath(FINGERPRINT_USERS_NAME, env_name).exists():
+            return entry.name
+    return None
+
+
+def register_environment(
+    registry: Union[str, Path],
+    fingerprint: str,
+    env_name: str,
+    target: Union[str, Path],
+) -> bool:
+    """Register an environment as user of the environment folder of a fingerprint.
+
+    The first environment registered for a fingerprint decides the folder all later users link to. An environment
+    living in another folder, e.g. created concurrently with the same fingerprint, is not registered.
+
+    Args:
+        registry:
+            The folder of the registry.
+        fingerprint:
+            The fingerprint of the dependencies of the environment.
+        env_name:
+            The name of the environment.
+        target:
+            The folder the environment lives in.
+
+    Returns:
+        True if the environment was registered.
+
+    """
+    entry = Path(registry).joinpath(fingerprint)
+    create_path_recursively(entry.joinpath(FINGERPRINT_USERS_NAME))
+    target = Path(target).resolve()
+    registered_target = get_fingerprint_target(registry, fingerprint)
+    if registered_target is None:
+        entry.joinpath(FINGERPRINT_TARGET_FILE_NAME).write_text(str(target))
+    elif registered_target.resolve() != target:
+        return False
+    entry.joinpath(FINGERPRINT_USERS_NAME, env_name).touch()
+    return True
+
+
+def release_environment(registry: Union[str, Path], env_name: str) -> Optional[bool]:
+    """Remove an environment from the users of its fingerprint.
+
+    Args:
+        registry:
+            The folder of the registry.
+        env_name:
+            The name of the environment.
+
+    Returns:
+        None if the environment is not registered, True if other environments still use its folder,
+        False if it was the last user. The registry entry is removed together with the last user.
+
+    """
+    registry = Path(registry)
+    if not registry.is_dir():
+        return None
+
+    for entry in registry.iterdir():
+        user = entry.joinpath(FINGERPRINT_USERS_NAME, env_name)
+        if not user.exists():
+            continue
+        force_remove(user)
+        if get_fingerprint_users(registry, entry.name):
+            module_logger().debug(
+                "Environment %s is still used by %s."
+                % (env_name, ", ".join(get_fingerprint_users(registry, entry.name)))
+            )
+            return True
+        force_remove(entry)
+        return False
+
+    return None
@@ -0,0 +1,244 @@
+"""Relocatable archives of environments, extracted on other hosts instead of creating the environment again."""
+
+import io
+import json
+import os
+import platform
+import posixpath
+import re
+import stat
+import sys
+import tarfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+from album.core.utils.operations.file_operations import create_path_recursively
+from album.runner import album_logging
+
+module_logger = album_logging.get_active_logger
+
+ENVIRONMENT_PACK_MANIFEST_NAME = "album_environment.json"
+ENVIRONMENT_PACK_FOLDER_NAME = "env"
+ENVIRONMENT_PACK_CHUNK_SIZE = 1024 * 1024
+
+# extraction filter refusing members outside the target folder, available since python 3.10.12
+_EXTRACT_ARGS: Dict[str, Any] = (
+    {"filter": "tar"} if hasattr(tarfile, "tar_filter") else {}
+)
+
+
+def get_environment_pack_platform() -> str:
+    """Return the platform environments packed on this host can be extracted on."""
+    return "%s-%s" % (sys.platform, platform.machine().lower())
+
+
+def write_environment_pack(
+    env_path: Union[str, Path], archive: Union[str, Path], manifest: Dict[str, Any]
+) -> Path:
+    """Write a relocatable archive of an environment.
+
+    Files containing the prefix of the environment are listed in the manifest of the archive and rewritten
+    when the archive is extracted. Links pointing into the environment are stored relative to their folder.
+
+    Args:
+        env_path:
+            The folder of the environment.
+        archive:
+            The archive to write. Compressed with gzip (.tar.gz, .tgz), xz (.tar.xz) or not compressed (.tar).
+        manifest:
+            Further information to store in the manifest, e.g. the name of the environment.
+
+    Returns:
+        The archive.
+
+    """
+    env_path = Path(env_path).resolve()
+    prefix = str(env_path)
+    text_files, binary_files = _find_prefix_files(env_path, prefix.encode())
+    manifest = dict(
+        manifest,
+        prefix=prefix,
+        platform=get_environment_pack_platform(),
+        text_files=text_files,
+        binary_files=binary_files,
+    )
+
+    def _relative_link(member: tarfile.TarInfo) -> tarfile.TarInfo:
+        if member.issym() and _is_in_prefix(member.linkname, prefix):
+            location = env_path.joinpath(
+                os.path.relpath(member.name, ENVIRONMENT_PACK_FOLDER_NAME)
+            )
+            member.linkname = os.path.relpath(member.linkname, location.parent)
+        return member
+
+    archive = Path(archive)
+    create_path_recursively(archive.parent)
+    with tarfile.open(archive, "w" + _get_compression(archive)) as tar:
+        data = json.dumps(manifest, indent=4).encode("utf-8")
+        info = tarfile.TarInfo(ENVIRONMENT_PACK_MANIFEST_NAME)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        tar.addfile(info, io.BytesIO(data))
+        tar.add(prefix, arcname=ENVIRONMENT_PACK_FOLDER_NAME, filter=_relative_link)
+    return archive
+
+
+def read_environment_pack_manifest(archive: Union[str, Path]) -> Dict[str, Any]:
+    """Return the manifest of an environment archive without extracting the environment."""
+    with tarfile.open(archive, "r:*") as tar:
+        member = tar.next()
+        if member is None or member.name != ENVIRONMENT_PACK_MANIFEST_NAME:
+            raise ValueError("%s is not an environment pack!" % archive)
+        return json.load(tar.extractfile(member))  # type: ignore[arg-type]
+
+
+def extract_environment_pack(
+    archive: Union[str, Path], target: Union[str, Path]
+) -> Dict[str, Any]:
+    """Extract an environment archive and rewrite the prefix of the environment to the target folder.
+
+    Args:
+        archive:
+            The archive written by write_environment_pack.
+        target:
+            The folder of the extracted environment.
+
+    Returns:
+        The manifest of the archive.
+
+    """
+    target = Path(target).resolve()
+    create_path_recursively(target)
+    manifest = read_environment_pack_manifest(archive)
+    if manifest["platform"] != get_environment_pack_platform():
+        raise RuntimeError(
+            "Environment pack %s was created for %s and cannot be used on %s!"
+            % (archive, manifest["platform"], get_environment_pack_platform())
+        )
+
+    folder = ENVIRONMENT_PACK_FOLDER_NAME + "/"
+    with tarfile.open(archive, "r:*") as tar:
+        for member in tar:
+            if member.name in [
+                ENVIRONMENT_PACK_MANIFEST_NAME,
+                ENVIRONMENT_PACK_FOLDER_NAME,
+            ]:
+                continue
+            if not member.name.startswith(folder):
+                raise ValueError(
+                    "Unexpected member %s in environment pack %s!"
+                    % (member.name, archive)
+                )
+            member.name = posixpath.relpath(member.name, ENVIRONMENT_PACK_FOLDER_NAME)
+            if member.islnk():
+                member.linkname = posixpath.relpath(
+                    member.linkname, ENVIRONMENT_PACK_FOLDER_NAME
+                )
+            _check_member(member, archive)
+            tar.extract(member, str(target), **_EXTRACT_ARGS)
+
+    _replace_prefix(target, manifest)
+    return manifest
+
+
+def _find_prefix_files(env_path: Path, prefix: bytes) -> Tuple[List[str], List[str]]:
+    """Return the text and binary files of an environment containing its prefix, relative to the environment."""
+    text_files = []
+    binary_files = []
+    for root, _, files in os.walk(env_path):
+        for file in files:
+            path = os.path.join(root, file)
+            if os.path.islink(path):
+                continue
+            found, binary = _scan_file(path, prefix)
+            if found:
+                name = Path(path).relative_to(env_path).as_posix()
+                (binary_files if binary else text_files).append(name)
+    return sorted(text_files), sorted(binary_files)
+
+
+def _scan_file(path: str, prefix: bytes) -> Tuple[bool, bool]:
+    """Return whether a file contains the prefix and whether it is a binary file."""
+    found = binary = False
+    tail = b""
+    try:
+        with open(path, "rb") as f:
+            while not (found and binary):
+                chunk = f.read(ENVIRONMENT_PACK_CHUNK_SIZE)
+                if not chunk:
+                    break
+                data = tail + chunk
+                found = found or prefix in data
+                binary = binary or b"\0" in chunk
+                # keep the end of the chunk to find prefixes spanning two chunks
+                tail = data[len(data) - len(prefix) + 1 :]  # noqa: E203
+    except OSError as e:
+        module_logger().debug("Cannot read %s: %s" % (path, e))
+    return found, binary
+
+
+def _replace_prefix(target: Path, manifest: Dict[str, Any]) -> None:
+    old = manifest["prefix"].encode()
+    new = str(target).encode()
+    if old == new:
+        return
+
+    for name in manifest["text_files"]:
+        path = target.joinpath(name)
+        _write_file(path, path.read_bytes().replace(old, new))
+
+    if not manifest["binary_files"]:
+        return
+    if len(new) > len(old):
+        raise RuntimeError(
+            "Cannot relocate the environment from %s to %s, its binary files only allow prefixes up to %s "
+            "characters!" % (manifest["prefix"], target, len(old))
+        )
+
+    # prefixes in binary files are part of null terminated strings, the strings are padded to keep their length
+    def _pad(match: "re.Match[bytes]") -> bytes:
+        s = match.group()
+        return s.replace(old, new) + b"\0" * ((len(old) - len(new)) * s.count(old))
+
+    pattern = re.compile(re.escape(old) + b"[^\0]*?\0")
+    for name in manifest["binary_files"]:
+        path = target.joinpath(name)
+        _write_file(path, pattern.sub(_pad, path.read_bytes()))
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    mode = path.stat().st_mode
+    if not mode & stat.S_IWUSR:
+        os.chmod(path, mode | stat.S_IWUSR)
+    try:
+        path.write_bytes(data)
+    finally:
+        os.chmod(path, mode)
+
+
+def _check_member(member: tarfile.TarInfo, archive: Union[str, Path]) -> None:
+    names = [member.name] + ([member.linkname] if member.islnk() else [])
+    for name in names:
+        if os.path.isabs(name) or ".." in Path(name).parts:
+            raise ValueError(
+                "Member %s of environment pack %s points outside of the environment!"
+                % (name, archive)
+            )
+
+
+def _is_in_prefix(path: str, prefix: str) -> bool:
+    return path == prefix or path.startswith(prefix + os.sep)
+
+
+def _get_compression(archive: Path) -> str:
+    name = archive.name
+    if name.endswith(".tar.gz") or name.endswith(".tgz"):
+        return ":gz"
+    if name.endswith(".tar.xz"):
+        return ":xz"
+    if name.endswith(".tar"):
+        return ""
+    raise ValueError(
+        'Unsupported archive format "%s", use .tar.gz, .tgz, .tar.xz or .tar!' % name
+    )
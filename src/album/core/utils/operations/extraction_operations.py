@@ -0,0 +1,165 @@
+"""Cache of extracted archives, keyed by the content hash of the archive."""
+
+import atexit
+import os
+from pathlib import Path
+from typing import List, Optional, Set, Union
+
+from album.core.model.default_values import DefaultValues
+from album.core.utils.operations.blob_operations import get_file_hash
+from album.core.utils.operations.file_operations import (
+    create_path_recursively,
+    force_remove,
+    rand_folder_name,
+    unzip_archive,
+)
+from album.core.utils.operations.lease_operations import (
+    get_lease_owner,
+    hold_lease,
+    is_lease_valid,
+    release_lease,
+)
+from album.runner import album_logging
+
+module_logger = album_logging.get_active_logger
+
+EXTRACTION_TREE_NAME = "tree"
+EXTRACTION_COMPLETE_MARKER = "complete"
+EXTRACTION_REFERENCES_NAME = "refs"
+
+# references of this process, released when the process ends
+_references: Set[Path] = set()
+
+
+def extract_archive_cached(
+    archive: Union[str, Path],
+    cache_dir: Union[str, Path],
+    max_size: int = DefaultValues.extraction_cache_max_size.value,
+) -> Path:
+    """Extract an archive into the extraction cache unless the same content was extracted before.
+
+    The extracted folder is referenced by the calling process and not evicted while the process is running.
+    It must not be changed, copy it first.
+
+    Args:
+        archive:
+            The archive to extract.
+        cache_dir:
+            The extraction cache.
+        max_size:
+            The size in bytes the cache gets evicted to after adding an archive.
+
+    Returns:
+        The folder holding the content of the archive.
+
+    """
+    cache_dir = Path(cache_dir)
+    entry = cache_dir.joinpath(get_file_hash(archive)[:32])
+    tree = entry.joinpath(EXTRACTION_TREE_NAME)
+    marker = entry.joinpath(EXTRACTION_COMPLETE_MARKER)
+
+    if marker.exists():
+        module_logger().debug("Using cached extraction of %s..." % archive)
+        _add_reference(entry)
+        os.utime(marker)
+        return tree
+
+    staging = cache_dir.joinpath("tmp_" + rand_folder_name())
+    try:
+        unzip_archive(archive, staging.joinpath(EXTRACTION_TREE_NAME))
+        size = 0
+        for root, _, files in os.walk(staging):
+            for f in files:
+                size += os.path.getsize(os.path.join(root, f))
+        # the marker is written last, entries without are incomplete
+        staging.joinpath(EXTRACTION_COMPLETE_MARKER).write_text(str(size))
+
+        if entry.exists() and not marker.exists():
+            # left behind by an interrupted extraction
+            force_remove(entry)
+        try:
+            os.replace(staging, entry)
+        except OSError:
+            # extracted concurrently by another process, which might be using it already
+            if not marker.exists():
+                raise
+    finally:
+        force_remove(staging)
+
+    _add_reference(entry)
+    evict_extraction_cache(cache_dir, max_size, keep=entry)
+
+    return tree
+
+
+def evict_extraction_cache(
+    cache_dir: Union[str, Path], max_size: int, keep: Optional[Path] = None
+) -> List[Path]:
+    """Remove the least recently used extractions not referenced by a running process.
+
+    Args:
+        cache_dir:
+            The extraction cache.
+        max_size:
+            The size in bytes to evict the cache to.
+        keep:
+            An entry never to remove.
+
+    Returns:
+        The removed entries.
+
+    """
+    entries = []
+    cache_dir = Path(cache_dir)
+    if not cache_dir.exists():
+        return []
+    for entry in cache_dir.iterdir():
+        marker = entry.joinpath(EXTRACTION_COMPLETE_MARKER)
+        try:
+            entries.append((marker.stat().st_mtime, int(marker.read_text()), entry))
+        except (OSError, ValueError):
+            continue
+
+    total_size = sum(size for _, size, _ in entries)
+    removed = []
+    for _, size, entry in sorted(entries, key=lambda e: e[0]):
+        if total_size <= max_size:
+            break
+        if (keep and entry == keep) or _is_referenced(entry):
+            continue
+        module_logger().debug("Evicting %s from the extraction cache..." % entry)
+        force_remove(entry)
+        total_size -= size
+        removed.append(entry)
+
+    return removed
+
+
+def _is_referenced(entry: Path) -> bool:
+    references = entry.joinpath(EXTRACTION_REFERENCES_NAME)
+    if not references.exists():
+        return False
+    for reference in references.iterdir():
+        if is_lease_valid(reference.name, reference):
+            return True
+        # left behind by a process which did not end properly
+        force_remove(reference)
+    return False
+
+
+def _add_reference(entry: Path) -> None:
+    reference = entry.joinpath(EXTRACTION_REFERENCES_NAME, get_lease_owner())
+    if reference in _references:
+        return
+    create_path_recursively(reference.parent)
+    reference.touch()
+    hold_lease(reference)
+    if not _references:
+        atexit.register(_release_references)
+    _references.add(reference)
+
+
+def _release_references() -> None:
+    for reference in _references:
+        release_lease(reference)
+    _references.clear()
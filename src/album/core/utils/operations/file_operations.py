@@ -1,14 +1,19 @@
 """File operations module."""
+
+import gzip
 import json
+import lzma
 import os
 import platform
 import random
 import shutil
 import sys
 import tempfile
+import threading
 import zipfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import IO, Any, Dict, Generator, List, Optional, Union
 
 from album.environments.utils.file_operations import (
     copy,
@@ -23,6 +28,12 @@ enc = sys.getfilesystemencoding()
 
 win_shell = None
 
+# serializes picking free link destinations of concurrent threads
+_link_lock = threading.Lock()
+
+# file in a link destination root keeping track of the used and freed numbered folders
+LINK_SLOTS_FILE_NAME = ".slots"
+
 
 def get_dict_entry(
     d: Dict[str, Any], key: str, allow_none: bool = True, message: str = ""
@@ -188,6 +199,47 @@ def unzip_archive(
     return target_folder
 
 
+def _open_compressed(path: Union[str, Path], mode: str) -> Any:
+    """Open a gzip (.gz) or xz (.xz) compressed file, chosen by its suffix."""
+    suffix = Path(path).suffix
+    if suffix == ".gz":
+        return gzip.open(path, mode)
+    if suffix == ".xz":
+        return lzma.open(path, mode)
+    raise ValueError('Unsupported compression format "%s"!' % suffix)
+
+
+def compress_file(file: Union[str, Path], target_file: Union[str, Path]) -> Path:
+    """Compress a file. The compression format (gzip or xz) is determined by the suffix of the target file."""
+    target_file = Path(target_file)
+    create_path_recursively(target_file.parent)
+
+    with open(file, "rb") as f_in, _open_compressed(target_file, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+
+    return target_file
+
+
+def decompress_file(
+    compressed_file: Union[str, Path], target_file: Union[str, Path]
+) -> Path:
+    """Decompress a gzip (.gz) or xz (.xz) compressed file to the given target file."""
+    target_file = Path(target_file)
+    create_path_recursively(target_file.parent)
+
+    fd, tmp_file_name = tempfile.mkstemp(dir=target_file.parent)
+    try:
+        with _open_compressed(compressed_file, "rb") as f_in:
+            with os.fdopen(fd, "wb") as f_out:
+                shutil.copyfileobj(f_in, f_out)
+        os.replace(tmp_file_name, target_file)
+    finally:
+        if os.path.exists(tmp_file_name):
+            os.remove(tmp_file_name)
+
+    return target_file
+
+
 def remove_link(link_target: Path) -> None:
     """Remove a link from the file system."""
     if link_target:
@@ -197,6 +249,7 @@ def remove_link(link_target: Path) -> None:
         else:
             raise RuntimeError("Path doesn't seem to be a link")
         force_remove(link_target)
+        release_link_slot(link_target)
 
 
 def rand_folder_name(f_len: int = 8) -> str:
@@ -241,9 +294,7 @@ def construct_cache_link_target(
         if shortcut.exists():
             return _get_shortcut_target(shortcut)
         if create:
-            point_to = root.joinpath(_next_free_pointer_number(root))
-
-            create_path_recursively(point_to)
+            point_to = allocate_link_slot(root)
             create_path_recursively(shortcut.parent)
 
             _create_shortcut(shortcut, target=point_to)
@@ -258,9 +309,7 @@ def construct_cache_link_target(
 
             return r
         if create:
-            point_to = root.joinpath(_next_free_pointer_number(root))
-
-            create_path_recursively(point_to)
+            point_to = allocate_link_slot(root)
             create_path_recursively(Path(point_from).parent)
 
             # point_from -> point_to
@@ -270,16 +319,126 @@ def construct_cache_link_target(
     return Path("")
 
 
-def _next_free_pointer_number(root: Union[str, Path]) -> str:
-    """Determine the next free point_to number."""
-    root = Path(root)
+def create_link(point_from: Union[str, Path], point_to: Union[str, Path]) -> Path:
+    """Link point_from to the existing folder point_to.
+
+    Args:
+        point_from:
+            Path where to point from.
+        point_to:
+            The folder to point to.
+
+    Returns:
+        Path to the resolved link.
+
+    """
+    operation_system = platform.system().lower()
+    create_path_recursively(Path(point_from).parent)
+    if "windows" in operation_system:
+        _create_shortcut(str(point_from) + ".lnk", target=point_to)
+        return Path(point_to).absolute()
+    os.symlink(str(point_to), point_from, target_is_directory=True)
+    return Path(point_to).resolve()
+
+
+def allocate_link_slot(root: Union[str, Path]) -> Path:
+    """Create the next free numbered folder in a link destination root.
 
-    # determine next free point_to number
-    i = 0
-    while root.joinpath("%s" % i).exists():
-        i += 1
+    The used numbers are kept track of in a slots file in the root, locked against concurrent album processes.
+    Numbers of removed folders are handed out again first. A root without slots file, e.g. created by an older
+    album version, is scanned once to seed it.
+
+    Args:
+        root:
+            The folder holding the numbered folders.
+
+    Returns:
+        The created folder.
+
+    """
+    root = Path(root)
+    create_path_recursively(root)
+    with _link_lock, _locked_file(root.joinpath(LINK_SLOTS_FILE_NAME)) as f:
+        slots = _read_link_slots(f, root)
+        while True:
+            if slots["free"]:
+                number = slots["free"].pop()
+            else:
+                number = slots["next"]
+                slots["next"] += 1
+            slot = root.joinpath(str(number))
+            # the folder might have been created by an album version not using the slots file
+            if not slot.exists():
+                break
+        create_path_recursively(slot)
+        _write_link_slots(f, slots)
+    return slot
+
+
+def release_link_slot(slot: Union[str, Path]) -> None:
+    """Hand out the number of a removed folder of a link destination root again."""
+    slot = Path(slot)
+    slots_file = slot.parent.joinpath(LINK_SLOTS_FILE_NAME)
+    if not slot.name.isdigit() or not slots_file.exists():
+        return
+    with _link_lock, _locked_file(slots_file) as f:
+        slots = _read_link_slots(f, slot.parent)
+        number = int(slot.name)
+        if slot.exists() or number >= slots["next"] or number in slots["free"]:
+            return
+        slots["free"].append(number)
+        _write_link_slots(f, slots)
+
+
+def _read_link_slots(f: IO[str], root: Path) -> Dict[str, Any]:
+    f.seek(0)
+    try:
+        slots = json.loads(f.read())
+        if isinstance(slots.get("next"), int) and isinstance(slots.get("free"), list):
+            return slots
+    except (ValueError, AttributeError):
+        pass
+    return _seed_link_slots(root)
+
+
+def _seed_link_slots(root: Path) -> Dict[str, Any]:
+    """Determine the used and free numbers of a root from its numbered folders."""
+    used = {int(name) for name in os.listdir(root) if name.isdigit()}
+    next_number = max(used) + 1 if used else 0
+    # free numbers are popped from the end, hand out the lowest number first
+    free = sorted(set(range(next_number)) - used, reverse=True)
+    return {"next": next_number, "free": free}
+
+
+def _write_link_slots(f: IO[str], slots: Dict[str, Any]) -> None:
+    f.seek(0)
+    f.truncate()
+    f.write(json.dumps(slots))
+    f.flush()
+
+
+@contextmanager
+def _locked_file(path: Path) -> Generator[IO[str], None, None]:
+    """Open a file exclusively locked against other processes for reading and writing."""
+    with open(path, "a+") as f:
+        if "windows" in platform.system().lower():
+            import msvcrt
+
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield f
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
 
-    return str(i)
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield f
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
 
 def get_link_target(link: Union[str, Path]) -> Optional[Path]:
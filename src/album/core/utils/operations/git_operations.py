@@ -16,7 +16,7 @@ from album.core.utils.operations.file_operations import (
     folder_empty,
     force_remove,
 )
-from album.core.utils.operations.url_operations import is_url
+from album.core.utils.operations.url_operations import is_git_ssh_address, is_url
 from album.runner import album_logging
 
 module_logger = album_logging.get_active_logger
@@ -295,9 +295,22 @@ def add_tag(repo: Repo, tag: str) -> None:
         tag:
             The tag associated with the commit
     """
-    repo.git.tag("-a", tag, "-f", "-m", "")
+    add_tags(repo, [tag])
+
+
+def add_tags(repo: Repo, tags: List[str]) -> None:
+    """Add tags to the most recent commit and push them all at once.
+
+    Args:
+        repo:
+            The repository
+        tags:
+            The tags associated with the commit
+    """
+    for tag in tags:
+        repo.git.tag("-a", tag, "-f", "-m", "")
     remote_name = get_remote_name(repo)
-    repo.git.push([remote_name, tag, "-f"])
+    repo.git.push([remote_name] + tags + ["-f"])
 
 
 def get_remote_name(repo: Repo) -> str:
@@ -487,7 +500,8 @@ def download_repository(
         git_folder_path:
             The complete path to clone to
         force_download:
-            Boolean, indicates whether to force delete existing folder before cloning
+            Boolean, indicates whether to force delete an existing folder before cloning. An existing repository is
+            only deleted when it cannot be reused safely (see is_reusable_repository).
         update:
             Flag to indicate whether to hard reset the repo upon initialization or not.
 
@@ -498,6 +512,13 @@ def download_repository(
     git_folder_path = Path(git_folder_path)
     Path.mkdir(git_folder_path, parents=True, exist_ok=True)
 
+    if (
+        force_download
+        and Path.exists(git_folder_path.joinpath(".git"))
+        and not is_reusable_repository(git_folder_path, repo_url)
+    ):
+        force_remove(git_folder_path.joinpath(".git"))
+
     # update existing repo or clone new repo
     if Path.exists(git_folder_path.joinpath(".git")):
         module_logger().info("Found existing repository in %s..." % git_folder_path)
@@ -522,6 +543,71 @@ def download_repository(
     return repo
 
 
+def is_reusable_repository(git_folder_path: Union[str, Path], repo_url: str) -> bool:
+    """Check whether an existing repository can be updated instead of cloned again.
+
+    Local changes do not prevent reuse, they are discarded when the repository gets initialized. A repository
+    is not reusable when it is broken, when it points to another remote or when an operation (merge, rebase, ...)
+    was interrupted in it.
+
+    Args:
+        git_folder_path:
+            The path to the existing repository.
+        repo_url:
+            The URL the repository is expected to be cloned from.
+
+    Returns:
+        True if the repository can be reused, False otherwise.
+
+    """
+    try:
+        with git.Repo(git_folder_path) as repo:
+            remote_urls = list(repo.remote().urls) if repo.remotes else []
+            git_dir = Path(repo.git_dir)
+    except (git.InvalidGitRepositoryError, git.NoSuchPathError, ValueError) as e:
+        module_logger().warning(
+            "Cannot reuse repository in %s: %s" % (git_folder_path, e)
+        )
+        return False
+
+    if not any(_same_repository_url(url, repo_url) for url in remote_urls):
+        module_logger().warning(
+            "Cannot reuse repository in %s: remote %s does not match %s."
+            % (git_folder_path, ", ".join(remote_urls), repo_url)
+        )
+        return False
+
+    for marker in [
+        "index.lock",
+        "MERGE_HEAD",
+        "CHERRY_PICK_HEAD",
+        "REVERT_HEAD",
+        "rebase-merge",
+        "rebase-apply",
+    ]:
+        if git_dir.joinpath(marker).exists():
+            module_logger().warning(
+                "Cannot reuse repository in %s: interrupted git operation (%s)."
+                % (git_folder_path, marker)
+            )
+            return False
+
+    return True
+
+
+def _same_repository_url(url: str, other_url: str) -> bool:
+    if url == other_url:
+        return True
+    if is_url(url) or is_git_ssh_address(url):
+        return url.rstrip("/").removesuffix(".git") == other_url.rstrip(
+            "/"
+        ).removesuffix(".git")
+    try:
+        return os.path.samefile(url, other_url)
+    except OSError:
+        return False
+
+
 def checkout_files(repo: Repo, files_to_download: List[str]) -> None:
     """Checkout files in a repository."""
     for file in files_to_download:
@@ -614,10 +700,15 @@ def init_repository(path: Union[Path, str]) -> Repo:
 
     repo = git.Repo(path)
 
-    # update the remote to get latest changes on all remotes (pushes, HEAD pointer change, reverts, etc.)
-    repo.remote().update()
+    # fetch latest changes of the remote (pushes, HEAD pointer change, reverts, etc.) - also drops local tags and
+    # branches no longer present on the remote, e.g. left behind by an undeploy or an aborted push
+    repo.git.fetch(repo.remote().name, "--prune", "--prune-tags", "--tags", "--force")
 
     # remove all eventual changes made local
+    if repo.is_dirty(untracked_files=True):
+        module_logger().warning(
+            "Discarding local changes in repository %s..." % repo.working_tree_dir
+        )
     remote_head = get_local_remote_ref_head(repo)
     checkout_main(repo, remote_head.name)
     clean_repository(repo, remote_head.name)
@@ -0,0 +1,113 @@
+"""Leases marking files and folders as used by a running album process, also on file systems shared by several hosts.
+
+A lease names its owner by host name and process id. Owners on the same host are checked for running. Owners on
+other hosts cannot be checked, their leases are refreshed while the owner runs and stay valid until they are not
+refreshed for a while.
+"""
+
+import os
+import platform
+import re
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Set
+
+from album.core.model.default_values import DefaultValues
+from album.core.utils.operations.file_operations import force_remove
+
+LEASE_OWNER_SEPARATOR = "_"
+
+# leases of this process refreshed in the background
+_held_leases: Set[Path] = set()
+_held_leases_lock = threading.Lock()
+_refresh_thread: Optional[threading.Thread] = None
+
+
+def get_lease_owner() -> str:
+    """Return the owner of leases taken by the running process, made of the host name and the process id.
+
+    The owner can be used in file names, characters other than letters, digits and dashes are replaced in the host
+    name.
+    """
+    host = re.sub(r"[^A-Za-z0-9-]", "-", socket.gethostname())
+    return "%s%s%s" % (host, LEASE_OWNER_SEPARATOR, os.getpid())
+
+
+def is_lease_valid(owner: str, lease: Path, max_age: Optional[int] = None) -> bool:
+    """Return whether a lease is held by a running process.
+
+    Args:
+        owner:
+            The owner of the lease as returned by get_lease_owner. A process id only is an owner on this host.
+        lease:
+            The file or folder the owner refreshes while running.
+        max_age:
+            The time in seconds since the last refresh a lease of another host stays valid.
+            (Default: DefaultValues.lease_max_age)
+
+    """
+    host, _, pid = owner.rpartition(LEASE_OWNER_SEPARATOR)
+    try:
+        pid = int(pid)
+    except ValueError:
+        return False
+
+    if host and host != get_lease_owner().rpartition(LEASE_OWNER_SEPARATOR)[0]:
+        if max_age is None:
+            max_age = DefaultValues.lease_max_age.value
+        try:
+            return time.time() - lease.stat().st_mtime < max_age
+        except OSError:
+            return False
+
+    return pid == os.getpid() or is_process_alive(pid)
+
+
+def hold_lease(lease: Path) -> None:
+    """Refresh the modification time of a lease in the background until it is released."""
+    global _refresh_thread
+    with _held_leases_lock:
+        _held_leases.add(Path(lease))
+        if _refresh_thread is None:
+            _refresh_thread = threading.Thread(
+                target=_refresh_leases, name="album-lease-refresh", daemon=True
+            )
+            _refresh_thread.start()
+
+
+def release_lease(lease: Path, remove: bool = True) -> None:
+    """Stop refreshing a lease and remove it."""
+    with _held_leases_lock:
+        _held_leases.discard(Path(lease))
+    if remove:
+        force_remove(lease, warning=False)
+
+
+def is_process_alive(pid: int) -> bool:
+    """Return whether a process with the given id is running. Always True on Windows."""
+    if "windows" in platform.system().lower():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # the process exists, but belongs to another user
+        return True
+    return True
+
+
+def _refresh_leases() -> None:
+    interval = max(1, DefaultValues.lease_max_age.value // 4)
+    while True:
+        time.sleep(interval)
+        with _held_leases_lock:
+            leases = list(_held_leases)
+        for lease in leases:
+            try:
+                os.utime(lease)
+            except OSError:
+                # removed concurrently
+                pass
@@ -1,28 +1,33 @@
 """Module for resolving solutions from different sources."""
 
 import errno
+import hashlib
 import os
 import re
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from album.core.api.model.catalog import ICatalog
 from album.core.api.model.collection_index import ICollectionIndex
 from album.core.model.default_values import DefaultValues
+from album.core.utils.operations.blob_operations import get_file_hash
+from album.core.utils.operations.extraction_operations import extract_archive_cached
 from album.core.utils.operations.file_operations import (
     check_zip,
     create_path_recursively,
     force_remove,
+    get_dict_from_json,
     rand_folder_name,
     unzip_archive,
+    write_dict_to_json,
 )
 from album.core.utils.operations.url_operations import (
     download,
+    download_resource,
     is_url,
     retrieve_redirect_url,
 )
-from album.environments.utils.url_operations import download_resource
 from album.runner import album_logging
 from album.runner.core.api.model.coordinates import ICoordinates
 from album.runner.core.model.coordinates import Coordinates
@@ -173,26 +178,192 @@ def is_pathname_valid(pathname: str) -> bool:
     # (e.g., a bug). Permit this exception to unwind the call stack.
 
 
-def check_doi(doi: str, tmp_cache_dir: Union[Path, str]) -> Path:
-    """Check the DOI and return the path to the solution file."""
-    tmp_cache_dir = Path(tmp_cache_dir).joinpath(rand_folder_name())
+def check_doi(
+    doi: str,
+    tmp_cache_dir: Union[Path, str],
+    doi_cache_dir: Union[Path, str, None] = None,
+) -> Path:
+    """Check the DOI and return the path to the solution file.
+
+    Args:
+        doi:
+            The DOI of the solution, e.g. 10.5281/zenodo.5571504
+        tmp_cache_dir:
+            The temporary directory to download and extract the solution to when no DOI cache is used.
+        doi_cache_dir:
+            The persistent DOI cache. DOI records are immutable, a cached DOI is served without network access.
+
+    Returns:
+        The path to the solution file.
+
+    """
+    if doi_cache_dir:
+        cached_solution = _get_cached_doi_solution(doi, doi_cache_dir)
+        if cached_solution:
+            module_logger().debug("Using cached download of DOI %s..." % doi)
+            return cached_solution
+        tmp_cache_dir = Path(doi_cache_dir).joinpath("tmp_" + rand_folder_name())
+    else:
+        tmp_cache_dir = Path(tmp_cache_dir).joinpath(rand_folder_name())
 
     link = "https://doi.org/" + doi  # e.g. 10.5281/zenodo.5571504
 
-    url = retrieve_redirect_url(link)
+    try:
+        url = retrieve_redirect_url(link)
 
-    link_to_solution_zip = parse_doi_service_url(url)
+        link_to_solution_zip = parse_doi_service_url(url)
 
-    p = download_resource(link_to_solution_zip, tmp_cache_dir.joinpath("solution.zip"))
+        p = download_resource(
+            link_to_solution_zip, tmp_cache_dir.joinpath("solution.zip")
+        )
 
-    p_prepared = prepare_path(p, tmp_cache_dir)
+        p_prepared = prepare_path(p, tmp_cache_dir)
 
-    if not p_prepared:
-        raise ValueError("Could not prepare the solution file! Aborting...")
+        if not p_prepared:
+            raise ValueError("Could not prepare the solution file! Aborting...")
+
+        if doi_cache_dir:
+            return _add_doi_solution_to_cache(
+                doi, doi_cache_dir, tmp_cache_dir, url, Path(p), Path(p_prepared)
+            )
+    except Exception:
+        if doi_cache_dir:
+            force_remove(tmp_cache_dir)
+        raise
 
     return p_prepared
 
 
+def _get_doi_cache_entry(doi: str, doi_cache_dir: Union[Path, str]) -> Path:
+    """Return the folder of a DOI in the DOI cache."""
+    return Path(doi_cache_dir).joinpath(
+        hashlib.sha256(doi.encode("utf-8")).hexdigest()[:32]
+    )
+
+
+def _get_cached_doi_solution(
+    doi: str, doi_cache_dir: Union[Path, str]
+) -> Optional[Path]:
+    """Return the cached solution file of a DOI or None if the DOI is not cached."""
+    entry = _get_doi_cache_entry(doi, doi_cache_dir)
+    meta_file = entry.joinpath(DefaultValues.doi_cache_meta_file_name.value)
+    # the meta file is written last, entries without are incomplete
+    if not meta_file.exists():
+        return None
+    try:
+        meta = get_dict_from_json(meta_file)
+    except (OSError, ValueError):
+        return None
+    if meta.get("doi", None) != doi:
+        return None
+    solution_file = entry.joinpath(meta["solution_file"])
+    if not solution_file.exists():
+        return None
+
+    # remember the last usage for the eviction
+    os.utime(meta_file)
+
+    return solution_file
+
+
+def _add_doi_solution_to_cache(
+    doi: str,
+    doi_cache_dir: Union[Path, str],
+    download_dir: Path,
+    redirect_url: str,
+    archive: Path,
+    solution_file: Path,
+) -> Path:
+    """Move a downloaded and extracted DOI solution into the DOI cache. Returns the cached solution file."""
+    entry = _get_doi_cache_entry(doi, doi_cache_dir)
+    archive_hash = get_file_hash(archive) if archive.is_file() else None
+    if archive.is_file() and check_zip(archive):
+        force_remove(archive)
+
+    size = 0
+    for root, _, files in os.walk(download_dir):
+        for f in files:
+            size += os.path.getsize(os.path.join(root, f))
+
+    write_dict_to_json(
+        download_dir.joinpath(DefaultValues.doi_cache_meta_file_name.value),
+        {
+            "doi": doi,
+            "redirect_url": redirect_url,
+            "archive_hash": archive_hash,
+            "solution_file": str(solution_file.relative_to(download_dir)),
+            "size": size,
+        },
+    )
+
+    cached_solution = _get_cached_doi_solution(doi, doi_cache_dir)
+    if cached_solution is not None:
+        # added concurrently by another process, which might be using it already
+        force_remove(download_dir)
+        return cached_solution
+    if entry.exists():
+        # left behind by an interrupted download
+        force_remove(entry)
+    try:
+        os.replace(download_dir, entry)
+    except OSError:
+        # added concurrently by another process
+        force_remove(download_dir)
+        cached_solution = _get_cached_doi_solution(doi, doi_cache_dir)
+        if cached_solution is None:
+            raise
+        return cached_solution
+
+    evict_doi_cache(doi_cache_dir, keep=entry)
+
+    return entry.joinpath(solution_file.relative_to(download_dir))
+
+
+def evict_doi_cache(
+    doi_cache_dir: Union[Path, str],
+    max_size: int = DefaultValues.doi_cache_max_size.value,
+    keep: Optional[Path] = None,
+) -> List[Path]:
+    """Remove the least recently used DOIs from the DOI cache until it is smaller than the given size.
+
+    Args:
+        doi_cache_dir:
+            The DOI cache.
+        max_size:
+            The maximal size of the DOI cache in bytes.
+        keep:
+            A cache entry never to remove.
+
+    Returns:
+        The removed cache entries.
+
+    """
+    entries = []
+    for entry in Path(doi_cache_dir).iterdir():
+        meta_file = entry.joinpath(DefaultValues.doi_cache_meta_file_name.value)
+        if not meta_file.exists():
+            continue
+        try:
+            size = get_dict_from_json(meta_file)["size"]
+        except (OSError, ValueError, KeyError):
+            continue
+        entries.append((meta_file.stat().st_mtime, size, entry))
+
+    total_size = sum(size for _, size, _ in entries)
+    removed = []
+    for _, size, entry in sorted(entries, key=lambda e: e[0]):
+        if total_size <= max_size:
+            break
+        if keep and entry == keep:
+            continue
+        module_logger().debug("Evicting %s from the DOI cache..." % entry)
+        force_remove(entry)
+        total_size -= size
+        removed.append(entry)
+
+    return removed
+
+
 def parse_doi_service_url(url: str) -> str:
     """Parse the DOI service URL and return the download link for the zip file."""
     if re.search(r"https:\/\/[a-zA-Z.]*zenodo[.]org\/", url):
@@ -237,11 +408,17 @@ def check_file_or_url(
     else:
         return None
 
-    return prepare_path(p, tmp_cache_dir)
+    return prepare_path(
+        p,
+        tmp_cache_dir,
+        Path(tmp_cache_dir).joinpath(DefaultValues.cache_path_extraction_prefix.value),
+    )
 
 
 def prepare_path(
-    path: Union[str, Path], tmp_cache_dir: Union[Path, str]
+    path: Union[str, Path],
+    tmp_cache_dir: Union[Path, str],
+    extraction_cache_dir: Union[Path, str, None] = None,
 ) -> Optional[Path]:
     """Prepare the path to be run in album. Returning path points to the solution file.
 
@@ -250,6 +427,9 @@ def prepare_path(
             The path pointing to a zip, file, or folder suited to be run in album.
         tmp_cache_dir:
             The temporary cache dir to extract/copy files to.
+        extraction_cache_dir:
+            When set, archives are extracted into this cache, keyed by their content. An archive extracted before
+            is not extracted again.
 
     Returns:
         The path pointing to the python file executable in album.
@@ -261,7 +441,10 @@ def prepare_path(
         target_folder = tmp_cache_dir_.joinpath(rand_folder_name())
         if p.is_file():
             if check_zip(p):  # zip file — unzip and point to solution.py inside
-                p = unzip_archive(p, target_folder)
+                if extraction_cache_dir:
+                    p = extract_archive_cached(p, extraction_cache_dir)
+                else:
+                    p = unzip_archive(p, target_folder)
                 # Zenodo deposit archives contain solution.zip (with full
                 # directory structure) plus individual preview files.  If
                 # solution.py is not at the top level but solution.zip is,
@@ -273,7 +456,11 @@ def prepare_path(
                     and inner_zip.is_file()
                     and check_zip(inner_zip)
                 ):
-                    unzip_archive(inner_zip, p)
+                    if extraction_cache_dir:
+                        # cached extractions are shared, never extract into them
+                        p = extract_archive_cached(inner_zip, extraction_cache_dir)
+                    else:
+                        unzip_archive(inner_zip, p)
                 p = p.joinpath(DefaultValues.solution_default_name.value)
             else:  # single python file — return as-is (can have any name)
                 pass
@@ -1,8 +1,11 @@
 """Operations for the solution object."""
+
+import ast
 import copy
 import hashlib
 import json
 from datetime import date, time
+from io import StringIO
 from typing import Any, Dict, List, Optional, Union
 
 from album.environments.api.model.environment import IEnvironment
@@ -79,3 +82,180 @@ def serialize(obj: Any) -> Union[str, Dict[str, Any]]:
         return serial
 
     return obj.__dict__
+
+
+class _NonLiteralError(ValueError):
+    """Raised when a setup keyword cannot be evaluated without executing the solution."""
+
+
+class _SolutionFunction:
+    """Marks a value referencing a function defined in the solution."""
+
+
+def _is_setup_call(node: ast.expr, setup_names: set, api_names: set) -> bool:
+    if not isinstance(node, ast.Call):
+        return False
+    func = node.func
+    return (isinstance(func, ast.Name) and func.id in setup_names) or (
+        isinstance(func, ast.Attribute)
+        and func.attr == "setup"
+        and isinstance(func.value, ast.Name)
+        and func.value.id in api_names
+    )
+
+
+def _get_mutated_names(node: ast.AST, local_scope: bool = False) -> set:
+    """Collect the names a node (re)binds or possibly changes in place, e.g. via item assignments or method calls.
+
+    Names bound in a local scope only rebind module level names when declared global.
+    """
+    names = set()
+    for child in ast.walk(node):
+        if isinstance(child, (ast.Global, ast.Nonlocal)):
+            names.update(child.names)
+        elif (
+            not local_scope
+            and isinstance(child, ast.Name)
+            and isinstance(child.ctx, (ast.Store, ast.Del))
+        ):
+            names.add(child.id)
+        elif (
+            isinstance(child, (ast.Subscript, ast.Attribute))
+            and isinstance(child.ctx, (ast.Store, ast.Del))
+        ) or (isinstance(child, ast.Call) and isinstance(child.func, ast.Attribute)):
+            base = child.func if isinstance(child, ast.Call) else child
+            while isinstance(base, (ast.Subscript, ast.Attribute)):
+                base = base.value
+            if isinstance(base, ast.Name):
+                names.add(base.id)
+    return names
+
+
+def get_setup_attrs_from_source(source: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+    """Statically extract the keyword arguments of the setup call of a solution without executing it.
+
+    Only solutions calling setup once on module level are supported. The keywords must be literals, names of literals
+    or StringIO objects assigned once on module level and not changed by any other statement, or functions defined on
+    module level. Functions are left out, as they only exist when executing the solution.
+
+    Args:
+        source:
+            The content of the solution file.
+
+    Returns:
+        The keyword arguments of the setup call or None if the solution needs to be executed to receive them.
+
+    """
+    try:
+        module = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return None
+
+    setup_names, api_names, stringio_names, io_names = set(), set(), set(), set()
+    functions, assignments, reassigned = set(), {}, set()
+    setup_calls = []
+    for node in module.body:
+        if isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                name = alias.asname if alias.asname else alias.name
+                if node.module == "album.runner.api" and alias.name == "setup":
+                    setup_names.add(name)
+                elif node.module == "album.runner" and alias.name == "api":
+                    api_names.add(name)
+                elif node.module == "io" and alias.name == "StringIO":
+                    stringio_names.add(name)
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name == "io":
+                    io_names.add(alias.asname if alias.asname else alias.name)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions.add(node.name)
+            # functions called on module level may change module level values
+            reassigned.update(_get_mutated_names(node, local_scope=True))
+        elif isinstance(node, ast.Expr) and _is_setup_call(
+            node.value, setup_names, api_names
+        ):
+            setup_calls.append(node.value)
+            reassigned.update(_get_mutated_names(node))
+        elif isinstance(node, ast.Assign) and all(
+            isinstance(target, ast.Name) for target in node.targets
+        ):
+            # names only resolve to values assigned exactly once before the setup call
+            if not setup_calls:
+                for target in node.targets:
+                    if target.id in assignments:
+                        reassigned.add(target.id)
+                    assignments[target.id] = node.value
+            reassigned.update(_get_mutated_names(node.value))
+        else:
+            # any other statement (subscript or attribute assignments, augmented assignments, method calls, del,
+            # loops, ...) might change the values passed to the setup call
+            for child in ast.walk(node):
+                if isinstance(child, ast.Name):
+                    reassigned.add(child.id)
+
+    # values referenced by a changed name might have been changed through it
+    changed = True
+    while changed:
+        changed = False
+        for name, value in assignments.items():
+            if name in reassigned:
+                for child in ast.walk(value):
+                    if isinstance(child, ast.Name) and child.id not in reassigned:
+                        reassigned.add(child.id)
+                        changed = True
+
+    if len(setup_calls) != 1 or setup_calls[0].args:
+        return None
+
+    def _is_stringio(func: ast.expr) -> bool:
+        if isinstance(func, ast.Name):
+            return func.id in stringio_names
+        return (
+            isinstance(func, ast.Attribute)
+            and func.attr == "StringIO"
+            and isinstance(func.value, ast.Name)
+            and func.value.id in io_names
+        )
+
+    def _evaluate(node: ast.expr, visited: frozenset) -> Any:
+        if isinstance(node, ast.Name):
+            if node.id in functions:
+                return _SolutionFunction()
+            if node.id in assignments and node.id not in reassigned | visited:
+                return _evaluate(assignments[node.id], visited | {node.id})
+            raise _NonLiteralError(node.id)
+        if isinstance(node, ast.Dict):
+            d = {}
+            for k, v in zip(node.keys, node.values):
+                if k is None:
+                    raise _NonLiteralError("**")
+                value = _evaluate(v, visited)
+                if not isinstance(value, _SolutionFunction):
+                    d[ast.literal_eval(k)] = value
+            return d
+        if isinstance(node, (ast.List, ast.Tuple)):
+            values = [_evaluate(v, visited) for v in node.elts]
+            values = [v for v in values if not isinstance(v, _SolutionFunction)]
+            return values if isinstance(node, ast.List) else tuple(values)
+        if isinstance(node, ast.Call) and _is_stringio(node.func):
+            if len(node.args) != 1 or node.keywords:
+                raise _NonLiteralError("StringIO")
+            content = _evaluate(node.args[0], visited)
+            if not isinstance(content, str):
+                raise _NonLiteralError("StringIO")
+            return StringIO(content)
+        return ast.literal_eval(node)
+
+    attrs = {}
+    try:
+        for keyword in setup_calls[0].keywords:
+            if keyword.arg is None:
+                return None
+            value = _evaluate(keyword.value, frozenset())
+            if not isinstance(value, _SolutionFunction):
+                attrs[keyword.arg] = value
+    except (ValueError, TypeError, SyntaxError, RecursionError):
+        return None
+
+    return attrs
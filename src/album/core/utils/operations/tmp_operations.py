@@ -0,0 +1,122 @@
+"""Temporary folders owned by single album processes and the cleanup of folders left behind by other processes."""
+
+import atexit
+import os
+import time
+from pathlib import Path
+from typing import List, Optional, Union
+
+from album.core.utils.operations.file_operations import (
+    create_path_recursively,
+    force_remove,
+    rand_folder_name,
+)
+from album.core.utils.operations.lease_operations import (
+    get_lease_owner,
+    hold_lease,
+    is_lease_valid,
+    release_lease,
+)
+from album.runner import album_logging
+
+module_logger = album_logging.get_active_logger
+
+TMP_LEASE_SUFFIX = ".lease"
+
+
+def create_process_tmp_dir(tmp_root: Union[str, Path]) -> Path:
+    """Create a temporary folder owned by the running process.
+
+    A lease marker next to the folder holds the owning process, refreshed while it runs. The lease is released when
+    the process ends. The folder itself is left for clean_tmp, ending the process is not blocked by deleting it.
+
+    Args:
+        tmp_root:
+            The folder holding the temporary folders of all processes.
+
+    Returns:
+        The temporary folder of the running process.
+
+    """
+    tmp_root = Path(tmp_root)
+    name = "%s_%s" % (os.getpid(), rand_folder_name())
+    folder = tmp_root.joinpath(name)
+    create_path_recursively(folder)
+
+    lease = _get_lease(folder)
+    lease.write_text(get_lease_owner())
+    hold_lease(lease)
+    atexit.register(release_lease, lease)
+
+    return folder
+
+
+def clean_tmp(
+    tmp_root: Union[str, Path], max_age: int, keep: Optional[Path] = None
+) -> List[Path]:
+    """Remove temporary folders not leased by a running process and not modified for a while.
+
+    Files and folders in the temporary folder not created via create_process_tmp_dir have no lease and are
+    removed once they are old enough.
+
+    Args:
+        tmp_root:
+            The folder holding the temporary folders of all processes.
+        max_age:
+            The time in seconds since the last modification before an entry without a valid lease is removed.
+        keep:
+            An entry never to remove.
+
+    Returns:
+        The removed entries.
+
+    """
+    tmp_root = Path(tmp_root)
+    if not tmp_root.exists():
+        return []
+
+    now = time.time()
+    removed = []
+    for entry in list(tmp_root.iterdir()):
+        if keep and entry == keep:
+            continue
+        try:
+            if entry.name.endswith(TMP_LEASE_SUFFIX):
+                # leases are removed together with their folder, unless the folder is gone
+                folder = entry.with_name(entry.name[: -len(TMP_LEASE_SUFFIX)])
+                if not folder.exists() and not _is_leased(folder):
+                    force_remove(entry)
+                continue
+            if _is_leased(entry) or now - _get_last_modification(entry) < max_age:
+                continue
+            module_logger().debug("Removing stale temporary entry %s..." % entry)
+            force_remove(entry)
+            force_remove(_get_lease(entry))
+        except OSError as e:
+            # removed or changed concurrently
+            module_logger().debug("Cannot remove %s: %s" % (entry, e))
+            continue
+        removed.append(entry)
+
+    return removed
+
+
+def _get_lease(folder: Path) -> Path:
+    return folder.parent.joinpath(folder.name + TMP_LEASE_SUFFIX)
+
+
+def _is_leased(entry: Path) -> bool:
+    lease = _get_lease(entry)
+    try:
+        owner = lease.read_text().strip()
+    except OSError:
+        return False
+    return is_lease_valid(owner, lease)
+
+
+def _get_last_modification(entry: Path) -> float:
+    last_modification = entry.lstat().st_mtime
+    lease = _get_lease(entry)
+    if lease.exists():
+        last_modification = max(last_modification, lease.stat().st_mtime)
+    return last_modification
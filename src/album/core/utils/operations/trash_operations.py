@@ -0,0 +1,134 @@
+"""Deferred deletion of large folders, e.g. environments, by moving them into a trash folder emptied later."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Union
+
+from album.core.utils.operations.file_operations import (
+    create_path_recursively,
+    force_remove,
+    rand_folder_name,
+)
+from album.core.utils.operations.lease_operations import (
+    get_lease_owner,
+    hold_lease,
+    is_lease_valid,
+    release_lease,
+)
+from album.runner import album_logging
+
+module_logger = album_logging.get_active_logger
+
+TRASH_CLAIM_SUFFIX = ".deleting"
+
+
+def move_to_trash(
+    path: Union[str, Path], trash_root: Union[str, Path]
+) -> Optional[Path]:
+    """Move a file or folder into the trash folder.
+
+    Moving is a rename and returns immediately, independent of the size of the folder. If the path cannot be
+    renamed into the trash folder, e.g. because it lives on another file system, it is removed right away.
+
+    Args:
+        path:
+            The file or folder to remove. Links are not followed.
+        trash_root:
+            The trash folder. Needs to be on the same file system as path.
+
+    Returns:
+        The entry in the trash folder or None if the path does not exist or was removed directly.
+
+    """
+    path = Path(path)
+    if not os.path.lexists(path):
+        return None
+
+    trash_root = Path(trash_root)
+    create_path_recursively(trash_root)
+    entry = trash_root.joinpath("%s_%s" % (rand_folder_name(), path.name))
+    try:
+        os.rename(path, entry)
+    except OSError as e:
+        module_logger().debug(
+            "Cannot move %s to the trash, removing it: %s" % (path, e)
+        )
+        force_remove(path)
+        return None
+    return entry
+
+
+def empty_trash(trash_root: Union[str, Path], max_workers: int = 1) -> List[Path]:
+    """Delete the entries of the trash folder.
+
+    Each entry is claimed by the running process by renaming it before it gets deleted. Entries claimed by
+    processes no longer running, e.g. interrupted while deleting, are claimed again. With several workers the
+    top level contents of the entries are deleted concurrently.
+
+    Args:
+        trash_root:
+            The trash folder.
+        max_workers:
+            The number of threads deleting concurrently.
+
+    Returns:
+        The deleted entries.
+
+    """
+    trash_root = Path(trash_root)
+    if not trash_root.exists():
+        return []
+
+    claimed = [e for e in (_claim(entry) for entry in list(trash_root.iterdir())) if e]
+    if not claimed:
+        return []
+    module_logger().debug("Deleting %s entries of the trash..." % len(claimed))
+
+    if max_workers > 1:
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="album-trash"
+        ) as executor:
+            contents = [
+                c
+                for entry in claimed
+                if entry.is_dir() and not entry.is_symlink()
+                for c in entry.iterdir()
+            ]
+            list(executor.map(_remove, contents))
+
+    for entry in claimed:
+        _remove(entry)
+        release_lease(entry, remove=False)
+    return claimed
+
+
+def _claim(entry: Path) -> Optional[Path]:
+    """Rename an entry of the trash to mark it being deleted by the running process.
+
+    The claimed entry is the lease of the process and refreshed until it is deleted.
+    """
+    name = entry.name
+    if name.endswith(TRASH_CLAIM_SUFFIX):
+        base, _, owner = name[: -len(TRASH_CLAIM_SUFFIX)].rpartition(".")
+        if is_lease_valid(owner, entry):
+            return None
+        name = base
+    claimed = entry.with_name("%s.%s%s" % (name, get_lease_owner(), TRASH_CLAIM_SUFFIX))
+    try:
+        os.rename(entry, claimed)
+    except OSError:
+        # claimed concurrently by another process
+        return None
+    hold_lease(claimed)
+    return claimed
+
+
+def _remove(path: Path) -> None:
+    try:
+        if path.is_symlink():
+            path.unlink()
+        else:
+            force_remove(path)
+    except OSError as e:
+        module_logger().debug("Cannot delete %s: %s" % (path, e))
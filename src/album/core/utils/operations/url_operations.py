@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
 import re
+import shutil
 import tempfile
 from enum import Enum, unique
 from pathlib import Path
-
-from album.core.utils.operations.file_operations import check_zip
-from album.environments.utils.file_operations import copy
-from album.environments.utils.url_operations import _get_session
+from typing import Union
+
+from album.core.model.default_values import DefaultValues
+from album.core.utils.operations.file_operations import (
+    check_zip,
+    force_remove,
+    get_dict_from_json,
+    write_dict_to_json,
+)
 from album.runner import album_logging
 
 module_logger = album_logging.get_active_logger
@@ -17,7 +25,7 @@ module_logger = album_logging.get_active_logger
 
 def retrieve_redirect_url(url: str) -> str:
     """Retrieve the redirect url."""
-    with _get_session() as s:
+    with _create_session() as s:
         r = s.get(url, allow_redirects=True, stream=False)
 
         if r.status_code != ResponseStatus.OK.value:
@@ -52,20 +60,142 @@ def is_git_ssh_address(str_input: str) -> bool:
 
 
 def download(str_input: str, base: str) -> Path:
-    """Download a solution file into a temporary file."""
-    Path(base).mkdir(exist_ok=True, parents=True)
+    """Download a solution file into the url cache of the given folder.
+
+    The file is streamed to disk. A previous download of the same url is revalidated via its ETag and
+    Last-Modified headers and only downloaded again when it changed. When the server cannot be reached,
+    a previous download is used.
+
+    Args:
+        str_input:
+            The url of the solution file.
+        base:
+            The folder holding the url cache.
+
+    Returns:
+        The downloaded file. Zip archives are returned with a .zip suffix.
+
+    """
+    cache_dir = Path(base).joinpath(
+        DefaultValues.cache_path_url_prefix.value,
+        hashlib.sha256(str_input.encode("utf-8")).hexdigest()[:32],
+    )
+    target = cache_dir.joinpath(DefaultValues.url_cache_file_name.value)
+    target_zip = target.with_suffix(".zip")
+
+    try:
+        downloaded = conditional_download(str_input, target)
+    except ConnectionError as e:
+        if not target.exists():
+            raise e
+        module_logger().warning(
+            "Cannot revalidate %s, using the previous download..." % str_input
+        )
+        downloaded = False
+
+    if check_zip(target):
+        # archives are unpacked by suffix - link instead of copying the download
+        if downloaded or not target_zip.exists():
+            force_remove(target_zip)
+            try:
+                os.link(target, target_zip)
+            except OSError:
+                shutil.copyfile(target, target_zip)
+        return target_zip
+
+    return target
+
+
+def conditional_download(url: str, target: Union[str, Path]) -> bool:
+    """Download a url to a target file unless the remote file did not change since the last download.
+
+    The ETag and Last-Modified headers of the last response are kept next to the target file and
+    sent along as If-None-Match and If-Modified-Since headers with the next request.
+
+    Args:
+        url:
+            The url of the file to download.
+        target:
+            The path to download the file to. An existing file is only replaced once the
+            download finished.
+
+    Returns:
+        True when the file was downloaded, False when the server reported it unchanged.
+
+    Raises:
+        FileNotFoundError when the server does not know the url.
+        ConnectionError when the file could not be retrieved.
+
+    """
+    from requests import RequestException
+
+    target = Path(target)
+    header_file = get_conditional_download_header_file(target)
+
+    headers = {}
+    if target.exists() and header_file.exists():
+        cached_headers = get_dict_from_json(header_file)
+        if cached_headers.get("etag"):
+            headers["If-None-Match"] = cached_headers["etag"]
+        if cached_headers.get("last_modified"):
+            headers["If-Modified-Since"] = cached_headers["last_modified"]
+
+    try:
+        with _create_session() as s:
+            with s.get(url, headers=headers, allow_redirects=True, stream=True) as r:
+                if r.status_code == ResponseStatus.NotModified.value:
+                    module_logger().debug("%s not modified, using cached copy..." % url)
+                    return False
+                if r.status_code == ResponseStatus.NotFound.value:
+                    raise FileNotFoundError("Could not find resource %s!" % url)
+                if r.status_code != ResponseStatus.OK.value:
+                    raise ConnectionError("Could not connect to resource %s!" % url)
+
+                target.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_file_name = tempfile.mkstemp(dir=target.parent)
+                try:
+                    with os.fdopen(fd, "wb") as out:
+                        for chunk in r.iter_content(chunk_size=1024 * 1024):
+                            out.write(chunk)
+                    os.replace(tmp_file_name, target)
+                finally:
+                    if os.path.exists(tmp_file_name):
+                        os.remove(tmp_file_name)
+
+                write_dict_to_json(
+                    header_file,
+                    {
+                        "url": url,
+                        "etag": r.headers.get("ETag"),
+                        "last_modified": r.headers.get("Last-Modified"),
+                    },
+                )
+    except RequestException as e:
+        raise ConnectionError("Could not connect to resource %s!" % url) from e
+
+    return True
+
+
+def download_resource(url: str, path: Union[str, Path]) -> Path:
+    """Download a resource to the given path, retrying on connection errors."""
+    from album.environments.utils.url_operations import (
+        download_resource as _download_resource,
+    )
+
+    return _download_resource(url, path)
+
+
+def _create_session():
+    # requests is slow to import, it is only imported once album accesses the network
+    from album.environments.utils.url_operations import _get_session
+
+    return _get_session()
 
-    with _get_session() as s:
-        r = s.get(str_input, allow_redirects=True, stream=True)
 
-        new_file, tmp_file_name = tempfile.mkstemp(dir=base)
-        with open(tmp_file_name, "wb") as out:
-            out.write(r.content)
-        if check_zip(tmp_file_name):
-            new_file, tmp_file_name_zip = tempfile.mkstemp(dir=base, suffix=".zip")
-            copy(tmp_file_name, tmp_file_name_zip)
-            return Path(tmp_file_name_zip)
-        return Path(tmp_file_name)
+def get_conditional_download_header_file(target: Union[str, Path]) -> Path:
+    """Return the file holding the cache validators of a file downloaded with conditional_download."""
+    target = Path(target)
+    return target.with_name(target.name + ".headers.json")
 
 
 @unique
@@ -76,6 +206,7 @@ class ResponseStatus(Enum):
     Created = 201  # response included
     Accepted = 202  # response included
     NoContent = 204  # response NOT included
+    NotModified = 304  # response NOT included
     BadRequest = 400  # error response included
     Unauthorized = 401  # error response included
     Forbidden = 403  # error response included
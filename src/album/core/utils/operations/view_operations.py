@@ -193,6 +193,50 @@ def get_search_result_as_string(args: Namespace, search_result: List[Tuple[Any,
     return res
 
 
+def get_disk_usage_as_string(disk_usage: Dict[str, Any]) -> str:
+    """Get the disk usage as a string."""
+    res = "\nDisk usage of the album cache:\n"
+    width = max(len(category["name"]) for category in disk_usage["categories"])
+    for category in disk_usage["categories"]:
+        res += "├─ %s: %s (%s)\n" % (
+            category["name"].ljust(width),
+            get_size_as_string(category["size"]),
+            category["path"],
+        )
+    res += "└─ %s: %s\n" % (
+        "total".ljust(width),
+        get_size_as_string(disk_usage["total"]),
+    )
+    if disk_usage["orphans"]:
+        res += "Orphans - run `album gc` to remove them:\n"
+        for i, orphan in enumerate(disk_usage["orphans"]):
+            prefix = "└─" if i == len(disk_usage["orphans"]) - 1 else "├─"
+            res += "%s [%s] %s (%s)\n" % (
+                prefix,
+                orphan["type"],
+                orphan["path"],
+                get_size_as_string(orphan["size"]),
+            )
+        res += "Reclaimable: %s\n" % get_size_as_string(
+            sum(orphan["size"] for orphan in disk_usage["orphans"])
+        )
+    else:
+        res += "No orphans found.\n"
+    return res
+
+
+def get_size_as_string(size: int) -> str:
+    """Get a size in bytes as a human readable string."""
+    if size < 1024:
+        return "%d B" % size
+    value = float(size)
+    for unit in ["KiB", "MiB", "GiB", "TiB"]:
+        value /= 1024
+        if value < 1024:
+            break
+    return "%.1f %s" % (value, unit)
+
+
 def get_logging_formatter(
     fmt: Optional[str] = None, time: Optional[str] = None
 ) -> colorlog.ColoredFormatter:
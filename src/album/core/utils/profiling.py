@@ -0,0 +1,190 @@
+"""Timed spans of the phases of an album call, recorded when profiling is enabled."""
+
+import cProfile
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Generator, List, Optional, TypeVar, Union
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# the profiler of the running process, None unless profiling is enabled
+_profiler: Optional["Profiler"] = None
+
+
+class Profiler:
+    """Records timed spans and optionally a cProfile profile of the running process."""
+
+    class Span:
+        """A named phase, its start relative to the start of the profiler and its duration in seconds."""
+
+        def __init__(self, name: str, start: float, thread_id: int, depth: int):
+            """Create a span of the given thread, depth is the number of spans it is nested in."""
+            self.name = name
+            self.start = start
+            self.duration = 0.0
+            self.thread_id = thread_id
+            self.depth = depth
+
+    def __init__(self, use_cprofile: bool = False, start: Optional[float] = None):
+        """Start profiling, at start as returned by time.perf_counter() if given."""
+        self._start = start if start is not None else time.perf_counter()
+        self._spans: List[Profiler.Span] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._cprofile = cProfile.Profile() if use_cprofile else None
+        if self._cprofile:
+            self._cprofile.enable()
+
+    @contextmanager
+    def span(self, name: str) -> Generator[None, None, None]:
+        """Record the time spent in the with block as a span nested in the span currently open in this thread."""
+        depth = getattr(self._local, "depth", 0)
+        record = Profiler.Span(
+            name, time.perf_counter() - self._start, threading.get_ident(), depth
+        )
+        self._local.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+            record.duration = time.perf_counter() - self._start - record.start
+            with self._lock:
+                self._spans.append(record)
+
+    def add_span(self, name: str, start: float, end: float) -> None:
+        """Record a span measured before profiling got enabled, times as returned by time.perf_counter()."""
+        record = Profiler.Span(name, start - self._start, threading.get_ident(), 0)
+        record.duration = end - start
+        with self._lock:
+            self._spans.append(record)
+
+    def stop(self) -> None:
+        """Stop the cProfile profile, if any."""
+        if self._cprofile:
+            self._cprofile.disable()
+
+    def spans(self) -> List["Profiler.Span"]:
+        """Return the recorded spans ordered by thread and start."""
+        with self._lock:
+            return sorted(self._spans, key=lambda s: (s.thread_id, s.start))
+
+    def total(self) -> float:
+        """Return the seconds elapsed since profiling started."""
+        return time.perf_counter() - self._start
+
+    def get_summary_as_string(self) -> str:
+        """Return a table of the recorded spans, nested spans are indented below their parent span."""
+        total = self.total()
+        rows = []
+        for s in self.spans():
+            rows.append(
+                (
+                    "  " * s.depth + s.name,
+                    "%.1f" % (s.duration * 1000),
+                    "%.1f" % (s.duration / total * 100) if total else "-",
+                )
+            )
+        rows.append(("total", "%.1f" % (total * 1000), "100.0"))
+        header = ("phase", "ms", "%")
+        width = max(len(r[0]) for r in rows + [header])
+        lines = ["%s %10s %6s" % (header[0].ljust(width), header[1], header[2])]
+        lines.append("-" * len(lines[0]))
+        for r in rows:
+            lines.append("%s %10s %6s" % (r[0].ljust(width), r[1], r[2]))
+        return "\n".join(lines)
+
+    def write_trace(self, path: Union[str, Path]) -> None:
+        """Write the recorded spans as Chrome trace events (chrome://tracing, Perfetto)."""
+        events: List[Dict[str, Any]] = [
+            {
+                "name": s.name,
+                "ph": "X",
+                "ts": round(s.start * 1e6),
+                "dur": round(s.duration * 1e6),
+                "pid": os.getpid(),
+                "tid": s.thread_id,
+            }
+            for s in self.spans()
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def write_stats(self, path: Union[str, Path]) -> None:
+        """Write the cProfile profile in pstats format."""
+        if not self._cprofile:
+            raise RuntimeError("Profiler was started without cProfile!")
+        self._cprofile.dump_stats(str(path))
+
+
+class _NoSpan:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *args) -> bool:
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def start_profiling(
+    use_cprofile: bool = False, start: Optional[float] = None
+) -> Profiler:
+    """Enable recording spans in this process.
+
+    Args:
+        use_cprofile:
+            Additionally record a cProfile profile.
+        start:
+            The time (as returned by time.perf_counter()) spans are relative to. Defaults to now.
+
+    Returns:
+        The active profiler.
+
+    """
+    global _profiler
+    _profiler = Profiler(use_cprofile, start)
+    return _profiler
+
+
+def stop_profiling() -> Optional[Profiler]:
+    """Disable recording spans. Returns the profiler holding the spans recorded so far."""
+    global _profiler
+    profiler = _profiler
+    _profiler = None
+    if profiler:
+        profiler.stop()
+    return profiler
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Return the active profiler or None if profiling is disabled."""
+    return _profiler
+
+
+def span(name: str):
+    """Record the time spent in a with block as span. Does nothing unless profiling is enabled."""
+    if _profiler is None:
+        return _NO_SPAN
+    return _profiler.span(name)
+
+
+def profiled(name: str) -> Callable[[F], F]:
+    """Record the time spent in the decorated function as span. Does nothing unless profiling is enabled."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _profiler is None:
+                return func(*args, **kwargs)
+            with _profiler.span(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -237,6 +237,48 @@ class TestIntegrationDeploy(TestIntegrationCoreCommon):
         self.assertNotIn("WARNING", self.get_logs_as_string())
         self.assertNotIn("ERROR", self.get_logs_as_string())
 
+    @patch(
+        "album.environments.controller.conda_lock_manager.CondaLockManager.create_conda_lock_file"
+    )
+    def test_deploy_many(self, conda_lock_mock):
+        # prepare
+        path, _ = self.setup_empty_catalog("test_catalog")
+        catalog = self.album_controller.collection_manager().catalogs().add_by_src(path)
+        conda_lock_mock.return_value = None
+
+        # call
+        self.album_controller.deploy_manager().deploy_many(
+            [
+                str(self.get_test_solution_path("solution11_minimal.py")),
+                str(self.get_test_solution_path("solution11_changed_group.py")),
+            ],
+            catalog_name=catalog.name(),
+            changelog="something changed",
+            dry_run=False,
+            git_email=DefaultValues.catalog_git_email.value,
+            git_name=DefaultValues.catalog_git_user.value,
+        )
+
+        # assert
+        self.assertNotIn("ERROR", self.get_logs_as_string())
+        self.album_controller.collection_manager().catalogs().update_any("test_catalog")
+        updates = (
+            self.album_controller.collection_manager()
+            .catalogs()
+            .update_collection("test_catalog")
+        )
+        self.assertEqual(2, len(updates["test_catalog"].solution_changes()))
+
+        # both solutions are pushed with a single commit and tagged
+        with catalog.retrieve_catalog(
+            Path(self.tmp_dir.name).joinpath("tmp_cat_dir")
+        ) as tmp_repo:
+            self.assertEqual(2, len(list(tmp_repo.iter_commits())))
+            self.assertCountEqual(
+                ["group-name-0.1.0", "group2-name-0.2.0"],
+                [tag.name for tag in tmp_repo.tags],
+            )
+
     @patch(
         "album.environments.controller.conda_lock_manager.CondaLockManager.create_conda_lock_file"
     )
@@ -1,3 +1,5 @@
+import platform
+import threading
 import unittest
 from pathlib import Path
 from test.unit.test_unit_core_common import TestCatalogAndCollectionCommon
@@ -7,6 +9,7 @@ from unittest.mock import MagicMock, patch
 from album.core.model.catalog import Catalog
 from album.core.model.collection_index import CollectionIndex
 from album.core.model.resolve_result import ResolveResult
+from album.core.utils.operations.file_operations import construct_cache_link_target
 from album.runner.core.model.coordinates import Coordinates
 from album.runner.core.model.solution import Solution
 
@@ -26,6 +29,96 @@ class TestCollectionManager(TestCatalogAndCollectionCommon):
     def test_catalogs(self):
         self.assertIsNotNone(self.album_controller.collection_manager().catalogs())
 
+    @unittest.skipIf(
+        platform.system().lower() == "windows",
+        "Linking in windows currently not tested!",
+    )
+    @patch(
+        "album.core.controller.collection.collection_manager.construct_cache_link_target",
+        wraps=construct_cache_link_target,
+    )
+    def test_get_link_target(self, construct_mock):
+        collection_manager = self.album_controller.collection_manager()
+        point_from = Path(self.tmp_dir.name).joinpath("links", "a")
+
+        # call
+        target = collection_manager.get_link_target(point_from, Path("pkg"))
+        self.assertEqual(
+            target, collection_manager.get_link_target(point_from, Path("pkg"))
+        )
+
+        # assert - the second lookup uses the registered link
+        self.assertEqual(1, construct_mock.call_count)
+        self.assertEqual(target, point_from.resolve())
+        self.assertEqual(
+            str(target),
+            collection_manager.get_collection_index().get_link_target(str(point_from)),
+        )
+
+        # call - the link gets removed
+        point_from.unlink()
+        self.assertEqual(
+            Path(""),
+            collection_manager.get_link_target(point_from, Path("pkg"), create=False),
+        )
+
+        # assert
+        self.assertEqual(2, construct_mock.call_count)
+        self.assertIsNone(
+            collection_manager.get_collection_index().get_link_target(str(point_from))
+        )
+
+    @unittest.skipIf(
+        platform.system().lower() == "windows",
+        "Linking in windows currently not tested!",
+    )
+    def test_get_link_target_stale_registration(self):
+        collection_manager = self.album_controller.collection_manager()
+        point_from = Path(self.tmp_dir.name).joinpath("links", "a")
+        target = collection_manager.get_link_target(point_from, Path("pkg"))
+        other = Path(self.tmp_dir.name).joinpath("links", "b")
+        other_target = collection_manager.get_link_target(other, Path("pkg"))
+
+        # the link was changed without updating the registration, e.g. by another process
+        point_from.unlink()
+        point_from.symlink_to(other_target)
+
+        # call
+        res = collection_manager.get_link_target(point_from, Path("pkg"))
+
+        # assert - the folder of the registered target is not handed out
+        self.assertNotEqual(target, res)
+        self.assertEqual(other_target, res)
+        self.assertEqual(
+            str(other_target),
+            collection_manager.get_collection_index().get_link_target(str(point_from)),
+        )
+
+    def test_register_link_write_lock(self):
+        collection_manager = self.album_controller.collection_manager()
+        point_from = Path(self.tmp_dir.name).joinpath("links", "a")
+        registered = threading.Event()
+
+        def _register():
+            collection_manager.register_link(point_from, Path("target"))
+            registered.set()
+
+        # call - registering waits for the lock held by a concurrent collection write
+        with collection_manager.write_lock():
+            thread = threading.Thread(target=_register)
+            thread.start()
+            self.assertFalse(registered.wait(0.2))
+            # reentrant
+            collection_manager.unregister_link(point_from)
+        thread.join()
+
+        # assert
+        self.assertTrue(registered.is_set())
+        self.assertEqual(
+            "target",
+            collection_manager.get_collection_index().get_link_target(str(point_from)),
+        )
+
     def test_solutions(self):
         self.assertIsNotNone(self.album_controller.collection_manager().solutions())
 
@@ -128,6 +221,108 @@ class TestCollectionManager(TestCatalogAndCollectionCommon):
             self.album_controller.configuration().cache_path_download(),
         )
 
+    @patch("album.core.controller.collection.collection_manager.check_file_or_url")
+    @patch("album.core.controller.state_manager.StateManager.load")
+    def test_resolve_and_load_memoized(self, load_mock, check_file_or_url_mock):
+        # mocks
+        search_mock = MagicMock(
+            return_value=CollectionIndex.CollectionSolution(
+                internal={"catalog_id": 1, "installed": True},
+                setup={"group": "grp", "name": "name", "version": "version"},
+            )
+        )
+        self.album_controller.collection_manager()._search = search_mock
+        load_mock.return_value = Solution(
+            {"group": "grp", "name": "name", "version": "version"}
+        )
+        check_file_or_url_mock.return_value = None
+        self.album_controller.collection_manager().retrieve_and_load_resolve_result = (
+            MagicMock(
+                side_effect=lambda r, m=False: r.set_loaded_solution(
+                    load_mock.return_value
+                )
+            )
+        )
+
+        # call
+        r1 = self.album_controller.collection_manager().resolve_and_load(
+            "grp:name:version"
+        )
+        r2 = self.album_controller.collection_manager().resolve_and_load(
+            "grp:name:version"
+        )
+        r3 = self.album_controller.collection_manager().resolve_installed_and_load(
+            "grp:name:version"
+        )
+
+        # assert
+        self.assertIs(r1, r2)
+        self.assertIs(r1, r3)
+        self.assertIs(r1.loaded_solution(), r2.loaded_solution())
+        search_mock.assert_called_once_with("grp:name:version")
+        self.album_controller.collection_manager().retrieve_and_load_resolve_result.assert_called_once()
+        load_mock.assert_not_called()
+
+    @patch("album.core.controller.collection.collection_manager.check_file_or_url")
+    def test_resolve_and_load_memo_invalidated(self, check_file_or_url_mock):
+        # mocks
+        search_mock = MagicMock(
+            return_value=CollectionIndex.CollectionSolution(
+                internal={"catalog_id": 1, "installed": False},
+                setup={"group": "grp", "name": "name", "version": "version"},
+            )
+        )
+        self.album_controller.collection_manager()._search = search_mock
+        check_file_or_url_mock.return_value = None
+        retrieve_and_load = MagicMock(
+            side_effect=lambda r, m=False: r.set_loaded_solution(
+                Solution({"group": "grp", "name": "name", "version": "version"})
+            )
+        )
+        self.album_controller.collection_manager().retrieve_and_load_resolve_result = (
+            retrieve_and_load
+        )
+
+        # call
+        r1 = self.album_controller.collection_manager().resolve_and_load(
+            "grp:name:version", metadata_only=True
+        )
+        r2 = self.album_controller.collection_manager().resolve_and_load(
+            "grp:name:version"
+        )  # metadata is not enough, loads again
+        self.album_controller.collection_manager().solutions().set_installed(
+            self.album_controller.catalogs().get_cache_catalog(),
+            Coordinates("grp", "name", "version"),
+        )
+        r3 = self.album_controller.collection_manager().resolve_and_load(
+            "grp:name:version"
+        )
+
+        # assert
+        self.assertIs(r1, r2)
+        self.assertIsNot(r2, r3)
+        self.assertEqual(2, search_mock.call_count)
+        self.assertEqual(3, retrieve_and_load.call_count)
+
+    def test_resolve_memo_local_file_changed(self):
+        # prepare
+        f = Path(self.tmp_dir.name).joinpath("mySolution.py")
+        f.write_text("a")
+
+        _resolve_uncached = MagicMock(side_effect=lambda s: MagicMock())
+        self.album_controller.collection_manager()._resolve_uncached = _resolve_uncached
+
+        # call
+        r1 = self.album_controller.collection_manager()._resolve(str(f))
+        r2 = self.album_controller.collection_manager()._resolve(str(f))
+        f.write_text("changed")
+        r3 = self.album_controller.collection_manager()._resolve(str(f))
+
+        # assert
+        self.assertIs(r1, r2)
+        self.assertIsNot(r1, r3)
+        self.assertEqual(2, _resolve_uncached.call_count)
+
     @unittest.skip("Needs to be implemented!")
     def test_resolve_require_installation_and_load_valid_path(self):
         # todo: implement
@@ -291,7 +486,11 @@ class TestCollectionManager(TestCatalogAndCollectionCommon):
         _search_for_local_file_mock.assert_not_called()
         _search_mock.assert_not_called()
         _search_doi_mock.assert_called_once_with("10.5072/zenodo.931388")
-        check_doi_mock.assert_called_once_with("10.5072/zenodo.931388", mock.ANY)
+        check_doi_mock.assert_called_once_with(
+            "10.5072/zenodo.931388",
+            mock.ANY,
+            self.album_controller.configuration().doi_cache_path(),
+        )
 
     @patch("album.core.controller.collection.collection_manager.check_doi")
     @patch(
@@ -43,11 +43,11 @@ class TestSolutionHandler(TestCatalogAndCollectionCommon):
     def tearDown(self) -> None:
         super().tearDown()
 
-    @patch("album.core.controller.collection.solution_handler.copy")
-    @patch("album.core.controller.collection.solution_handler.copy_folder")
+    @patch("album.core.controller.collection.solution_handler.link_file_from_blob")
+    @patch("album.core.controller.collection.solution_handler.link_folder_from_blobs")
     @patch("album.core.controller.collection.solution_handler.get_deploy_dict")
     def test_add_or_replace_folder_call(
-        self, get_deploy_dict_mock, copy_folder_mock, copy_mock
+        self, get_deploy_dict_mock, link_folder_mock, link_file_mock
     ):
         get_deploy_dict_mock.return_value = self.solution_default_dict
 
@@ -81,14 +81,16 @@ class TestSolutionHandler(TestCatalogAndCollectionCommon):
         get_solution_path.assert_called_once_with(
             catalog, Coordinates("tsg", "tsn", "tsv")
         )
-        copy_folder_mock.assert_called_once_with(
-            Path("path"), Path("myCopyPath"), copy_root_folder=False
+        link_folder_mock.assert_called_once_with(
+            self.album_controller.configuration().blob_path(),
+            Path("path"),
+            Path("myCopyPath"),
         )
-        copy_mock.assert_not_called()
+        link_file_mock.assert_not_called()
 
-    @patch("album.core.controller.collection.solution_handler.copy")
-    @patch("album.core.controller.collection.solution_handler.copy_folder")
-    def test_add_or_replace_file_call(self, copy_folder_mock, copy_mock):
+    @patch("album.core.controller.collection.solution_handler.link_file_from_blob")
+    @patch("album.core.controller.collection.solution_handler.link_folder_from_blobs")
+    def test_add_or_replace_file_call(self, link_folder_mock, link_file_mock):
         self.setup_solution_no_env()
         solution = create_autospec(ResolveResult)
         solution.loaded_solution = lambda: self.active_solution
@@ -116,9 +118,11 @@ class TestSolutionHandler(TestCatalogAndCollectionCommon):
         get_solution_path.assert_called_once_with(
             catalog, Coordinates("tsg", "tsn", "tsv")
         )
-        copy_folder_mock.assert_not_called()
-        copy_mock.assert_called_once_with(
-            solution.path(), Path("myCopyPath").joinpath("solution.py")
+        link_folder_mock.assert_not_called()
+        link_file_mock.assert_called_once_with(
+            self.album_controller.configuration().blob_path(),
+            solution.path(),
+            Path("myCopyPath").joinpath("solution.py"),
         )
 
     def test_add_to_cache_catalog(self):
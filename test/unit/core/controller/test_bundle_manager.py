@@ -0,0 +1,170 @@
+import os
+import platform
+import unittest
+from pathlib import Path
+from test.unit.test_unit_core_common import TestUnitCoreCommon
+from unittest.mock import MagicMock, patch
+
+from album.core.controller.album_controller import AlbumController
+from album.core.controller.bundle_manager import BundleManager
+from album.core.utils.operations.bundle_operations import read_bundle
+from album.runner.core.model.coordinates import Coordinates
+
+
+@unittest.skipIf(
+    platform.system().lower() == "windows",
+    "Linking in windows currently not tested!",
+)
+class TestBundleManager(TestUnitCoreCommon):
+    def setUp(self):
+        super().setUp()
+        self.setup_collection()
+        self.configuration = self.album_controller.configuration()
+        self.coordinates = Coordinates("tsg", "tsn", "tsv")
+
+        # a catalog with a downloaded solution package and shared resources
+        catalog_src, _ = self.setup_empty_catalog("test_catalog")
+        self.catalog = self.album_controller.catalogs().add_by_src(str(catalog_src))
+        self.catalog.index().update(self.coordinates, self.solution_default_dict)
+        self.catalog.index().save()
+        self.album_controller.collection_manager().get_collection_index().insert_solution(
+            self.catalog.catalog_id(), self.solution_default_dict
+        )
+        package = self.album_controller.solutions().get_solution_package_path(
+            self.catalog, self.coordinates
+        )
+        package.joinpath("solution.py").write_text("solution")
+        package.joinpath("solution.conda-lock.yml").write_text("lock")
+        resources = self.configuration.shared_resources_path().joinpath("test_catalog")
+        resources.joinpath("data").mkdir(parents=True)
+        resources.joinpath("data", "file").write_bytes(b"x" * 10)
+
+        self.archive = Path(self.tmp_dir.name).joinpath("bundle.tar.gz")
+        self.bundle_manager = BundleManager(self.album_controller)
+
+    def _create_node(self):
+        """Create the album controller of another host."""
+        album_controller = AlbumController(
+            base_cache_path=Path(self.tmp_dir.name).joinpath("node")
+        )
+        with patch(
+            "album.core.model.configuration.Configuration.get_initial_catalogs"
+        ) as get_initial_catalogs_mock:
+            get_initial_catalogs_mock.return_value = {}
+            album_controller.collection_manager().load_or_create()
+        return album_controller
+
+    def test_create_bundle(self):
+        manifest = self.bundle_manager.create_bundle(self.archive, resources=True)
+
+        # assert
+        self.assertEqual(["test_catalog"], [c["name"] for c in manifest["catalogs"]])
+        self.assertEqual(
+            [{"group": "tsg", "name": "tsn", "version": "tsv"}],
+            manifest["catalogs"][0]["solutions"],
+        )
+        self.assertCountEqual(
+            [
+                "catalogs/test_catalog/album_catalog_index.db",
+                "catalogs/test_catalog/album_catalog_index.json",
+                "catalogs/test_catalog/solutions/tsg/tsn/tsv/solution.py",
+                "catalogs/test_catalog/solutions/tsg/tsn/tsv/solution.conda-lock.yml",
+                "resources/test_catalog/data/file",
+            ],
+            manifest["files"],
+        )
+        self.assertEqual(
+            manifest,
+            read_bundle(self.archive, Path(self.tmp_dir.name).joinpath("extracted")),
+        )
+
+    def test_create_bundle_cache_catalog(self):
+        with self.assertRaises(ValueError):
+            self.bundle_manager.create_bundle(
+                self.archive,
+                [self.album_controller.catalogs().get_cache_catalog().name()],
+            )
+
+    def test_import_bundle(self):
+        self.bundle_manager.create_bundle(self.archive, resources=True)
+        node = self._create_node()
+        node._environment_manager = MagicMock()
+        try:
+            # call - without access to the src of the catalog
+            with patch(
+                "album.core.model.catalog.retrieve_index_files_from_src",
+                side_effect=ConnectionError(),
+            ):
+                res = BundleManager(node).import_bundle(self.archive)
+
+            # assert
+            self.assertEqual(
+                {
+                    "catalogs": ["test_catalog"],
+                    "solutions": 1,
+                    "environments": [],
+                    "resources": 1,
+                },
+                res,
+            )
+            catalog = node.catalogs().get_by_name("test_catalog")
+            self.assertEqual(self.catalog.src(), catalog.src())
+            solutions = (
+                node.collection_manager()
+                .get_collection_index()
+                .get_solutions_by_catalog(catalog.catalog_id())
+            )
+            self.assertEqual(["tsn"], [s.setup()["name"] for s in solutions])
+            package = node.solutions().get_solution_package_path(
+                catalog, self.coordinates
+            )
+            self.assertEqual(
+                "lock", package.joinpath("solution.conda-lock.yml").read_text()
+            )
+            # materialized from the blob store
+            self.assertEqual(2, os.stat(package.joinpath("solution.py")).st_nlink)
+            self.assertEqual(
+                b"x" * 10,
+                node.configuration()
+                .shared_resources_path()
+                .joinpath("test_catalog", "data", "file")
+                .read_bytes(),
+            )
+
+            # call - importing again updates the catalog
+            BundleManager(node).import_bundle(self.archive)
+            self.assertEqual(2, len(node.catalogs().get_all()))
+        finally:
+            node.close()
+
+    def test_import_bundle_environments(self):
+        environment_manager = MagicMock()
+        environment_manager.get_environment_name.return_value = "env_a"
+
+        def _pack(collection_solution, archive):
+            Path(archive).write_bytes(b"environment")
+            return archive
+
+        environment_manager.pack_environment.side_effect = _pack
+        self.album_controller._environment_manager = environment_manager
+        self.album_controller.solutions().set_installed(self.catalog, self.coordinates)
+        self.album_controller.collection_manager().resolve_installed_and_load = (
+            MagicMock()
+        )
+        self.bundle_manager.create_bundle(self.archive, environments=True)
+        node = self._create_node()
+        node._environment_manager = MagicMock()
+        try:
+            # call
+            res = BundleManager(node).import_bundle(self.archive)
+
+            # assert
+            self.assertEqual(["env_a"], res["environments"])
+            archive = node._environment_manager.unpack_environment.call_args[0][0]
+            self.assertEqual("env_a.tar", archive.name)
+        finally:
+            node.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -59,6 +59,173 @@ class TestDeployManager(TestGitCommon, TestCatalogAndCollectionCommon):
             False,
         )
 
+    def test_deploy_many(self):
+        # mock
+        _get_path_to_solution = MagicMock(side_effect=lambda p: p)
+        self.deploy_manager._get_path_to_solution = _get_path_to_solution
+
+        load = MagicMock(return_value=self.active_solution)
+        self.album_controller.state_manager().load = load
+
+        catalog = EmptyTestClass()
+        catalog.type = lambda: "direct"
+        get_by_name = MagicMock(return_value=catalog)
+        self.album_controller.catalogs().get_by_name = get_by_name
+
+        _deploy_many = MagicMock(return_value=None)
+        self.deploy_manager._deploy_many = _deploy_many
+
+        # call
+        self.deploy_manager.deploy_many(["path1", "path2"], "catName", False)
+
+        # assert
+        self.assertEqual(2, load.call_count)
+        _deploy_many.assert_called_once_with(
+            catalog,
+            [
+                (self.active_solution, Path("path1")),
+                (self.active_solution, Path("path2")),
+            ],
+            False,
+            False,
+            [],
+            "",
+            "",
+            False,
+        )
+
+    def test_deploy_many_invalid_solutions(self):
+        # mock
+        def _load(path):
+            if str(path) != "valid":
+                raise ValueError("Invalid solution %s!" % path)
+            return self.active_solution
+
+        self.deploy_manager._get_path_to_solution = MagicMock(side_effect=lambda p: p)
+        self.album_controller.state_manager().load = MagicMock(side_effect=_load)
+
+        catalog = EmptyTestClass()
+        catalog.type = lambda: "direct"
+        self.album_controller.catalogs().get_by_name = MagicMock(return_value=catalog)
+
+        _deploy_many = MagicMock(return_value=None)
+        self.deploy_manager._deploy_many = _deploy_many
+
+        # call
+        with self.assertRaises(RuntimeError) as context:
+            self.deploy_manager.deploy_many(
+                ["invalid1", "valid", "invalid2"], "catName", False
+            )
+
+        # assert - all errors reported, nothing deployed
+        self.assertIn("Cannot deploy 2 of 3 solution(s)", str(context.exception))
+        self.assertIn("Invalid solution invalid1!", str(context.exception))
+        self.assertIn("Invalid solution invalid2!", str(context.exception))
+        _deploy_many.assert_not_called()
+
+    def test_deploy_many_several_versions(self):
+        # mock
+        other_version = MagicMock()
+        other_version.coordinates.return_value = Coordinates("tsg", "tsn", "tsv2")
+        other_solution = MagicMock()
+        other_solution.coordinates.return_value = Coordinates("tsg", "other", "tsv")
+        solutions = {
+            "path1": self.active_solution,
+            "path2": other_version,
+            "path3": other_solution,
+        }
+
+        self.deploy_manager._get_path_to_solution = MagicMock(side_effect=lambda p: p)
+        self.album_controller.state_manager().load = MagicMock(
+            side_effect=lambda p: solutions[str(p)]
+        )
+
+        catalog = EmptyTestClass()
+        catalog.type = lambda: "direct"
+        self.album_controller.catalogs().get_by_name = MagicMock(return_value=catalog)
+
+        _deploy_many = MagicMock(return_value=None)
+        self.deploy_manager._deploy_many = _deploy_many
+
+        # call
+        with self.assertRaises(RuntimeError) as context:
+            self.deploy_manager.deploy_many(
+                ["path1", "path2", "path3"], "catName", False
+            )
+
+        # assert - versions of one solution would overwrite each other in the same commit
+        self.assertIn("Cannot deploy 1 of 3 solution(s)", str(context.exception))
+        self.assertIn(
+            "tsg:tsn: Cannot deploy several versions (tsv, tsv2)",
+            str(context.exception),
+        )
+        _deploy_many.assert_not_called()
+
+    def test_deploy_many_request_catalog(self):
+        catalog = EmptyTestClass()
+        catalog.type = lambda: "request"
+        self.album_controller.catalogs().get_by_name = MagicMock(return_value=catalog)
+
+        with self.assertRaises(NotImplementedError):
+            self.deploy_manager.deploy_many(["path1", "path2"], "catName", False)
+
+    @patch("album.core.controller.deploy_manager.add_tags")
+    @patch("album.core.controller.deploy_manager.process_changelog_file")
+    def test__deploy_many(self, process_changelog_file, add_tags):
+        # prepare
+        repo = EmptyTestClass()
+        repo.working_tree_dir = "myWorkingDir"
+
+        catalog = MagicMock()
+        catalog.is_cache.return_value = False
+        catalog.retrieve_catalog.return_value.__enter__.return_value = repo
+        catalog.index_file_path.return_value = "indexSrcPath"
+        catalog.export_index_transport.return_value = ["transportFile"]
+
+        second_solution = MagicMock()
+        second_solution.coordinates.return_value = Coordinates("g2", "n2", "v2")
+
+        # mock
+        self.album_controller.migration_manager().load_index = MagicMock()
+        refresh_index = MagicMock()
+        self.album_controller.migration_manager().refresh_index = refresh_index
+
+        _deploy_routine_in_local_src = MagicMock(side_effect=[["export1"], ["export2"]])
+        self.deploy_manager._deploy_routine_in_local_src = _deploy_routine_in_local_src
+
+        _commit_to_main = MagicMock()
+        self.deploy_manager._commit_to_main = _commit_to_main
+
+        # call
+        self.deploy_manager._deploy_many(
+            catalog,
+            [
+                (self.active_solution, Path("path1")),
+                (second_solution, Path("path2")),
+            ],
+            False,
+            False,
+            [],
+        )
+
+        # assert - one index transaction, one commit, one push of all tags
+        catalog.add_all.assert_called_once_with(
+            [self.active_solution, second_solution], force_overwrite=False
+        )
+        self.assertEqual(2, process_changelog_file.call_count)
+        _commit_to_main.assert_called_once_with(
+            "Adding new/updated tsg_tsn_tsv, g2_n2_v2",
+            repo,
+            [str(Path("solutions", "tsg", "tsn")), str(Path("solutions", "g2", "n2"))],
+            ["export1", "export2", "indexSrcPath", "transportFile"],
+            False,
+            [],
+            "",
+            "",
+        )
+        add_tags.assert_called_once_with(repo, ["tsg-tsn-tsv", "g2-n2-v2"])
+        refresh_index.assert_called_once_with(catalog)
+
     @patch(
         "album.core.controller.deploy_manager.process_changelog_file",
         return_value="Chanelog",
@@ -154,6 +321,7 @@ class TestDeployManager(TestGitCommon, TestCatalogAndCollectionCommon):
         catalog = EmptyTestClass()
         catalog.src = lambda: "mySrc"
         catalog.index_file_path = lambda: "indexSrcPath"
+        catalog.export_index_transport = MagicMock(return_value=["transportFile"])
 
         repo = EmptyTestClass()
         repo.working_tree_dir = "myWorkingDir"
@@ -195,12 +363,13 @@ class TestDeployManager(TestGitCommon, TestCatalogAndCollectionCommon):
             self.active_solution.coordinates(),
             repo,
             [str(Path("solutions", "tsg", "tsn"))],
-            ["export1", "export2", "indexSrcPath"],
+            ["export1", "export2", "indexSrcPath", "transportFile"],
             False,
             None,
             "myEmail",
             "myName",
         )
+        catalog.export_index_transport.assert_called_once_with(Path("myWorkingDir"))
         refresh_index.assert_called_once()
 
     @patch(
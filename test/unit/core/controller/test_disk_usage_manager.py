@@ -0,0 +1,173 @@
+import os
+import platform
+import time
+import unittest
+from pathlib import Path
+from test.unit.test_unit_core_common import TestUnitCoreCommon
+
+from album.core.controller.disk_usage_manager import (
+    ORPHAN_LINK,
+    ORPHAN_LINK_DESTINATION,
+    ORPHAN_REGISTERED_LINK,
+    ORPHAN_SHARED_RESOURCES,
+    DiskUsageManager,
+)
+from album.core.model.default_values import DefaultValues
+from album.core.utils.operations.blob_operations import link_folder_from_blobs
+from album.runner.core.model.coordinates import Coordinates
+
+
+@unittest.skipIf(
+    platform.system().lower() == "windows",
+    "Linking in windows currently not tested!",
+)
+class TestDiskUsageManager(TestUnitCoreCommon):
+    def setUp(self):
+        super().setUp()
+        self.setup_collection()
+        self.disk_usage_manager = DiskUsageManager(self.album_controller)
+        self.configuration = self.album_controller.configuration()
+        self.collection_manager = self.album_controller.collection_manager()
+        self.catalog = self.album_controller.catalogs().get_cache_catalog()
+
+        # an installed solution with environment and installation
+        self.collection_manager.get_collection_index().insert_solution(
+            self.catalog.catalog_id(), self.solution_default_dict
+        )
+        self.collection_manager.solutions().set_installed(
+            self.catalog, Coordinates("tsg", "tsn", "tsv")
+        )
+        self.env = self._link(
+            self.configuration.environments_path().joinpath(
+                "%s_tsg_tsn_tsv" % self.catalog.name()
+            ),
+            DefaultValues.lnk_env_prefix.value,
+        )
+        self.installation = self._link(
+            self.configuration.installation_path().joinpath(
+                self.catalog.name(), "tsg", "tsn", "tsv"
+            ),
+            DefaultValues.lnk_solution_prefix.value,
+        )
+
+    def _link(self, link, prefix, size=100):
+        target = self.collection_manager.get_link_target(link, Path(prefix))
+        target.joinpath("file").write_bytes(b"x" * size)
+        self._age(target)
+        self._age(link)
+        return link, target
+
+    @staticmethod
+    def _age(path):
+        old = time.time() - 2 * DefaultValues.gc_orphan_min_age.value
+        os.utime(path, (old, old), follow_symlinks=False)
+
+    def _create_orphans(self):
+        failed_env = self._link(
+            self.configuration.environments_path().joinpath(
+                "%s_tsg_failed_tsv" % self.catalog.name()
+            ),
+            DefaultValues.lnk_env_prefix.value,
+            size=1000,
+        )
+        lnk_inst = self.configuration.lnk_path().joinpath(
+            DefaultValues.lnk_solution_prefix.value
+        )
+        unlinked = lnk_inst.joinpath("7")
+        unlinked.mkdir()
+        self._age(unlinked)
+        # recently created, e.g. by a running installation
+        lnk_inst.joinpath("8").mkdir()
+        self.collection_manager.get_collection_index().set_link_target(
+            "/missing/link", "/lnk/pck/9"
+        )
+        shared = self.configuration.shared_resources_path()
+        shared.joinpath(self.catalog.name()).mkdir()
+        removed_catalog = shared.joinpath("removed_catalog")
+        removed_catalog.mkdir()
+        removed_catalog.joinpath("resource").write_bytes(b"x" * 10)
+        self._age(removed_catalog)
+        return failed_env, unlinked, removed_catalog
+
+    def test_get_orphans(self):
+        failed_env, unlinked, removed_catalog = self._create_orphans()
+
+        # call
+        orphans = self.disk_usage_manager.get_orphans()
+
+        # assert
+        self.assertCountEqual(
+            [
+                {"type": ORPHAN_LINK, "path": str(failed_env[0])},
+                {"type": ORPHAN_REGISTERED_LINK, "path": str(Path("/missing/link"))},
+                {"type": ORPHAN_LINK_DESTINATION, "path": str(failed_env[1])},
+                {"type": ORPHAN_LINK_DESTINATION, "path": str(unlinked)},
+                {"type": ORPHAN_SHARED_RESOURCES, "path": str(removed_catalog)},
+            ],
+            orphans,
+        )
+
+    def test_get_orphans_none(self):
+        self.assertEqual([], self.disk_usage_manager.get_orphans())
+
+    def test_reclaim_orphans(self):
+        failed_env, unlinked, removed_catalog = self._create_orphans()
+
+        # call
+        reclaimed = self.disk_usage_manager.reclaim_orphans()
+
+        # assert
+        self.assertEqual(5, len(reclaimed))
+        self.assertFalse(os.path.lexists(failed_env[0]))
+        self.assertFalse(failed_env[1].exists())
+        self.assertFalse(unlinked.exists())
+        self.assertFalse(removed_catalog.exists())
+        self.assertEqual(3, len(list(self.configuration.trash_path().iterdir())))
+        self.assertEqual(
+            [str(self.env[0]), str(self.installation[0])],
+            sorted(self.collection_manager.get_collection_index().get_all_links()),
+        )
+        self.assertEqual([], self.disk_usage_manager.get_orphans())
+        # the used links are kept
+        self.assertTrue(self.env[0].joinpath("file").exists())
+        self.assertTrue(self.installation[0].joinpath("file").exists())
+
+    def test_get_disk_usage(self):
+        failed_env, unlinked, removed_catalog = self._create_orphans()
+
+        # call
+        disk_usage = self.disk_usage_manager.get_disk_usage(max_workers=2)
+
+        # assert
+        sizes = {c["name"]: c["size"] for c in disk_usage["categories"]}
+        # including the slots file of the link destinations
+        self.assertLessEqual(1100, sizes["environments"])
+        self.assertLessEqual(100, sizes["installations"])
+        self.assertEqual(10, sizes["shared resources"])
+        self.assertEqual(0, sizes["blobs"])
+        self.assertEqual(sum(sizes.values()), disk_usage["total"])
+        orphan_sizes = {o["path"]: o["size"] for o in disk_usage["orphans"]}
+        self.assertEqual(5, len(orphan_sizes))
+        self.assertEqual(1000, orphan_sizes[str(failed_env[1])])
+        self.assertEqual(0, orphan_sizes[str(unlinked)])
+        self.assertEqual(10, orphan_sizes[str(removed_catalog)])
+
+    def test_get_disk_usage_blobs(self):
+        src = Path(self.tmp_dir.name).joinpath("src")
+        src.mkdir()
+        src.joinpath("solution.py").write_bytes(b"x" * 10)
+        src.joinpath("data").write_bytes(b"x" * 1000)
+        package = Path(self.tmp_dir.name).joinpath("package")
+        link_folder_from_blobs(self.configuration.blob_path(), src, package)
+        package.joinpath("data").unlink()
+
+        # call
+        disk_usage = self.disk_usage_manager.get_disk_usage()
+
+        # assert - only the blob no longer linked from a package
+        sizes = {c["name"]: c["size"] for c in disk_usage["categories"]}
+        self.assertEqual(1000, sizes["blobs"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 import io
+import os
 import tempfile
 import unittest
 import unittest.mock
@@ -11,6 +12,11 @@ from album.runner.core.model.coordinates import Coordinates
 from album.runner.core.model.solution import Solution
 
 from album.core.model.catalog import Catalog
+from album.core.utils.operations.environment_fingerprint_operations import (
+    get_environment_fingerprint,
+    get_fingerprint_users,
+    register_environment,
+)
 from album.core.model.resolve_result import ResolveResult
 
 
@@ -34,6 +40,14 @@ class TestEnvironmentManager(TestUnitCoreCommon):
 
         return active_solution
 
+    def _create_env_file(self, name="env.yml", dependencies=None):
+        env_file = Path(self.tmp_dir.name).joinpath(name)
+        env_file.write_text(
+            "name: %s\ndependencies:\n%s"
+            % (name, "".join("  - %s\n" % d for d in dependencies or ["python=3.10"]))
+        )
+        return env_file
+
     @patch(
         "album.core.controller.environment_manager.EnvironmentManager._prepare_env_file"
     )
@@ -41,6 +55,7 @@ class TestEnvironmentManager(TestUnitCoreCommon):
         self,
         mock_prepare_env_file,
     ):
+        mock_prepare_env_file.return_value = self._create_env_file()
         mock_create_environment_from_lockfile = MagicMock()
         self.environment_manager._environment_handler.create_environment_prefer_lock_file = (
             mock_create_environment_from_lockfile
@@ -74,6 +89,7 @@ class TestEnvironmentManager(TestUnitCoreCommon):
     )
     def test_install_environment_from_yml(self, _prepare_env, create_function):
         # prepare
+        _prepare_env.return_value = self._create_env_file()
         resolve = ResolveResult(
             None,
             self.catalog,
@@ -97,10 +113,231 @@ class TestEnvironmentManager(TestUnitCoreCommon):
         # ToDo: implement!
         pass
 
-    @unittest.skip("Needs to be implemented!")
-    def test_remove_environment(self):
-        # ToDo: implement!
-        pass
+    @patch(
+        "album.core.controller.environment_manager.EnvironmentManager._prepare_env_file"
+    )
+    def test_create_environment_shared(self, prepare_env_file_mock):
+        create_mock = MagicMock()
+        handler = self.environment_manager._environment_handler
+        handler.create_environment_prefer_lock_file = create_mock
+        self.environment_manager._environment_exists = MagicMock(return_value=True)
+        cache = Path(self.tmp_dir.name)
+
+        # call
+        prepare_env_file_mock.return_value = self._create_env_file("a.yml")
+        env_a = self.environment_manager.create_environment(
+            cache, {}, "env_a", "0.1.0", cache
+        )
+        prepare_env_file_mock.return_value = self._create_env_file("b.yml")
+        env_b = self.environment_manager.create_environment(
+            cache, {}, "env_b", "0.1.0", cache
+        )
+        prepare_env_file_mock.return_value = self._create_env_file(
+            "c.yml", ["python=3.11"]
+        )
+        env_c = self.environment_manager.create_environment(
+            cache, {}, "env_c", "0.1.0", cache
+        )
+
+        # assert
+        self.assertEqual(2, create_mock.call_count)
+        self.assertEqual(env_a.path().resolve(), env_b.path().resolve())
+        self.assertNotEqual(env_a.path().resolve(), env_c.path().resolve())
+
+    @patch(
+        "album.core.controller.environment_manager.EnvironmentManager._prepare_env_file"
+    )
+    def test_remove_environment_shared(self, prepare_env_file_mock):
+        handler = self.environment_manager._environment_handler
+        handler.create_environment_prefer_lock_file = MagicMock()
+        self.environment_manager._environment_exists = MagicMock(return_value=True)
+        remove_mock = MagicMock()
+        handler.remove_environment = remove_mock
+        cache = Path(self.tmp_dir.name)
+        prepare_env_file_mock.return_value = self._create_env_file()
+        env_a = self.environment_manager.create_environment(
+            cache, {}, "env_a", "0.1.0", cache
+        )
+        env_b = self.environment_manager.create_environment(
+            cache, {}, "env_b", "0.1.0", cache
+        )
+        target = env_a.path().resolve()
+
+        # call - the environment is still used by env_b
+        self.assertTrue(self.environment_manager.remove_environment(env_a))
+
+        # assert
+        remove_mock.assert_not_called()
+        self.assertIsNone(env_a.path())
+        self.assertTrue(target.exists())
+        self.assertEqual(target, env_b.path().resolve())
+
+        # call - last user
+        self.assertTrue(self.environment_manager.remove_environment(env_b))
+
+        # assert - the environment folder is moved to the trash
+        remove_mock.assert_not_called()
+        self.assertFalse(target.exists())
+        self.assertEqual(
+            1,
+            len(list(self.album_controller.configuration().trash_path().iterdir())),
+        )
+
+    def _create_installed_environment(self, env_name):
+        """Create an environment folder the way the package manager would and register its fingerprint."""
+        env_path = self.environment_manager.get_environment_path(env_name)
+        env_path.joinpath("conda-meta").mkdir()
+        env_path.joinpath("bin").mkdir()
+        env_path.joinpath("bin", "script").write_text("#!%s/bin/python\n" % env_path)
+        register_environment(
+            self.album_controller.configuration().environment_fingerprints_path(),
+            "fp",
+            env_name,
+            env_path,
+        )
+        return env_path
+
+    def _mock_environment_list(self):
+        package_manager = MagicMock()
+        package_manager.get_environment_list.side_effect = lambda: sorted(
+            self.environment_manager.env_base_path.iterdir()
+        )
+        self.environment_manager._environment_handler.get_package_manager = MagicMock(
+            return_value=package_manager
+        )
+
+    def test_pack_environment_unpack_environment(self):
+        self._mock_environment_list()
+        env_path = self._create_installed_environment("testname_testid_test_1.0.0")
+        collection_solution = MagicMock()
+        collection_solution.database_entry().internal.return_value = {"parent": None}
+        collection_solution.coordinates.return_value = (
+            self.active_solution.coordinates()
+        )
+        collection_solution.catalog.return_value = self.catalog
+        archive = Path(self.tmp_dir.name).joinpath("env.tar.gz")
+
+        # call
+        self.assertEqual(
+            archive,
+            self.environment_manager.pack_environment(collection_solution, archive),
+        )
+
+        # another host - the environment does not exist yet
+        registry = self.album_controller.configuration().environment_fingerprints_path()
+        self.environment_manager.remove_environment(
+            self.environment_manager.set_environment(collection_solution)
+        )
+        self.assertFalse(env_path.exists())
+
+        environment = self.environment_manager.unpack_environment(archive)
+
+        # assert
+        self.assertEqual("testname_testid_test_1.0.0", environment.name())
+        self.assertEqual(
+            "#!%s/bin/python\n" % environment.path().resolve(),
+            environment.path().joinpath("bin", "script").read_text(),
+        )
+        self.assertEqual(
+            ["testname_testid_test_1.0.0"], get_fingerprint_users(registry, "fp")
+        )
+        self.assertEqual(
+            environment.path().resolve(),
+            self.environment_manager.get_installed_environment_path(
+                "testname_testid_test_1.0.0"
+            ).resolve(),
+        )
+        # unpacking again keeps the environment
+        self.assertEqual(
+            environment.path().resolve(),
+            self.environment_manager.unpack_environment(archive).path().resolve(),
+        )
+
+    @patch(
+        "album.core.controller.environment_manager.EnvironmentManager._prepare_env_file"
+    )
+    def test_create_environment_unpacked(self, prepare_env_file_mock):
+        self._mock_environment_list()
+        create_mock = MagicMock()
+        self.environment_manager._environment_handler.create_environment_prefer_lock_file = (
+            create_mock
+        )
+        cache = Path(self.tmp_dir.name)
+        prepare_env_file_mock.return_value = self._create_env_file()
+        fingerprint = get_environment_fingerprint(prepare_env_file_mock.return_value)
+        env_path = self.environment_manager.get_environment_path("env_a")
+        env_path.joinpath("conda-meta").mkdir()
+        register_environment(
+            self.album_controller.configuration().environment_fingerprints_path(),
+            fingerprint,
+            "env_a",
+            env_path,
+        )
+
+        # call
+        environment = self.environment_manager.create_environment(
+            cache, {}, "env_a", "0.1.0", cache
+        )
+
+        # assert - the unpacked environment is reused without creating it
+        create_mock.assert_not_called()
+        self.assertEqual(env_path.resolve(), environment.path().resolve())
+
+    def test_get_installed_environment_path(self):
+        package_manager = MagicMock()
+        package_manager.get_environment_list.side_effect = lambda: sorted(
+            self.environment_manager.env_base_path.iterdir()
+        )
+        self.environment_manager._environment_handler.get_package_manager = MagicMock(
+            return_value=package_manager
+        )
+        env_path = self.environment_manager.get_environment_path("env_a")
+
+        # call
+        self.assertEqual(
+            env_path, self.environment_manager.get_installed_environment_path("env_a")
+        )
+        self.assertEqual(
+            env_path, self.environment_manager.get_installed_environment_path("env_a")
+        )
+
+        # assert - the environment list is reused while the base folder does not change
+        self.assertEqual(1, package_manager.get_environment_list.call_count)
+        with self.assertRaises(LookupError):
+            self.environment_manager.get_installed_environment_path("env_b")
+
+        # call - a new environment gets created
+        self.environment_manager._invalidate_environment_list()
+        env_path_b = self.environment_manager.get_environment_path("env_b")
+
+        # assert
+        self.assertEqual(
+            env_path_b,
+            self.environment_manager.get_installed_environment_path("env_b"),
+        )
+        self.assertEqual(2, package_manager.get_environment_list.call_count)
+
+    def test__get_environment_list_base_folder_modified(self):
+        package_manager = MagicMock()
+        package_manager.get_environment_list.return_value = []
+        self.environment_manager._environment_handler.get_package_manager = MagicMock(
+            return_value=package_manager
+        )
+        self.environment_manager.env_base_path.mkdir(parents=True, exist_ok=True)
+
+        self.environment_manager._get_environment_list()
+        self.environment_manager._get_environment_list()
+        self.assertEqual(1, package_manager.get_environment_list.call_count)
+
+        # the base folder gets modified by another process
+        stat = self.environment_manager.env_base_path.stat()
+        os.utime(
+            self.environment_manager.env_base_path,
+            ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000),
+        )
+
+        self.environment_manager._get_environment_list()
+        self.assertEqual(2, package_manager.get_environment_list.call_count)
 
     @unittest.skip("Needs to be implemented!")
     def test_get_environment_base_folder(self):
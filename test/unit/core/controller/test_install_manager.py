@@ -49,6 +49,128 @@ class TestInstallManager(TestUnitCoreCommon):
             resolve_result, parent=False, allow_recursive=False
         )
 
+    def _create_resolve_result(self, name, parent=None):
+        attrs = {
+            "group": "group",
+            "name": name,
+            "version": "0.1.0",
+            "album_api_version": "0.5.1",
+        }
+        if parent:
+            attrs["dependencies"] = {
+                "parent": {"group": "group", "name": parent, "version": "0.1.0"}
+            }
+        solution = Solution(attrs)
+        return ResolveResult(
+            path=Path(self.tmp_dir.name),
+            catalog=self.album_controller.collection_manager()
+            .catalogs()
+            .get_cache_catalog(),
+            collection_entry=None,
+            coordinates=solution.coordinates(),
+            loaded_solution=solution,
+        )
+
+    def _mock_resolve(self, resolve_results):
+        def _resolve(solution_to_resolve):
+            if solution_to_resolve not in resolve_results:
+                raise LookupError("Cannot resolve %s!" % solution_to_resolve)
+            return resolve_results[solution_to_resolve]
+
+        self.album_controller.collection_manager().resolve_and_load = MagicMock(
+            side_effect=_resolve
+        )
+
+    def test_install_many(self):
+        parent = self._create_resolve_result("parent")
+        self._mock_resolve(
+            {
+                "a": self._create_resolve_result("a", parent="parent"),
+                "b": self._create_resolve_result("b", parent="parent"),
+                "c": self._create_resolve_result("c"),
+                "group:parent:0.1.0": parent,
+            }
+        )
+        installed = []
+        self.install_manager._install_plan_entry = MagicMock(
+            side_effect=lambda entry, *_: installed.append(
+                entry.resolve_result.coordinates().name()
+            )
+        )
+
+        # call
+        results = self.install_manager.install_many(
+            ["a", "b", "c", "missing"], max_workers=2
+        )
+
+        # assert
+        self.assertEqual(["a", "b", "c", "missing"], list(results.keys()))
+        self.assertIsNone(results["a"])
+        self.assertIsNone(results["b"])
+        self.assertIsNone(results["c"])
+        self.assertIsInstance(results["missing"], LookupError)
+        # the shared parent is installed once and before its children
+        self.assertCountEqual(["parent", "a", "b", "c"], installed)
+        self.assertLess(installed.index("parent"), installed.index("a"))
+        self.assertLess(installed.index("parent"), installed.index("b"))
+
+    def test_install_many_parent_failed(self):
+        self._mock_resolve(
+            {
+                "a": self._create_resolve_result("a", parent="parent"),
+                "b": self._create_resolve_result("b"),
+                "group:parent:0.1.0": self._create_resolve_result("parent"),
+            }
+        )
+
+        def _install(entry, *_):
+            if entry.resolve_result.coordinates().name() == "parent":
+                raise RuntimeError("Failed!")
+
+        self.install_manager._install_plan_entry = MagicMock(side_effect=_install)
+
+        # call
+        results = self.install_manager.install_many(["a", "b"])
+
+        # assert
+        self.assertIn("parent", str(results["a"]))
+        self.assertIsNone(results["b"])
+        self.assertEqual(2, self.install_manager._install_plan_entry.call_count)
+
+    def test__install_plan_entry(self):
+        parent = InstallManager.PlanEntry(self._create_resolve_result("parent"))
+        entry = InstallManager.PlanEntry(
+            self._create_resolve_result("a", parent="parent"), parent
+        )
+
+        # mocks
+        self.install_manager._register = MagicMock()
+        self.install_manager._set_parent = MagicMock()
+        self.install_manager._create_installation_paths = MagicMock()
+        self.install_manager._run_solution_install_routine = MagicMock()
+        self.album_controller.solutions().set_installation_unfinished = MagicMock()
+        self.album_controller.solutions().set_installed = MagicMock()
+        install_environment = MagicMock()
+        self.environment_manager.install_environment = install_environment
+        collection_index = (
+            self.album_controller.collection_manager().get_collection_index()
+        )
+        close_current_connection = MagicMock()
+        collection_index.close_current_connection = close_current_connection
+
+        # call
+        self.install_manager._install_plan_entry(parent, False, None)
+        self.install_manager._install_plan_entry(entry, False, None)
+
+        # assert
+        install_environment.assert_called_once_with(parent.resolve_result, False)
+        self.install_manager._set_parent.assert_called_once_with(
+            entry.resolve_result, parent.resolve_result
+        )
+        self.assertEqual(2, self.album_controller.solutions().set_installed.call_count)
+        # the connections of the pool threads are closed
+        self.assertEqual(2, close_current_connection.call_count)
+
     @unittest.skip("Needs to be implemented!")
     def test__resolve_result_is_installed(self):
         # TODO implement
@@ -193,6 +315,83 @@ class TestInstallManager(TestUnitCoreCommon):
         package_path.assert_called_once()
         data_path.assert_called_once()
 
+    def test__install_with_resources(self):
+        self.active_solution._setup.dependencies = {"resource_file": "resources.yml"}
+        r = ResolveResult(
+            path=Path(""),
+            catalog=None,
+            collection_entry=None,
+            coordinates=self.active_solution.coordinates(),
+            loaded_solution=self.active_solution,
+        )
+        downloads = [Path(self.tmp_dir.name).joinpath("resource")]
+
+        # mocks
+        download_manager = MagicMock()
+        download_manager.download_resources.return_value = downloads
+        self.album_controller.download_manager = MagicMock(
+            return_value=download_manager
+        )
+        _install_solution = MagicMock()
+        self.install_manager._install_solution = _install_solution
+
+        # call
+        self.install_manager._install_with_resources(r, True, False)
+
+        # assert
+        download_manager.download_resources.assert_called_once_with(r)
+        _install_solution.assert_called_once_with(r, True, False)
+        download_manager.remove_downloads.assert_not_called()
+
+    def test__install_with_resources_failed(self):
+        self.active_solution._setup.dependencies = {"resource_file": "resources.yml"}
+        r = ResolveResult(
+            path=Path(""),
+            catalog=None,
+            collection_entry=None,
+            coordinates=self.active_solution.coordinates(),
+            loaded_solution=self.active_solution,
+        )
+        downloads = [Path(self.tmp_dir.name).joinpath("resource")]
+
+        # mocks
+        download_manager = MagicMock()
+        download_manager.download_resources.return_value = downloads
+        self.album_controller.download_manager = MagicMock(
+            return_value=download_manager
+        )
+        self.install_manager._install_solution = MagicMock(
+            side_effect=RuntimeError("Environment creation failed!")
+        )
+
+        # call
+        with self.assertRaises(RuntimeError):
+            self.install_manager._install_with_resources(r, True, False)
+
+        # assert
+        download_manager.remove_downloads.assert_called_once_with(downloads)
+
+    def test__install_with_resources_no_resource_file(self):
+        r = ResolveResult(
+            path=Path(""),
+            catalog=None,
+            collection_entry=None,
+            coordinates=self.active_solution.coordinates(),
+            loaded_solution=self.active_solution,
+        )
+
+        # mocks
+        self.album_controller.download_manager = MagicMock()
+        _install_solution = MagicMock()
+        self.install_manager._install_solution = _install_solution
+
+        # call
+        self.install_manager._install_with_resources(r, False)
+
+        # assert
+        _install_solution.assert_called_once_with(r, False, False)
+        self.album_controller.download_manager.assert_not_called()
+
     @unittest.skip("Needs to be implemented!")
     def test_run_solution_install_routine(self):
         # TODO implement
@@ -7,6 +7,9 @@ from pathlib import Path
 from test.unit.test_unit_core_common import TestCatalogAndCollectionCommon
 from unittest.mock import MagicMock, patch
 
+from jsonschema import ValidationError, exceptions
+
+from album.core.controller import migration_manager
 from album.core.model.catalog import Catalog
 from album.core.model.mmversion import MMVersion
 
@@ -30,6 +33,7 @@ class TestMigrationManager(TestCatalogAndCollectionCommon):
             MMVersion.from_string("0.0.0"),
             MMVersion.from_string("0.0.1"),
             MMVersion.from_string("0.1.0"),
+            MMVersion.from_string("0.2.0"),
         ]
 
     def tearDown(self) -> None:
@@ -125,6 +129,48 @@ class TestMigrationManager(TestCatalogAndCollectionCommon):
         self.active_solution.setup().pop("album_version")
         self.migration_manager.migrate_solution_attrs(self.active_solution.setup())
 
+    def test_migrate_solution_attrs_invalid(self):
+        self.setup_solution_no_env()
+        self.active_solution.setup()["name"] = 1
+
+        with self.assertRaises(ValidationError):
+            self.migration_manager.migrate_solution_attrs(self.active_solution.setup())
+        # failed validations are not remembered
+        with self.assertRaises(ValidationError):
+            self.migration_manager.migrate_solution_attrs(self.active_solution.setup())
+
+    def test_migrate_solution_attrs_skip_validated(self):
+        self.setup_solution_no_env()
+        self.active_solution.setup().pop("timestamp")
+        self.active_solution.setup().pop("album_version")
+        self.active_solution.setup()["description"] = "skip validated"
+        attrs = self.active_solution.setup()
+
+        # validators are created once per process
+        self.migration_manager._load_solution_schema()
+        validator = self.migration_manager._solution_validator
+        self.assertIs(
+            validator,
+            migration_manager._get_schema_validator(
+                "album.runner.core.schema", "solution_schema.json"
+            ),
+        )
+
+        with patch(
+            "jsonschema.exceptions.best_match", wraps=exceptions.best_match
+        ) as best_match:
+            self.migration_manager.migrate_solution_attrs(attrs)
+            self.migration_manager.migrate_solution_attrs(deepcopy(attrs))
+            self.assertEqual(1, best_match.call_count)
+
+            self.migration_manager.migrate_solution_attrs(attrs, skip_validated=False)
+            self.assertEqual(2, best_match.call_count)
+
+            # changed attributes are validated again
+            attrs["description"] = "changed"
+            self.migration_manager.migrate_solution_attrs(attrs)
+            self.assertEqual(3, best_match.call_count)
+
     def test_migrate_solution_schema0_attrs(self):
         self.setup_solution_no_env()
         self.active_solution.setup().pop("timestamp")
@@ -160,7 +206,7 @@ class TestMigrationManager(TestCatalogAndCollectionCommon):
             self.album_controller._collection_manager.catalog_collection,
             current_version,
         )
-        self.assertEqual(migrate_catalog_collection_db.call_count, 2)
+        self.assertEqual(migrate_catalog_collection_db.call_count, 3)
 
     def test_load_catalog_index(self):
         # prepare
@@ -278,13 +324,45 @@ WHERE name = 'album_collection'"""
         cur.close()
         con.close()
 
+    def test_migrate_catalog_collection_db_010_to_020(self):
+        collection_path = Path(self.tmp_dir.name).joinpath("collection_010.db")
+        con = sqlite3.connect(collection_path)
+        con.executescript(
+            "CREATE TABLE catalog_collection (name_id INTEGER PRIMARY KEY, name TEXT, version TEXT);"
+            "INSERT INTO catalog_collection VALUES (1, 'album_collection', '0.1.0');"
+        )
+        con.commit()
+        con.close()
+
+        # call
+        self.migration_manager.migrate_catalog_collection_db(
+            collection_path,
+            MMVersion.from_string("0.1.0"),
+            MMVersion.from_string("0.2.0"),
+        )
+
+        # assert
+        con = sqlite3.connect(collection_path)
+        cur = con.cursor()
+        self.assertEqual(
+            "link",
+            cur.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name='link'"
+            ).fetchone()[0],
+        )
+        self.assertEqual(
+            "0.2.0", cur.execute("SELECT version FROM catalog_collection").fetchone()[0]
+        )
+        cur.close()
+        con.close()
+
     def test_update_catalog_collection_version(self):
         # call
         self.migration_manager._update_catalog_collection_version()
 
         # assert
         with open(Path(self.tmp_dir.name).joinpath("catalog_collection.json")) as file:
-            self.assertTrue(json.load(file)["catalog_collection_version"] == "0.1.0")
+            self.assertTrue(json.load(file)["catalog_collection_version"] == "0.2.0")
 
     def test_update_catalog_index_version(self):
         # call
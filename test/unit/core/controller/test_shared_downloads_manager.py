@@ -0,0 +1,64 @@
+from pathlib import Path
+from test.unit.test_unit_core_common import TestUnitCoreCommon
+from unittest.mock import MagicMock, patch
+
+from album.core.controller.shared_downloads_manager import DownloadManager
+
+
+class TestDownloadManager(TestUnitCoreCommon):
+    def setUp(self):
+        super().setUp()
+        self.download_manager = DownloadManager(MagicMock())
+        self.path = Path(self.tmp_dir.name).joinpath("downloads")
+        self.path.mkdir()
+        self.path.joinpath("existing").write_text("existing")
+
+    def _resources(self, *names):
+        return {
+            "resources": {
+                name: {"name": name, "url": "https://a.b/" + name, "hash": "md5:1234"}
+                for name in names
+            }
+        }
+
+    def _retrieve(self, url, known_hash, fname, path, progressbar):
+        if fname == "failing":
+            raise ValueError("Download failed!")
+        target = Path(path).joinpath(fname)
+        target.write_text(fname)
+        return str(target)
+
+    @patch("album.core.controller.shared_downloads_manager.pooch.retrieve")
+    def test__retrieve_resources_from_dict(self, retrieve_mock):
+        retrieve_mock.side_effect = self._retrieve
+        resources = self._resources("existing", "new")
+        DownloadManager._set_paths_in_dict(resources, self.path, "catalog", self.path)
+
+        # call
+        downloaded = self.download_manager._retrieve_resources_from_dict(resources)
+
+        # assert
+        self.assertEqual([self.path.joinpath("new")], downloaded)
+        self.assertEqual(2, retrieve_mock.call_count)
+
+    @patch("album.core.controller.shared_downloads_manager.pooch.retrieve")
+    def test__retrieve_resources_from_dict_failed(self, retrieve_mock):
+        retrieve_mock.side_effect = self._retrieve
+        resources = self._resources("existing", "new", "failing")
+        DownloadManager._set_paths_in_dict(resources, self.path, "catalog", self.path)
+
+        # call
+        with self.assertRaises(ValueError):
+            self.download_manager._retrieve_resources_from_dict(resources)
+
+        # assert - the files downloaded before are removed, files present before are kept
+        self.assertFalse(self.path.joinpath("new").exists())
+        self.assertTrue(self.path.joinpath("existing").exists())
+
+    def test_remove_downloads(self):
+        download = self.path.joinpath("new")
+        download.write_text("new")
+
+        self.download_manager.remove_downloads([download])
+
+        self.assertFalse(download.exists())
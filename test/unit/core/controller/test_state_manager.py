@@ -0,0 +1,134 @@
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from test.unit.test_unit_core_common import TestUnitCoreCommon
+
+
+class TestStateManager(TestUnitCoreCommon):
+    def setUp(self):
+        super().setUp()
+        self.solution_file = Path(self.tmp_dir.name).joinpath("solution.py")
+        shutil.copy(
+            Path(__file__).parent.parent.parent.parent.joinpath(
+                "resources", "solution0_dummy.py"
+            ),
+            self.solution_file,
+        )
+        self.state_manager = self.album_controller.state_manager()
+
+    def tearDown(self) -> None:
+        super().tearDown()
+
+    def test_load(self):
+        solution = self.state_manager.load(str(self.solution_file))
+
+        self.assertEqual("group", solution.coordinates().group())
+        self.assertEqual(str(self.solution_file), solution.script())
+        self.assertTrue(callable(solution.setup().run))
+
+    def test_load_cached(self):
+        self.state_manager.load(str(self.solution_file))
+        put = MagicMock()
+        self.state_manager._get_metadata_cache().put = put
+
+        # call
+        solution = self.state_manager.load(str(self.solution_file))
+
+        # assert - the complete entry is not written again
+        put.assert_not_called()
+        self.assertTrue(callable(solution.setup().run))
+
+        # call - the file changed
+        self.solution_file.write_text(self.solution_file.read_text() + "\n")
+        self.state_manager.load(str(self.solution_file))
+
+        # assert
+        put.assert_called_once()
+
+    def test_load_metadata_only(self):
+        migrate = MagicMock(side_effect=lambda attrs: attrs)
+        self.album_controller.migration_manager().migrate_solution_attrs = migrate
+
+        # nothing cached yet - the metadata gets extracted and validated
+        self.state_manager.load(str(self.solution_file), metadata_only=True)
+        self.assertEqual(1, migrate.call_count)
+
+        solution = self.state_manager.load(str(self.solution_file), metadata_only=True)
+
+        # neither executed nor validated again
+        self.assertEqual(1, migrate.call_count)
+        self.assertEqual("group", solution.coordinates().group())
+        self.assertEqual("testArg1", solution.setup().args[0]["name"])
+        self.assertIsNone(solution.setup().run)
+
+        # a full load executes the solution
+        solution = self.state_manager.load(str(self.solution_file))
+        self.assertEqual(2, migrate.call_count)
+        self.assertTrue(callable(solution.setup().run))
+
+    def test_load_metadata_only_not_executed(self):
+        # the solution cannot be executed in the album environment
+        self.solution_file.write_text(
+            "import not_installed_module\n" + self.solution_file.read_text()
+        )
+
+        solution = self.state_manager.load(str(self.solution_file), metadata_only=True)
+
+        self.assertEqual("name", solution.coordinates().name())
+        self.assertEqual("A description", solution.setup().description)
+        with self.assertRaises(ModuleNotFoundError):
+            self.state_manager.load(str(self.solution_file))
+
+    def test_load_metadata_only_non_literal(self):
+        self.solution_file.write_text(
+            self.solution_file.read_text().replace(
+                'version="0.1.0"', 'version=".".join(["0", "2", "0"])'
+            )
+        )
+
+        solution = self.state_manager.load(str(self.solution_file), metadata_only=True)
+
+        # executed to receive the version
+        self.assertEqual("0.2.0", solution.coordinates().version())
+        self.assertTrue(callable(solution.setup().run))
+
+    def test_load_metadata_only_persisted(self):
+        self.state_manager.load(str(self.solution_file))
+
+        # a new process only has the persisted cache
+        self.state_manager._metadata_cache = None
+        migrate = MagicMock(side_effect=lambda attrs: attrs)
+        self.album_controller.migration_manager().migrate_solution_attrs = migrate
+
+        solution = self.state_manager.load(str(self.solution_file), metadata_only=True)
+
+        migrate.assert_not_called()
+        self.assertEqual("name", solution.coordinates().name())
+
+    def test_load_metadata_only_changed_file(self):
+        self.state_manager.load(str(self.solution_file))
+        self.solution_file.write_text(
+            self.solution_file.read_text().replace('name="name"', 'name="changed"')
+        )
+        stat = os.stat(self.solution_file)
+        os.utime(self.solution_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        solution = self.state_manager.load(str(self.solution_file), metadata_only=True)
+
+        self.assertEqual("changed", solution.coordinates().name())
+
+    def test_clear_metadata_cache(self):
+        self.state_manager.load(str(self.solution_file))
+
+        self.state_manager.clear_metadata_cache()
+
+        self.assertEqual(
+            [],
+            os.listdir(
+                self.album_controller.configuration().solution_metadata_cache_path()
+            ),
+        )
+        solution = self.state_manager.load(str(self.solution_file))
+        self.assertTrue(callable(solution.setup().run))
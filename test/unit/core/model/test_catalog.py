@@ -1,4 +1,5 @@
 import os
+import time
 import unittest.mock
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -6,10 +7,19 @@ from unittest.mock import patch
 
 import git
 
-from album.core.model.catalog import Catalog, retrieve_index_files_from_src
+from album.core.model.catalog import (
+    Catalog,
+    retrieve_index_files_from_src,
+    retrieve_index_files_from_url,
+)
+from album.core.controller.collection.catalog_handler import CatalogHandler
 from album.core.model.catalog_index import CatalogIndex
 from album.core.model.default_values import DefaultValues
-from album.core.utils.operations.file_operations import force_remove
+from album.core.utils.operations.file_operations import (
+    force_remove,
+    get_dict_from_json,
+    write_dict_to_json,
+)
 from album.core.utils.operations.resolve_operations import dict_to_coordinates
 from album.runner.core.model.solution import Solution
 from test.unit.test_unit_core_common import TestCatalogAndCollectionCommon
@@ -123,6 +133,43 @@ class TestCatalog(TestCatalogAndCollectionCommon):
         with self.assertRaises(RuntimeError):
             self.catalog.add(solution)
 
+    def test_add_all(self):
+        self.populate_index(r=2)
+
+        solutions = []
+        for i in range(2, 5):
+            d = self.get_solution_dict()
+            for key in ["group", "name", "version"]:
+                d[key] = "%s%s" % (key, str(i))
+            solutions.append(Solution(d))
+
+        # call
+        self.catalog.add_all(solutions)
+
+        # assert
+        self.assertEqual(5, len(self.catalog._catalog_index))
+        self.assertEqual(5, len(self.catalog._index_changes))
+
+    def test_add_all_invalid(self):
+        self.populate_index(r=2)
+
+        solutions = []
+        for i in [0, 2, 1]:
+            d = self.get_solution_dict()
+            for key in ["group", "name", "version"]:
+                d[key] = "%s%s" % (key, str(i))
+            solutions.append(Solution(d))
+
+        # call
+        with self.assertRaises(RuntimeError) as context:
+            self.catalog.add_all(solutions)
+
+        # assert - all errors reported, nothing added
+        self.assertIn("Cannot add 2 of 3 solution(s)", str(context.exception))
+        self.assertIn("group0:name0:version0", str(context.exception))
+        self.assertIn("group1:name1:version1", str(context.exception))
+        self.assertEqual(2, len(self.catalog._catalog_index))
+
     @patch(
         "album.core.controller.collection.solution_handler.SolutionHandler.get_solution_file"
     )
@@ -193,6 +240,180 @@ class TestCatalog(TestCatalogAndCollectionCommon):
         force_remove(catalog_src_path)
         force_remove(catalog_clone_path)
 
+    def test_download_index_files_from_url(self):
+        serve_dir = Path(self.tmp_dir.name).joinpath("serve")
+        CatalogHandler(self.album_controller).create_new_metadata(
+            serve_dir, "test", "direct"
+        )
+        CatalogIndex(
+            "test", serve_dir.joinpath(DefaultValues.catalog_index_file_name.value)
+        ).close()
+        target_dir = Path(self.tmp_dir.name).joinpath("http_cache")
+
+        with self.serve_directory(serve_dir) as url:
+            db, meta = retrieve_index_files_from_url(url, target_dir)
+            self.assertTrue(db.exists())
+            self.assertTrue(meta.exists())
+
+            # catalog without index file
+            serve_dir.joinpath(DefaultValues.catalog_index_file_name.value).unlink()
+            db, meta = retrieve_index_files_from_url(url, target_dir)
+            self.assertFalse(db.exists())
+            self.assertTrue(meta.exists())
+
+    def test_update_index_cache_from_index_url(self):
+        serve_dir = Path(self.tmp_dir.name).joinpath("serve")
+        CatalogHandler(self.album_controller).create_new_metadata(
+            serve_dir, "test", "direct"
+        )
+        CatalogIndex(
+            "test", serve_dir.joinpath(DefaultValues.catalog_index_file_name.value)
+        ).close()
+        self.catalog._src = "https://mycatalog.org"
+
+        with self.serve_directory(serve_dir) as url:
+            # the catalog announces its index url in the meta file
+            for meta_file in [
+                self.catalog.get_meta_file_path(),
+                serve_dir.joinpath(DefaultValues.catalog_index_metafile_json.value),
+            ]:
+                meta_dict = get_dict_from_json(meta_file)
+                meta_dict[DefaultValues.catalog_index_url_key.value] = url
+                write_dict_to_json(meta_file, meta_dict)
+            self.assertEqual(url, self.catalog.index_url())
+
+            with patch(
+                "album.core.model.catalog.retrieve_index_files_from_src"
+            ) as retrieve_git_mock:
+                self.assertTrue(self.catalog._update_index_cache(self.tmp_dir.name))
+                # unchanged index is served from the http cache
+                self.assertTrue(self.catalog._update_index_cache(self.tmp_dir.name))
+                retrieve_git_mock.assert_not_called()
+
+            self.assertTrue(self.catalog.index_file_path().exists())
+            self.assertEqual(url, self.catalog.index_url())
+
+    def test_update_index_cache_from_index_url_fallback(self):
+        meta_dict = get_dict_from_json(self.catalog.get_meta_file_path())
+        meta_dict[DefaultValues.catalog_index_url_key.value] = "http://127.0.0.1:1"
+        write_dict_to_json(self.catalog.get_meta_file_path(), meta_dict)
+
+        with patch(
+            "album.core.model.catalog.retrieve_index_files_from_src"
+        ) as retrieve_git_mock:
+            retrieve_git_mock.return_value = (
+                Path(self.tmp_dir.name).joinpath("db"),
+                self.catalog.get_meta_file_path(),
+            )
+            with patch.object(self.catalog, "_copy_index_to_cache") as copy_mock:
+                copy_mock.return_value = True
+                self.assertTrue(self.catalog._update_index_cache(self.tmp_dir.name))
+
+        retrieve_git_mock.assert_called_once()
+
+    def test_export_index_transport(self):
+        # catalog not serving its index via http
+        self.assertEqual([], self.catalog.export_index_transport(self.catalog.path()))
+
+        meta_dict = get_dict_from_json(self.catalog.get_meta_file_path())
+        meta_dict[DefaultValues.catalog_index_url_key.value] = "https://mycatalog.org"
+        write_dict_to_json(self.catalog.get_meta_file_path(), meta_dict)
+        self.populate_index(r=2)
+
+        # call
+        files = self.catalog.export_index_transport(self.catalog.path())
+
+        # assert
+        meta_dict = get_dict_from_json(self.catalog.get_meta_file_path())
+        self.assertEqual(1, meta_dict[DefaultValues.catalog_index_revision_key.value])
+        self.assertEqual(
+            DefaultValues.catalog_index_compressed_file_name.value,
+            meta_dict[DefaultValues.catalog_index_compressed_key.value],
+        )
+        delta_dir = self.catalog.path().joinpath(
+            DefaultValues.catalog_index_delta_prefix.value
+        )
+        self.assertEqual(
+            [
+                self.catalog.get_meta_file_path(),
+                self.catalog.path().joinpath(
+                    DefaultValues.catalog_index_compressed_file_name.value
+                ),
+                delta_dir,
+            ],
+            files,
+        )
+        delta = get_dict_from_json(delta_dir.joinpath("1.json"))
+        self.assertEqual(
+            ["ADDED", "ADDED"], [c["change_type"] for c in delta["changes"]]
+        )
+
+        # changes are only exported once
+        self.catalog.export_index_transport(self.catalog.path())
+        self.assertEqual(
+            [], get_dict_from_json(delta_dir.joinpath("2.json"))["changes"]
+        )
+
+    def test_retrieve_index_files_from_url_deltas(self):
+        meta_dict = get_dict_from_json(self.catalog.get_meta_file_path())
+        meta_dict[DefaultValues.catalog_index_url_key.value] = "https://mycatalog.org"
+        write_dict_to_json(self.catalog.get_meta_file_path(), meta_dict)
+        target_dir = Path(self.tmp_dir.name).joinpath("http_cache")
+
+        def _export():
+            files = self.catalog.export_index_transport(self.catalog.path())
+            # the test server announces modifications by the second only
+            revision = get_dict_from_json(self.catalog.get_meta_file_path())[
+                DefaultValues.catalog_index_revision_key.value
+            ]
+            mtime = time.time() + 10 * revision
+            for file in files[:2]:
+                os.utime(file, (mtime, mtime))
+
+        def _solutions(index_file):
+            index = CatalogIndex("test", index_file)
+            try:
+                return sorted(s["name"] for s in index.get_all_solutions())
+            finally:
+                index.close()
+
+        self.populate_index(r=2)
+        _export()
+
+        with self.serve_directory(self.catalog.path()) as url:
+            # call - no local index, compressed index is downloaded
+            index_src, _ = retrieve_index_files_from_url(url, target_dir)
+            self.assertEqual(["name0", "name1"], _solutions(index_src))
+
+            # call - deltas are applied
+            self.catalog.remove(
+                dict_to_coordinates(
+                    {"group": "group0", "name": "name0", "version": "version0"}
+                )
+            )
+            _export()
+            with patch("album.core.model.catalog.decompress_file") as decompress_mock:
+                index_src, _ = retrieve_index_files_from_url(url, target_dir)
+                decompress_mock.assert_not_called()
+            self.assertEqual(["name1"], _solutions(index_src))
+
+            # call - deltas not available any longer, compressed index is downloaded
+            self.populate_index(r=1)
+            _export()
+            force_remove(
+                self.catalog.path().joinpath(
+                    DefaultValues.catalog_index_delta_prefix.value
+                )
+            )
+            index_src, _ = retrieve_index_files_from_url(url, target_dir)
+            self.assertEqual(["name0", "name1"], _solutions(index_src))
+            meta_dict = get_dict_from_json(
+                target_dir.joinpath(DefaultValues.catalog_index_metafile_json.value)
+            )
+            self.assertEqual(
+                3, meta_dict[DefaultValues.catalog_index_revision_key.value]
+            )
+
     def test_retrieve_catalog(self):
         # prepare
         self.catalog = Catalog(
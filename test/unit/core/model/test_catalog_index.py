@@ -482,6 +482,29 @@ class TestCatalogIndex(TestUnitCoreCommon):
         update_solution.assert_called_once_with(coordinates, attrs, close=True)
         insert_solution.assert_not_called()
 
+    def test_apply_changes(self):
+        attrs = self.solution_default_dict.copy()
+        coordinates = dict_to_coordinates(attrs)
+
+        # call - add
+        self.catalog_index.apply_changes([{"change_type": "ADDED", "solution": attrs}])
+        self.assertIsNotNone(
+            self.catalog_index.get_solution_by_coordinates(coordinates)
+        )
+
+        # call - remove
+        self.catalog_index.apply_changes(
+            [
+                {
+                    "change_type": "REMOVED",
+                    "group": coordinates.group(),
+                    "name": coordinates.name(),
+                    "version": coordinates.version(),
+                }
+            ]
+        )
+        self.assertIsNone(self.catalog_index.get_solution_by_coordinates(coordinates))
+
     def test_export(self):
         self.fill_solution()
 
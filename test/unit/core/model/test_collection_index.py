@@ -85,7 +85,36 @@ class TestCollectionIndex(TestUnitCoreCommon):
 
     def test_get_version(self):
         self.test_catalog_collection_index.create()  # sets the version!
-        self.assertEqual("0.1.0", self.test_catalog_collection_index.get_version())
+        self.assertEqual("0.2.0", self.test_catalog_collection_index.get_version())
+
+    def test_link_target(self):
+        self.assertIsNone(self.test_catalog_collection_index.get_link_target("/a/b"))
+
+        # call
+        self.test_catalog_collection_index.set_link_target("/a/b", "/lnk/pkg/0")
+
+        # assert
+        self.assertEqual(
+            "/lnk/pkg/0", self.test_catalog_collection_index.get_link_target("/a/b")
+        )
+
+        # call - replace
+        self.test_catalog_collection_index.set_link_target("/a/b", "/lnk/pkg/1")
+
+        # assert
+        self.assertEqual(
+            "/lnk/pkg/1", self.test_catalog_collection_index.get_link_target("/a/b")
+        )
+        self.assertEqual(
+            {"/a/b": "/lnk/pkg/1"}, self.test_catalog_collection_index.get_all_links()
+        )
+
+        # call - remove
+        self.test_catalog_collection_index.remove_link("/a/b")
+
+        # assert
+        self.assertIsNone(self.test_catalog_collection_index.get_link_target("/a/b"))
+        self.assertEqual({}, self.test_catalog_collection_index.get_all_links())
 
     def test_next_id(self):
         self.test_catalog_collection_index.create()
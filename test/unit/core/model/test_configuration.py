@@ -1,4 +1,6 @@
+import os
 import tempfile
+import time
 import unittest
 from pathlib import Path
 from test.unit.test_unit_core_common import TestUnitCoreCommon
@@ -15,7 +17,8 @@ class TestConfiguration(TestUnitCoreCommon):
     def tearDown(self) -> None:
         super().tearDown()
 
-    def test_setup(self):
+    @patch("album.core.model.configuration.threading.Thread")
+    def test_setup(self, thread_mock):
         # prepare
         base_path = Path(self.tmp_dir.name).joinpath("base_path")
         c_path = base_path.joinpath(DefaultValues.cache_path_tmp_prefix.value)
@@ -33,8 +36,20 @@ class TestConfiguration(TestUnitCoreCommon):
         # assert
         self.assertEqual(base_path, conf.base_cache_path())
 
-        # leftovers should be removed by now
-        self.assertFalse(leftover_file.exists())
+        # leftovers are removed in the background, the process uses its own tmp folder
+        thread_mock.assert_any_call(
+            target=conf.clean_tmp, name="album-tmp-cleanup", daemon=True
+        )
+        # an interrupted deletion of the trash is resumed in the background
+        thread_mock.assert_any_call(
+            target=conf._empty_trash_in_background,
+            name="album-trash-cleanup",
+            daemon=True,
+        )
+        self.assertEqual(2, thread_mock.return_value.start.call_count)
+        self.assertTrue(leftover_file.exists())
+        self.assertEqual(c_path, conf.tmp_path().parent)
+        self.assertTrue(conf.tmp_path().exists())
 
         # check if all recursive paths are created
         self.assertTrue(base_path.exists())
@@ -48,6 +63,7 @@ class TestConfiguration(TestUnitCoreCommon):
         self.assertTrue(conf.lnk_path().exists())
         self.assertTrue(conf.environments_path().exists())
         self.assertTrue(conf.shared_resources_path().exists())
+        self.assertTrue(conf.trash_path().exists())
 
     def test_base_cache_path(self):
         new_tmp_dir = tempfile.TemporaryDirectory(dir=self.tmp_dir.name)
@@ -98,15 +114,68 @@ class TestConfiguration(TestUnitCoreCommon):
         # todo: implement
         pass
 
-    @patch("album.core.model.configuration.force_remove")
-    def test_empty_tmp(self, force_remove_mock):
-        force_remove_mock.return_value = None
+    @patch("album.core.model.configuration.threading.Thread")
+    def test_clean_tmp(self, _):
+        conf = Configuration()
+        conf.setup(base_cache_path=Path(self.tmp_dir.name).joinpath("base_path"))
+        leftover_folder = conf.tmp_path().parent.joinpath("a_leftover_folder")
+        leftover_folder.mkdir()
+        old = time.time() - 2 * DefaultValues.tmp_max_age.value
+        os.utime(leftover_folder, (old, old))
+        os.utime(conf.tmp_path(), (old, old))
+
+        # call
+        removed = conf.clean_tmp()
+
+        # assert
+        self.assertEqual([leftover_folder], removed)
+        self.assertTrue(conf.tmp_path().exists())
+
+    def test_empty_trash(self):
+        conf = Configuration()
+        with patch("album.core.model.configuration.threading.Thread"):
+            conf.setup(base_cache_path=Path(self.tmp_dir.name).joinpath("base_path"))
+        removed_folder = conf.trash_path().joinpath("a_removed_folder")
+        removed_folder.joinpath("lib").mkdir(parents=True)
+
         # call
+        deleted = conf.empty_trash(max_workers=2)
+
+        # assert
+        self.assertEqual(1, len(deleted))
+        self.assertFalse(removed_folder.exists())
+        self.assertEqual([], list(conf.trash_path().iterdir()))
+
+    @patch("album.core.model.configuration.threading.Thread")
+    def test_setup_no_trash_cleanup(self, thread_mock):
         conf = Configuration()
-        conf._cache_path_tmp_user = Path(self.tmp_dir.name)
-        conf._empty_tmp()
+        conf.setup(
+            base_cache_path=Path(self.tmp_dir.name).joinpath("base_path"),
+            clean_trash=False,
+        )
+
+        # assert - only the tmp folder is cleaned
+        thread_mock.assert_called_once_with(
+            target=conf.clean_tmp, name="album-tmp-cleanup", daemon=True
+        )
+
+    def test_empty_trash_after_setup(self):
+        # prepare - folders left in the trash by a previous process
+        base_path = Path(self.tmp_dir.name).joinpath("base_path")
+        trash_path = base_path.joinpath(DefaultValues.cache_path_trash_prefix.value)
+        for name in ["a_removed_folder", "another_removed_folder"]:
+            trash_path.joinpath(name, "lib").mkdir(parents=True)
+            trash_path.joinpath(name, "lib", "file").write_text("content")
+
+        # call - deleting the trash in the background was started by setup
+        conf = Configuration()
+        conf.setup(base_cache_path=base_path)
+        deleted = conf.empty_trash(max_workers=8)
 
-        force_remove_mock.assert_called_once()
+        # assert - waits for the deletion in the background and reports its entries
+        self.assertEqual(2, len(deleted))
+        self.assertEqual([], list(conf.trash_path().iterdir()))
+        self.assertEqual([], conf.empty_trash(max_workers=8))
 
 
 if __name__ == "__main__":
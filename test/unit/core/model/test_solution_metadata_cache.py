@@ -0,0 +1,103 @@
+import os
+from io import StringIO
+from pathlib import Path
+
+from album.core.model.solution_metadata_cache import SolutionMetadataCache
+from test.unit.test_unit_core_common import TestUnitCoreCommon
+
+
+class TestSolutionMetadataCache(TestUnitCoreCommon):
+    def setUp(self):
+        super().setUp()
+        self.cache_path = Path(self.tmp_dir.name).joinpath("solution_meta")
+        self.cache = SolutionMetadataCache(self.cache_path)
+        self.solution_file = Path(self.tmp_dir.name).joinpath("solution.py")
+        self.source = b"x = 1\n"
+        self.solution_file.write_bytes(self.source)
+        self.code = compile(self.source, str(self.solution_file), "exec")
+
+    def tearDown(self) -> None:
+        super().tearDown()
+
+    def test_get_empty(self):
+        self.assertIsNone(self.cache.get(self.solution_file, self.source))
+
+    def test_put_get(self):
+        attrs = {
+            "name": "n",
+            "run": lambda: None,
+            "args": [{"name": "a", "action": print}],
+        }
+
+        self.cache.put(self.solution_file, self.source, attrs, self.code)
+        entry = self.cache.get(self.solution_file, self.source)
+
+        self.assertEqual({"name": "n", "args": [{"name": "a"}]}, entry.attrs)
+        self.assertEqual(self.code, entry.code)
+        # entries are copies
+        entry.attrs["name"] = "changed"
+        self.assertEqual(
+            "n", self.cache.get(self.solution_file, self.source).attrs["name"]
+        )
+
+    def test_get_persisted(self):
+        self.cache.put(self.solution_file, self.source, {"name": "n"}, self.code)
+
+        entry = SolutionMetadataCache(self.cache_path).get(
+            self.solution_file, self.source
+        )
+
+        self.assertEqual({"name": "n"}, entry.attrs)
+        self.assertEqual(self.code, entry.code)
+
+    def test_get_changed(self):
+        self.cache.put(self.solution_file, self.source, {"name": "n"}, self.code)
+
+        # same size and modification time, different content
+        stat = os.stat(self.solution_file)
+        self.solution_file.write_bytes(b"x = 2\n")
+        os.utime(self.solution_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self.assertIsNone(self.cache.get(self.solution_file, b"x = 2\n"))
+
+    def test_get_persisted_code_of_other_version(self):
+        self.cache.put(self.solution_file, self.source, {"name": "n"}, self.code)
+        code_files = list(self.cache_path.glob("*.code"))
+        old_code = code_files[0].read_bytes()
+        source = b"x = 2\n"
+        self.solution_file.write_bytes(source)
+        self.cache.put(
+            self.solution_file,
+            source,
+            {"name": "n2"},
+            compile(source, str(self.solution_file), "exec"),
+        )
+        # the code file of the previous version remains, e.g. after an interrupted or concurrent write
+        code_files[0].write_bytes(old_code)
+
+        entry = SolutionMetadataCache(self.cache_path).get(self.solution_file, source)
+
+        self.assertEqual({"name": "n2"}, entry.attrs)
+        self.assertIsNone(entry.code)
+
+    def test_put_not_serializable(self):
+        attrs = {"name": "n", "dependencies": {"environment_file": StringIO("env")}}
+
+        self.cache.put(self.solution_file, self.source, attrs, self.code)
+
+        entry = self.cache.get(self.solution_file, self.source)
+        self.assertEqual(
+            "env", entry.attrs["dependencies"]["environment_file"].getvalue()
+        )
+        # only kept in memory
+        self.assertIsNone(
+            SolutionMetadataCache(self.cache_path).get(self.solution_file, self.source)
+        )
+
+    def test_clear(self):
+        self.cache.put(self.solution_file, self.source, {"name": "n"}, self.code)
+
+        self.cache.clear()
+
+        self.assertIsNone(self.cache.get(self.solution_file, self.source))
+        self.assertEqual([], os.listdir(self.cache_path))
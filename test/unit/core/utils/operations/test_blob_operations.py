@@ -0,0 +1,131 @@
+import os
+import stat
+from pathlib import Path
+
+from album.core.utils.operations.blob_operations import (
+    get_blob_path,
+    get_file_hash,
+    link_file_from_blob,
+    link_folder_from_blobs,
+    get_unreferenced_blobs,
+    prune_blobs,
+    store_blob,
+)
+from test.unit.test_unit_core_common import TestUnitCoreCommon
+
+
+class TestBlobOperations(TestUnitCoreCommon):
+    def setUp(self):
+        super().setUp()
+        self.blob_root = Path(self.tmp_dir.name).joinpath("blobs")
+        self.src = Path(self.tmp_dir.name).joinpath("src")
+        self.src.joinpath("sub").mkdir(parents=True)
+        self.src.joinpath("solution.py").write_text("print('hello')")
+        self.src.joinpath("sub", "data.txt").write_text("data")
+
+    def tearDown(self) -> None:
+        super().tearDown()
+
+    def test_get_file_hash(self):
+        other = Path(self.tmp_dir.name).joinpath("other.py")
+        other.write_text("print('hello')")
+
+        self.assertEqual(
+            get_file_hash(self.src.joinpath("solution.py")), get_file_hash(other)
+        )
+        self.assertNotEqual(
+            get_file_hash(self.src.joinpath("solution.py")),
+            get_file_hash(self.src.joinpath("sub", "data.txt")),
+        )
+
+    def test_store_blob(self):
+        file = self.src.joinpath("solution.py")
+
+        blob = store_blob(self.blob_root, file)
+
+        self.assertEqual(get_blob_path(self.blob_root, file), blob)
+        self.assertEqual(blob.parent.name, blob.name[:2])
+        self.assertEqual("print('hello')", blob.read_text())
+        # storing the same content again is a no-op
+        self.assertEqual(blob, store_blob(self.blob_root, file))
+        self.assertEqual(1, len(list(blob.parent.iterdir())))
+
+    def test_store_blob_executable(self):
+        file = self.src.joinpath("solution.py")
+        blob = store_blob(self.blob_root, file)
+
+        os.chmod(file, os.stat(file).st_mode | stat.S_IXUSR)
+        blob_x = store_blob(self.blob_root, file)
+
+        self.assertNotEqual(blob, blob_x)
+        self.assertTrue(blob_x.name.endswith(".x"))
+
+    def test_store_blob_replaces_corrupted(self):
+        file = self.src.joinpath("solution.py")
+        blob = store_blob(self.blob_root, file)
+        blob.write_text("corrupt")
+
+        blob = store_blob(self.blob_root, file)
+
+        self.assertEqual("print('hello')", blob.read_text())
+
+    def test_link_file_from_blob(self):
+        target = Path(self.tmp_dir.name).joinpath("pck", "solution.py")
+        target.parent.mkdir()
+        target.write_text("old content")
+
+        link_file_from_blob(self.blob_root, self.src.joinpath("solution.py"), target)
+
+        self.assertEqual("print('hello')", target.read_text())
+        blob = get_blob_path(self.blob_root, target)
+        self.assertTrue(os.path.samefile(blob, target))
+
+    def test_link_folder_from_blobs(self):
+        target_a = Path(self.tmp_dir.name).joinpath("pck_a")
+        target_b = Path(self.tmp_dir.name).joinpath("pck_b")
+
+        files = link_folder_from_blobs(self.blob_root, self.src, target_a)
+        link_folder_from_blobs(self.blob_root, self.src, target_b)
+
+        self.assertEqual(
+            sorted(
+                [target_a.joinpath("solution.py"), target_a.joinpath("sub", "data.txt")]
+            ),
+            sorted(files),
+        )
+        self.assertTrue(
+            os.path.samefile(
+                target_a.joinpath("sub", "data.txt"),
+                target_b.joinpath("sub", "data.txt"),
+            )
+        )
+        self.assertEqual(3, os.stat(target_a.joinpath("solution.py")).st_nlink)
+
+    def test_get_unreferenced_blobs(self):
+        target = Path(self.tmp_dir.name).joinpath("pck")
+        link_folder_from_blobs(self.blob_root, self.src, target)
+        self.assertEqual([], get_unreferenced_blobs(self.blob_root))
+
+        os.remove(target.joinpath("sub", "data.txt"))
+
+        blobs = get_unreferenced_blobs(self.blob_root)
+        self.assertEqual(1, len(blobs))
+        # not removed
+        self.assertTrue(blobs[0].exists())
+        self.assertEqual(
+            [], get_unreferenced_blobs(Path(self.tmp_dir.name).joinpath("missing"))
+        )
+
+    def test_prune_blobs(self):
+        target = Path(self.tmp_dir.name).joinpath("pck")
+        link_folder_from_blobs(self.blob_root, self.src, target)
+        os.remove(target.joinpath("sub", "data.txt"))
+
+        removed = prune_blobs(self.blob_root)
+
+        self.assertEqual(1, len(removed))
+        self.assertFalse(removed[0].exists())
+        self.assertTrue(
+            get_blob_path(self.blob_root, target.joinpath("solution.py")).exists()
+        )
+        self.assertEqual([], prune_blobs(Path(self.tmp_dir.name).joinpath("missing")))
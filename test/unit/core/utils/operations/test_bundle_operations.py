@@ -0,0 +1,91 @@
+import io
+import json
+import os
+import tarfile
+from pathlib import Path
+
+from album.core.utils.operations.bundle_operations import (
+    BUNDLE_MANIFEST_NAME,
+    read_bundle,
+    write_bundle,
+)
+from test.unit.test_unit_core_common import TestUnitCoreCommon
+
+
+class TestBundleOperations(TestUnitCoreCommon):
+    def setUp(self):
+        super().setUp()
+        self.src = Path(self.tmp_dir.name).joinpath("src")
+        self.src.mkdir()
+        self.src.joinpath("a.txt").write_text("a")
+        self.src.joinpath("b.bin").write_bytes(b"\0b")
+        # hard links are stored as files
+        os.link(self.src.joinpath("b.bin"), self.src.joinpath("c.bin"))
+        self.files = {
+            "x/a.txt": self.src.joinpath("a.txt"),
+            "x/y/b.bin": self.src.joinpath("b.bin"),
+            "c.bin": self.src.joinpath("c.bin"),
+        }
+        self.archive = Path(self.tmp_dir.name).joinpath("bundle.tar.gz")
+        self.target = Path(self.tmp_dir.name).joinpath("target")
+
+    def _write_tampered_bundle(self, files, manifest_files):
+        with tarfile.open(str(self.archive), "w:gz") as tar:
+            data = json.dumps({"version": "1", "files": manifest_files}).encode()
+            info = tarfile.TarInfo(BUNDLE_MANIFEST_NAME)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+            for name, content in files.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(content)
+                tar.addfile(info, io.BytesIO(content))
+
+    def test_write_bundle_read_bundle(self):
+        manifest = write_bundle(self.archive, self.files, {"catalogs": []})
+
+        self.assertEqual("1", manifest["version"])
+        self.assertEqual([], manifest["catalogs"])
+        self.assertEqual(2, manifest["files"]["c.bin"]["size"])
+
+        # the archive can be read from a stream
+        with open(self.archive, "rb") as f:
+            with tarfile.open(fileobj=f, mode="r|gz") as tar:
+                self.assertTrue(all(m.isfile() for m in tar))
+
+        self.assertEqual(manifest, read_bundle(self.archive, self.target))
+        self.assertEqual("a", self.target.joinpath("x", "a.txt").read_text())
+        self.assertEqual(b"\0b", self.target.joinpath("x", "y", "b.bin").read_bytes())
+        self.assertEqual(b"\0b", self.target.joinpath("c.bin").read_bytes())
+
+    def test_write_bundle_invalid_name(self):
+        for name in ["../a.txt", "/a.txt", BUNDLE_MANIFEST_NAME]:
+            with self.assertRaises(ValueError):
+                write_bundle(self.archive, {name: self.src.joinpath("a.txt")}, {})
+
+    def test_read_bundle_hash_mismatch(self):
+        manifest = write_bundle(self.archive, self.files, {})
+        self._write_tampered_bundle({"x/a.txt": b"b"}, manifest["files"])
+
+        with self.assertRaises(ValueError):
+            read_bundle(self.archive, self.target)
+
+    def test_read_bundle_unexpected_member(self):
+        self._write_tampered_bundle({"../a.txt": b"a"}, {})
+
+        with self.assertRaises(ValueError):
+            read_bundle(self.archive, self.target)
+        self.assertFalse(Path(self.tmp_dir.name).joinpath("a.txt").exists())
+
+    def test_read_bundle_incomplete(self):
+        manifest = write_bundle(self.archive, self.files, {})
+        self._write_tampered_bundle({}, manifest["files"])
+
+        with self.assertRaises(ValueError):
+            read_bundle(self.archive, self.target)
+
+    def test_read_bundle_no_bundle(self):
+        with tarfile.open(str(self.archive), "w:gz") as tar:
+            tar.add(str(self.src.joinpath("a.txt")), arcname="a.txt")
+
+        with self.assertRaises(ValueError):
+            read_bundle(self.archive, self.target)
@@ -0,0 +1,37 @@
+import os
+from pathlib import Path
+
+from album.core.utils.operations.disk_usage_operations import get_size, get_sizes
+from test.unit.test_unit_core_common import TestUnitCoreCommon
+
+
+class TestDiskUsageOperations(TestUnitCoreCommon):
+    def setUp(self):
+        super().setUp()
+        self.folder = Path(self.tmp_dir.name).joinpath("folder")
+        self.folder.joinpath("lib", "a").mkdir(parents=True)
+        self.folder.joinpath("lib", "a", "file").write_bytes(b"x" * 100)
+        self.folder.joinpath("file").write_bytes(b"x" * 10)
+
+    def test_get_size(self):
+        self.assertEqual(110, get_size(self.folder))
+        self.assertEqual(10, get_size(self.folder.joinpath("file")))
+        self.assertEqual(0, get_size(self.folder.joinpath("missing")))
+
+    def test_get_size_links(self):
+        outside = Path(self.tmp_dir.name).joinpath("outside")
+        outside.mkdir()
+        outside.joinpath("file").write_bytes(b"x" * 1000)
+        os.symlink(outside, self.folder.joinpath("link"), target_is_directory=True)
+        os.link(
+            self.folder.joinpath("lib", "a", "file"), self.folder.joinpath("hardlink")
+        )
+
+        # assert - the link is not followed, the hard linked file counted once
+        self.assertEqual(110 + len(str(outside)), get_size(self.folder))
+
+    def test_get_sizes(self):
+        paths = [self.folder, self.folder.joinpath("lib"), self.folder.joinpath("file")]
+
+        self.assertEqual([110, 100, 10], get_sizes(paths))
+        self.assertEqual([110, 100, 10], get_sizes(paths, max_workers=4))
@@ -0,0 +1,75 @@
+import json
+from importlib.metadata import entry_points
+from pathlib import Path
+from unittest.mock import patch
+
+from album.core.utils.operations import entry_point_operations
+from album.core.utils.operations.entry_point_operations import get_entry_points
+from test.unit.test_unit_core_common import TestUnitCoreCommon
+
+
+class TestEntryPointOperations(TestUnitCoreCommon):
+    def setUp(self):
+        super().setUp()
+        self.cache_file = Path(self.tmp_dir.name).joinpath("entry_points.json")
+        entry_point_operations._entry_points.clear()
+
+    def tearDown(self) -> None:
+        entry_point_operations._entry_points.clear()
+        super().tearDown()
+
+    def test_get_entry_points(self):
+        eps = get_entry_points("console_parsers_album", self.cache_file)
+
+        self.assertIn("run", [ep.name for ep in eps])
+        cache = json.loads(self.cache_file.read_text())
+        self.assertIn(
+            ["run", "album.argument_parsing:create_run_parser"],
+            cache["groups"]["console_parsers_album"],
+        )
+
+    @patch(
+        "album.core.utils.operations.entry_point_operations.entry_points",
+        wraps=entry_points,
+    )
+    def test_get_entry_points_cached(self, entry_points_mock):
+        eps = get_entry_points("console_parsers_album", self.cache_file)
+        entry_point_operations._entry_points.clear()
+
+        # discovered once, the next process reads the cache file
+        cached_eps = get_entry_points("console_parsers_album", self.cache_file)
+        self.assertEqual(1, entry_points_mock.call_count)
+        self.assertEqual(
+            [(ep.name, ep.value) for ep in eps],
+            [(ep.name, ep.value) for ep in cached_eps],
+        )
+        self.assertEqual(
+            "album.argument_parsing:create_run_parser",
+            [ep for ep in cached_eps if ep.name == "run"][0].value,
+        )
+        self.assertTrue(
+            callable([ep for ep in cached_eps if ep.name == "run"][0].load())
+        )
+
+    @patch("album.core.utils.operations.entry_point_operations.entry_points")
+    def test_get_entry_points_packages_changed(self, entry_points_mock):
+        entry_points_mock.return_value = []
+        get_entry_points("console_parsers_album", self.cache_file)
+        entry_point_operations._entry_points.clear()
+
+        # installing a package changes the python path fingerprint
+        with patch(
+            "album.core.utils.operations.entry_point_operations._get_path_fingerprint",
+            return_value=[["changed", 1]],
+        ):
+            get_entry_points("console_parsers_album", self.cache_file)
+
+        self.assertEqual(2, entry_points_mock.call_count)
+
+    def test_get_entry_points_cache_folder_missing(self):
+        cache_file = Path(self.tmp_dir.name).joinpath("missing", "entry_points.json")
+
+        eps = get_entry_points("console_parsers_album", cache_file)
+
+        self.assertIn("run", [ep.name for ep in eps])
+        self.assertFalse(cache_file.parent.exists())
@@ -0,0 +1,83 @@
+from pathlib import Path
+
+from album.core.utils.operations.environment_fingerprint_operations import (
+    get_environment_fingerprint,
+    get_fingerprint_target,
+    get_fingerprint_users,
+    get_registered_fingerprint,
+    register_environment,
+    release_environment,
+)
+from test.unit.test_unit_core_common import TestUnitCoreCommon
+
+
+class TestEnvironmentFingerprintOperations(TestUnitCoreCommon):
+    def setUp(self):
+        super().setUp()
+        self.registry = Path(self.tmp_dir.name).joinpath("registry")
+        self.target = Path(self.tmp_dir.name).joinpath("lnk", "env", "0")
+        self.target.mkdir(parents=True)
+
+    def _create_env_file(self, name, dependencies):
+        env_file = Path(self.tmp_dir.name).joinpath(name + ".yml")
+        env_file.write_text(
+            "name: %s\ndependencies:\n%s"
+            % (name, "".join("  - %s\n" % d for d in dependencies))
+        )
+        return env_file
+
+    def test_get_environment_fingerprint(self):
+        env_a = self._create_env_file("a", ["python=3.10", "numpy"])
+        env_b = self._create_env_file("b", ["python=3.10", "numpy"])
+        env_c = self._create_env_file("c", ["python=3.11", "numpy"])
+        lock_file = Path(self.tmp_dir.name).joinpath("solution.conda-lock.yml")
+        lock_file.write_text("lock")
+
+        fingerprint = get_environment_fingerprint(env_a)
+
+        # the name is ignored
+        self.assertEqual(fingerprint, get_environment_fingerprint(env_b))
+        self.assertNotEqual(fingerprint, get_environment_fingerprint(env_c))
+        self.assertNotEqual(fingerprint, get_environment_fingerprint(env_a, lock_file))
+        # a missing lock file is ignored
+        self.assertEqual(
+            fingerprint,
+            get_environment_fingerprint(env_a, lock_file.with_name("missing.yml")),
+        )
+
+    def test_register_environment(self):
+        self.assertIsNone(get_fingerprint_target(self.registry, "fp"))
+
+        self.assertTrue(register_environment(self.registry, "fp", "env_a", self.target))
+        self.assertTrue(register_environment(self.registry, "fp", "env_b", self.target))
+        other_target = self.target.with_name("1")
+        other_target.mkdir()
+        self.assertFalse(
+            register_environment(self.registry, "fp", "env_c", other_target)
+        )
+
+        # the first environment decides the target
+        self.assertEqual(self.target, get_fingerprint_target(self.registry, "fp"))
+        self.assertEqual(["env_a", "env_b"], get_fingerprint_users(self.registry, "fp"))
+        self.assertEqual("fp", get_registered_fingerprint(self.registry, "env_a"))
+        self.assertIsNone(get_registered_fingerprint(self.registry, "env_c"))
+
+    def test_get_fingerprint_target_removed(self):
+        register_environment(self.registry, "fp", "env_a", self.target)
+        self.target.rmdir()
+
+        self.assertIsNone(get_fingerprint_target(self.registry, "fp"))
+
+    def test_release_environment(self):
+        register_environment(self.registry, "fp", "env_a", self.target)
+        register_environment(self.registry, "fp", "env_b", self.target)
+
+        self.assertIsNone(release_environment(self.registry, "env_c"))
+        self.assertTrue(release_environment(self.registry, "env_a"))
+        self.assertEqual(["env_b"], get_fingerprint_users(self.registry, "fp"))
+        self.assertFalse(release_environment(self.registry, "env_b"))
+        self.assertFalse(self.registry.joinpath("fp").exists())
+        self.assertIsNone(release_environment(self.registry, "env_b"))
+
+    def test_release_environment_missing_registry(self):
+        self.assertIsNone(release_environment(self.registry, "env_a"))
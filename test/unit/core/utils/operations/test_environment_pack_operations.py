@@ -0,0 +1,106 @@
+import io
+import json
+import os
+import platform
+import tarfile
+import unittest
+from pathlib import Path
+
+from album.core.utils.operations.environment_pack_operations import (
+    ENVIRONMENT_PACK_MANIFEST_NAME,
+    extract_environment_pack,
+    read_environment_pack_manifest,
+    write_environment_pack,
+)
+from test.unit.test_unit_core_common import TestUnitCoreCommon
+
+
+@unittest.skipIf(
+    platform.system().lower() == "windows",
+    "Linking in windows currently not tested!",
+)
+class TestEnvironmentPackOperations(TestUnitCoreCommon):
+    def setUp(self):
+        super().setUp()
+        self.env = Path(self.tmp_dir.name).joinpath("a_long_environment_prefix")
+        self.env.joinpath("bin").mkdir(parents=True)
+        self.env.joinpath("lib").mkdir()
+        self.prefix = str(self.env.resolve())
+        script = self.env.joinpath("bin", "script")
+        script.write_text("#!%s/bin/python\n" % self.prefix)
+        script.chmod(0o755)
+        self.env.joinpath("lib", "binary").write_bytes(
+            b"\x7fELF\0" + self.prefix.encode() + b"/lib:/usr/lib\0rest"
+        )
+        self.env.joinpath("lib", "plain").write_bytes(b"nothing to relocate\0")
+        os.symlink(self.env.joinpath("bin", "script"), self.env.joinpath("link"))
+        self.archive = Path(self.tmp_dir.name).joinpath("env.tar.gz")
+
+    def test_write_environment_pack(self):
+        write_environment_pack(self.env, self.archive, {"name": "env_a"})
+
+        manifest = read_environment_pack_manifest(self.archive)
+        self.assertEqual("env_a", manifest["name"])
+        self.assertEqual(self.prefix, manifest["prefix"])
+        self.assertEqual(["bin/script"], manifest["text_files"])
+        self.assertEqual(["lib/binary"], manifest["binary_files"])
+        with tarfile.open(self.archive) as tar:
+            self.assertEqual("bin/script", tar.getmember("env/link").linkname)
+
+    def test_read_environment_pack_manifest_invalid(self):
+        with tarfile.open(self.archive, "w:gz") as tar:
+            tar.add(self.env, arcname="env")
+
+        with self.assertRaises(ValueError):
+            read_environment_pack_manifest(self.archive)
+
+    def test_extract_environment_pack(self):
+        write_environment_pack(self.env, self.archive, {"name": "env_a"})
+        target = Path(self.tmp_dir.name).joinpath("short")
+
+        # call
+        manifest = extract_environment_pack(self.archive, target)
+
+        # assert
+        new_prefix = str(target.resolve())
+        self.assertEqual("env_a", manifest["name"])
+        self.assertEqual(
+            "#!%s/bin/python\n" % new_prefix,
+            target.joinpath("bin", "script").read_text(),
+        )
+        self.assertTrue(os.access(target.joinpath("bin", "script"), os.X_OK))
+        binary = target.joinpath("lib", "binary").read_bytes()
+        self.assertEqual(self.env.joinpath("lib", "binary").stat().st_size, len(binary))
+        self.assertTrue(
+            binary.startswith(b"\x7fELF\0" + new_prefix.encode() + b"/lib:/usr/lib\0")
+        )
+        self.assertTrue(binary.endswith(b"\0rest"))
+        self.assertEqual(
+            b"nothing to relocate\0", target.joinpath("lib", "plain").read_bytes()
+        )
+        self.assertEqual(
+            target.joinpath("bin", "script").resolve(),
+            target.joinpath("link").resolve(),
+        )
+
+    def test_extract_environment_pack_longer_prefix(self):
+        write_environment_pack(self.env, self.archive, {"name": "env_a"})
+        target = Path(self.tmp_dir.name).joinpath("an_even_longer_environment_prefix")
+
+        with self.assertRaises(RuntimeError):
+            extract_environment_pack(self.archive, target)
+
+    def test_extract_environment_pack_other_platform(self):
+        write_environment_pack(self.env, self.archive, {"name": "env_a"})
+        manifest = read_environment_pack_manifest(self.archive)
+        manifest["platform"] = "other"
+        data = json.dumps(manifest).encode()
+        with tarfile.open(self.archive, "w:gz") as tar:
+            info = tarfile.TarInfo(ENVIRONMENT_PACK_MANIFEST_NAME)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+        with self.assertRaises(RuntimeError):
+            extract_environment_pack(
+                self.archive, Path(self.tmp_dir.name).joinpath("t")
+            )
@@ -0,0 +1,117 @@
+import os
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+from album.core.utils.operations import extraction_operations
+from album.core.utils.operations.extraction_operations import (
+    evict_extraction_cache,
+    extract_archive_cached,
+)
+from album.core.utils.operations.lease_operations import get_lease_owner
+from test.unit.test_unit_core_common import TestUnitCoreCommon
+
+
+class TestExtractionOperations(TestUnitCoreCommon):
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = Path(self.tmp_dir.name).joinpath("extracted")
+
+    def tearDown(self) -> None:
+        extraction_operations._release_references()
+        super().tearDown()
+
+    def _create_zip(self, name, content):
+        zip_path = Path(self.tmp_dir.name).joinpath(name)
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("solution.py", content)
+        return zip_path
+
+    def test_extract_archive_cached(self):
+        archive = self._create_zip("a.zip", "print('a')")
+
+        tree = extract_archive_cached(archive, self.cache_dir)
+
+        self.assertEqual("print('a')", tree.joinpath("solution.py").read_text())
+        # only the complete entry remains
+        self.assertEqual([tree.parent], list(self.cache_dir.iterdir()))
+        self.assertTrue(tree.parent.joinpath("refs", get_lease_owner()).exists())
+
+        # same content in another archive is not extracted again
+        same_content = self._create_zip("b.zip", "print('a')")
+        os.utime(same_content, (0, 0))
+        with patch(
+            "album.core.utils.operations.extraction_operations.unzip_archive"
+        ) as unzip_archive_mock:
+            self.assertEqual(tree, extract_archive_cached(same_content, self.cache_dir))
+            unzip_archive_mock.assert_not_called()
+
+        # references are released
+        extraction_operations._release_references()
+        self.assertFalse(tree.parent.joinpath("refs", get_lease_owner()).exists())
+
+    def test_extract_archive_cached_concurrently(self):
+        archive = self._create_zip("a.zip", "print('a')")
+        unzip_archive = extraction_operations.unzip_archive
+
+        def _extract_concurrently(zip_archive, target):
+            # another process completes the entry while this one is extracting
+            other_staging = self.cache_dir.joinpath("other")
+            unzip_archive(zip_archive, other_staging.joinpath("tree"))
+            other_staging.joinpath("tree", "used_by_other").touch()
+            other_staging.joinpath("complete").write_text("10")
+            entry = self.cache_dir.joinpath(
+                extraction_operations.get_file_hash(zip_archive)[:32]
+            )
+            os.replace(other_staging, entry)
+            return unzip_archive(zip_archive, target)
+
+        with patch(
+            "album.core.utils.operations.extraction_operations.unzip_archive",
+            side_effect=_extract_concurrently,
+        ):
+            tree = extract_archive_cached(archive, self.cache_dir)
+
+        # the entry of the other process is kept and used
+        self.assertTrue(tree.joinpath("used_by_other").exists())
+        self.assertEqual([tree.parent], list(self.cache_dir.iterdir()))
+
+    def test_extract_archive_cached_incomplete(self):
+        archive = self._create_zip("a.zip", "print('a')")
+        entry = self.cache_dir.joinpath(
+            extraction_operations.get_file_hash(archive)[:32]
+        )
+        # left behind by an interrupted extraction
+        entry.joinpath("tree").mkdir(parents=True)
+        entry.joinpath("tree", "partial").touch()
+
+        tree = extract_archive_cached(archive, self.cache_dir)
+
+        self.assertEqual(entry.joinpath("tree"), tree)
+        self.assertFalse(tree.joinpath("partial").exists())
+        self.assertEqual("print('a')", tree.joinpath("solution.py").read_text())
+
+    def test_evict_extraction_cache(self):
+        tree_a = extract_archive_cached(
+            self._create_zip("a.zip", "a" * 100), self.cache_dir
+        )
+        tree_b = extract_archive_cached(
+            self._create_zip("b.zip", "b" * 100), self.cache_dir
+        )
+        marker_a = tree_a.parent.joinpath("complete")
+        os.utime(marker_a, (0, 0))
+
+        # referenced by this process
+        self.assertEqual([], evict_extraction_cache(self.cache_dir, 0))
+
+        extraction_operations._release_references()
+        # stale reference of a process which is not running anymore
+        with patch(
+            "album.core.utils.operations.lease_operations.is_process_alive",
+            return_value=False,
+        ):
+            tree_b.parent.joinpath("refs", "1").touch()
+            removed = evict_extraction_cache(self.cache_dir, 150)
+
+        self.assertEqual([tree_a.parent], removed)
+        self.assertTrue(tree_b.exists())
@@ -16,10 +16,13 @@ from album.core.utils.operations.file_operations import (
     zip_paths,
     rand_folder_name,
     folder_empty,
-    _next_free_pointer_number,
     get_link_target,
     construct_cache_link_target,
     list_files_recursively,
+    compress_file,
+    decompress_file,
+    allocate_link_slot,
+    release_link_slot,
 )
 from test.unit.test_unit_core_common import TestUnitCoreCommon
 
@@ -167,6 +170,22 @@ class TestFileOperations(TestUnitCoreCommon):
         # assert
         self.assertTrue(target_unzip.joinpath("aFile.txt").exists())
 
+    def test_compress_file(self):
+        file = Path(self.tmp_dir.name).joinpath("file.txt")
+        file.write_text("content" * 100)
+
+        for suffix in [".gz", ".xz"]:
+            compressed = compress_file(file, file.with_suffix(".txt" + suffix))
+            self.assertTrue(compressed.stat().st_size < file.stat().st_size)
+
+            decompressed = decompress_file(
+                compressed, Path(self.tmp_dir.name).joinpath("out", "file.txt")
+            )
+            self.assertEqual(file.read_text(), decompressed.read_text())
+
+        with self.assertRaises(ValueError):
+            compress_file(file, file.with_suffix(".zip"))
+
     def test_force_remove_no_folder(self):
         p = Path(self.tmp_dir.name).joinpath("not_exist")
 
@@ -239,7 +258,7 @@ class TestFileOperations(TestUnitCoreCommon):
             Path(self.tmp_dir.name).joinpath("point_to", "0").resolve(), r.resolve()
         )
 
-    def test__next_free_pointer_number(self):
+    def test_allocate_link_slot(self):
         p0 = Path(self.tmp_dir.name).joinpath("0")
         p1 = Path(self.tmp_dir.name).joinpath("1")
         p2isMissing = Path(self.tmp_dir.name).joinpath("3")
@@ -248,9 +267,48 @@ class TestFileOperations(TestUnitCoreCommon):
         p1.touch()
         p2isMissing.mkdir()
 
-        r = _next_free_pointer_number(self.tmp_dir.name)
+        # call - the slots get seeded from the existing folders
+        r = allocate_link_slot(self.tmp_dir.name)
+
+        # assert
+        self.assertEqual(Path(self.tmp_dir.name).joinpath("2"), r)
+        self.assertTrue(r.is_dir())
+        self.assertEqual(
+            Path(self.tmp_dir.name).joinpath("4"),
+            allocate_link_slot(self.tmp_dir.name),
+        )
+
+    def test_allocate_link_slot_reuses_released(self):
+        root = Path(self.tmp_dir.name).joinpath("root")
+        slots = [allocate_link_slot(root) for _ in range(3)]
+        self.assertEqual([root.joinpath(str(i)) for i in range(3)], slots)
 
-        self.assertEqual("2", r)
+        # call
+        force_remove(slots[1])
+        release_link_slot(slots[1])
+
+        # assert
+        self.assertEqual(slots[1], allocate_link_slot(root))
+        self.assertEqual(root.joinpath("3"), allocate_link_slot(root))
+
+    def test_allocate_link_slot_skips_existing(self):
+        root = Path(self.tmp_dir.name).joinpath("root")
+        allocate_link_slot(root)
+
+        # folder created without the slots file
+        root.joinpath("1").mkdir()
+
+        self.assertEqual(root.joinpath("2"), allocate_link_slot(root))
+
+    def test_release_link_slot_existing(self):
+        root = Path(self.tmp_dir.name).joinpath("root")
+        slot = allocate_link_slot(root)
+
+        # call - the folder was not removed
+        release_link_slot(slot)
+
+        # assert
+        self.assertEqual(root.joinpath("1"), allocate_link_slot(root))
 
     @unittest.skipIf(
         platform.system().lower() == "windows",
@@ -7,7 +7,7 @@ from unittest.mock import patch
 
 import album.core.utils.operations.git_operations as git_op
 from album.core.model.default_values import DefaultValues
-from album.environments.utils.file_operations import copy
+from album.environments.utils.file_operations import copy, force_remove
 from album.runner.core.model.solution import Solution
 
 
@@ -217,6 +217,61 @@ class TestGitOperations(TestGitCommon):
             self.assertListEqual([], repo.untracked_files)
             self.assertEqual("main", repo.active_branch.name)
 
+    def test_add_tags(self):
+        with self.setup_tmp_repo() as repo:
+            # call
+            git_op.add_tags(repo, ["tag1", "tag2"])
+
+            # assert - tags survive a reset to the remote
+            git_op.init_repository(repo.working_tree_dir)
+            self.assertCountEqual(["tag1", "tag2"], git_op.get_tags(repo))
+
+    def test_init_repository_prunes_tags(self):
+        with self.setup_tmp_repo() as repo:
+            repo.git.tag("stale_tag")
+            self.assertIn("stale_tag", git_op.get_tags(repo))
+
+            # call
+            git_op.init_repository(repo.working_tree_dir)
+
+            # tags not known to the remote are gone
+            self.assertNotIn("stale_tag", git_op.get_tags(repo))
+
+    def test_is_reusable_repository(self):
+        src, clone = self.setup_empty_catalog("testReuse")
+
+        self.assertTrue(git_op.is_reusable_repository(clone, str(src)))
+        self.assertFalse(git_op.is_reusable_repository(clone, "https://other.org/c"))
+
+        # interrupted operation
+        Path(clone).joinpath(".git", "MERGE_HEAD").touch()
+        self.assertFalse(git_op.is_reusable_repository(clone, str(src)))
+
+        # broken repository
+        force_remove(Path(clone).joinpath(".git"))
+        Path(clone).joinpath(".git").mkdir()
+        self.assertFalse(git_op.is_reusable_repository(clone, str(src)))
+
+    def test_download_repository_reuse(self):
+        src, _ = self.setup_empty_catalog("testReuse")
+        p = Path(self.tmp_dir.name).joinpath("testGitReuse")
+        git_op.download_repository(str(src), p).close()
+        p.joinpath("myFile1").touch()
+
+        with patch("git.Repo.clone_from") as clone_from_mock:
+            repo = git_op.download_repository(str(src), p)
+            repo.close()
+            clone_from_mock.assert_not_called()
+
+        self.assertFalse(p.joinpath("myFile1").exists())
+
+        # not reusable
+        p.joinpath(".git", "MERGE_HEAD").touch()
+        repo = git_op.download_repository(str(src), p)
+        repo.close()
+        self.assertFalse(p.joinpath(".git", "MERGE_HEAD").exists())
+        self.assertIn("album_catalog_index.json", os.listdir(p))
+
     def test_checkout_main(self):
         with self.setup_tmp_repo(create_test_branch=True) as repo:
             test_head = repo.heads["test_branch"]
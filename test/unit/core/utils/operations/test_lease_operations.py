@@ -0,0 +1,59 @@
+import os
+import socket
+from pathlib import Path
+from unittest.mock import patch
+
+from album.core.utils.operations import lease_operations
+from album.core.utils.operations.lease_operations import (
+    get_lease_owner,
+    hold_lease,
+    is_lease_valid,
+    is_process_alive,
+    release_lease,
+)
+from test.unit.test_unit_core_common import TestUnitCoreCommon
+
+
+class TestLeaseOperations(TestUnitCoreCommon):
+    def setUp(self):
+        super().setUp()
+        self.lease = Path(self.tmp_dir.name).joinpath("lease")
+        self.lease.touch()
+
+    def test_get_lease_owner(self):
+        with patch.object(socket, "gethostname", return_value="node.cluster_1"):
+            self.assertEqual("node-cluster-1_%s" % os.getpid(), get_lease_owner())
+
+    @patch("album.core.utils.operations.lease_operations.is_process_alive")
+    def test_is_lease_valid(self, is_process_alive_mock):
+        is_process_alive_mock.side_effect = lambda pid: pid == 1
+        host = get_lease_owner().rpartition("_")[0]
+
+        self.assertTrue(is_lease_valid(get_lease_owner(), self.lease))
+        self.assertTrue(is_lease_valid("%s_1" % host, self.lease))
+        self.assertFalse(is_lease_valid("%s_2" % host, self.lease))
+        # process id only
+        self.assertTrue(is_lease_valid("1", self.lease))
+        self.assertFalse(is_lease_valid("2", self.lease))
+        self.assertFalse(is_lease_valid("invalid", self.lease))
+
+    def test_is_lease_valid_other_host(self):
+        # processes of other hosts are not checked, their leases are valid while refreshed
+        self.assertTrue(is_lease_valid("other-host_1", self.lease, 60))
+        os.utime(self.lease, (0, 0))
+        self.assertFalse(is_lease_valid("other-host_1", self.lease, 60))
+        self.assertFalse(
+            is_lease_valid("other-host_1", self.lease.with_name("missing"), 60)
+        )
+
+    def test_hold_release_lease(self):
+        hold_lease(self.lease)
+        self.assertIn(self.lease, lease_operations._held_leases)
+        self.assertIsNotNone(lease_operations._refresh_thread)
+
+        release_lease(self.lease)
+        self.assertNotIn(self.lease, lease_operations._held_leases)
+        self.assertFalse(self.lease.exists())
+
+    def test_is_process_alive(self):
+        self.assertTrue(is_process_alive(os.getpid()))
@@ -1,3 +1,5 @@
+import json
+import os
 import unittest.mock
 import zipfile
 from copy import deepcopy
@@ -8,10 +10,13 @@ from unittest.mock import patch
 
 from album.core.model.default_values import DefaultValues
 from album.core.utils.operations.resolve_operations import (
+    _add_doi_solution_to_cache,
+    _get_doi_cache_entry,
     _parse_zenodo_url,
     check_doi,
     check_file_or_url,
     dict_to_coordinates,
+    evict_doi_cache,
     get_attributes_from_string,
     get_cgnv_from_input,
     get_doi_from_input,
@@ -137,6 +142,135 @@ class TestResolveOperations(TestUnitCoreCommon):
         dl_mock.assert_called_once_with(parse_doi_mock.return_value, mock.ANY)
         prepare_mock.assert_called_once_with("myDownloadFile", mock.ANY)
 
+    def _download_doi_zip(self, _, target):
+        target = Path(target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(target, "w") as z:
+            z.writestr("solution.py", "print('doi')")
+            z.writestr("data/file.txt", "data")
+        return target
+
+    @patch("album.core.utils.operations.resolve_operations.download_resource")
+    @patch(
+        "album.core.utils.operations.resolve_operations.parse_doi_service_url",
+        return_value="https://zenodo.org/api/records/5571504/files-archive",
+    )
+    @patch(
+        "album.core.utils.operations.resolve_operations.retrieve_redirect_url",
+        return_value="https://zenodo.org/record/5571504",
+    )
+    def test_check_doi_cached(self, retrieve_url_mock, _, dl_mock):
+        doi = "10.5281/zenodo.5571504"
+        doi_cache = Path(self.tmp_dir.name).joinpath("doi")
+        dl_mock.side_effect = self._download_doi_zip
+
+        p = check_doi(doi, "myTempDir", doi_cache)
+
+        self.assertEqual("print('doi')", p.read_text())
+        self.assertTrue(p.parent.joinpath("data", "file.txt").exists())
+        self.assertTrue(str(p).startswith(str(doi_cache)))
+        # only the complete entry remains in the cache
+        self.assertEqual(1, len(list(doi_cache.iterdir())))
+        meta = json.loads(
+            p.parent.parent.joinpath(
+                DefaultValues.doi_cache_meta_file_name.value
+            ).read_text()
+        )
+        self.assertEqual(doi, meta["doi"])
+        self.assertEqual("https://zenodo.org/record/5571504", meta["redirect_url"])
+        self.assertIsNotNone(meta["archive_hash"])
+
+        # served from the cache without network access
+        self.assertEqual(p, check_doi(doi, "myTempDir", doi_cache))
+        retrieve_url_mock.assert_called_once()
+        dl_mock.assert_called_once()
+
+    @patch(
+        "album.core.utils.operations.resolve_operations.download_resource",
+        side_effect=ConnectionError("offline"),
+    )
+    @patch("album.core.utils.operations.resolve_operations.parse_doi_service_url")
+    @patch("album.core.utils.operations.resolve_operations.retrieve_redirect_url")
+    def test_check_doi_cached_failed_download(self, _, __, ___):
+        doi_cache = Path(self.tmp_dir.name).joinpath("doi")
+        doi_cache.mkdir()
+
+        with self.assertRaises(ConnectionError):
+            check_doi("10.5281/zenodo.5571504", "myTempDir", doi_cache)
+
+        self.assertEqual([], list(doi_cache.iterdir()))
+
+    def _create_doi_download(self, name):
+        download_dir = Path(self.tmp_dir.name).joinpath(name)
+        download_dir.mkdir()
+        solution_file = download_dir.joinpath("solution.py")
+        solution_file.write_text("print('%s')" % name)
+        return download_dir, solution_file
+
+    def test_add_doi_solution_to_cache_concurrently(self):
+        doi = "10.5281/zenodo.5571504"
+        doi_cache = Path(self.tmp_dir.name).joinpath("doi")
+        doi_cache.mkdir()
+        archive = Path(self.tmp_dir.name).joinpath("missing.zip")
+        # added by another process in the meantime
+        other_dir, other_solution = self._create_doi_download("other")
+        cached = _add_doi_solution_to_cache(
+            doi, doi_cache, other_dir, "url", archive, other_solution
+        )
+        download_dir, solution_file = self._create_doi_download("this")
+
+        p = _add_doi_solution_to_cache(
+            doi, doi_cache, download_dir, "url", archive, solution_file
+        )
+
+        # the entry of the other process is kept and used
+        self.assertEqual(cached, p)
+        self.assertEqual("print('other')", p.read_text())
+        self.assertFalse(download_dir.exists())
+
+    def test_add_doi_solution_to_cache_incomplete(self):
+        doi = "10.5281/zenodo.5571504"
+        doi_cache = Path(self.tmp_dir.name).joinpath("doi")
+        # left behind by an interrupted download, without meta file
+        entry = _get_doi_cache_entry(doi, doi_cache)
+        entry.mkdir(parents=True)
+        entry.joinpath("partial").touch()
+        download_dir, solution_file = self._create_doi_download("this")
+
+        p = _add_doi_solution_to_cache(
+            doi,
+            doi_cache,
+            download_dir,
+            "url",
+            Path(self.tmp_dir.name).joinpath("missing.zip"),
+            solution_file,
+        )
+
+        self.assertEqual(entry.joinpath("solution.py"), p)
+        self.assertEqual("print('this')", p.read_text())
+        self.assertFalse(entry.joinpath("partial").exists())
+
+    def test_evict_doi_cache(self):
+        doi_cache = Path(self.tmp_dir.name).joinpath("doi")
+        for i, name in enumerate(["old", "new", "newest"]):
+            entry = doi_cache.joinpath(name)
+            entry.mkdir(parents=True)
+            meta_file = entry.joinpath(DefaultValues.doi_cache_meta_file_name.value)
+            meta_file.write_text(json.dumps({"doi": name, "size": 10}))
+            os.utime(meta_file, (1000 + i, 1000 + i))
+        # incomplete entries are ignored
+        doi_cache.joinpath("tmp_download").mkdir()
+
+        removed = evict_doi_cache(doi_cache, 15, keep=doi_cache.joinpath("old"))
+
+        self.assertEqual(
+            [doi_cache.joinpath("new"), doi_cache.joinpath("newest")], removed
+        )
+        self.assertEqual(
+            ["old", "tmp_download"], sorted(e.name for e in doi_cache.iterdir())
+        )
+        self.assertEqual([], evict_doi_cache(doi_cache, 15))
+
     @patch(
         "album.core.utils.operations.resolve_operations._parse_zenodo_url",
         return_value="link",
@@ -228,12 +362,12 @@ class TestResolveOperations(TestUnitCoreCommon):
 
     @patch("album.core.utils.operations.resolve_operations.check_zip")
     @patch("album.core.utils.operations.resolve_operations.rand_folder_name")
-    @patch("album.core.utils.operations.resolve_operations.unzip_archive")
+    @patch("album.core.utils.operations.resolve_operations.extract_archive_cached")
     @patch("album.core.utils.operations.resolve_operations.download")
     def test_check_file_or_url_case_zip(
         self,
         download_mock,
-        unzip_archive_mock,
+        extract_archive_cached_mock,
         rand_folder_name_mock,
         check_zip_mock,
     ):
@@ -246,7 +380,7 @@ class TestResolveOperations(TestUnitCoreCommon):
 
         # mocks
         download_mock.return_value = pythonfile
-        unzip_archive_mock.return_value = Path("uPath")
+        extract_archive_cached_mock.return_value = Path("uPath")
         rand_folder_name_mock.return_value = Path("rPath")
         check_zip_mock.return_value = True
 
@@ -256,12 +390,14 @@ class TestResolveOperations(TestUnitCoreCommon):
             Path(self.tmp_dir.name).joinpath(DefaultValues.cache_path_tmp_prefix.value),
         )
         self.assertEqual(
-            unzip_archive_mock.return_value.joinpath("solution.py"), case_zip
+            extract_archive_cached_mock.return_value.joinpath("solution.py"), case_zip
         )
 
-        unzip_archive_mock.assert_called_once_with(
+        extract_archive_cached_mock.assert_called_once_with(
             zipfile,
-            Path(self.tmp_dir.name).joinpath("tmp", rand_folder_name_mock.return_value),
+            Path(self.tmp_dir.name).joinpath(
+                "tmp", DefaultValues.cache_path_extraction_prefix.value
+            ),
         )
         rand_folder_name_mock.assert_called_once()
         check_zip_mock.assert_called_once_with(zipfile)
@@ -409,6 +545,39 @@ class TestResolveOperations(TestUnitCoreCommon):
         self.assertEqual("solution.py", result.name)
         self.assertTrue(result.exists())
 
+    def test_prepare_path_extraction_cache(self):
+        tmp = Path(self.tmp_dir.name)
+
+        inner_zip_path = tmp.joinpath("inner", "solution.zip")
+        inner_zip_path.parent.mkdir(parents=True)
+        with zipfile.ZipFile(inner_zip_path, "w") as zf:
+            zf.writestr("solution.py", "from album.runner.api import setup\nsetup()")
+            zf.writestr("src/main/java/Main.java", "class Main {}")
+        outer_zip_path = tmp.joinpath("outer", "archive.zip")
+        outer_zip_path.parent.mkdir(parents=True)
+        with zipfile.ZipFile(outer_zip_path, "w") as zf:
+            zf.write(inner_zip_path, "solution.zip")
+            zf.writestr("cover.png", "fake")
+        extraction_cache = tmp.joinpath("extracted")
+
+        result = prepare_path(outer_zip_path, tmp.joinpath("cache"), extraction_cache)
+
+        self.assertTrue(result.exists())
+        self.assertTrue(
+            result.parent.joinpath("src", "main", "java", "Main.java").exists()
+        )
+        self.assertTrue(str(result).startswith(str(extraction_cache)))
+
+        # extracted only once
+        with patch(
+            "album.core.utils.operations.extraction_operations.unzip_archive"
+        ) as unzip_archive_mock:
+            self.assertEqual(
+                result,
+                prepare_path(outer_zip_path, tmp.joinpath("cache"), extraction_cache),
+            )
+            unzip_archive_mock.assert_not_called()
+
     def test_dict_to_coordinates(self):
         self.assertEqual(
             Coordinates(
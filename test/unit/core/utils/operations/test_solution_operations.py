@@ -4,7 +4,10 @@ from test.unit.test_unit_core_common import TestUnitCoreCommon
 from album.runner.core.model.solution import Solution
 
 from album.core.model.catalog_index import CatalogIndex
-from album.core.utils.operations.solution_operations import get_deploy_dict
+from album.core.utils.operations.solution_operations import (
+    get_deploy_dict,
+    get_setup_attrs_from_source,
+)
 
 
 class TestSolutionOperations(TestUnitCoreCommon):
@@ -43,3 +46,131 @@ channels:
         active_solution = Solution(attrs_dict)
 
         self.assertEqual(get_deploy_dict(active_solution), attrs_dict_result)
+
+    def test_get_setup_attrs_from_source(self):
+        source = """
+from io import StringIO
+
+from album.runner.api import setup
+
+env_file = StringIO(\"\"\"channels:
+  - conda-forge
+\"\"\")
+creators = ["Me", "You"]
+
+
+def run():
+    pass
+
+
+setup(
+    group="g",
+    name="n",
+    version="0.1.0",
+    solution_creators=creators,
+    args=[{"name": "a", "default": 1, "action": run}],
+    run=run,
+    dependencies={"environment_file": env_file},
+)
+"""
+        attrs = get_setup_attrs_from_source(source)
+
+        self.assertEqual("g", attrs["group"])
+        self.assertEqual(["Me", "You"], attrs["solution_creators"])
+        self.assertEqual([{"name": "a", "default": 1}], attrs["args"])
+        self.assertNotIn("run", attrs)
+        self.assertEqual(
+            "channels:\n  - conda-forge\n",
+            attrs["dependencies"]["environment_file"].getvalue(),
+        )
+
+    def test_get_setup_attrs_from_source_api_module(self):
+        source = """
+from album.runner import api
+
+api.setup(group="g", name="n", version="0.1.0")
+"""
+        self.assertEqual(
+            {"group": "g", "name": "n", "version": "0.1.0"},
+            get_setup_attrs_from_source(source),
+        )
+
+    def test_get_setup_attrs_from_source_non_literal(self):
+        header = "from album.runner.api import setup\n"
+        # computed values
+        self.assertIsNone(get_setup_attrs_from_source(header + "setup(name=str(1))"))
+        # names changed before the call
+        self.assertIsNone(
+            get_setup_attrs_from_source(header + "n = 'a'\nn += 'b'\nsetup(name=n)")
+        )
+        # keyword expansion
+        self.assertIsNone(get_setup_attrs_from_source(header + "d = {}\nsetup(**d)"))
+        # conditional setup call
+        self.assertIsNone(
+            get_setup_attrs_from_source(header + "if True:\n    setup(name='n')")
+        )
+        # setup not imported from the album api
+        self.assertIsNone(get_setup_attrs_from_source("setup(name='n')"))
+        # invalid code
+        self.assertIsNone(get_setup_attrs_from_source(header + "setup(name="))
+
+    def test_get_setup_attrs_from_source_mutated(self):
+        header = "from album.runner.api import setup\n"
+        # item assignment
+        self.assertIsNone(
+            get_setup_attrs_from_source(
+                header
+                + "deps = {'environment_file': 'a'}\n"
+                + "deps['parent'] = {'name': 'p'}\n"
+                + "setup(dependencies=deps)"
+            )
+        )
+        # method call
+        self.assertIsNone(
+            get_setup_attrs_from_source(
+                header + "args = [{'name': 'a'}]\n"
+                "args.append({'name': 'b'})\n"
+                "setup(args=args)"
+            )
+        )
+        # method call after the setup call
+        self.assertIsNone(
+            get_setup_attrs_from_source(
+                header + "args = [{'name': 'a'}]\n"
+                "setup(args=args)\n"
+                "args.append({'name': 'b'})"
+            )
+        )
+        # change through an alias
+        self.assertIsNone(
+            get_setup_attrs_from_source(
+                header + "args = []\nalias = args\nalias.extend([1])\nsetup(args=args)"
+            )
+        )
+        # change from a function called on module level
+        self.assertIsNone(
+            get_setup_attrs_from_source(
+                header + "deps = {}\n"
+                "def f():\n    deps.update(a=1)\n"
+                "f()\n"
+                "setup(dependencies=deps)"
+            )
+        )
+        # deletion and loops
+        self.assertIsNone(
+            get_setup_attrs_from_source(header + "n = 'a'\ndel n\nsetup(name=n)")
+        )
+        self.assertIsNone(
+            get_setup_attrs_from_source(
+                header + "a = []\nfor i in range(2):\n    a += [i]\nsetup(args=a)"
+            )
+        )
+        # locals of functions do not change module level names
+        self.assertEqual(
+            {"name": "n"},
+            get_setup_attrs_from_source(
+                header + "name = 'n'\n"
+                "def run():\n    name = 'local'\n"
+                "setup(name=name, run=run)"
+            ),
+        )
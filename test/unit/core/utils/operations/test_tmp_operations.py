@@ -0,0 +1,84 @@
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from album.core.utils.operations.tmp_operations import (
+    TMP_LEASE_SUFFIX,
+    clean_tmp,
+    create_process_tmp_dir,
+)
+from album.core.utils.operations.lease_operations import get_lease_owner
+from test.unit.test_unit_core_common import TestUnitCoreCommon
+
+
+class TestTmpOperations(TestUnitCoreCommon):
+    def setUp(self):
+        super().setUp()
+        self.tmp_root = Path(self.tmp_dir.name).joinpath("tmp_root")
+
+    def _make_old(self, path):
+        old = time.time() - 7200
+        os.utime(path, (old, old))
+
+    def _create_entry(self, name, pid=None):
+        folder = self.tmp_root.joinpath(name)
+        folder.mkdir(parents=True)
+        folder.joinpath("file").write_text("content")
+        if pid is not None:
+            lease = self.tmp_root.joinpath(name + TMP_LEASE_SUFFIX)
+            lease.write_text(str(pid))
+            self._make_old(lease)
+        self._make_old(folder)
+        return folder
+
+    def test_create_process_tmp_dir(self):
+        folder = create_process_tmp_dir(self.tmp_root)
+
+        self.assertTrue(folder.is_dir())
+        self.assertTrue(folder.name.startswith("%s_" % os.getpid()))
+        lease = self.tmp_root.joinpath(folder.name + TMP_LEASE_SUFFIX)
+        self.assertEqual(get_lease_owner(), lease.read_text())
+
+        # a second folder does not clash
+        self.assertNotEqual(folder, create_process_tmp_dir(self.tmp_root))
+
+    @patch("album.core.utils.operations.lease_operations.is_process_alive")
+    def test_clean_tmp(self, is_process_alive_mock):
+        is_process_alive_mock.side_effect = lambda pid: pid == 1
+
+        running = self._create_entry("1_running", pid=1)
+        stopped = self._create_entry("2_stopped", pid=2)
+        legacy = self._create_entry("legacy")
+        recent = self._create_entry("3_recent", pid=3)
+        os.utime(recent)
+        kept = self._create_entry("4_kept", pid=4)
+        orphan_lease = self.tmp_root.joinpath("5_gone" + TMP_LEASE_SUFFIX)
+        orphan_lease.write_text("5")
+
+        removed = clean_tmp(self.tmp_root, 3600, keep=kept)
+
+        self.assertCountEqual([stopped, legacy], removed)
+        self.assertTrue(running.exists())
+        self.assertFalse(stopped.exists())
+        self.assertFalse(
+            self.tmp_root.joinpath(stopped.name + TMP_LEASE_SUFFIX).exists()
+        )
+        self.assertFalse(legacy.exists())
+        self.assertTrue(recent.exists())
+        self.assertTrue(kept.exists())
+        self.assertFalse(orphan_lease.exists())
+
+    def test_clean_tmp_other_host(self):
+        # leased by a process on another host sharing the folder, refreshed while running
+        running = self._create_entry("1_running", pid="other-host_1")
+        os.utime(self.tmp_root.joinpath(running.name + TMP_LEASE_SUFFIX))
+        stopped = self._create_entry("2_stopped", pid="other-host_2")
+
+        removed = clean_tmp(self.tmp_root, 3600)
+
+        self.assertEqual([stopped], removed)
+        self.assertTrue(running.exists())
+
+    def test_clean_tmp_missing_root(self):
+        self.assertEqual([], clean_tmp(self.tmp_root, 0))
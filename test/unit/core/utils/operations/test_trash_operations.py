@@ -0,0 +1,124 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from album.core.utils.operations.lease_operations import get_lease_owner
+from album.core.utils.operations.trash_operations import (
+    TRASH_CLAIM_SUFFIX,
+    empty_trash,
+    move_to_trash,
+)
+from test.unit.test_unit_core_common import TestUnitCoreCommon
+
+
+class TestTrashOperations(TestUnitCoreCommon):
+    def setUp(self):
+        super().setUp()
+        self.trash = Path(self.tmp_dir.name).joinpath("trash")
+
+    def _create_folder(self, name):
+        folder = Path(self.tmp_dir.name).joinpath(name)
+        folder.joinpath("lib", "a").mkdir(parents=True)
+        folder.joinpath("lib", "a", "file").write_text("content")
+        folder.joinpath("bin").mkdir()
+        folder.joinpath("bin", "file").write_text("content")
+        return folder
+
+    def test_move_to_trash(self):
+        folder = self._create_folder("env")
+
+        # call
+        entry = move_to_trash(folder, self.trash)
+
+        # assert
+        self.assertFalse(folder.exists())
+        self.assertEqual(self.trash, entry.parent)
+        self.assertTrue(entry.joinpath("lib", "a", "file").exists())
+
+    def test_move_to_trash_missing(self):
+        self.assertIsNone(
+            move_to_trash(Path(self.tmp_dir.name).joinpath("missing"), self.trash)
+        )
+
+    @patch("album.core.utils.operations.trash_operations.os.rename")
+    def test_move_to_trash_rename_failed(self, rename_mock):
+        rename_mock.side_effect = OSError("Invalid cross-device link")
+        folder = self._create_folder("env")
+
+        # call
+        self.assertIsNone(move_to_trash(folder, self.trash))
+
+        # assert - removed directly
+        self.assertFalse(folder.exists())
+
+    def test_empty_trash(self):
+        move_to_trash(self._create_folder("env_a"), self.trash)
+        move_to_trash(self._create_folder("env_b"), self.trash)
+
+        # call
+        deleted = empty_trash(self.trash)
+
+        # assert
+        self.assertEqual(2, len(deleted))
+        self.assertEqual([], list(self.trash.iterdir()))
+
+    def test_empty_trash_max_workers(self):
+        move_to_trash(self._create_folder("env_a"), self.trash)
+        move_to_trash(self._create_folder("env_b"), self.trash)
+
+        # call
+        deleted = empty_trash(self.trash, max_workers=4)
+
+        # assert
+        self.assertEqual(2, len(deleted))
+        self.assertEqual([], list(self.trash.iterdir()))
+
+    @patch("album.core.utils.operations.lease_operations.is_process_alive")
+    def test_empty_trash_claimed(self, is_process_alive_mock):
+        is_process_alive_mock.side_effect = lambda pid: pid == 1
+        self.trash.mkdir()
+        interrupted = self.trash.joinpath("a_env.999999%s" % TRASH_CLAIM_SUFFIX)
+        interrupted.mkdir()
+        in_progress = self.trash.joinpath("b_env.1%s" % TRASH_CLAIM_SUFFIX)
+        in_progress.mkdir()
+
+        # call
+        deleted = empty_trash(self.trash)
+
+        # assert - deletions of processes no longer running are resumed
+        self.assertEqual(
+            [
+                self.trash.joinpath(
+                    "a_env.%s%s" % (get_lease_owner(), TRASH_CLAIM_SUFFIX)
+                )
+            ],
+            deleted,
+        )
+        self.assertEqual([in_progress], list(self.trash.iterdir()))
+
+    def test_empty_trash_claimed_other_host(self):
+        self.trash.mkdir()
+        # refreshed by a process on another host sharing the trash
+        in_progress = self.trash.joinpath("a_env.other-host_1%s" % TRASH_CLAIM_SUFFIX)
+        in_progress.mkdir()
+        # no longer refreshed
+        interrupted = self.trash.joinpath("b_env.other-host_2%s" % TRASH_CLAIM_SUFFIX)
+        interrupted.mkdir()
+        os.utime(interrupted, (0, 0))
+
+        # call
+        deleted = empty_trash(self.trash)
+
+        # assert
+        self.assertEqual(
+            [
+                self.trash.joinpath(
+                    "b_env.%s%s" % (get_lease_owner(), TRASH_CLAIM_SUFFIX)
+                )
+            ],
+            deleted,
+        )
+        self.assertEqual([in_progress], list(self.trash.iterdir()))
+
+    def test_empty_trash_missing(self):
+        self.assertEqual([], empty_trash(self.trash))
@@ -1,8 +1,15 @@
-import unittest
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import patch
 
+from album.core.utils.operations.file_operations import check_zip, zip_folder
 from album.core.utils.operations.url_operations import (
-    is_url,
+    conditional_download,
+    download,
+    get_conditional_download_header_file,
     is_git_ssh_address,
+    is_url,
 )
 from test.unit.test_unit_core_common import TestUnitCoreCommon
 
@@ -46,7 +53,69 @@ class TestUrlOperations(TestUnitCoreCommon):
         self.assertTrue(all([u1, u2, u3, u4, u5, u6, u7, u8]))
         self.assertFalse(all([u9, u10, u11, u12]))
 
-    @unittest.skip("Needs to be implemented!")
+    def test_conditional_download(self):
+        serve_dir = Path(self.tmp_dir.name).joinpath("serve")
+        serve_dir.mkdir()
+        served_file = serve_dir.joinpath("file.txt")
+        served_file.write_text("content")
+        target = Path(self.tmp_dir.name).joinpath("target", "file.txt")
+
+        with self.serve_directory(serve_dir) as url:
+            # call - first download
+            self.assertTrue(conditional_download(url + "/file.txt", target))
+            self.assertEqual("content", target.read_text())
+            self.assertTrue(get_conditional_download_header_file(target).exists())
+
+            # call - unchanged
+            self.assertFalse(conditional_download(url + "/file.txt", target))
+            self.assertEqual("content", target.read_text())
+
+            # call - changed
+            served_file.write_text("new content")
+            mtime = served_file.stat().st_mtime + 10
+            os.utime(served_file, (mtime, mtime))
+            self.assertTrue(conditional_download(url + "/file.txt", target))
+            self.assertEqual("new content", target.read_text())
+
+            # call - missing
+            with self.assertRaises(FileNotFoundError):
+                conditional_download(url + "/missing.txt", target)
+            self.assertEqual("new content", target.read_text())
+
     def test_download(self):
-        # Todo: implement
-        pass
+        serve_dir = Path(self.tmp_dir.name).joinpath("served")
+        serve_dir.mkdir()
+        serve_dir.joinpath("solution.py").write_text("print('url')")
+        zip_file = Path(
+            zip_folder(serve_dir, Path(self.tmp_dir.name).joinpath("solution.zip"))
+        )
+        shutil.move(str(zip_file), serve_dir.joinpath("solution.zip"))
+        base = Path(self.tmp_dir.name).joinpath("downloads")
+
+        with self.serve_directory(serve_dir) as url:
+            # call - single file
+            p = download(url + "/solution.py", str(base))
+            self.assertEqual("print('url')", p.read_text())
+
+            # call - zip archive, linked with zip suffix
+            p_zip = download(url + "/solution.zip", str(base))
+            self.assertEqual(".zip", p_zip.suffix)
+            self.assertTrue(check_zip(p_zip))
+
+            # call - cached, unchanged
+            with patch(
+                "album.core.utils.operations.url_operations.conditional_download",
+                wraps=conditional_download,
+            ) as conditional_download_mock:
+                self.assertEqual(p, download(url + "/solution.py", str(base)))
+                self.assertEqual(p_zip, download(url + "/solution.zip", str(base)))
+                self.assertEqual(2, conditional_download_mock.call_count)
+
+            # call - missing
+            with self.assertRaises(FileNotFoundError):
+                download(url + "/missing.py", str(base))
+
+        # call - offline, previous download is used
+        self.assertEqual(p, download(url + "/solution.py", str(base)))
+        with self.assertRaises(ConnectionError):
+            download(url + "/missing.py", str(base))
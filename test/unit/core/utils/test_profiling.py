@@ -0,0 +1,139 @@
+import json
+import pstats
+import threading
+from pathlib import Path
+
+from album.core.utils import profiling
+from album.core.utils.profiling import (
+    get_profiler,
+    profiled,
+    span,
+    start_profiling,
+    stop_profiling,
+)
+from test.unit.test_unit_core_common import TestUnitCoreCommon
+
+
+@profiled("decorated")
+def _decorated(value):
+    return value * 2
+
+
+class TestProfiling(TestUnitCoreCommon):
+    def tearDown(self) -> None:
+        stop_profiling()
+        super().tearDown()
+
+    def test_disabled(self):
+        self.assertIsNone(get_profiler())
+
+        with span("ignored"):
+            pass
+
+        self.assertIs(profiling._NO_SPAN, span("ignored"))
+        self.assertEqual(4, _decorated(2))
+        self.assertIsNone(stop_profiling())
+
+    def test_spans(self):
+        profiler = start_profiling()
+
+        with span("outer"):
+            with span("inner"):
+                self.assertEqual(4, _decorated(2))
+        thread = threading.Thread(target=_decorated, args=(1,))
+        thread.start()
+        thread.join()
+
+        self.assertIs(profiler, stop_profiling())
+        self.assertIsNone(get_profiler())
+
+        spans = [s for s in profiler.spans() if s.thread_id != thread.ident]
+        self.assertEqual(
+            [("outer", 0), ("inner", 1), ("decorated", 2)],
+            [(s.name, s.depth) for s in spans],
+        )
+        self.assertEqual(
+            [("decorated", 0)],
+            [
+                (s.name, s.depth)
+                for s in profiler.spans()
+                if s.thread_id == thread.ident
+            ],
+        )
+        outer, inner = spans[0], spans[1]
+        self.assertLessEqual(outer.start, inner.start)
+        self.assertGreaterEqual(outer.duration, inner.duration)
+
+        # spans recorded after stopping are ignored
+        with span("ignored"):
+            pass
+        self.assertEqual(4, len(profiler.spans()))
+
+    def test_span_exception(self):
+        profiler = start_profiling()
+
+        with self.assertRaises(ValueError):
+            with span("failing"):
+                raise ValueError("error")
+        with span("next"):
+            pass
+
+        self.assertEqual(
+            [("failing", 0), ("next", 0)],
+            [(s.name, s.depth) for s in profiler.spans()],
+        )
+
+    def test_add_span(self):
+        profiler = start_profiling(start=10.0)
+        profiler.add_span("before", 10.0, 10.5)
+
+        s = profiler.spans()[0]
+        self.assertEqual("before", s.name)
+        self.assertEqual(0.0, s.start)
+        self.assertEqual(0.5, s.duration)
+
+    def test_get_summary_as_string(self):
+        profiler = start_profiling()
+        with span("outer"):
+            with span("inner"):
+                pass
+
+        lines = profiler.get_summary_as_string().splitlines()
+
+        self.assertTrue(lines[0].startswith("phase"))
+        self.assertTrue(lines[2].startswith("outer"))
+        self.assertTrue(lines[3].startswith("  inner"))
+        self.assertTrue(lines[4].startswith("total"))
+
+    def test_write_trace(self):
+        profiler = start_profiling()
+        with span("outer"):
+            pass
+        trace_file = Path(self.tmp_dir.name).joinpath("trace.json")
+
+        profiler.write_trace(trace_file)
+
+        with open(trace_file) as f:
+            trace = json.load(f)
+        self.assertEqual(1, len(trace["traceEvents"]))
+        event = trace["traceEvents"][0]
+        self.assertEqual("outer", event["name"])
+        self.assertEqual("X", event["ph"])
+        self.assertGreaterEqual(event["dur"], 0)
+
+    def test_write_stats(self):
+        profiler = start_profiling(use_cprofile=True)
+        _decorated(2)
+        stop_profiling()
+        stats_file = Path(self.tmp_dir.name).joinpath("profile.pstats")
+
+        profiler.write_stats(stats_file)
+
+        stats = pstats.Stats(str(stats_file))
+        self.assertTrue(any(f[2] == "_decorated" for f in stats.stats))
+
+    def test_write_stats_without_cprofile(self):
+        profiler = start_profiling()
+
+        with self.assertRaises(RuntimeError):
+            profiler.write_stats(Path(self.tmp_dir.name).joinpath("profile.pstats"))
@@ -16,6 +16,10 @@ from album.commandline import (
     run,
     test,
     clone,
+    gc,
+    du,
+    env,
+    bundle,
 )
 
 
@@ -31,6 +35,21 @@ class TestArgumentParsing(unittest.TestCase):
         finally:
             os.remove(fp.name)
 
+    @patch("album.argument_parsing.__run_subcommand", return_value=True)
+    def test_run_profile(self, _):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            prefix = os.path.join(tmp_dir, "profile")
+            sys.argv = ["", "--profile-output", prefix, "run", "solution.py"]
+
+            with patch("sys.stderr") as stderr_mock:
+                self.assertIsNone(argument_parsing.main())
+
+            printed = "".join(str(c.args[0]) for c in stderr_mock.write.call_args_list)
+            self.assertIn("parse arguments", printed)
+            self.assertIn("command", printed)
+            self.assertTrue(os.path.exists(prefix + ".pstats"))
+            self.assertTrue(os.path.exists(prefix + ".trace.json"))
+
     def test_run_no_args(self):
         sys.argv = ["", "run"]
         with self.assertRaises(SystemExit) as e:
@@ -57,11 +76,87 @@ class TestArgumentParsing(unittest.TestCase):
         self.assertSubcommandWithFileArgParsed(parser, "add-catalog", add_catalog)
         self.assertSubcommandWithFileArgParsed(parser, "remove-catalog", remove_catalog)
 
+        # check parsing of several solution paths
+        sys.argv = ["", "deploy", "test/path1", "test/path2", "catalog-name"]
+        args = parser.parse_known_args()
+        self.assertEqual(["test/path1", "test/path2"], args[0].path)
+        self.assertEqual("catalog-name", args[0].catalog)
+
+        # check parsing of several solutions to install
+        sys.argv = ["", "install", "test/path1", "test/path2", "--max-workers", "2"]
+        args = parser.parse_known_args()
+        self.assertEqual(["test/path1", "test/path2"], args[0].path)
+        self.assertEqual(2, args[0].max_workers)
+
         # check parsing of additional arguments
         sys.argv = ["", "run", "test/path", "--input", "/other/path"]
         args = parser.parse_known_args()
         self.assertEqual(["--input", "/other/path"], args[1])
 
+    def test_create_gc_parser(self):
+        album_parser = argument_parsing.AlbumParser()
+        argument_parsing.create_gc_parser(album_parser)
+
+        sys.argv = ["", "gc", "--max-workers", "2"]
+        args = album_parser.parser.parse_known_args()
+        self.assertEqual(gc, args[0].func)
+        self.assertEqual(2, args[0].max_workers)
+
+    def test_create_du_parser(self):
+        album_parser = argument_parsing.AlbumParser()
+        argument_parsing.create_du_parser(album_parser)
+
+        sys.argv = ["", "du", "--max-workers", "2"]
+        args = album_parser.parser.parse_known_args()
+        self.assertEqual(du, args[0].func)
+        self.assertEqual(2, args[0].max_workers)
+
+    def test_create_env_parser(self):
+        album_parser = argument_parsing.AlbumParser()
+        argument_parsing.create_env_parser(album_parser)
+
+        sys.argv = ["", "env", "pack", "group:name:version", "--output", "env.tar.gz"]
+        args = album_parser.parser.parse_known_args()
+        self.assertEqual(env, args[0].func)
+        self.assertEqual("pack", args[0].action)
+        self.assertEqual("group:name:version", args[0].path)
+        self.assertEqual("env.tar.gz", args[0].output)
+
+        sys.argv = ["", "env", "unpack", "env.tar.gz"]
+        args = album_parser.parser.parse_known_args()
+        self.assertEqual("unpack", args[0].action)
+        self.assertIsNone(args[0].output)
+
+    def test_create_bundle_parser(self):
+        album_parser = argument_parsing.AlbumParser()
+        argument_parsing.create_bundle_parser(album_parser)
+
+        sys.argv = ["", "bundle", "create", "bundle.tar.gz", "--catalog", "a"]
+        sys.argv += ["--catalog", "b", "--resources"]
+        args = album_parser.parser.parse_known_args()
+        self.assertEqual(bundle, args[0].func)
+        self.assertEqual("create", args[0].action)
+        self.assertEqual("bundle.tar.gz", args[0].path)
+        self.assertEqual(["a", "b"], args[0].catalog)
+        self.assertFalse(args[0].environments)
+        self.assertTrue(args[0].resources)
+
+        sys.argv = ["", "bundle", "import", "bundle.tar.gz"]
+        args = album_parser.parser.parse_known_args()
+        self.assertEqual("import", args[0].action)
+        self.assertIsNone(args[0].catalog)
+
+    @patch("album.api.configure_root_logger")
+    @patch("album.api.AlbumController")
+    def test_create_album_instance(self, album_controller_mock, _):
+        argument_parsing.create_album_instance(None, "install")
+        album_controller_mock.assert_called_once_with(None, True)
+
+        # album gc deletes the trash itself
+        album_controller_mock.reset_mock()
+        argument_parsing.create_album_instance(None, "gc")
+        album_controller_mock.assert_called_once_with(None, False)
+
     def assertSubcommandParsed(self, parser, name, method, arguments=None):
         sys.argv = ["", name]
         if arguments:
@@ -0,0 +1,94 @@
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import unittest
+from typing import Dict
+
+HELP_CODE = """
+import sys
+sys.argv = ["album", "--help"]
+from album.argument_parsing import main
+try:
+    main()
+except SystemExit:
+    pass
+"""
+
+SEARCH_CODE = """
+import sys
+sys.argv = ["album", "search", "keyword"]
+from album.argument_parsing import create_parser
+namespace, _ = create_parser().parse_known_args()
+from album.api import Album
+from album.core.controller.album_controller import AlbumController
+controller = AlbumController()
+controller.collection_manager()
+controller.migration_manager()
+controller.search_manager()
+"""
+
+
+class TestImportTime(unittest.TestCase):
+    # cumulative time in microseconds album modules may spend importing before a command gets executed
+    IMPORT_TIME_BUDGET = 400000
+
+    # modules only needed when album accesses the network, catalog repositories or validates solutions
+    HEAVY_MODULES = ["git", "jsonschema", "requests", "pooch", "validators"]
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _get_import_times(self, code: str) -> Dict[str, int]:
+        env = dict(os.environ)
+        env["ALBUM_BASE_CACHE_PATH"] = self.tmp_dir.name
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        self.assertEqual(0, result.returncode, result.stderr)
+
+        import_times = {}
+        for line in result.stderr.splitlines():
+            m = re.match(r"import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)$", line)
+            if m:
+                # only top level imports, the cumulative time includes nested imports
+                if not m.group(2):
+                    import_times[m.group(3)] = int(m.group(1))
+                else:
+                    import_times.setdefault(m.group(3), 0)
+        return import_times
+
+    def assertWithinBudget(self, import_times: Dict[str, int]):
+        album_import_time = sum(
+            t
+            for name, t in import_times.items()
+            if name == "album" or name.startswith("album.")
+        )
+        self.assertLess(album_import_time, self.IMPORT_TIME_BUDGET)
+
+    def test_help(self):
+        import_times = self._get_import_times(HELP_CODE)
+
+        self.assertIn("album.argument_parsing", import_times)
+        for module in self.HEAVY_MODULES + ["album.core.controller.album_controller"]:
+            self.assertNotIn(module, import_times)
+        self.assertWithinBudget(import_times)
+
+    def test_search(self):
+        import_times = self._get_import_times(SEARCH_CODE)
+
+        self.assertIn("album.core.controller.search_manager", import_times)
+        for module in self.HEAVY_MODULES:
+            self.assertNotIn(module, import_times)
+        self.assertWithinBudget(import_times)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
+import functools
 import logging
 import os
 import tempfile
+import threading
 from contextlib import contextmanager
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from test.test_common import TEST_ALBUM_API_VERSION, TestCommon
 from typing import Generator
@@ -115,6 +118,27 @@ class TestUnitCoreCommon(TestCommon):
         self.active_solution.init = lambda: None
         self.active_solution.args = []
 
+    @staticmethod
+    @contextmanager
+    def serve_directory(path) -> Generator[str, None, None]:
+        """Serve a directory via a local http server, yields the base url."""
+
+        class QuietHandler(SimpleHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), functools.partial(QuietHandler, directory=str(path))
+        )
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield "http://127.0.0.1:%s" % server.server_address[1]
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
     @staticmethod
     def get_catalog_db_from_resources(catalog_name):
         current_path = Path(os.path.dirname(os.path.realpath(__file__)))